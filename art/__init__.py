@@ -2,14 +2,17 @@
 The Adversarial Robustness Toolbox (ART).
 """
 import logging.config
+from typing import TYPE_CHECKING
 
-# Project Imports
-from art import attacks
-from art import defences
-from art import estimators
-from art import evaluations
-from art import metrics
-from art import preprocessing
+# Project Imports, the subpackages and their public names are only imported when first accessed
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art import attacks, defences, estimators, evaluations, metrics, preprocessing
+
+__getattr__, __dir__, __all__ = attach(
+    __name__, submodules=["attacks", "defences", "estimators", "evaluations", "metrics", "preprocessing"]
+)
 
 # Semantic Version
 __version__ = "1.17.1"
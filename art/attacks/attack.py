@@ -21,8 +21,10 @@ This module implements the abstract base classes for all attacks.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import abc
+import json
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+import os
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 
@@ -224,6 +226,107 @@ class EvasionAttack(Attack):
         """
         raise NotImplementedError
 
+    def generate_out_of_core(
+        self,
+        x: Union[np.ndarray, Iterable],
+        output_path: str,
+        y: Optional[np.ndarray] = None,
+        nb_samples: Optional[int] = None,
+        chunk_size: int = 1024,
+        resume: bool = True,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Generate adversarial examples for datasets larger than the memory. The inputs are attacked chunk by chunk with
+        `generate` and the adversarial examples are written into a memory-mapped `.npy` file. The number of completed
+        samples is recorded in `<output_path>.progress.json` after every chunk, so that an interrupted run can be
+        resumed from the last completed chunk.
+
+        :param x: An array with the original inputs to be attacked, usually a memory-mapped array loaded with
+                  `np.load(path, mmap_mode="r")`, or an iterable of batches of inputs `x` or of tuples `(x, y)`.
+        :param output_path: Path of the `.npy` file receiving the adversarial examples.
+        :param y: Correct labels or target labels for an array `x`, depending if the attack is targeted or not. The
+                  labels of an iterable of batches are provided with the batches.
+        :param nb_samples: Total number of samples of an iterable of batches, required to allocate the output file.
+        :param chunk_size: Number of samples attacked per call of `generate` if `x` is an array. The batches of an
+                           iterable are attacked one by one.
+        :param resume: Whether to resume a previous run writing to `output_path` from its last completed chunk instead
+                       of starting from the first sample.
+        :param kwargs: Additional arguments passed to every call of `generate`.
+        :return: A read-only memory-mapped array holding the adversarial examples.
+        """
+        batches: Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]
+        progress_path = output_path + ".progress.json"
+        nb_completed = 0
+        output: Optional[np.memmap] = None
+
+        if isinstance(x, np.ndarray):
+            nb_samples = len(x)
+            if y is not None and len(y) != nb_samples:
+                raise ValueError("The number of labels `y` must match the number of inputs `x`.")
+        elif nb_samples is None:
+            raise ValueError("The total number of samples `nb_samples` is required for an iterable of batches.")
+        elif y is not None:
+            raise ValueError("The labels `y` of an iterable of batches have to be provided with the batches.")
+        if not isinstance(chunk_size, int) or chunk_size <= 0:
+            raise ValueError("The chunk size `chunk_size` has to be a positive integer.")
+
+        if resume and os.path.exists(progress_path) and os.path.exists(output_path):
+            with open(progress_path, encoding="utf8") as file_:
+                progress = json.load(file_)
+            if progress["nb_samples"] != nb_samples:
+                raise ValueError(
+                    f"The output {output_path} holds {progress['nb_samples']} samples, it cannot be resumed for "
+                    f"{nb_samples} samples."
+                )
+            nb_completed = progress["nb_completed"]
+            output = np.load(output_path, mmap_mode="r+")
+            logger.info("Resuming the attack from sample %d of %d.", nb_completed, nb_samples)
+        elif os.path.exists(progress_path):
+            os.remove(progress_path)
+
+        if isinstance(x, np.ndarray):
+            batches = (
+                (x[i : i + chunk_size], None if y is None else y[i : i + chunk_size])
+                for i in range(nb_completed, nb_samples, chunk_size)
+            )
+            position = nb_completed
+        else:
+            batches = (batch if isinstance(batch, tuple) else (batch, None) for batch in x)
+            position = 0
+
+        for x_batch, y_batch in batches:
+            # Skip the samples completed by a previous run
+            offset = max(nb_completed - position, 0)
+            position += len(x_batch)
+            if offset >= len(x_batch):
+                continue
+            if position > nb_samples:
+                raise ValueError(f"The iterable of batches provides more than `nb_samples={nb_samples}` samples.")
+
+            x_adv = self.generate(
+                np.asarray(x_batch[offset:]), y=None if y_batch is None else np.asarray(y_batch[offset:]), **kwargs
+            )
+            if output is None:
+                output = np.lib.format.open_memmap(
+                    output_path, mode="w+", dtype=x_adv.dtype, shape=(nb_samples,) + x_adv.shape[1:]
+                )
+            output[position - len(x_adv) : position] = x_adv
+            output.flush()
+
+            # Record the progress atomically, so that an interruption never leaves a partial progress file
+            with open(progress_path + ".tmp", "w", encoding="utf8") as file_:
+                json.dump({"nb_samples": nb_samples, "nb_completed": position}, file_)
+            os.replace(progress_path + ".tmp", progress_path)
+
+        if position < nb_samples:
+            logger.warning("The attack stopped after %d of %d samples.", position, nb_samples)
+        if output is None:
+            raise ValueError("No inputs have been provided to attack.")
+        del output
+
+        return np.load(output_path, mmap_mode="r")
+
     @property
     def targeted(self) -> bool:
         """
@@ -135,6 +135,11 @@ class CarliniL2Method(EvasionAttack):
         # clear how their proposed trick ("instead of scaling by 1/2 we scale by 1/2 + eps") works in detail.
         self._tanh_smoother = 0.999999
 
+        # Samples whose loss decreases by less than this relative amount in two consecutive iterations are considered
+        # converged and drop out of the optimization for the current binary search step (similar to "abort early" in
+        # the implementation of the authors):
+        self._convergence_tolerance = 1e-4
+
     def _loss(
         self, x: np.ndarray, x_adv: np.ndarray, target: np.ndarray, c_weight: np.ndarray
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -211,8 +216,11 @@ class CarliniL2Method(EvasionAttack):
                 axis=1,
             )
 
-        loss_gradient = self.estimator.class_gradient(x_adv, label=i_add)
-        loss_gradient -= self.estimator.class_gradient(x_adv, label=i_sub)
+        # Compute the gradients of both logits in a single call to the estimator
+        class_gradients = self.estimator.class_gradient(
+            np.concatenate([x_adv, x_adv]), label=np.concatenate([i_add, i_sub])
+        )
+        loss_gradient = class_gradients[: x_adv.shape[0]] - class_gradients[x_adv.shape[0] :]
         loss_gradient = loss_gradient.reshape(x.shape)
 
         c_mult = c_weight
@@ -226,6 +234,123 @@ class CarliniL2Method(EvasionAttack):
 
         return loss_gradient
 
+    def _loss_candidates(
+        self,
+        x: np.ndarray,
+        x_adv_tanh: np.ndarray,
+        perturbation_tanh: np.ndarray,
+        target: np.ndarray,
+        c_weight: np.ndarray,
+        learning_rates: np.ndarray,
+        clip_min: float,
+        clip_max: float,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the objective function value of several candidate steps per sample in stacked batches of `batch_size`.
+
+        :param x: An array with the original input.
+        :param x_adv_tanh: An array with the adversarial input in tanh space.
+        :param perturbation_tanh: An array with the perturbation in tanh space.
+        :param target: An array with the target class (one-hot encoded).
+        :param c_weight: Weight of the loss term aiming for classification as target.
+        :param learning_rates: An array of shape `(nb_samples, nb_candidates)` with the candidate learning rates.
+        :param clip_min: Minimum clipping value.
+        :param clip_max: Maximum clipping value.
+        :return: A tuple holding the l2 distances and overall losses, each of shape `(nb_samples, nb_candidates)`.
+        """
+        nb_samples, nb_candidates = learning_rates.shape
+        lr_mult = learning_rates.reshape(learning_rates.shape + (1,) * (len(x.shape) - 1))
+        x_adv_candidates_tanh = x_adv_tanh[:, np.newaxis] + lr_mult * perturbation_tanh[:, np.newaxis]
+        x_adv_candidates = tanh_to_original(
+            x_adv_candidates_tanh.reshape((nb_samples * nb_candidates,) + x.shape[1:]), clip_min, clip_max
+        )
+        _, l2dist, loss = self._loss(
+            np.repeat(x, nb_candidates, axis=0),
+            x_adv_candidates,
+            np.repeat(target, nb_candidates, axis=0),
+            np.repeat(c_weight, nb_candidates),
+        )
+        return l2dist.reshape(nb_samples, nb_candidates), loss.reshape(nb_samples, nb_candidates)
+
+    def _line_search(
+        self,
+        x: np.ndarray,
+        x_adv_tanh: np.ndarray,
+        perturbation_tanh: np.ndarray,
+        target: np.ndarray,
+        c_weight: np.ndarray,
+        learning_rate: np.ndarray,
+        loss: np.ndarray,
+        clip_min: float,
+        clip_max: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Perform the line search on the learning rate: first, halve the learning rate until the perturbation actually
+        decreases the loss; if no halving was required, double the learning rate as long as this decreases the loss.
+        All halving steps and all doubling steps are each evaluated in a single stacked forward pass for all samples and
+        the outcome of the sequential search is selected per sample with masks.
+
+        :param x: An array with the original input.
+        :param x_adv_tanh: An array with the adversarial input in tanh space.
+        :param perturbation_tanh: An array with the perturbation in tanh space.
+        :param target: An array with the target class (one-hot encoded).
+        :param c_weight: Weight of the loss term aiming for classification as target.
+        :param learning_rate: An array with the current learning rate of each sample.
+        :param loss: An array with the current loss of each sample.
+        :param clip_min: Minimum clipping value.
+        :param clip_max: Maximum clipping value.
+        :return: A tuple holding the best learning rate (zero if no step decreases the loss), the corresponding loss and
+                 the updated learning rate of each sample.
+        """
+        rows = np.arange(x.shape[0])
+
+        # Halving: the step with learning rate `learning_rate / 2**i` is evaluated if all larger steps did not decrease
+        # the loss
+        halving_lr = learning_rate[:, np.newaxis] / 2.0 ** np.arange(self.max_halving)
+        _, halving_loss = self._loss_candidates(
+            x, x_adv_tanh, perturbation_tanh, target, c_weight, halving_lr, clip_min, clip_max
+        )
+        evaluated = np.ones(halving_loss.shape, dtype=bool)
+        evaluated[:, 1:] = np.cumprod(halving_loss[:, :-1] >= loss[:, np.newaxis], axis=1).astype(bool)
+        nb_halving = np.sum(evaluated, axis=1)
+
+        candidate_loss = np.where(evaluated, halving_loss, np.inf)
+        i_best = np.argmin(candidate_loss, axis=1)
+        improved = candidate_loss[rows, i_best] < loss
+        best_lr = np.where(improved, halving_lr[rows, i_best], 0.0)
+        best_loss = np.where(improved, candidate_loss[rows, i_best], loss)
+        new_learning_rate = learning_rate / 2.0 ** (nb_halving - 1)
+
+        # Doubling: if no halving was required, the step with learning rate `learning_rate * 2**(i + 1)` is evaluated as
+        # long as all smaller steps decreased the loss
+        do_doubling = nb_halving == 1
+        if np.any(do_doubling):
+            rows_doubling = np.arange(int(np.sum(do_doubling)))
+            doubling_lr = learning_rate[do_doubling, np.newaxis] * 2.0 ** np.arange(1, self.max_doubling + 1)
+            _, doubling_loss = self._loss_candidates(
+                x[do_doubling],
+                x_adv_tanh[do_doubling],
+                perturbation_tanh[do_doubling],
+                target[do_doubling],
+                c_weight[do_doubling],
+                doubling_lr,
+                clip_min,
+                clip_max,
+            )
+            previous_loss = np.concatenate([best_loss[do_doubling, np.newaxis], doubling_loss], axis=1)
+            evaluated = np.ones(doubling_loss.shape, dtype=bool)
+            evaluated[:, 1:] = np.cumprod(previous_loss[:, 1:-1] <= previous_loss[:, :-2], axis=1).astype(bool)
+            nb_doubling = np.sum(evaluated, axis=1)
+
+            candidate_loss = np.where(evaluated, doubling_loss, np.inf)
+            i_best = np.argmin(candidate_loss, axis=1)
+            improved = candidate_loss[rows_doubling, i_best] < best_loss[do_doubling]
+            best_lr[do_doubling] = np.where(improved, doubling_lr[rows_doubling, i_best], best_lr[do_doubling])
+            best_loss[do_doubling] = np.where(improved, candidate_loss[rows_doubling, i_best], best_loss[do_doubling])
+            new_learning_rate[do_doubling] = learning_rate[do_doubling] * 2.0 ** (nb_doubling - 1)
+
+        return best_lr, best_loss, new_learning_rate
+
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial samples and return them in an array.
@@ -294,6 +419,8 @@ class CarliniL2Method(EvasionAttack):
                 if nb_active == 0:  # pragma: no cover
                     break
                 learning_rate = self.learning_rate * np.ones(x_batch.shape[0])
+                stalled = np.zeros(x_batch.shape[0], dtype=bool)
+                converged = np.zeros(x_batch.shape[0], dtype=bool)
 
                 # Initialize perturbation in tanh space:
                 x_adv_batch = x_batch.copy()
@@ -320,10 +447,11 @@ class CarliniL2Method(EvasionAttack):
                         best_l2dist[improved_adv] = l2dist[improved_adv]
                         best_x_adv_batch[improved_adv] = x_adv_batch[improved_adv]
 
-                    active = (c_current < self._c_upper_bound) & (learning_rate > 0)
+                    active = (c_current < self._c_upper_bound) & (learning_rate > 0) & ~converged
                     nb_active = int(np.sum(active))
                     logger.debug(
-                        "Number of samples with c_current < _c_upper_bound and learning_rate > 0: %i out of %i",
+                        "Number of not converged samples with c_current < _c_upper_bound and learning_rate > 0: %i out "
+                        "of %i",
                         nb_active,
                         x_batch.shape[0],
                     )
@@ -344,93 +472,24 @@ class CarliniL2Method(EvasionAttack):
                     )
 
                     # perform line search to optimize perturbation
-                    # first, halve the learning rate until perturbation actually decreases the loss:
-                    prev_loss = loss.copy()
-                    best_loss = loss.copy()
-                    best_lr = np.zeros(x_batch.shape[0])
-                    halving = np.zeros(x_batch.shape[0])
-
-                    for i_halve in range(self.max_halving):
-                        logger.debug(
-                            "Perform halving iteration %i out of %i",
-                            i_halve,
-                            self.max_halving,
-                        )
-                        do_halving = loss[active] >= prev_loss[active]
-                        logger.debug(
-                            "Halving to be performed on %i samples",
-                            int(np.sum(do_halving)),
-                        )
-                        if np.sum(do_halving) == 0:
-                            break
-                        active_and_do_halving = active.copy()
-                        active_and_do_halving[active] = do_halving
-
-                        lr_mult = learning_rate[active_and_do_halving]
-                        for _ in range(len(x.shape) - 1):
-                            lr_mult = lr_mult[:, np.newaxis]
-
-                        x_adv1 = x_adv_batch_tanh[active_and_do_halving]
-                        new_x_adv_batch_tanh = x_adv1 + lr_mult * perturbation_tanh[do_halving]
-                        new_x_adv_batch = tanh_to_original(new_x_adv_batch_tanh, clip_min, clip_max)
-                        _, l2dist[active_and_do_halving], loss[active_and_do_halving] = self._loss(
-                            x_batch[active_and_do_halving],
-                            new_x_adv_batch,
-                            y_batch[active_and_do_halving],
-                            c_current[active_and_do_halving],
-                        )
-
-                        logger.debug("New Average Loss: %f", np.mean(loss))
-                        logger.debug("New Average L2Dist: %f", np.mean(l2dist))
-                        logger.debug("New Average Margin Loss: %f", np.mean(loss - l2dist))
-
-                        best_lr[loss < best_loss] = learning_rate[loss < best_loss]
-                        best_loss[loss < best_loss] = loss[loss < best_loss]
-                        learning_rate[active_and_do_halving] /= 2
-                        halving[active_and_do_halving] += 1
-                    learning_rate[active] *= 2
-
-                    # if no halving was actually required, double the learning rate as long as this
-                    # decreases the loss:
-                    for i_double in range(self.max_doubling):
-                        logger.debug(
-                            "Perform doubling iteration %i out of %i",
-                            i_double,
-                            self.max_doubling,
-                        )
-                        do_doubling = (halving[active] == 1) & (loss[active] <= best_loss[active])
-                        logger.debug(
-                            "Doubling to be performed on %i samples",
-                            int(np.sum(do_doubling)),
-                        )
-                        if np.sum(do_doubling) == 0:
-                            break
-                        active_and_do_doubling = active.copy()
-                        active_and_do_doubling[active] = do_doubling
-                        learning_rate[active_and_do_doubling] *= 2
-
-                        lr_mult = learning_rate[active_and_do_doubling]
-                        for _ in range(len(x.shape) - 1):
-                            lr_mult = lr_mult[:, np.newaxis]
-
-                        x_adv2 = x_adv_batch_tanh[active_and_do_doubling]
-                        new_x_adv_batch_tanh = x_adv2 + lr_mult * perturbation_tanh[do_doubling]
-                        new_x_adv_batch = tanh_to_original(new_x_adv_batch_tanh, clip_min, clip_max)
-                        _, l2dist[active_and_do_doubling], loss[active_and_do_doubling] = self._loss(
-                            x_batch[active_and_do_doubling],
-                            new_x_adv_batch,
-                            y_batch[active_and_do_doubling],
-                            c_current[active_and_do_doubling],
-                        )
-                        logger.debug("New Average Loss: %f", np.mean(loss))
-                        logger.debug("New Average L2Dist: %f", np.mean(l2dist))
-                        logger.debug("New Average Margin Loss: %f", np.mean(loss - l2dist))
-                        best_lr[loss < best_loss] = learning_rate[loss < best_loss]
-                        best_loss[loss < best_loss] = loss[loss < best_loss]
-
-                    learning_rate[halving == 1] /= 2
+                    prev_loss = loss[active]
+                    best_lr, best_loss, learning_rate[active] = self._line_search(
+                        x_batch[active],
+                        x_adv_batch_tanh[active],
+                        perturbation_tanh,
+                        y_batch[active],
+                        c_current[active],
+                        learning_rate[active],
+                        prev_loss,
+                        clip_min,
+                        clip_max,
+                    )
+                    logger.debug("New Average Loss: %f", np.mean(best_loss))
+                    stalled_active = best_loss >= (1 - self._convergence_tolerance) * prev_loss
+                    converged[active] = stalled[active] & stalled_active
+                    stalled[active] = stalled_active
 
-                    update_adv = best_lr[active] > 0
+                    update_adv = best_lr > 0
                     logger.debug(
                         "Number of adversarial samples to be finally updated: %i",
                         int(np.sum(update_adv)),
@@ -439,7 +498,7 @@ class CarliniL2Method(EvasionAttack):
                     if np.sum(update_adv) > 0:
                         active_and_update_adv = active.copy()
                         active_and_update_adv[active] = update_adv
-                        best_lr_mult = best_lr[active_and_update_adv]
+                        best_lr_mult = best_lr[update_adv]
                         for _ in range(len(x.shape) - 1):
                             best_lr_mult = best_lr_mult[:, np.newaxis]
 
@@ -592,8 +651,8 @@ class CarliniLInfMethod(EvasionAttack):
         :param target: An array with the target class (one-hot encoded).
         :param x: Benign samples.
         :param  const: Current constant `c`.
-        :param tau: Current limit `tau`.
-        :return: A tuple of current predictions, total loss, logits loss and regularisation loss.
+        :param tau: Current limit `tau`, either a scalar or broadcastable per sample.
+        :return: A tuple of current predictions, total loss, logits loss and regularisation loss of each sample.
         """
         z_predicted = self.estimator.predict(np.array(x_adv, dtype=ART_NUMPY_DTYPE), batch_size=self.batch_size)
         z_target = np.sum(z_predicted * target, axis=1)
@@ -609,7 +668,7 @@ class CarliniLInfMethod(EvasionAttack):
             # if untargeted, optimize for making any other class most likely
             loss_1 = np.maximum(z_target - z_other + self.confidence, np.zeros(x_adv.shape[0]))
 
-        loss_2 = np.sum(np.maximum(0.0, np.abs(x_adv - x) - tau))
+        loss_2 = np.sum(np.maximum(0.0, np.abs(x_adv - x) - tau).reshape(x_adv.shape[0], -1), axis=1)
 
         loss = loss_1 * const + loss_2
 
@@ -636,7 +695,7 @@ class CarliniLInfMethod(EvasionAttack):
         :param clip_min: Minimum clipping values.
         :param clip_max: Maximum clipping values.
         :param x: Benign samples.
-        :param tau: Current limit `tau`.
+        :param tau: Current limit `tau`, either a scalar or broadcastable per sample.
         :return: An array with the gradient of the loss function.
         """
         if self.targeted:
@@ -652,8 +711,11 @@ class CarliniLInfMethod(EvasionAttack):
                 axis=1,
             )
 
-        loss_gradient = self.estimator.class_gradient(x_adv, label=i_add)
-        loss_gradient -= self.estimator.class_gradient(x_adv, label=i_sub)
+        # Compute the gradients of both logits in a single call to the estimator
+        class_gradients = self.estimator.class_gradient(
+            np.concatenate([x_adv, x_adv]), label=np.concatenate([i_add, i_sub])
+        )
+        loss_gradient = class_gradients[: x_adv.shape[0]] - class_gradients[x_adv.shape[0] :]
         loss_gradient = loss_gradient.reshape(x_adv.shape)
 
         loss_gradient_2 = np.sign(np.maximum(0.0, np.abs(x_adv - x) - tau)) * np.sign(x_adv - x)
@@ -667,22 +729,23 @@ class CarliniLInfMethod(EvasionAttack):
 
         return loss_gradient
 
-    def _generate_single(self, x_batch, y_batch, clip_min, clip_max, const, tau):
+    def _generate_batch(self, x_batch, y_batch, clip_min, clip_max, const, tau):
         """
-        Generate a single adversarial example.
+        Generate a batch of adversarial examples for the current constant `c`.
 
-        :param x_batch: Current benign sample.
-        :param y_batch: Current label.
+        :param x_batch: Current benign samples.
+        :param y_batch: Current labels.
         :param clip_min: Minimum clipping values.
         :param clip_max: Maximum clipping values.
         :param  const: Current constant `c`.
-        :param tau: Current limit `tau`.
+        :param tau: Current limit `tau` of each sample.
         """
+        tau = tau.reshape((-1,) + (1,) * (len(x_batch.shape) - 1))
 
         # The optimization is performed in tanh space to keep the adversarial images bounded from clip_min and clip_max.
         x_adv_batch_tanh = original_to_tanh(x_batch, clip_min, clip_max, self._tanh_smoother)
 
-        def func(x_i):
+        def func(x_i, index):
             x_adv_batch_tanh = x_i
 
             x_adv_batch = tanh_to_original(
@@ -691,11 +754,11 @@ class CarliniLInfMethod(EvasionAttack):
                 clip_max,
             )
 
-            _, loss, _, _ = self._loss(x_adv_batch, y_batch, x_batch, const, tau)
+            _, loss, _, _ = self._loss(x_adv_batch, y_batch[index], x_batch[index], const, tau[index])
 
             return loss
 
-        def func_der(x_i):
+        def func_der(x_i, index):
             x_adv_batch_tanh = x_i
 
             x_adv_batch = tanh_to_original(
@@ -704,17 +767,17 @@ class CarliniLInfMethod(EvasionAttack):
                 clip_max,
             )
 
-            z_logits, _, _, _ = self._loss(x_adv_batch, y_batch, x_batch, const, tau)
+            z_logits, _, _, _ = self._loss(x_adv_batch, y_batch[index], x_batch[index], const, tau[index])
 
             perturbation_tanh = self._loss_gradient(
                 z_logits,
-                y_batch,
+                y_batch[index],
                 x_adv_batch,
                 x_adv_batch_tanh,
                 clip_min,
                 clip_max,
-                x_batch,
-                tau,
+                x_batch[index],
+                tau[index],
             )
 
             return perturbation_tanh
@@ -722,7 +785,9 @@ class CarliniLInfMethod(EvasionAttack):
         x_0 = x_adv_batch_tanh.copy()
 
         adam = Adam(alpha=self.learning_rate, beta_1=0.9, beta_2=0.999, epsilon=1e-8)
-        x_adv_batch_tanh = adam.optimize(func=func, jac=func_der, x_0=x_0, max_iter=self.max_iter, loss_converged=0.001)
+        x_adv_batch_tanh = adam.optimize_batch(
+            func=func, jac=func_der, x_0=x_0, max_iter=self.max_iter, loss_converged=0.001
+        )
 
         x_adv_batch = tanh_to_original(
             x_adv_batch_tanh,
@@ -765,54 +830,69 @@ class CarliniLInfMethod(EvasionAttack):
             )
 
         # Compute perturbation with implicit batching
-        for sample_id in trange(x.shape[0], desc="C&W L_inf", disable=not self.verbose):
+        nb_batches = int(np.ceil(x_adv.shape[0] / float(self.batch_size)))
+        for batch_id in trange(nb_batches, desc="C&W L_inf", disable=not self.verbose):
+            batch_index_1, batch_index_2 = batch_id * self.batch_size, (batch_id + 1) * self.batch_size
+            x_batch = x[batch_index_1:batch_index_2]
+            y_batch = y[batch_index_1:batch_index_2]
+            x_adv_batch = x_adv[batch_index_1:batch_index_2]
 
-            sample_done = False
-            tau = 1.0
-            delta_i_best = 1.0
-            while tau > 1.0 / 256.0 and not sample_done:
+            # Samples drop out of the search once no smaller perturbation has been found for the current limit `tau`
+            tau = np.ones(x_batch.shape[0])
+            delta_i_best = np.ones(x_batch.shape[0])
+            sample_done = np.zeros(x_batch.shape[0], dtype=bool)
+            active = (tau > 1.0 / 256.0) & ~sample_done
 
-                sample_done = True
+            while np.any(active):
+
+                active_ids = np.where(active)[0]
+                sample_done[active_ids] = True
 
                 const = self.initial_const
                 while const < self.largest_const:
 
-                    x_batch = x[[sample_id]]
-                    y_batch = y[[sample_id]]
-
-                    x_adv_batch = self._generate_single(x_batch, y_batch, clip_min, clip_max, const=const, tau=tau)
+                    x_adv_active = self._generate_batch(
+                        x_batch[active_ids], y_batch[active_ids], clip_min, clip_max, const=const, tau=tau[active_ids]
+                    )
 
                     # Update depending on attack success:
-                    _, loss, loss_1, loss_2 = self._loss(x_adv_batch, y_batch, x_batch, const, tau)
+                    _, loss, loss_1, loss_2 = self._loss(
+                        x_adv_active,
+                        y_batch[active_ids],
+                        x_batch[active_ids],
+                        const,
+                        tau[active_ids].reshape((-1,) + (1,) * (len(x.shape) - 1)),
+                    )
 
-                    delta_i = np.max(np.abs(x_adv_batch - x[sample_id]))
+                    delta_i = np.max(np.abs(x_adv_active - x_batch[active_ids]).reshape(len(active_ids), -1), axis=1)
 
                     logger.debug(
                         "tau: %4.3f, const: %4.5f, loss: %4.3f, loss_1: %4.3f, loss_2: %4.3f, delta_i: %4.3f",
-                        tau,
+                        np.mean(tau[active_ids]),
                         const,
-                        loss,
-                        loss_1,
-                        loss_2,
-                        delta_i,
+                        np.mean(loss),
+                        np.mean(loss_1),
+                        np.mean(loss_2),
+                        np.mean(delta_i),
                     )
 
-                    if (
-                        np.argmax(self.estimator.predict(x_adv_batch), axis=1) != np.argmax(y_batch, axis=1)
-                        and delta_i < delta_i_best
-                    ):
-                        x_adv[sample_id] = x_adv_batch
-                        delta_i_best = delta_i
-                        sample_done = False
+                    improved = (
+                        np.argmax(self.estimator.predict(x_adv_active, batch_size=self.batch_size), axis=1)
+                        != np.argmax(y_batch[active_ids], axis=1)
+                    ) & (delta_i < delta_i_best[active_ids])
+                    improved_ids = active_ids[improved]
+                    x_adv_batch[improved_ids] = x_adv_active[improved]
+                    delta_i_best[improved_ids] = delta_i[improved]
+                    sample_done[improved_ids] = False
 
                     const *= self.const_factor
 
-                tau_actual = np.max(np.abs(x_adv[sample_id] - x[sample_id]))
-
-                if tau_actual < tau:
-                    tau = tau_actual
+                tau_actual = np.max(
+                    np.abs(x_adv_batch[active_ids] - x_batch[active_ids]).reshape(len(active_ids), -1), axis=1
+                )
+                tau[active_ids] = np.minimum(tau[active_ids], tau_actual) * self.decrease_factor
 
-                tau *= self.decrease_factor
+                active = (tau > 1.0 / 256.0) & ~sample_done
 
         return x_adv
 
@@ -936,6 +1016,11 @@ class CarliniL0Method(CarliniL2Method):
         # clear how their proposed trick ("instead of scaling by 1/2 we scale by 1/2 + eps") works in detail.
         self._tanh_smoother = 0.999999
 
+        # Samples whose loss decreases by less than this relative amount in two consecutive iterations are considered
+        # converged and drop out of the optimization for the current binary search step (similar to "abort early" in
+        # the implementation of the authors):
+        self._convergence_tolerance = 1e-4
+
         # The tanh transformation does not always map inputs back to their original values event if they are unmodified
         # To overcome this problem, we set a threshold of minimal difference considered as perturbation
         # Below this threshold, a difference between values is considered as tanh transformation difference.
@@ -1033,6 +1118,8 @@ class CarliniL0Method(CarliniL2Method):
                     if nb_active == 0:
                         break
                     learning_rate = self.learning_rate * np.ones(x_batch.shape[0])
+                    stalled = np.zeros(x_batch.shape[0], dtype=bool)
+                    converged = np.zeros(x_batch.shape[0], dtype=bool)
 
                     # Initialize perturbation in tanh space:
                     x_adv_batch = x_batch.copy()
@@ -1062,10 +1149,11 @@ class CarliniL0Method(CarliniL2Method):
                             best_l0dist_batch[improved_adv] = l0dist[improved_adv]
                             best_x_adv_batch[improved_adv] = x_adv_batch[improved_adv]
 
-                        active = (c_current < self._c_upper_bound) & (learning_rate > 0)
+                        active = (c_current < self._c_upper_bound) & (learning_rate > 0) & ~converged
                         nb_active = int(np.sum(active))
                         logger.debug(
-                            "Number of samples with c_current < _c_upper_bound and learning_rate > 0: %i out of %i",
+                            "Number of not converged samples with c_current < _c_upper_bound and learning_rate > 0: %i "
+                            "out of %i",
                             nb_active,
                             x_batch.shape[0],
                         )
@@ -1084,99 +1172,39 @@ class CarliniL0Method(CarliniL2Method):
                             clip_min,
                             clip_max,
                         )
+                        perturbation_tanh *= activation_batch[active]
 
                         # perform line search to optimize perturbation
-                        # first, halve the learning rate until perturbation actually decreases the loss:
-                        prev_loss = loss.copy()
-                        best_loss = loss.copy()
-                        best_lr = np.zeros(x_batch.shape[0])
-                        halving = np.zeros(x_batch.shape[0])
-
-                        for i_halve in range(self.max_halving):
-                            logger.debug("Perform halving iteration %i out of %i", i_halve, self.max_halving)
-                            do_halving = loss[active] >= prev_loss[active]
-                            logger.debug("Halving to be performed on %i samples", int(np.sum(do_halving)))
-                            if np.sum(do_halving) == 0:
-                                break
-                            active_and_do_halving = active.copy()
-                            active_and_do_halving[active] = do_halving
-
-                            lr_mult = learning_rate[active_and_do_halving]
-                            for _ in range(len(x.shape) - 1):
-                                lr_mult = lr_mult[:, np.newaxis]
-
-                            x_adv1 = x_adv_batch_tanh[active_and_do_halving]
-                            new_x_adv_batch_tanh = (
-                                x_adv1 + lr_mult * perturbation_tanh[do_halving] * activation_batch[do_halving]
-                            )
-                            new_x_adv_batch = tanh_to_original(new_x_adv_batch_tanh, clip_min, clip_max)
-                            _, l2dist[active_and_do_halving], loss[active_and_do_halving] = self._loss(
-                                x_batch[active_and_do_halving],
-                                new_x_adv_batch,
-                                y_batch[active_and_do_halving],
-                                c_current[active_and_do_halving],
-                            )
-
-                            logger.debug("New Average Loss: %f", np.mean(loss))
-                            logger.debug("New Average L2Dist: %f", np.mean(l2dist))
-                            logger.debug("New Average Margin Loss: %f", np.mean(loss - l2dist))
-
-                            best_lr[loss < best_loss] = learning_rate[loss < best_loss]
-                            best_loss[loss < best_loss] = loss[loss < best_loss]
-                            learning_rate[active_and_do_halving] /= 2
-                            halving[active_and_do_halving] += 1
-                        learning_rate[active] *= 2
-
-                        # if no halving was actually required, double the learning rate as long as this
-                        # decreases the loss:
-                        for i_double in range(self.max_doubling):
-                            logger.debug("Perform doubling iteration %i out of %i", i_double, self.max_doubling)
-                            do_doubling = (halving[active] == 1) & (loss[active] <= best_loss[active])
-                            logger.debug("Doubling to be performed on %i samples", int(np.sum(do_doubling)))
-                            if np.sum(do_doubling) == 0:  # pragma: no cover
-                                break
-                            active_and_do_doubling = active.copy()
-                            active_and_do_doubling[active] = do_doubling
-                            learning_rate[active_and_do_doubling] *= 2
-
-                            lr_mult = learning_rate[active_and_do_doubling]
-                            for _ in range(len(x.shape) - 1):
-                                lr_mult = lr_mult[:, np.newaxis]
-
-                            x_adv2 = x_adv_batch_tanh[active_and_do_doubling]
-                            new_x_adv_batch_tanh = (
-                                x_adv2 + lr_mult * perturbation_tanh[do_doubling] * activation_batch[do_doubling]
-                            )
-                            new_x_adv_batch = tanh_to_original(new_x_adv_batch_tanh, clip_min, clip_max)
-                            _, l2dist[active_and_do_doubling], loss[active_and_do_doubling] = self._loss(
-                                x_batch[active_and_do_doubling],
-                                new_x_adv_batch,
-                                y_batch[active_and_do_doubling],
-                                c_current[active_and_do_doubling],
-                            )
-                            logger.debug("New Average Loss: %f", np.mean(loss))
-                            logger.debug("New Average L2Dist: %f", np.mean(l2dist))
-                            logger.debug("New Average Margin Loss: %f", np.mean(loss - l2dist))
-                            best_lr[loss < best_loss] = learning_rate[loss < best_loss]
-                            best_loss[loss < best_loss] = loss[loss < best_loss]
-
-                        learning_rate[halving == 1] /= 2
+                        prev_loss = loss[active]
+                        best_lr, best_loss, learning_rate[active] = self._line_search(
+                            x_batch[active],
+                            x_adv_batch_tanh[active],
+                            perturbation_tanh,
+                            y_batch[active],
+                            c_current[active],
+                            learning_rate[active],
+                            prev_loss,
+                            clip_min,
+                            clip_max,
+                        )
+                        logger.debug("New Average Loss: %f", np.mean(best_loss))
+                        stalled_active = best_loss >= (1 - self._convergence_tolerance) * prev_loss
+                        converged[active] = stalled[active] & stalled_active
+                        stalled[active] = stalled_active
 
-                        update_adv = best_lr[active] > 0
+                        update_adv = best_lr > 0
                         logger.debug("Number of adversarial samples to be finally updated: %i", int(np.sum(update_adv)))
 
                         if np.sum(update_adv) > 0:
                             active_and_update_adv = active.copy()
                             active_and_update_adv[active] = update_adv
-                            best_lr_mult = best_lr[active_and_update_adv]
+                            best_lr_mult = best_lr[update_adv]
                             for _ in range(len(x.shape) - 1):
                                 best_lr_mult = best_lr_mult[:, np.newaxis]
 
                             x_adv4 = x_adv_batch_tanh[active_and_update_adv]
                             best_lr1 = best_lr_mult * perturbation_tanh[update_adv]
-                            x_adv_batch_tanh[active_and_update_adv] = (
-                                x_adv4 + best_lr1 * activation_batch[active_and_update_adv]
-                            )
+                            x_adv_batch_tanh[active_and_update_adv] = x_adv4 + best_lr1
 
                             x_adv6 = x_adv_batch_tanh[active_and_update_adv]
                             x_adv_batch[active_and_update_adv] = tanh_to_original(x_adv6, clip_min, clip_max)
@@ -21,13 +21,17 @@ This module implements attacks on Decision Trees.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import logging
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
-from tqdm.auto import trange
+from tqdm.auto import tqdm
 
 from art.attacks.attack import EvasionAttack
-from art.estimators.classification.scikitlearn import ScikitlearnDecisionTreeClassifier
+from art.estimators.classification.scikitlearn import (
+    ScikitlearnDecisionTreeClassifier,
+    ScikitlearnExtraTreesClassifier,
+    ScikitlearnRandomForestClassifier,
+)
 from art.utils import check_and_transform_label_format
 
 logger = logging.getLogger(__name__)
@@ -36,22 +40,28 @@ logger = logging.getLogger(__name__)
 class DecisionTreeAttack(EvasionAttack):
     """
     Close implementation of Papernot's attack on decision trees following Algorithm 2 and communication with the
-    authors.
+    authors. The attack works directly on the arrays of the fitted scikit-learn trees and crafts a whole batch of
+    samples at once. Ensembles of trees are attacked by applying the attack to their trees one after the other until
+    the prediction of the ensemble changes.
 
     | Paper link: https://arxiv.org/abs/1605.07277
     """
 
     attack_params = ["classifier", "offset", "verbose"]
-    _estimator_requirements = (ScikitlearnDecisionTreeClassifier,)
+    _estimator_requirements = (
+        (ScikitlearnDecisionTreeClassifier, ScikitlearnExtraTreesClassifier, ScikitlearnRandomForestClassifier),
+    )
 
     def __init__(
         self,
-        classifier: ScikitlearnDecisionTreeClassifier,
+        classifier: Union[
+            ScikitlearnDecisionTreeClassifier, ScikitlearnExtraTreesClassifier, ScikitlearnRandomForestClassifier
+        ],
         offset: float = 0.001,
         verbose: bool = True,
     ) -> None:
         """
-        :param classifier: A trained scikit-learn decision tree model.
+        :param classifier: A trained scikit-learn decision tree, extra trees or random forest model.
         :param offset: How much the value is pushed away from tree's threshold.
         :param verbose: Show progress bars.
         """
@@ -60,51 +70,6 @@ class DecisionTreeAttack(EvasionAttack):
         self.verbose = verbose
         self._check_params()
 
-    def _df_subtree(
-        self,
-        position: int,
-        original_class: Union[int, np.ndarray],
-        target: Optional[int] = None,
-    ) -> List[int]:
-        """
-        Search a decision tree for a mis-classifying instance.
-
-        :param position: An array with the original inputs to be attacked.
-        :param original_class: original label for the instances we are searching mis-classification for.
-        :param target: If the provided, specifies which output the leaf has to have to be accepted.
-        :return: An array specifying the path to the leaf where the classification is either != original class or
-                 ==target class if provided.
-        """
-        # base case, we're at a leaf
-        if self.estimator.get_left_child(position) == self.estimator.get_right_child(position):
-            if target is None:  # untargeted case
-                if self.estimator.get_classes_at_node(position) != original_class:
-                    path = [position]
-                else:
-                    path = [-1]
-            else:  # targeted case
-                if self.estimator.get_classes_at_node(position) == target:
-                    path = [position]
-                else:
-                    path = [-1]
-        else:  # go deeper, depths first
-            res = self._df_subtree(self.estimator.get_left_child(position), original_class, target)
-            if res[0] == -1:
-                # no result, try right subtree
-                res = self._df_subtree(self.estimator.get_right_child(position), original_class, target)
-                if res[0] == -1:
-                    # no desired result
-                    path = [-1]
-                else:
-                    res.append(position)
-                    path = res
-            else:
-                # done, it is returning a path
-                res.append(position)
-                path = res
-
-        return path
-
     def generate(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> np.ndarray:
         """
         Generate adversarial examples and return them as an array.
@@ -116,52 +81,170 @@ class DecisionTreeAttack(EvasionAttack):
         """
         if y is not None:
             y = check_and_transform_label_format(y, nb_classes=self.estimator.nb_classes, return_one_hot=False)
+            y = y.reshape(-1)
         x_adv = x.copy()
+        legitimate_classes = np.argmax(self.estimator.predict(x), axis=1)
+
+        if isinstance(self.estimator, ScikitlearnDecisionTreeClassifier):
+            trees = [self.estimator.model.tree_]
+        else:
+            trees = [estimator.tree_ for estimator in self.estimator.model.estimators_]
+
+        active = np.arange(x.shape[0])
+        for tree in tqdm(trees, desc="Decision tree attack", disable=not self.verbose):
+            if active.size == 0:
+                break
+
+            x_adv[active] = self._attack_tree(
+                tree, x_adv[active], legitimate_classes[active], None if y is None else y[active]
+            )
+
+            if len(trees) > 1:
+                # keep attacking the samples which do not yet fool the ensemble
+                y_adv = np.argmax(self.estimator.predict(x_adv[active]), axis=1)
+                if y is None:
+                    is_adversarial = y_adv != legitimate_classes[active]
+                else:
+                    is_adversarial = y_adv == y[active]
+                active = active[~is_adversarial]
 
-        for index in trange(x_adv.shape[0], desc="Decision tree attack", disable=not self.verbose):
-            path = self.estimator.get_decision_path(x_adv[index])
-            legitimate_class = int(np.argmax(self.estimator.predict(x_adv[index].reshape(1, -1))))
-            position = -2
-            adv_path = [-1]
-            ancestor = path[position]
-            while np.abs(position) < (len(path) - 1) or adv_path[0] == -1:
-                ancestor = path[position]
-                current_child = path[position + 1]
-                # search in right subtree
-                if current_child == self.estimator.get_left_child(ancestor):
-                    if y is None:
-                        adv_path = self._df_subtree(self.estimator.get_right_child(ancestor), legitimate_class)
-                    else:
-                        adv_path = self._df_subtree(
-                            self.estimator.get_right_child(ancestor),
-                            legitimate_class,
-                            y[index],
-                        )
-                else:  # search in left subtree
-                    if y is None:
-                        adv_path = self._df_subtree(self.estimator.get_left_child(ancestor), legitimate_class)
-                    else:
-                        adv_path = self._df_subtree(
-                            self.estimator.get_left_child(ancestor),
-                            legitimate_class,
-                            y[index],
-                        )
-                position = position - 1  # we are going the decision path upwards
-            adv_path.append(ancestor)
-            # we figured out which is the way to the target, now perturb
-            # first one is leaf-> no threshold, cannot be perturbed
-            for i in range(1, 1 + len(adv_path[1:])):
-                go_for = adv_path[i - 1]
-                threshold = self.estimator.get_threshold_at_node(adv_path[i])
-                feature = self.estimator.get_feature_at_node(adv_path[i])
-                # only perturb if the feature is actually wrong
-                if x_adv[index][feature] > threshold and go_for == self.estimator.get_left_child(adv_path[i]):
-                    x_adv[index][feature] = threshold - self.offset
-                elif x_adv[index][feature] <= threshold and go_for == self.estimator.get_right_child(adv_path[i]):
-                    x_adv[index][feature] = threshold + self.offset
+        return x_adv
+
+    def _attack_tree(
+        self, tree, x: np.ndarray, legitimate_classes: np.ndarray, target: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Perturb a batch of samples to reach a mis-classifying leaf of a single tree.
+
+        For every ancestor on the decision path of a sample, the first leaf in depth-first order of the subtree that is
+        not followed by the sample is a candidate. As in the original implementation, the ancestors at depth two, one
+        and zero are tried first in this order, the deeper ancestors are tried afterwards from the top down. The sample
+        is then moved along the path from the chosen ancestor to the candidate leaf.
+
+        :param tree: The `tree_` attribute of a fitted scikit-learn decision tree.
+        :param x: An array with the inputs to be attacked.
+        :param legitimate_classes: Original labels for the instances we are searching mis-classification for.
+        :param target: If provided, specifies which class the leaf has to have to be accepted.
+        :return: An array holding the perturbed inputs.
+        """
+        children_left = tree.children_left
+        children_right = tree.children_right
+        feature = tree.feature
+        threshold = tree.threshold
+        leaf_classes = np.argmax(tree.value.reshape(tree.node_count, -1), axis=1)
+        parents, levels = self._get_tree_structure(children_left, children_right)
+
+        classes = np.arange(self.estimator.nb_classes)
+        if target is None:
+            is_valid = leaf_classes[:, np.newaxis] != classes
+            search_classes = legitimate_classes
+        else:
+            is_valid = leaf_classes[:, np.newaxis] == classes
+            search_classes = target
+        first_leaves = self._get_first_leaves(children_left, children_right, levels, is_valid)
+
+        # follow the decision paths of all samples, scikit-learn compares the features in single precision
+        x_tree = x.astype(np.float32)
+        rows = np.arange(x.shape[0])
+        nodes = np.zeros(x.shape[0], dtype=np.intp)
+        ancestors: List[np.ndarray] = []
+        candidates: List[np.ndarray] = []
+        while True:
+            is_internal = children_left[nodes] != -1
+            if not is_internal.any():
+                break
+            features = np.where(is_internal, feature[nodes], 0)
+            go_left = x_tree[rows, features] <= threshold[nodes]
+            siblings = np.where(go_left, children_right[nodes], children_left[nodes])
+            ancestors.append(nodes)
+            candidates.append(np.where(is_internal, first_leaves[siblings, search_classes], -1))
+            nodes = np.where(is_internal, np.where(go_left, children_left[nodes], children_right[nodes]), nodes)
+
+        if target is None:
+            is_satisfied = leaf_classes[nodes] != legitimate_classes
+        else:
+            is_satisfied = leaf_classes[nodes] == target
+
+        depth_order = [2, 1, 0] + list(range(3, len(ancestors)))
+        chosen_leaves = np.full(x.shape[0], -1, dtype=np.intp)
+        chosen_ancestors = np.full(x.shape[0], -1, dtype=np.intp)
+        for depth in reversed(depth_order):
+            if depth >= len(ancestors):
+                continue
+            is_found = candidates[depth] != -1
+            chosen_leaves = np.where(is_found, candidates[depth], chosen_leaves)
+            chosen_ancestors = np.where(is_found, ancestors[depth], chosen_ancestors)
+
+        is_failed = (chosen_leaves == -1) & ~is_satisfied
+        if is_failed.any():
+            logger.warning("No mis-classifying leaf found for %d sample(s) in the current tree.", np.sum(is_failed))
+
+        # move up from the chosen leaf to the ancestor and perturb the features that do not lead to the leaf
+        x_adv = x.copy()
+        indices = np.where((chosen_leaves != -1) & ~is_satisfied)[0]
+        children = chosen_leaves[indices]
+        stop_nodes = chosen_ancestors[indices]
+        while indices.size > 0:
+            nodes = parents[children]
+            features = feature[nodes]
+            thresholds = threshold[nodes]
+            values = x_adv[indices, features]
+
+            to_left = (children == children_left[nodes]) & (values > thresholds)
+            x_adv[indices[to_left], features[to_left]] = thresholds[to_left] - self.offset
+            to_right = (children == children_right[nodes]) & (values <= thresholds)
+            x_adv[indices[to_right], features[to_right]] = thresholds[to_right] + self.offset
+
+            is_pending = nodes != stop_nodes
+            indices = indices[is_pending]
+            children = nodes[is_pending]
+            stop_nodes = stop_nodes[is_pending]
 
         return x_adv
 
+    @staticmethod
+    def _get_tree_structure(
+        children_left: np.ndarray, children_right: np.ndarray
+    ) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """
+        Compute the parent of every node and the nodes at every depth of a tree.
+
+        :param children_left: Left child of every node, -1 for leaves.
+        :param children_right: Right child of every node, -1 for leaves.
+        :return: Tuple of the parent of every node (-1 for the root) and the list of the nodes at every depth.
+        """
+        parents = np.full(len(children_left), -1, dtype=np.intp)
+        levels = []
+        nodes = np.zeros(1, dtype=np.intp)
+        while nodes.size > 0:
+            levels.append(nodes)
+            nodes = nodes[children_left[nodes] != -1]
+            parents[children_left[nodes]] = nodes
+            parents[children_right[nodes]] = nodes
+            nodes = np.concatenate([children_left[nodes], children_right[nodes]])
+        return parents, levels
+
+    @staticmethod
+    def _get_first_leaves(
+        children_left: np.ndarray, children_right: np.ndarray, levels: List[np.ndarray], is_valid: np.ndarray
+    ) -> np.ndarray:
+        """
+        Find for every node and class the first accepted leaf of the subtree of the node in depth-first order, visiting
+        the left child first.
+
+        :param children_left: Left child of every node, -1 for leaves.
+        :param children_right: Right child of every node, -1 for leaves.
+        :param levels: The nodes at every depth of the tree.
+        :param is_valid: Boolean array of shape `(nb_nodes, nb_classes)`, if a leaf is accepted for a class.
+        :return: Array of shape `(nb_nodes, nb_classes)` with the first accepted leaf, or -1 if there is none.
+        """
+        first_leaves = np.where(is_valid, np.arange(len(children_left))[:, np.newaxis], -1)
+        for nodes in reversed(levels):
+            nodes = nodes[children_left[nodes] != -1]
+            left_leaves = first_leaves[children_left[nodes]]
+            first_leaves[nodes] = np.where(left_leaves != -1, left_leaves, first_leaves[children_right[nodes]])
+        return first_leaves
+
     def _check_params(self) -> None:
 
         if self.offset <= 0:
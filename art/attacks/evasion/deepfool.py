@@ -31,6 +31,8 @@ from tqdm.auto import trange
 from art.config import ART_NUMPY_DTYPE
 from art.estimators.estimator import BaseEstimator
 from art.estimators.classification.classifier import ClassGradientsMixin
+from art.estimators.classification.pytorch import PyTorchClassifier
+from art.estimators.classification.tensorflow import TensorFlowV2Classifier
 from art.attacks.attack import EvasionAttack
 from art.utils import is_probability
 
@@ -71,8 +73,9 @@ class DeepFool(EvasionAttack):
         :param classifier: A trained classifier.
         :param max_iter: The maximum number of iterations.
         :param epsilon: Overshoot parameter.
-        :param nb_grads: The number of class gradients (top nb_grads w.r.t. prediction) to compute. This way only the
-                         most likely classes are considered, speeding up the computation.
+        :param nb_grads: The number of class gradients (top nb_grads w.r.t. prediction of each sample, including the
+                         predicted class) to compute. This way only the most likely classes are considered, speeding
+                         up the computation. At least the two most likely classes are considered.
         :param batch_size: Batch size
         :param verbose: Show progress bars.
         """
@@ -112,15 +115,8 @@ class DeepFool(EvasionAttack):
                 "to achieve its full attack strength."
             )
 
-        # Determine the class labels for which to compute the gradients
-        use_grads_subset = self.nb_grads < self.estimator.nb_classes
-        if use_grads_subset:
-            # TODO compute set of unique labels per batch
-            grad_labels = np.argsort(-preds, axis=1)[:, : self.nb_grads]
-            labels_set = np.unique(grad_labels)
-        else:
-            labels_set = np.arange(self.estimator.nb_classes)
-        sorter = np.arange(len(labels_set))
+        # Number of most likely classes (including the predicted one) for which to compute the gradients
+        nb_grads = min(max(self.nb_grads, 2), self.estimator.nb_classes)
 
         # Pick a small scalar to avoid division by 0
         tol = 10e-8
@@ -132,30 +128,26 @@ class DeepFool(EvasionAttack):
             batch_index_1, batch_index_2 = batch_id * self.batch_size, (batch_id + 1) * self.batch_size
             batch = x_adv[batch_index_1:batch_index_2].copy()
 
-            # Get predictions and gradients for batch
+            # Get predictions and the top predicted classes of each sample, the first being the predicted class
             f_batch = preds[batch_index_1:batch_index_2]
             fk_hat = np.argmax(f_batch, axis=1)
-            if use_grads_subset:
-                # Compute gradients only for top predicted classes
-                grd = np.array([self.estimator.class_gradient(batch, label=int(label_i)) for label_i in labels_set])
-                grd = np.squeeze(np.swapaxes(grd, 0, 2), axis=0)
-            else:
-                # Compute gradients for all classes
-                grd = self.estimator.class_gradient(batch)
-
-            # Get current predictions
+            labels = np.argsort(-f_batch, axis=1, kind="stable")[:, :nb_grads]
+
+            # Only samples which have not yet crossed the decision boundary are processed
             active_indices = np.arange(len(batch))
             current_step = 0
             while active_indices.size > 0 and current_step < self.max_iter:
-                # Compute difference in predictions and gradients only for selected top predictions
-                labels_indices = sorter[np.searchsorted(labels_set, fk_hat, sorter=sorter)]
-                grad_diff = grd - grd[np.arange(len(grd)), labels_indices][:, None]
-                f_diff = f_batch[:, labels_set] - f_batch[np.arange(len(f_batch)), labels_indices][:, None]
+                # Compute difference in predictions and gradients only for the top predicted classes
+                labels_active = labels[active_indices]
+                grd = self._class_gradient_top_k(batch[active_indices], labels_active)
+                f_k = np.take_along_axis(f_batch, labels_active, axis=1)
+                grad_diff = grd - grd[:, :1]
+                f_diff = f_k - f_k[:, :1]
 
                 # Choose coordinate and compute perturbation
-                norm = np.linalg.norm(grad_diff.reshape(len(grad_diff), len(labels_set), -1), axis=2) + tol
+                norm = np.linalg.norm(grad_diff.reshape(len(grad_diff), nb_grads, -1), axis=2) + tol
                 value = np.abs(f_diff) / norm
-                value[np.arange(len(value)), labels_indices] = np.inf
+                value[:, 0] = np.inf
                 l_var = np.argmin(value, axis=1)
                 absolute1 = abs(f_diff[np.arange(len(f_diff)), l_var])
                 draddiff = grad_diff[np.arange(len(grad_diff)), l_var].reshape(len(grad_diff), -1)
@@ -173,29 +165,21 @@ class DeepFool(EvasionAttack):
                 # Add perturbation and clip result
                 if self.estimator.clip_values is not None:
                     batch[active_indices] = np.clip(
-                        batch[active_indices]
-                        + r_var[active_indices] * (self.estimator.clip_values[1] - self.estimator.clip_values[0]),
+                        batch[active_indices] + r_var * (self.estimator.clip_values[1] - self.estimator.clip_values[0]),
                         self.estimator.clip_values[0],
                         self.estimator.clip_values[1],
                     )
                 else:
-                    batch[active_indices] += r_var[active_indices]
+                    batch[active_indices] += r_var
 
-                # Recompute prediction for new x
-                f_batch = self.estimator.predict(batch)
+                # Recompute prediction for the perturbed samples
+                f_batch = self.estimator.predict(batch[active_indices], batch_size=self.batch_size)
                 fk_i_hat = np.argmax(f_batch, axis=1)
 
-                # Recompute gradients for new x
-                if use_grads_subset:
-                    # Compute gradients only for (originally) top predicted classes
-                    grd = np.array([self.estimator.class_gradient(batch, label=int(label_i)) for label_i in labels_set])
-                    grd = np.squeeze(np.swapaxes(grd, 0, 2), axis=0)
-                else:
-                    # Compute gradients for all classes
-                    grd = self.estimator.class_gradient(batch)
-
                 # Stop if misclassification has been achieved
-                active_indices = np.where(fk_i_hat == fk_hat)[0]
+                still_active = fk_i_hat == fk_hat[active_indices]
+                active_indices = active_indices[still_active]
+                f_batch = f_batch[still_active]
 
                 current_step += 1
 
@@ -213,6 +197,34 @@ class DeepFool(EvasionAttack):
 
         return x_adv
 
+    def _class_gradient_top_k(self, x: np.ndarray, labels: np.ndarray) -> np.ndarray:
+        """
+        Compute the gradients of the given classes for each sample. The gradients of all classes are computed in a
+        single call if every class is requested. Otherwise, PyTorch and TensorFlow v2 classifiers compute the gradients
+        of a batch with one label per sample in a single backward pass, and the gradients of other estimators are
+        computed once per class for the samples requesting it.
+
+        :param x: An array with the inputs.
+        :param labels: An array of shape `(nb_samples, nb_grads)` with the class labels for each sample.
+        :return: An array of gradients of shape `(nb_samples, nb_grads) + x.shape[1:]`.
+        """
+        nb_samples, nb_grads = labels.shape
+
+        if nb_grads == self.estimator.nb_classes:
+            grads = self.estimator.class_gradient(x)
+            return np.take_along_axis(grads, labels.reshape(labels.shape + (1,) * (len(x.shape) - 1)), axis=1)
+
+        if isinstance(self.estimator, (PyTorchClassifier, TensorFlowV2Classifier)):
+            x_repeated = np.repeat(x, nb_grads, axis=0)
+            grads = self.estimator.class_gradient(x_repeated, label=labels.reshape(-1))
+            return grads.reshape((nb_samples, nb_grads) + x.shape[1:])
+
+        grads = np.zeros((nb_samples, nb_grads) + x.shape[1:], dtype=ART_NUMPY_DTYPE)
+        for label in np.unique(labels):
+            rows, cols = np.where(labels == label)
+            grads[rows, cols] = self.estimator.class_gradient(x[rows], label=int(label))[:, 0]
+        return grads
+
     def _check_params(self) -> None:
         if not isinstance(self.max_iter, int) or self.max_iter <= 0:
             raise ValueError("The number of iterations must be a positive integer.")
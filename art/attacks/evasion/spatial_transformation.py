@@ -24,11 +24,12 @@ rotations to find optimal attack parameters.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
 import numpy as np
-from scipy.ndimage import rotate, shift
+from scipy.ndimage import rotate
 from tqdm.auto import tqdm
 
 from art.attacks.attack import EvasionAttack
@@ -44,7 +45,8 @@ class SpatialTransformation(EvasionAttack):
     """
     Implementation of the spatial transformation attack using translation and rotation of inputs. The attack conducts
     black-box queries to the target model in a grid search over possible translations and rotations to find optimal
-    attack parameters.
+    attack parameters. The transformed copies of many samples are classified in a single call to the estimator and grid
+    points which can no longer achieve the highest fooling rate are not evaluated on the remaining samples.
 
     | Paper link: https://arxiv.org/abs/1712.02779
     """
@@ -54,6 +56,8 @@ class SpatialTransformation(EvasionAttack):
         "num_translations",
         "max_rotation",
         "num_rotations",
+        "batch_size",
+        "nb_workers",
         "verbose",
     ]
     _estimator_requirements = (BaseEstimator, NeuralNetworkMixin)
@@ -65,6 +69,8 @@ class SpatialTransformation(EvasionAttack):
         num_translations: int = 1,
         max_rotation: float = 0.0,
         num_rotations: int = 1,
+        batch_size: int = 128,
+        nb_workers: int = 1,
         verbose: bool = True,
     ) -> None:
         """
@@ -75,6 +81,8 @@ class SpatialTransformation(EvasionAttack):
         :param max_rotation: The maximum rotation in either direction in degrees. The value is expected to be in the
                range `[0, 180]`.
         :param num_rotations: The number of rotations to search on grid spacing.
+        :param batch_size: The number of transformed samples classified in a single call to the estimator.
+        :param nb_workers: The number of threads applying the transformations of different grid points in parallel.
         :param verbose: Show progress bars.
         """
         super().__init__(estimator=classifier)
@@ -82,6 +90,8 @@ class SpatialTransformation(EvasionAttack):
         self.num_translations = num_translations
         self.max_rotation = max_rotation
         self.num_rotations = num_rotations
+        self.batch_size = batch_size
+        self.nb_workers = nb_workers
         self.verbose = verbose
         self._check_params()
 
@@ -107,7 +117,7 @@ class SpatialTransformation(EvasionAttack):
 
         if self.attack_trans_x is None or self.attack_trans_y is None or self.attack_rot is None:
 
-            y_pred = self.estimator.predict(x, batch_size=1)
+            y_pred = self.estimator.predict(x, batch_size=self.batch_size)
             if self.estimator.nb_classes == 2 and y_pred.shape[1] == 1:
                 raise ValueError(
                     "This attack has not yet been tested for binary classification with a single output classifier."
@@ -152,39 +162,62 @@ class SpatialTransformation(EvasionAttack):
             grid_trans_y.sort()
             grid_rot.sort()
 
-            # Search for worst case
-            fooling_rate = 0.0
-            x_adv = np.copy(x)
-            trans_x = 0
-            trans_y = 0
-            rot = 0.0
-
-            # Initialize progress bar
-            pbar = tqdm(
-                total=len(grid_trans_x) * len(grid_trans_y) * len(grid_rot),
-                desc="Spatial transformation",
-                disable=not self.verbose,
-            )
-
-            for trans_x_i in grid_trans_x:
-                for trans_y_i in grid_trans_y:
-                    for rot_i in grid_rot:
-
-                        # Generate the adversarial examples
-                        x_adv_i = self._perturb(x, trans_x_i, trans_y_i, rot_i)
+            # Search for worst case over all grid points in the order of translation in x, translation in y and rotation
+            grid = [
+                (trans_x_i, trans_y_i, rot_i)
+                for trans_x_i in grid_trans_x
+                for trans_y_i in grid_trans_y
+                for rot_i in grid_rot
+            ]
+            nb_fooled = np.zeros(len(grid), dtype=int)
 
-                        # Compute the error rate
-                        y_adv_i = np.argmax(self.estimator.predict(x_adv_i, batch_size=1), axis=1)
-                        fooling_rate_i = np.sum(y_pred_max != y_adv_i) / nb_instances
+            # Indices of the grid points which can still achieve the highest number of fooled samples
+            candidates = np.arange(len(grid))
 
-                        if fooling_rate_i > fooling_rate:
-                            fooling_rate = fooling_rate_i
-                            trans_x = trans_x_i
-                            trans_y = trans_y_i
-                            rot = rot_i
-                            x_adv = np.copy(x_adv_i)
-                        pbar.update(1)
-            pbar.close()
+            # Initialize progress bar
+            pbar = tqdm(total=nb_instances, desc="Spatial transformation", disable=not self.verbose)
+
+            executor = ThreadPoolExecutor(max_workers=self.nb_workers) if self.nb_workers > 1 else None
+            map_func: Callable = map
+            if executor is not None:
+                map_func = executor.map
+
+            try:
+                index_1 = 0
+                while index_1 < nb_instances:
+                    # Classify the transformed copies of a chunk of samples for all candidates in a single call
+                    index_2 = min(index_1 + max(1, self.batch_size // len(candidates)), nb_instances)
+                    x_chunk = x[index_1:index_2]
+
+                    x_adv_chunk = np.concatenate(
+                        list(map_func(lambda i_grid, x_i=x_chunk: self._perturb(x_i, *grid[i_grid]), candidates))
+                    )
+                    y_adv_chunk = np.argmax(self.estimator.predict(x_adv_chunk, batch_size=self.batch_size), axis=1)
+                    y_adv_chunk = y_adv_chunk.reshape(len(candidates), len(x_chunk))
+                    nb_fooled[candidates] += np.sum(y_adv_chunk != y_pred_max[index_1:index_2], axis=1)
+
+                    # Discard grid points which cannot reach the highest number of fooled samples on the remaining
+                    # samples anymore
+                    nb_remaining = nb_instances - index_2
+                    candidates = candidates[nb_fooled[candidates] + nb_remaining >= np.max(nb_fooled)]
+
+                    pbar.update(len(x_chunk))
+                    index_1 = index_2
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+                pbar.close()
+
+            # The first grid point with the highest fooling rate is selected, no transformation if none fools any sample
+            i_best = int(np.argmax(nb_fooled))
+            if nb_fooled[i_best] > 0:
+                fooling_rate = nb_fooled[i_best] / nb_instances
+                trans_x, trans_y, rot = grid[i_best]
+                x_adv = self._perturb(x, trans_x, trans_y, rot)
+            else:
+                fooling_rate = 0.0
+                trans_x, trans_y, rot = 0, 0, 0.0
+                x_adv = np.copy(x)
 
             self.fooling_rate = fooling_rate
             self.attack_trans_x = trans_x
@@ -193,7 +226,7 @@ class SpatialTransformation(EvasionAttack):
 
             logger.info(
                 "Success rate of spatial transformation attack: %.2f%%",
-                100 * self.fooling_rate,
+                100 * fooling_rate,
             )
             logger.info("Attack-translation in x: %.2f%%", self.attack_trans_x)
             logger.info("Attack-translation in y: %.2f%%", self.attack_trans_y)
@@ -205,14 +238,20 @@ class SpatialTransformation(EvasionAttack):
         return x_adv
 
     def _perturb(self, x: np.ndarray, trans_x: int, trans_y: int, rot: float) -> np.ndarray:
-        if not self.estimator.channels_first:
-            x_adv = shift(x, [0, trans_x, trans_y, 0])
-            x_adv = rotate(x_adv, angle=rot, axes=(1, 2), reshape=False)
-        elif self.estimator.channels_first:
-            x_adv = shift(x, [0, 0, trans_x, trans_y])
-            x_adv = rotate(x_adv, angle=rot, axes=(2, 3), reshape=False)
-        else:
-            raise ValueError("Unsupported channel_first value.")
+        axes = (2, 3) if self.estimator.channels_first else (1, 2)
+
+        # Translations by whole pixels are applied exactly by copying the translated region and padding with zeros
+        x_adv = np.zeros_like(x)
+        slices_source = [slice(None)] * len(x.shape)
+        slices_target = [slice(None)] * len(x.shape)
+        for axis, trans in zip(axes, (trans_x, trans_y)):
+            size = x.shape[axis]
+            trans = int(np.clip(trans, -size, size))
+            slices_source[axis] = slice(max(-trans, 0), size - max(trans, 0))
+            slices_target[axis] = slice(max(trans, 0), size + min(trans, 0))
+        x_adv[tuple(slices_target)] = x[tuple(slices_source)]
+
+        x_adv = rotate(x_adv, angle=rot, axes=axes, reshape=False)
 
         if self.estimator.clip_values is not None:
             np.clip(
@@ -237,5 +276,11 @@ class SpatialTransformation(EvasionAttack):
         if not isinstance(self.num_rotations, int) or self.num_rotations <= 0:
             raise ValueError("The number of rotations must be a positive integer.")
 
+        if not isinstance(self.batch_size, int) or self.batch_size <= 0:
+            raise ValueError("The batch size must be a positive integer.")
+
+        if not isinstance(self.nb_workers, int) or self.nb_workers <= 0:
+            raise ValueError("The number of workers must be a positive integer.")
+
         if not isinstance(self.verbose, bool):
             raise ValueError("The argument `verbose` has to be of type bool.")
@@ -23,6 +23,7 @@ This module implements ``Wasserstein Adversarial Examples via Projected Sinkhorn
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import logging
+from functools import lru_cache
 from typing import Optional, TYPE_CHECKING
 
 import numpy as np
@@ -399,6 +400,9 @@ class Wasserstein(EvasionAttack):
         var_k = np.expand_dims(np.expand_dims(np.expand_dims(psi, -1), -1), -1)
         var_k = np.exp(-var_k * cost_matrix - 1)
 
+        # The squared cost kernel is constant across the Newton steps
+        cost_matrix_squared = cost_matrix * cost_matrix
+
         convergence = np.array([-np.inf])
 
         for _ in range(self.conjugate_sinkhorn_max_iter):
@@ -415,7 +419,7 @@ class Wasserstein(EvasionAttack):
             )
 
             var_h = -self._batch_dot(
-                exp_alpha, self._local_transport(cost_matrix * cost_matrix * var_k, exp_beta, self.kernel_size)
+                exp_alpha, self._local_transport(cost_matrix_squared * var_k, exp_beta, self.kernel_size)
             )
 
             delta = var_g / var_h
@@ -477,6 +481,9 @@ class Wasserstein(EvasionAttack):
         var_k = np.expand_dims(np.expand_dims(np.expand_dims(psi, -1), -1), -1)
         var_k = np.exp(-var_k * cost_matrix - 1)
 
+        # The squared cost kernel is constant across the Newton steps
+        cost_matrix_squared = cost_matrix * cost_matrix
+
         convergence = np.array([-np.inf])
 
         for _ in range(self.projected_sinkhorn_max_iter):
@@ -500,7 +507,7 @@ class Wasserstein(EvasionAttack):
             )
 
             var_h = -self._batch_dot(
-                exp_alpha, self._local_transport(cost_matrix * cost_matrix * var_k, exp_beta, self.kernel_size)
+                exp_alpha, self._local_transport(cost_matrix_squared * var_k, exp_beta, self.kernel_size)
             )
 
             delta = var_g / var_h
@@ -542,23 +549,23 @@ class Wasserstein(EvasionAttack):
         return result
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _compute_cost_matrix(var_p: int, kernel_size: int) -> np.ndarray:
         """
-        Compute the default cost matrix.
+        Compute the default cost matrix. The result is cached per `(var_p, kernel_size)` and returned read-only.
 
         :param var_p: The p-wasserstein distance.
         :param kernel_size: Kernel size for computing the cost matrix.
         :return: The cost matrix.
         """
         center = kernel_size // 2
-        cost_matrix = np.zeros((kernel_size, kernel_size))
+        offsets = np.abs(np.arange(kernel_size) - center)
 
-        for i in range(kernel_size):
-            for j in range(kernel_size):
-                # The code of the paper of this attack (https://arxiv.org/abs/1902.07906) implements the cost as:
-                # cost_matrix[i, j] = (abs(i - center) ** 2 + abs(j - center) ** 2) ** (p / 2)
-                # which only can reproduce L2-norm for p=1 correctly
-                cost_matrix[i, j] = (abs(i - center) ** var_p + abs(j - center) ** var_p) ** (1 / var_p)
+        # The code of the paper of this attack (https://arxiv.org/abs/1902.07906) implements the cost as:
+        # cost_matrix[i, j] = (abs(i - center) ** 2 + abs(j - center) ** 2) ** (p / 2)
+        # which only can reproduce L2-norm for p=1 correctly
+        cost_matrix = (offsets[:, None] ** var_p + offsets[None, :] ** var_p) ** (1 / var_p)
+        cost_matrix.flags.writeable = False
 
         return cost_matrix
 
@@ -582,34 +589,20 @@ class Wasserstein(EvasionAttack):
         return result
 
     @staticmethod
-    def _unfold(x: np.ndarray, kernel_size: int, padding: int) -> np.ndarray:
+    def _sliding_windows(x: np.ndarray, kernel_size: int, padding: int) -> np.ndarray:
         """
-        Extract sliding local blocks from a batched input.
+        Return a strided view of the sliding local blocks of a batched input without copying them.
 
         :param x: A batched input of shape `batch x channel x width x height`.
         :param kernel_size: Kernel size for computing the cost matrix.
         :param padding: Controls the amount of implicit zero-paddings on both sides for padding number of points
             for each dimension before reshaping.
-        :return: Sliding local blocks.
+        :return: Sliding local blocks of shape `batch x channel x width' x height' x kernel_size x kernel_size`.
         """
-        # Do padding
-        shape = tuple(np.array(x.shape[2:]) + padding * 2)
-        x_pad = np.zeros(x.shape[:2] + shape)
-        x_pad[:, :, padding : (shape[0] - padding), padding : (shape[1] - padding)] = x
-
-        # Do unfolding
-        res_dim_0 = x.shape[0]
-        res_dim_1 = x.shape[1] * kernel_size ** 2
-        res_dim_2 = (shape[0] - kernel_size + 1) * (shape[1] - kernel_size + 1)
-        result = np.zeros((res_dim_0, res_dim_1, res_dim_2))
-
-        for i in range(shape[0] - kernel_size + 1):
-            for j in range(shape[1] - kernel_size + 1):
-                patch = x_pad[:, :, i : (i + kernel_size), j : (j + kernel_size)]
-                patch = patch.reshape(x.shape[0], -1)
-                result[:, :, i * (shape[1] - kernel_size + 1) + j] = patch
-
-        return result
+        x_pad = np.pad(x.astype(np.float64, copy=False), ((0, 0), (0, 0), (padding, padding), (padding, padding)))
+        # Windows of size one over the batch and channel axes, as the type stubs of numpy only accept a single `axis`
+        windows = np.lib.stride_tricks.sliding_window_view(x_pad, (1, 1, kernel_size, kernel_size))
+        return windows[:, :, :, :, 0, 0]
 
     def _local_transport(self, var_k: np.ndarray, x: np.ndarray, kernel_size: int) -> np.ndarray:
         """
@@ -621,28 +614,16 @@ class Wasserstein(EvasionAttack):
         :param kernel_size: Kernel size for computing the cost matrix.
         :return: Local transport result.
         """
-        # Compute number of channels
-        num_channels = x.shape[1 if self.estimator.channels_first else 3]
-
-        # Expand channels
-        var_k = np.repeat(var_k, num_channels, axis=1)
-
         # Swap channels to prepare for local transport computation
         if not self.estimator.channels_first:
             x = np.swapaxes(x, 1, 3)
 
-        # Compute local transport
-        unfold_x = self._unfold(x=x, kernel_size=kernel_size, padding=kernel_size // 2)
-        unfold_x = unfold_x.swapaxes(-1, -2)
-        unfold_x = unfold_x.reshape(*unfold_x.shape[:-1], num_channels, kernel_size ** 2)
-        unfold_x = unfold_x.swapaxes(-2, -3)
-
-        tmp_k = var_k.reshape(var_k.shape[0], num_channels, -1)
-        tmp_k = np.expand_dims(tmp_k, -1)
+        # Broadcast K over the batch and channels, each channel is transported with the same kernel
+        var_k = np.broadcast_to(var_k, (x.shape[0], x.shape[1], kernel_size, kernel_size))
 
-        result = np.matmul(unfold_x, tmp_k)
-        result = np.squeeze(result, -1)
-        result = result.reshape(*result.shape[:-1], x.shape[-2], x.shape[-1])
+        # Contract every local block with its kernel
+        windows = self._sliding_windows(x=x, kernel_size=kernel_size, padding=kernel_size // 2)
+        result = np.einsum("bchwij,bcij->bchw", windows, var_k, optimize=True)
 
         # Swap channels for final result
         if not self.estimator.channels_first:
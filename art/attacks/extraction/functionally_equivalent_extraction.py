@@ -29,7 +29,7 @@ Extracted model - Test Fidelity: 0.9977
 """
 import logging
 import os
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING, Union
 
 import numpy as np
 from scipy.optimize import least_squares
@@ -56,17 +56,21 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
     | Paper link: https://arxiv.org/abs/1909.01838
     """
 
+    attack_params = ExtractionAttack.attack_params + ["num_neurons", "batch_size"]
+
     _estimator_requirements = (BaseEstimator, NeuralNetworkMixin, ClassifierMixin)
 
-    def __init__(self, classifier: "CLASSIFIER_TYPE", num_neurons: Optional[int] = None) -> None:
+    def __init__(self, classifier: "CLASSIFIER_TYPE", num_neurons: Optional[int] = None, batch_size: int = 128) -> None:
         """
         Create a `FunctionallyEquivalentExtraction` instance.
 
         :param classifier: A trained ART classifier.
         :param num_neurons: The number of neurons in the first dense layer.
+        :param batch_size: Number of probe points submitted to the classifier in one query.
         """
         super().__init__(estimator=classifier)
         self.num_neurons = num_neurons
+        self.batch_size = batch_size
         self.num_classes = classifier.nb_classes
         self.num_features = int(np.prod(classifier.input_shape))
 
@@ -74,11 +78,13 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
         self.vector_v = np.random.normal(0, 1, (1, self.num_features)).astype(dtype=NUMPY_DTYPE)
 
         self.critical_points: List[np.ndarray] = []
+        self.nb_queries = 0  # Number of samples submitted to the target model
 
         self.w_0: Optional[np.ndarray] = None  # Weight matrix of first dense layer
         self.b_0: Optional[np.ndarray] = None  # Bias vector of first dense layer
         self.w_1: Optional[np.ndarray] = None  # Weight matrix of second dense layer
         self.b_1: Optional[np.ndarray] = None  # Bias vector of second dense layer
+        self._check_params()
 
     def extract(  # pylint: disable=W0221
         self,
@@ -98,7 +104,8 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
         **kwargs,
     ) -> BlackBoxClassifier:
         """
-        Extract the targeted model.
+        Extract the targeted model. The number of samples submitted to the targeted model is available afterwards in
+        the attribute `nb_queries`.
 
         :param x: Samples of input data of shape (num_samples, num_features).
         :param y: Correct labels or target labels for `x`, depending if the attack is targeted
@@ -116,6 +123,9 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
         :param ftol: Tolerance for termination by the change of the cost function.
         :return: ART :class:`.BlackBoxClassifier` of the extracted model.
         """
+        self.critical_points = []
+        self.nb_queries = 0
+
         self._critical_point_search(
             delta_0=delta_0,
             fraction_true=fraction_true,
@@ -131,6 +141,7 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
         )
         self._sign_recovery(unit_vector_scale=unit_vector_scale, ftol=ftol)
         self._last_layer_extraction(x, ftol)
+        logger.info("Extracted the model with %d queries.", self.nb_queries)
 
         def predict(x: np.ndarray) -> np.ndarray:
             """
@@ -154,26 +165,24 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
 
         return extracted_classifier
 
-    def _o_l(self, x: np.ndarray, e_j: Optional[np.ndarray] = None) -> np.ndarray:
+    def _o_l(self, x: np.ndarray) -> np.ndarray:
         """
-        Predict the target model.
+        Predict the target model and count the queries.
 
         :param x: Samples of input data of shape `(num_samples, num_features)`.
-        :param e_j: Additive delta vector of shape `(1, num_features)`.
         :return: Prediction of the target model of shape `(num_samples, num_classes)`.
         """
-        if e_j is not None:
-            x = x + e_j
-        return self.estimator.predict(x).astype(NUMPY_DTYPE)
+        self.nb_queries += x.shape[0]
+        return self.estimator.predict(x, batch_size=self.batch_size).astype(NUMPY_DTYPE)
 
-    def _get_x(self, var_t: float) -> np.ndarray:
+    def _get_x(self, var_t: Union[float, np.ndarray]) -> np.ndarray:
         """
-        Get input sample as function of multiplicative factor of random vector.
+        Get input samples as function of multiplicative factors of random vector.
 
-        :param var_t: Multiplicative factor of second random vector for critical point search.
-        :return: Input sample of shape `(1, num_features)`.
+        :param var_t: Multiplicative factor or array of factors of second random vector for critical point search.
+        :return: Input samples of shape `(num_factors, num_features)`.
         """
-        return self.vector_u + var_t * self.vector_v
+        return self.vector_u + np.reshape(var_t, (-1, 1)) * self.vector_v
 
     def _critical_point_search(
         self,
@@ -185,6 +194,9 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
         """
         Search for critical points.
 
+        The line is scanned in batches of consecutive intervals of length `delta_0`, which are probed in one query. The
+        binary search is only run on the first interval of a batch showing a change of slope.
+
         :param delta_0: Initial step size of binary search.
         :param fraction_true: Fraction of output predictions that have to fulfill criteria for critical point.
         :param rel_diff_slope: Relative slope difference at critical points.
@@ -195,63 +207,146 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
         if self.num_neurons is None:
             raise ValueError("The value of `num_neurons` is required for critical point search.")
         h_square = self.num_neurons * self.num_neurons
+        nb_intervals = max(1, self.batch_size // 3)
 
         t_current = float(-h_square)
         while t_current < h_square:
-            delta = delta_0
-            found_critical_point = False
-
-            while not found_critical_point:
-                epsilon = delta / 10
+            # Bounds of the next intervals, accumulated like consecutive steps of size delta_0
+            t_bounds = np.cumsum(np.concatenate([[t_current], np.full(nb_intervals, delta_0)]))
+            nb_scan = int(np.sum(t_bounds[:-1] < h_square))
+            t_bounds = t_bounds[: nb_scan + 1]
+
+            epsilon = delta_0 / 10
+            y_probes = self._o_l(
+                self._get_x(np.concatenate([t_bounds, t_bounds[:-1] + epsilon, t_bounds[1:] - epsilon]))
+            )
+            y_bounds = y_probes[: nb_scan + 1]
+            m_1 = (y_probes[nb_scan + 1 : 2 * nb_scan + 1] - y_bounds[:-1]) / epsilon
+            m_2 = (y_bounds[1:] - y_probes[2 * nb_scan + 1 :]) / epsilon
+
+            is_linear = np.sum(np.abs((m_1 - m_2) / m_1) < rel_diff_slope, axis=1) > fraction_true * self.num_classes
+            if np.all(is_linear):
+                t_current = t_bounds[-1]
+                continue
+
+            idx = int(np.argmin(is_linear))
+            t_current = self._binary_search(
+                t_bounds[idx],
+                y_bounds[idx : idx + 2],
+                m_1[idx],
+                m_2[idx],
+                delta_0,
+                fraction_true,
+                rel_diff_slope,
+                rel_diff_value,
+            )
 
-                t_1 = t_current
-                t_2 = t_current + delta
+        if len(self.critical_points) != self.num_neurons:
+            raise AssertionError(
+                f"The number of critical points found ({len(self.critical_points)}) does not equal the number of "
+                f"expected neurons in the first layer ({self.num_neurons})."
+            )
 
-                x_1 = self._get_x(t_1)
-                x_1_p = self._get_x(t_1 + epsilon)
-                x_2 = self._get_x(t_2)
-                x_2_m = self._get_x(t_2 - epsilon)
+    def _binary_search(
+        self,
+        t_1: float,
+        y_bounds: np.ndarray,
+        m_1: np.ndarray,
+        m_2: np.ndarray,
+        delta: float,
+        fraction_true: float,
+        rel_diff_slope: float,
+        rel_diff_value: float,
+    ) -> float:
+        """
+        Search a critical point in an interval by halving its length until the interval is linear or the intersection
+        of the tangents at its bounds is a critical point.
+
+        :param t_1: Lower bound of the interval.
+        :param y_bounds: Predictions at both bounds of the interval of shape `(2, num_classes)`.
+        :param m_1: Slope at the lower bound.
+        :param m_2: Slope at the upper bound.
+        :param delta: Length of the interval.
+        :param fraction_true: Fraction of output predictions that have to fulfill criteria for critical point.
+        :param rel_diff_slope: Relative slope difference at critical points.
+        :param rel_diff_value: Relative value difference at critical points.
+        :return: Upper bound of the last interval, where the search continues. If the interval cannot be halved any
+                 further, the search continues at the upper bound of the initial interval.
+        """
+        y_1, y_2 = y_bounds[0], y_bounds[1]
+        t_end = t_1 + delta
 
-                m_1 = (self._o_l(x_1_p) - self._o_l(x_1)) / epsilon
-                m_2 = (self._o_l(x_2) - self._o_l(x_2_m)) / epsilon
+        while True:
+            epsilon = delta / 10
+            t_2 = t_1 + delta
 
-                y_1 = self._o_l(x_1)
-                y_2 = self._o_l(x_2)
+            if t_2 == t_1:
+                logger.warning("No critical point found in the interval [%f, %f], the interval is skipped.", t_1, t_end)
+                return t_end
 
-                if np.sum(np.abs((m_1 - m_2) / m_1) < rel_diff_slope) > fraction_true * self.num_classes:
-                    t_current = t_2
-                    break
+            if np.sum(np.abs((m_1 - m_2) / m_1) < rel_diff_slope) > fraction_true * self.num_classes:
+                return t_2
 
-                t_hat = t_1 + np.divide(y_2 - y_1 - (t_2 - t_1) * m_2, m_1 - m_2)
-                y_hat = y_1 + m_1 * np.divide(y_2 - y_1 - (t_2 - t_1) * m_2, m_1 - m_2)
+            t_hat = t_1 + np.divide(y_2 - y_1 - (t_2 - t_1) * m_2, m_1 - m_2)
+            y_hat = y_1 + m_1 * np.divide(y_2 - y_1 - (t_2 - t_1) * m_2, m_1 - m_2)
 
-                t_mean = np.mean(t_hat[t_hat != -np.inf])
+            t_mean = np.mean(t_hat[t_hat != -np.inf])
 
-                x_mean = self._get_x(t_mean)
-                x_mean_p = self._get_x(t_mean + epsilon)
-                x_mean_m = self._get_x(t_mean - epsilon)
+            x_mean = self._get_x(t_mean)
+            y, y_mean_p, y_mean_m = self._o_l(self._get_x(np.array([t_mean, t_mean + epsilon, t_mean - epsilon])))
 
-                y = self._o_l(x_mean)
+            m_x_1 = (y_mean_p - y) / epsilon
+            m_x_2 = (y - y_mean_m) / epsilon
 
-                m_x_1 = (self._o_l(x_mean_p) - self._o_l(x_mean)) / epsilon
-                m_x_2 = (self._o_l(x_mean) - self._o_l(x_mean_m)) / epsilon
+            if (
+                np.sum(np.abs((y_hat - y) / y) < rel_diff_value) > fraction_true * self.num_classes
+                and t_1 < t_mean < t_2
+                and np.sum(np.abs((m_x_1 - m_x_2) / m_x_1) > rel_diff_slope) > fraction_true * self.num_classes
+            ):
+                self.critical_points.append(x_mean)
+                return t_2
 
-                if (
-                    np.sum(np.abs((y_hat - y) / y) < rel_diff_value) > fraction_true * self.num_classes
-                    and t_1 < t_mean < t_2
-                    and np.sum(np.abs((m_x_1 - m_x_2) / m_x_1) > rel_diff_slope) > fraction_true * self.num_classes
-                ):
-                    found_critical_point = True
-                    self.critical_points.append(x_mean)
-                    t_current = t_2
-                else:
-                    delta = delta / 2
+            # Halve the interval, the prediction at its lower bound is unchanged
+            delta = delta / 2
+            epsilon = delta / 10
+            t_2 = t_1 + delta
+            y_1_p, y_2, y_2_m = self._o_l(self._get_x(np.array([t_1 + epsilon, t_2, t_2 - epsilon])))
+            m_1 = (y_1_p - y_1) / epsilon
+            m_2 = (y_2 - y_2_m) / epsilon
 
-        if len(self.critical_points) != self.num_neurons:
-            raise AssertionError(
-                f"The number of critical points found ({len(self.critical_points)}) does not equal the number of "
-                f"expected neurons in the first layer ({self.num_neurons})."
-            )
+    def _second_derivatives(
+        self,
+        critical_points: np.ndarray,
+        y_critical: np.ndarray,
+        index_i: np.ndarray,
+        index_j: np.ndarray,
+        steps: np.ndarray,
+        steps_0: float = 0.0,
+    ) -> np.ndarray:
+        """
+        Compute second order finite differences of the target model at critical points, probed in batches.
+
+        :param critical_points: Critical points of shape `(num_neurons, num_features)`.
+        :param y_critical: Predictions at the critical points of shape `(num_neurons, num_classes)`.
+        :param index_i: Index of the critical point of each probe of shape `(num_probes,)`.
+        :param index_j: Index of the shifted feature of each probe of shape `(num_probes,)`.
+        :param steps: Step size of each probe of shape `(num_probes,)`.
+        :param steps_0: Step size added to the first feature of all probes.
+        :return: Second order finite differences of shape `(num_probes, num_classes)`.
+        """
+        second_derivatives = np.zeros((len(index_i), self.num_classes), dtype=NUMPY_DTYPE)
+        chunk = max(1, self.batch_size // 2)
+        for start in range(0, len(index_i), chunk):
+            batch = slice(start, start + chunk)
+            e_j = np.zeros((len(index_i[batch]), self.num_features), dtype=NUMPY_DTYPE)
+            e_j[:, 0] += steps_0
+            e_j[np.arange(len(e_j)), index_j[batch]] += steps[batch]
+
+            x_i = critical_points[index_i[batch]]
+            y_i = y_critical[index_i[batch]]
+            y_p, y_m = np.split(self._o_l(np.concatenate([x_i + e_j, x_i + -e_j])), 2)
+            second_derivatives[batch] = (y_p - y_i) / steps[batch, np.newaxis] - (y_i - y_m) / steps[batch, np.newaxis]
+        return second_derivatives
 
     def _weight_recovery(
         self,
@@ -275,68 +370,44 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
         if self.num_neurons is None:
             raise ValueError("The value of `num_neurons` is required for critical point search.")
 
-        # Absolute Value Recovery
-        d2_ol_d2ej_xi = np.zeros((self.num_features, self.num_neurons), dtype=NUMPY_DTYPE)
-
-        for i in range(self.num_neurons):
-            for j in range(self.num_features):
-
-                delta = delta_init_value
-                e_j = np.zeros((1, self.num_features))
-                d2_ol_d2ej_xi_ok = False
-
-                while not d2_ol_d2ej_xi_ok:
-
-                    e_j[0, j] = delta
+        critical_points = np.concatenate(self.critical_points)
+        y_critical = self._o_l(critical_points)
 
-                    d_ol_dej_xi_p_cej = (
-                        self._o_l(self.critical_points[i], e_j=e_j) - self._o_l(self.critical_points[i])
-                    ) / delta
-                    d_ol_dej_xi_m_cej = (
-                        self._o_l(self.critical_points[i]) - self._o_l(self.critical_points[i], e_j=-e_j)
-                    ) / delta
-
-                    d2_ol_d2ej_xi[j, i] = np.sum(np.abs(d_ol_dej_xi_p_cej - d_ol_dej_xi_m_cej)) / delta
+        # Absolute Value Recovery, all pairs of neuron and feature whose curvature is still too small are probed
+        # together with an increased step size
+        d2_ol_d2ej_xi = np.zeros((self.num_features, self.num_neurons), dtype=NUMPY_DTYPE)
+        delta = np.full((self.num_features, self.num_neurons), delta_init_value, dtype=NUMPY_DTYPE)
+        index_j, index_i = np.divmod(np.arange(self.num_features * self.num_neurons), self.num_neurons)
 
-                    if d2_ol_d2ej_xi[j, i] < d2_min and delta < delta_value_max:
-                        delta = delta + d_step
-                    else:
-                        d2_ol_d2ej_xi_ok = True
+        while len(index_j) > 0:
+            step = delta[index_j, index_i]
+            d2 = self._second_derivatives(critical_points, y_critical, index_i, index_j, step)
+            d2_ol_d2ej_xi[index_j, index_i] = np.sum(np.abs(d2), axis=1) / step
 
-        self.a0_pairwise_ratios = np.zeros((self.num_features, self.num_neurons), dtype=NUMPY_DTYPE)
+            retry = (d2_ol_d2ej_xi[index_j, index_i] < d2_min) & (step < delta_value_max)
+            index_j, index_i = index_j[retry], index_i[retry]
+            delta[index_j, index_i] = delta[index_j, index_i] + d_step
 
-        for i in range(self.num_neurons):
-            for k in range(self.num_features):
-                self.a0_pairwise_ratios[k, i] = d2_ol_d2ej_xi[0, i] / d2_ol_d2ej_xi[k, i]
+        self.a0_pairwise_ratios = d2_ol_d2ej_xi[0:1, :] / d2_ol_d2ej_xi
 
         # Weight Sign Recovery
-
-        for i in range(self.num_neurons):
-            d2_ol_dejek_xi_0 = None
-            for j in range(self.num_features):
-
-                e_j = np.zeros((1, self.num_features), dtype=NUMPY_DTYPE)
-
-                e_j[0, 0] += delta_sign
-                e_j[0, j] += delta_sign
-
-                d_ol_dejek_xi_p_cejek = (
-                    self._o_l(self.critical_points[i], e_j=e_j) - self._o_l(self.critical_points[i])
-                ) / delta_sign
-                d_ol_dejek_xi_m_cejek = (
-                    self._o_l(self.critical_points[i]) - self._o_l(self.critical_points[i], e_j=-e_j)
-                ) / delta_sign
-
-                d2_ol_dejek_xi = d_ol_dejek_xi_p_cejek - d_ol_dejek_xi_m_cejek
-
-                if j == 0:
-                    d2_ol_dejek_xi_0 = d2_ol_dejek_xi / 2.0
-
-                co_p = np.sum(np.abs(d2_ol_dejek_xi_0 * (1 + 1 / self.a0_pairwise_ratios[j, i]) - d2_ol_dejek_xi))
-                co_m = np.sum(np.abs(d2_ol_dejek_xi_0 * (1 - 1 / self.a0_pairwise_ratios[j, i]) - d2_ol_dejek_xi))
-
-                if co_m < co_p * np.max(1 / self.a0_pairwise_ratios[:, i]):
-                    self.a0_pairwise_ratios[j, i] *= -1
+        index_j, index_i = np.divmod(np.arange(self.num_features * self.num_neurons), self.num_neurons)
+        step = np.full(len(index_j), delta_sign, dtype=NUMPY_DTYPE)
+        d2_ol_dejek_xi = self._second_derivatives(critical_points, y_critical, index_i, index_j, step, delta_sign)
+        d2_ol_dejek_xi = d2_ol_dejek_xi.reshape((self.num_features, self.num_neurons, self.num_classes))
+        d2_ol_dejek_xi_0 = d2_ol_dejek_xi[0] / 2.0
+
+        ratios_inverse = (1 / self.a0_pairwise_ratios)[:, :, np.newaxis]
+        co_p = np.sum(np.abs(d2_ol_dejek_xi_0 * (1 + ratios_inverse) - d2_ol_dejek_xi), axis=2)
+        co_m = np.sum(np.abs(d2_ol_dejek_xi_0 * (1 - ratios_inverse) - d2_ol_dejek_xi), axis=2)
+
+        # The sign of a ratio is flipped feature after feature, each decision uses the ratios flipped so far
+        max_following = np.maximum.accumulate((1 / self.a0_pairwise_ratios)[::-1], axis=0)[::-1]
+        max_preceding = np.full(self.num_neurons, -np.inf)
+        for j in range(self.num_features):
+            flip = co_m[j] < co_p[j] * np.maximum(max_preceding, max_following[j])
+            self.a0_pairwise_ratios[j, flip] *= -1
+            max_preceding = np.maximum(max_preceding, 1 / self.a0_pairwise_ratios[j])
 
     def _sign_recovery(self, unit_vector_scale: int, ftol: float) -> None:
         """
@@ -351,47 +422,30 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
             raise ValueError("The value of `num_neurons` is required for critical point search.")
 
         a0_pairwise_ratios_inverse = 1.0 / self.a0_pairwise_ratios
-        self.b_0 = np.zeros((self.num_neurons, 1), dtype=NUMPY_DTYPE)
-
-        for i in range(self.num_neurons):
-            x_i = self.critical_points[i].flatten()
-            self.b_0[i] = -np.matmul(a0_pairwise_ratios_inverse[:, i], x_i)
+        critical_points = np.concatenate(self.critical_points)
+        b_0 = -np.sum(a0_pairwise_ratios_inverse.T * critical_points, axis=1, keepdims=True)
 
         z_0 = np.random.normal(0, 1, (self.num_features,)).astype(dtype=NUMPY_DTYPE)
 
         def f_z(z_i):
-            return np.squeeze(np.matmul(a0_pairwise_ratios_inverse.T, np.expand_dims(z_i, axis=0).T) + self.b_0)
+            return np.squeeze(np.matmul(a0_pairwise_ratios_inverse.T, np.expand_dims(z_i, axis=0).T) + b_0)
 
         result_z = least_squares(f_z, z_0, ftol=ftol)
 
-        for i in range(self.num_neurons):
-            e_i = np.zeros((self.num_neurons, 1), dtype=NUMPY_DTYPE)
-            e_i[i, 0] = unit_vector_scale
-
-            def f_v(v_i):
-                # pylint: disable=W0640
-                return np.squeeze(np.matmul(-a0_pairwise_ratios_inverse.T, np.expand_dims(v_i, axis=0).T) - e_i)
-
-            v_0 = np.random.normal(0, 1, self.num_features)
-            result_v_i = least_squares(f_v, v_0, ftol=ftol)
-            value_p = np.sum(
-                np.abs(
-                    self._o_l(np.expand_dims(result_z.x, axis=0))
-                    - (self._o_l(np.expand_dims(result_z.x + result_v_i.x, axis=0)))
-                )
-            )
-            value_m = np.sum(
-                np.abs(
-                    self._o_l(np.expand_dims(result_z.x, axis=0))
-                    - (self._o_l(np.expand_dims(result_z.x - result_v_i.x, axis=0)))
-                )
-            )
+        # Shifts activating one neuron each, all solved at once as the system is linear
+        e_i = unit_vector_scale * np.eye(self.num_neurons, dtype=NUMPY_DTYPE)
+        result_v = np.linalg.lstsq(-a0_pairwise_ratios_inverse.T, e_i, rcond=None)[0].T
+
+        predictions = self._o_l(np.concatenate([result_z.x[np.newaxis], result_z.x + result_v, result_z.x - result_v]))
+        value_p = np.sum(np.abs(predictions[0] - predictions[1 : self.num_neurons + 1]), axis=1)
+        value_m = np.sum(np.abs(predictions[0] - predictions[self.num_neurons + 1 :]), axis=1)
 
-            if value_m < value_p:
-                a0_pairwise_ratios_inverse[:, i] *= -1
-                self.b_0[i, 0] *= -1
+        flip = value_m < value_p
+        a0_pairwise_ratios_inverse[:, flip] *= -1
+        b_0[flip, 0] *= -1
 
         self.w_0 = a0_pairwise_ratios_inverse
+        self.b_0 = b_0
 
     def _last_layer_extraction(self, x: np.ndarray, ftol: float) -> None:
         """
@@ -405,12 +459,14 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
         if self.num_neurons is None:
             raise ValueError("The value of `num_neurons` is required for critical point search.")
 
+        if self.w_0 is None or self.b_0 is None:
+            raise ValueError("The weights and biases of the first layer have to be extracted first.")
+
         predictions = self._o_l(x)
         w_1_b_1_0 = np.random.normal(0, 1, ((self.num_neurons + 1) * self.num_classes)).astype(dtype=NUMPY_DTYPE)
+        layer_0 = np.maximum(np.matmul(self.w_0.T, x.T) + self.b_0, 0.0)
 
         def f_w_1_b_1(w_1_b_1_i):
-            layer_0 = np.maximum(np.matmul(self.w_0.T, x.T) + self.b_0, 0.0)
-
             w_1 = w_1_b_1_i[0 : self.num_neurons * self.num_classes].reshape(self.num_neurons, self.num_classes)
             b_1 = w_1_b_1_i[self.num_neurons * self.num_classes :].reshape(self.num_classes, 1)
 
@@ -423,6 +479,13 @@ class FunctionallyEquivalentExtraction(ExtractionAttack):
         self.w_1 = result_a1_b1.x[0 : self.num_neurons * self.num_classes].reshape(self.num_neurons, self.num_classes)
         self.b_1 = result_a1_b1.x[self.num_neurons * self.num_classes :].reshape(self.num_classes, 1)
 
+    def _check_params(self) -> None:
+        if self.num_neurons is not None and (not isinstance(self.num_neurons, int) or self.num_neurons <= 0):
+            raise ValueError("The number of neurons must be a positive integer.")
+
+        if not isinstance(self.batch_size, int) or self.batch_size <= 0:
+            raise ValueError("The batch size must be a positive integer.")
+
 
 # pylint: disable=C0103, E0401
 if __name__ == "__main__":
@@ -437,7 +500,7 @@ if __name__ == "__main__":
 
     np.random.seed(1)
     number_neurons = 16
-    batch_size = 128
+    train_batch_size = 128
     number_classes = 10
     epochs = 10
     img_rows = 28
@@ -479,7 +542,7 @@ if __name__ == "__main__":
         model.fit(
             x_train,
             y_train,
-            batch_size=batch_size,
+            batch_size=train_batch_size,
             epochs=epochs,
             verbose=1,
             validation_data=(x_test, y_test),
@@ -23,7 +23,7 @@ This module implements the Knockoff Nets attack `KnockoffNets`.
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import logging
-from typing import Optional, TYPE_CHECKING, Union
+from typing import Optional, TYPE_CHECKING
 
 import numpy as np
 from tqdm.auto import trange
@@ -56,6 +56,7 @@ class KnockoffNets(ExtractionAttack):
         "reward",
         "verbose",
         "use_probability",
+        "batch_size_adaptive",
     ]
 
     _estimator_requirements = (BaseEstimator, ClassifierMixin)
@@ -71,6 +72,7 @@ class KnockoffNets(ExtractionAttack):
         reward: str = "all",
         verbose: bool = True,
         use_probability: bool = False,
+        batch_size_adaptive: int = 1,
     ) -> None:
         """
         Create a KnockoffNets attack instance. Note, it is assumed that both the victim classifier and the thieved
@@ -84,6 +86,9 @@ class KnockoffNets(ExtractionAttack):
         :param sampling_strategy: Sampling strategy, either `random` or `adaptive`.
         :param reward: Reward type, in ['cert', 'div', 'loss', 'all'].
         :param verbose: Show progress bars.
+        :param use_probability: Use probability.
+        :param batch_size_adaptive: Number of actions drawn from the policy and queried together in each round of the
+               adaptive sampling strategy. The thieved classifier and the policy are updated once per round.
         """
         super().__init__(estimator=classifier)
 
@@ -95,6 +100,7 @@ class KnockoffNets(ExtractionAttack):
         self.reward = reward
         self.verbose = verbose
         self.use_probability = use_probability
+        self.batch_size_adaptive = batch_size_adaptive
         self._check_params()
 
     def extract(self, x: np.ndarray, y: Optional[np.ndarray] = None, **kwargs) -> "CLASSIFIER_TYPE":
@@ -200,11 +206,17 @@ class KnockoffNets(ExtractionAttack):
         """
         # Compute number of actions
         if len(y.shape) == 2:
-            nb_actions = len(np.unique(np.argmax(y, axis=1)))
+            y_index = np.argmax(y, axis=1)
         elif len(y.shape) == 1:
-            nb_actions = len(np.unique(y))
+            y_index = y
         else:
             raise ValueError("Target values `y` has a wrong shape.")
+        nb_actions = len(np.unique(y_index))
+
+        # Group the source input by action once, so that sampling a batch of actions is a single indexing operation
+        order = np.argsort(y_index, kind="stable")
+        counts = np.bincount(y_index.astype(int), minlength=nb_actions)[:nb_actions]
+        starts = np.cumsum(counts) - counts
 
         # We need to keep an average version of the victim output
         if self.reward in ("div", "all"):
@@ -223,23 +235,27 @@ class KnockoffNets(ExtractionAttack):
         queried_labels = []
 
         avg_reward = 0.0
-        for iteration in trange(1, self.nb_stolen + 1, desc="Knock-off nets", disable=not self.verbose):
-            # Sample an action
-            action = np.random.choice(np.arange(0, nb_actions), p=probs)
+        nb_rounds = int(np.ceil(self.nb_stolen / self.batch_size_adaptive))
+        for i_round in trange(nb_rounds, desc="Knock-off nets", disable=not self.verbose):
+            iteration = i_round * self.batch_size_adaptive + 1
+            batch_size = min(self.batch_size_adaptive, self.nb_stolen - iteration + 1)
+
+            # Sample a batch of actions
+            actions = np.random.choice(nb_actions, size=batch_size, p=probs)
 
             # Sample data to attack
-            sampled_x = self._sample_data(x, y, action)
+            sampled_x = x[order[starts[actions] + np.random.randint(counts[actions])]]
             selected_x.append(sampled_x)
 
             # Query the victim classifier
-            y_output = self.estimator.predict(x=np.array([sampled_x]), batch_size=self.batch_size_query)
+            y_output = self.estimator.predict(x=sampled_x, batch_size=self.batch_size_query)
             fake_label = np.argmax(y_output, axis=1)
             fake_label = to_categorical(labels=fake_label, nb_classes=self.estimator.nb_classes)
-            queried_labels.append(fake_label[0])
+            queried_labels.append(fake_label)
 
             # Train the thieved classifier
             thieved_classifier.fit(
-                x=np.array([sampled_x]),
+                x=sampled_x,
                 y=fake_label,
                 batch_size=self.batch_size_fit,
                 nb_epochs=1,
@@ -247,25 +263,19 @@ class KnockoffNets(ExtractionAttack):
             )
 
             # Test new labels
-            y_hat = thieved_classifier.predict(x=np.array([sampled_x]), batch_size=self.batch_size_query)
+            y_hat = thieved_classifier.predict(x=sampled_x, batch_size=self.batch_size_query)
 
             # Compute rewards
-            reward = self._reward(y_output, y_hat, iteration)
-            avg_reward = avg_reward + (1.0 / iteration) * (reward - avg_reward)
-
-            # Update learning rate
-            learning_rate[action] += 1
-
-            # Update H function
-            for i_action in range(nb_actions):
-                if i_action != action:
-                    h_func[i_action] = (
-                        h_func[i_action] - 1.0 / learning_rate[action] * (reward - avg_reward) * probs[i_action]
-                    )
-                else:
-                    h_func[i_action] = h_func[i_action] + 1.0 / learning_rate[action] * (reward - avg_reward) * (
-                        1 - probs[i_action]
-                    )
+            rewards = self._reward(y_output, y_hat, iteration)
+
+            # Update the H function with the gradient of every action of the round under the current policy
+            for action, reward in zip(actions, rewards):
+                avg_reward = avg_reward + (1.0 / iteration) * (reward - avg_reward)
+                learning_rate[action] += 1
+                gradient = -probs.copy()
+                gradient[action] += 1
+                h_func = h_func + 1.0 / learning_rate[action] * (reward - avg_reward) * gradient
+                iteration += 1
 
             # Update probs
             aux_exp = np.exp(h_func)
@@ -273,43 +283,22 @@ class KnockoffNets(ExtractionAttack):
 
         # Train the thieved classifier the final time
         thieved_classifier.fit(
-            x=np.array(selected_x),
-            y=np.array(queried_labels),
+            x=np.concatenate(selected_x),
+            y=np.concatenate(queried_labels),
             batch_size=self.batch_size_fit,
             nb_epochs=self.nb_epochs,
         )
 
         return thieved_classifier
 
-    @staticmethod
-    def _sample_data(x: np.ndarray, y: np.ndarray, action: int) -> np.ndarray:
+    def _reward(self, y_output: np.ndarray, y_hat: np.ndarray, n: int) -> np.ndarray:
         """
-        Sample data with a specific action.
+        Compute reward values.
 
-        :param x: An array with the source input to the victim classifier.
-        :param y: Target values (class labels) one-hot-encoded of shape (nb_samples, nb_classes) or indices of shape
-                  (nb_samples,).
-        :param action: The action index returned from the action sampling.
-        :return: An array with one input to the victim classifier.
-        """
-        if len(y.shape) == 2:
-            y_index = np.argmax(y, axis=1)
-        else:
-            y_index = y
-
-        x_index = x[y_index == action]
-        rnd_idx = np.random.choice(len(x_index))
-
-        return x_index[rnd_idx]
-
-    def _reward(self, y_output: np.ndarray, y_hat: np.ndarray, n: int) -> Union[float, np.ndarray]:
-        """
-        Compute reward value.
-
-        :param y_output: Output of the victim classifier.
-        :param y_hat: Output of the thieved classifier.
-        :param n: Current iteration.
-        :return: Reward value.
+        :param y_output: Output of the victim classifier of shape `(nb_samples, nb_classes)`.
+        :param y_hat: Output of the thieved classifier of shape `(nb_samples, nb_classes)`.
+        :param n: Iteration of the first sample.
+        :return: Reward values of shape `(nb_samples,)`.
         """
         if self.reward == "cert":
             return self._reward_cert(y_output)
@@ -320,82 +309,85 @@ class KnockoffNets(ExtractionAttack):
         return self._reward_all(y_output, y_hat, n)
 
     @staticmethod
-    def _reward_cert(y_output: np.ndarray) -> float:
+    def _reward_cert(y_output: np.ndarray) -> np.ndarray:
         """
-        Compute `cert` reward value.
+        Compute `cert` reward values.
 
         :param y_output: Output of the victim classifier.
-        :return: Reward value.
+        :return: Reward values.
         """
-        largests = np.partition(y_output.flatten(), -2)[-2:]
-        reward = largests[1] - largests[0]
+        largests = np.partition(y_output, -2, axis=1)[:, -2:]
+        reward = largests[:, 1] - largests[:, 0]
 
         return reward
 
-    def _reward_div(self, y_output: np.ndarray, n: int) -> float:
+    def _reward_div(self, y_output: np.ndarray, n: int) -> np.ndarray:
         """
-        Compute `div` reward value.
+        Compute `div` reward values.
 
         :param y_output: Output of the victim classifier.
-        :param n: Current iteration.
-        :return: Reward value.
+        :param n: Iteration of the first sample.
+        :return: Reward values.
         """
-        # First update y_avg
-        self.y_avg = self.y_avg + (1.0 / n) * (y_output[0] - self.y_avg)
+        # First compute the running average of the victim output after each sample
+        iterations = np.arange(n, n + len(y_output))[:, np.newaxis]
+        y_avg = (self.y_avg * (n - 1) + np.cumsum(y_output, axis=0)) / iterations
+        self.y_avg = y_avg[-1]
 
-        # Then compute reward
-        reward = 0
-        for k in range(self.estimator.nb_classes):
-            reward += np.maximum(0, y_output[0][k] - self.y_avg[k])
+        # Then compute rewards
+        reward = np.sum(np.maximum(0, y_output - y_avg), axis=1)
 
         return reward
 
-    def _reward_loss(self, y_output: np.ndarray, y_hat: np.ndarray) -> float:
+    @staticmethod
+    def _reward_loss(y_output: np.ndarray, y_hat: np.ndarray) -> np.ndarray:
         """
-        Compute `loss` reward value.
+        Compute `loss` reward values.
 
         :param y_output: Output of the victim classifier.
         :param y_hat: Output of the thieved classifier.
-        :return: Reward value.
+        :return: Reward values.
         """
         # Compute victim probs
-        aux_exp = np.exp(y_output[0])
-        probs_output = aux_exp / np.sum(aux_exp)
+        aux_exp = np.exp(y_output)
+        probs_output = aux_exp / np.sum(aux_exp, axis=1, keepdims=True)
 
         # Compute thieved probs
-        aux_exp = np.exp(y_hat[0])
-        probs_hat = aux_exp / np.sum(aux_exp)
+        aux_exp = np.exp(y_hat)
+        probs_hat = aux_exp / np.sum(aux_exp, axis=1, keepdims=True)
 
-        # Compute reward
-        reward = 0
-        for k in range(self.estimator.nb_classes):
-            reward += -probs_output[k] * np.log(probs_hat[k])
+        # Compute rewards
+        reward = np.sum(-probs_output * np.log(probs_hat), axis=1)
 
         return reward
 
-    def _reward_all(self, y_output: np.ndarray, y_hat: np.ndarray, n: int) -> float:
+    def _reward_all(self, y_output: np.ndarray, y_hat: np.ndarray, n: int) -> np.ndarray:
         """
-        Compute `all` reward value.
+        Compute `all` reward values.
 
         :param y_output: Output of the victim classifier.
         :param y_hat: Output of the thieved classifier.
-        :param n: Current iteration.
-        :return: Reward value.
+        :param n: Iteration of the first sample.
+        :return: Reward values.
         """
         reward_cert = self._reward_cert(y_output)
         reward_div = self._reward_div(y_output, n)
         reward_loss = self._reward_loss(y_output, y_hat)
-        reward = [reward_cert, reward_div, reward_loss]
-        self.reward_avg = self.reward_avg + (1.0 / n) * (reward - self.reward_avg)
-        self.reward_var = self.reward_var + (1.0 / n) * ((reward - self.reward_avg) ** 2 - self.reward_var)
+        reward = np.stack([reward_cert, reward_div, reward_loss], axis=1)
+
+        # Running average and variance of the rewards after each sample
+        iterations = np.arange(n, n + len(y_output))[:, np.newaxis]
+        reward_avg = (self.reward_avg * (n - 1) + np.cumsum(reward, axis=0)) / iterations
+        reward_var = (self.reward_var * (n - 1) + np.cumsum((reward - reward_avg) ** 2, axis=0)) / iterations
+        self.reward_avg = reward_avg[-1]
+        self.reward_var = reward_var[-1]
 
         # Normalize rewards
-        if n > 1:
-            reward = (reward - self.reward_avg) / np.sqrt(self.reward_var)
-        else:
-            reward = [max(min(r, 1), 0) for r in reward]
+        normalized = np.clip(reward, 0, 1)
+        later = iterations[:, 0] > 1
+        normalized[later] = (reward[later] - reward_avg[later]) / np.sqrt(reward_var[later])
 
-        return float(np.mean(reward))
+        return np.mean(normalized, axis=1)
 
     def _check_params(self) -> None:
         if not isinstance(self.batch_size_fit, int) or self.batch_size_fit <= 0:
@@ -420,3 +412,6 @@ class KnockoffNets(ExtractionAttack):
             raise ValueError("The argument `verbose` has to be of type bool.")
         if not isinstance(self.use_probability, bool):
             raise ValueError("The argument `use_probability` has to be of type bool.")
+
+        if not isinstance(self.batch_size_adaptive, int) or self.batch_size_adaptive <= 0:
+            raise ValueError("The number of actions per round of adaptive sampling must be a positive integer.")
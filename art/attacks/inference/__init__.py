@@ -1,7 +1,14 @@
 """
 Module providing inference attacks.
 """
-from art.attacks.inference import attribute_inference
-from art.attacks.inference import membership_inference
-from art.attacks.inference import model_inversion
-from art.attacks.inference import reconstruction
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.attacks.inference import attribute_inference, membership_inference, model_inversion, reconstruction
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["attribute_inference", "membership_inference", "model_inversion", "reconstruction"],
+)
@@ -1,8 +1,24 @@
 """
 Module providing membership inference attacks.
 """
-from art.attacks.inference.membership_inference.black_box import MembershipInferenceBlackBox
-from art.attacks.inference.membership_inference.black_box_rule_based import MembershipInferenceBlackBoxRuleBased
-from art.attacks.inference.membership_inference.label_only_gap_attack import LabelOnlyGapAttack
-from art.attacks.inference.membership_inference.label_only_boundary_distance import LabelOnlyDecisionBoundary
-from art.attacks.inference.membership_inference.shadow_models import ShadowModels
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.attacks.inference.membership_inference.black_box import MembershipInferenceBlackBox
+    from art.attacks.inference.membership_inference.black_box_rule_based import MembershipInferenceBlackBoxRuleBased
+    from art.attacks.inference.membership_inference.label_only_gap_attack import LabelOnlyGapAttack
+    from art.attacks.inference.membership_inference.label_only_boundary_distance import LabelOnlyDecisionBoundary
+    from art.attacks.inference.membership_inference.shadow_models import ShadowModels
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "black_box": ["MembershipInferenceBlackBox"],
+        "black_box_rule_based": ["MembershipInferenceBlackBoxRuleBased"],
+        "label_only_gap_attack": ["LabelOnlyGapAttack"],
+        "label_only_boundary_distance": ["LabelOnlyDecisionBoundary"],
+        "shadow_models": ["ShadowModels"],
+    },
+)
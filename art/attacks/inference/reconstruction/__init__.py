@@ -1,4 +1,16 @@
 """
 Module providing model inversion attacks.
 """
-from art.attacks.inference.reconstruction.white_box import DatabaseReconstruction
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.attacks.inference.reconstruction.white_box import DatabaseReconstruction
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "white_box": ["DatabaseReconstruction"],
+    },
+)
@@ -1,8 +1,16 @@
 """
 Module providing perturbation functions under a common interface
 """
-from art.attacks.poisoning.perturbations.image_perturbations import (
-    add_pattern_bd,
-    add_single_bd,
-    insert_image,
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.attacks.poisoning.perturbations.image_perturbations import add_pattern_bd, add_single_bd, insert_image
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "image_perturbations": ["add_pattern_bd", "add_single_bd", "insert_image"],
+    },
 )
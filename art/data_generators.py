@@ -27,7 +27,13 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import abc
 import inspect
 import logging
-from typing import Any, Dict, Generator, Iterator, Optional, Tuple, Union, TYPE_CHECKING
+import multiprocessing
+import queue
+import threading
+import time
+import traceback
+import weakref
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 
@@ -415,3 +421,294 @@ class TensorFlowV2DataGenerator(DataGenerator):
         # Get next batch
         x, y = next(self._iterator_iter)
         return x.numpy(), y.numpy()
+
+
+class PrefetchingDataGenerator(DataGenerator):
+    """
+    Wrapper class on top of any :class:`.DataGenerator` preparing the next batches on background threads or processes,
+    so that data loading and augmentation overlap with the training step consuming the batches.
+    """
+
+    def __init__(
+        self,
+        generator: DataGenerator,
+        prefetch: int = 2,
+        nb_workers: int = 1,
+        parallel_backend: str = "threads",
+        pin_memory: bool = False,
+    ) -> None:
+        """
+        Create a prefetching data generator wrapper and start its workers.
+
+        :param generator: The data generator to wrap. With the `processes` backend the generator has to be picklable and
+                          every worker process draws its batches from its own copy of the generator, which suits
+                          generators shuffling or augmenting their data.
+        :param prefetch: Number of batches prepared ahead of the consumer, which bounds the queue of ready batches.
+        :param nb_workers: Number of background threads or processes preparing batches. Threads share the wrapped
+                           generator and call its `get_batch` one at a time, so that the order of the batches is only
+                           preserved with a single worker.
+        :param parallel_backend: `threads` to prepare the batches on threads of this process or `processes` to prepare
+                                 them in separate processes, which transfer the NumPy arrays through shared memory.
+        :param pin_memory: Whether to return the NumPy arrays of the batches in page-locked memory, which speeds up
+                           their transfer to a GPU. Requires PyTorch with CUDA.
+        :raises `TypeError`, `ValueError`: If input parameters are not valid.
+        """
+        if not isinstance(generator, DataGenerator):
+            raise TypeError(f"Expected instance of `DataGenerator`, received {type(generator)} instead.")
+        if not isinstance(prefetch, int) or prefetch < 1:
+            raise ValueError("The number of prefetched batches must be an integer greater than zero.")
+        if not isinstance(nb_workers, int) or nb_workers < 1:
+            raise ValueError("The number of workers must be an integer greater than zero.")
+        if parallel_backend not in ["threads", "processes"]:
+            raise ValueError("The parallel backend must be either `threads` or `processes`.")
+
+        super().__init__(size=generator.size, batch_size=generator.batch_size)
+        self.generator = generator
+        self.prefetch = prefetch
+        self.nb_workers = nb_workers
+        self.parallel_backend = parallel_backend
+        self.pin_memory = pin_memory
+        self._iterator = generator.iterator
+
+        if self.pin_memory:
+            import torch
+
+            if not torch.cuda.is_available():
+                logger.warning("Page-locked memory requires CUDA, the batches are returned in pageable memory.")
+                self.pin_memory = False
+
+        self.metrics: Dict[str, float] = {"nb_batches": 0, "nb_stalls": 0, "stall_time": 0.0, "queue_depth": 0.0}
+        self._blocks: Dict[Tuple[int, int], Any] = {}
+
+        if self.parallel_backend == "threads":
+            self._queue: Any = queue.Queue(maxsize=prefetch)
+            self._stop: Any = threading.Event()
+            lock = threading.Lock()
+            workers: list = [
+                threading.Thread(
+                    target=_prefetch_thread,
+                    args=(generator, lock, self._queue, self._stop, self.pin_memory),
+                    daemon=True,
+                )
+                for _ in range(nb_workers)
+            ]
+            self._free_queues: list = []
+        else:
+            context = multiprocessing.get_context("spawn")
+            self._queue = context.Queue()
+            self._stop = context.Event()
+            self._free_queues = [context.Queue() for _ in range(nb_workers)]
+            nb_slots = int(np.ceil(prefetch / nb_workers))
+            seeds = np.random.randint(0, 2 ** 31 - 1, size=nb_workers)
+            workers = []
+            for i_worker in range(nb_workers):
+                for i_slot in range(nb_slots):
+                    self._free_queues[i_worker].put(i_slot)
+                workers.append(
+                    context.Process(
+                        target=_prefetch_process,
+                        args=(
+                            generator,
+                            i_worker,
+                            int(seeds[i_worker]),
+                            nb_slots,
+                            self._queue,
+                            self._free_queues[i_worker],
+                            self._stop,
+                        ),
+                        daemon=True,
+                    )
+                )
+
+        for worker in workers:
+            worker.start()
+        self._workers = workers
+        self._finalizer = weakref.finalize(self, _stop_prefetching, self._stop, workers, self._blocks)
+
+    def get_batch(self) -> tuple:
+        """
+        Provide the next prefetched batch for training in the form of a tuple `(x, y)`. The generator loops over the
+        data indefinitely.
+
+        :return: A tuple containing a batch of data `(x, y)`.
+        """
+        if not self._finalizer.alive:
+            raise ValueError("The data generator has been closed.")
+
+        try:
+            depth = self._queue.qsize()
+        except NotImplementedError:  # pragma: no cover
+            depth = 0
+        start = time.perf_counter()
+        item = self._get_item()
+        stall_time = time.perf_counter() - start
+
+        self.metrics["queue_depth"] = (self.metrics["queue_depth"] * self.metrics["nb_batches"] + depth) / (
+            self.metrics["nb_batches"] + 1
+        )
+        self.metrics["nb_batches"] += 1
+        if depth == 0:
+            self.metrics["nb_stalls"] += 1
+            self.metrics["stall_time"] += stall_time
+
+        if self.parallel_backend == "threads":
+            batch, exception = item
+            if exception is not None:
+                self.close()
+                raise exception
+            return batch
+
+        if item[0] == "error":
+            self.close()
+            raise RuntimeError(f"A prefetching worker failed with the following error:\n{item[1]}")
+        return self._read_batch(*item)
+
+    def close(self) -> None:
+        """
+        Stop the workers and release the shared memory of the prefetched batches.
+        """
+        self._finalizer()
+
+    def __enter__(self) -> "PrefetchingDataGenerator":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _get_item(self) -> Any:
+        """
+        Wait for the next item of the queue of ready batches, failing if all worker processes died without a message.
+        """
+        while True:
+            try:
+                return self._queue.get(timeout=1.0)
+            except queue.Empty as empty:
+                if self.parallel_backend == "processes" and not any(worker.is_alive() for worker in self._workers):
+                    self.close()
+                    raise RuntimeError("All prefetching worker processes have stopped unexpectedly.") from empty
+
+    def _read_batch(self, i_worker: int, i_slot: int, name: str, specs: list) -> tuple:
+        """
+        Copy a batch out of the shared memory block of a worker and hand the block back to the worker.
+        """
+        from multiprocessing import shared_memory
+
+        block = self._blocks.get((i_worker, i_slot))
+        if block is None or block.name != name:
+            if block is not None:
+                block.close()
+            block = shared_memory.SharedMemory(name=name)
+            self._blocks[(i_worker, i_slot)] = block
+
+        batch = []
+        for spec in specs:
+            if spec[0] == "array":
+                batch.append(
+                    _copy_array(np.ndarray(spec[1], dtype=spec[2], buffer=block.buf, offset=spec[3]), self.pin_memory)
+                )
+            else:
+                batch.append(spec[1])
+        self._free_queues[i_worker].put(i_slot)
+        return tuple(batch)
+
+
+def _copy_array(array: np.ndarray, pin_memory: bool) -> np.ndarray:
+    """
+    Copy an array into a new contiguous array in pageable or page-locked memory.
+    """
+    if pin_memory:
+        import torch
+
+        return torch.from_numpy(np.ascontiguousarray(array)).pin_memory().numpy()
+    return np.array(array, order="C", copy=True)
+
+
+def _prefetch_thread(generator: DataGenerator, lock: Any, ready_queue: Any, stop: Any, pin_memory: bool) -> None:
+    """
+    Prepare batches of a data generator shared with the other threads until stopped or until the generator fails.
+    """
+    while not stop.is_set():
+        try:
+            with lock:
+                batch = generator.get_batch()
+            if pin_memory:
+                batch = tuple(_copy_array(item, True) if isinstance(item, np.ndarray) else item for item in batch)
+            item: Tuple[Optional[tuple], Optional[Exception]] = (batch, None)
+        except Exception as exception:  # pylint: disable=W0703
+            item = (None, exception)
+
+        while not stop.is_set():
+            try:
+                ready_queue.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+
+        if item[1] is not None:
+            return
+
+
+def _prefetch_process(
+    generator: DataGenerator,
+    i_worker: int,
+    seed: int,
+    nb_slots: int,
+    ready_queue: Any,
+    free_queue: Any,
+    stop: Any,
+) -> None:
+    """
+    Prepare batches of a copy of a data generator in a ring of shared memory blocks until stopped or until the
+    generator fails. The consumer hands a block back through `free_queue` once it has copied the batch out of it.
+    """
+    from multiprocessing import shared_memory
+
+    np.random.seed(seed)
+    blocks: list = [None] * nb_slots
+
+    try:
+        while not stop.is_set():
+            try:
+                i_slot = free_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+            batch = generator.get_batch()
+            nbytes = sum(np.asarray(item).nbytes for item in batch if isinstance(item, np.ndarray))
+            if blocks[i_slot] is None or blocks[i_slot].size < nbytes:
+                if blocks[i_slot] is not None:
+                    blocks[i_slot].close()
+                    blocks[i_slot].unlink()
+                blocks[i_slot] = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+
+            specs: List[tuple] = []
+            offset = 0
+            for item in batch:
+                if isinstance(item, np.ndarray):
+                    np.ndarray(item.shape, dtype=item.dtype, buffer=blocks[i_slot].buf, offset=offset)[...] = item
+                    specs.append(("array", item.shape, item.dtype.str, offset))
+                    offset += item.nbytes
+                else:
+                    specs.append(("object", item))
+            ready_queue.put((i_worker, i_slot, blocks[i_slot].name, specs))
+    except Exception:  # pylint: disable=W0703
+        ready_queue.put(("error", traceback.format_exc()))
+    finally:
+        for block in blocks:
+            if block is not None:
+                block.close()
+                block.unlink()
+
+
+def _stop_prefetching(stop: Any, workers: list, blocks: Dict[Tuple[int, int], Any]) -> None:
+    """
+    Stop the workers of a prefetching data generator and close the shared memory blocks attached by the consumer.
+    """
+    stop.set()
+    for worker in workers:
+        worker.join(timeout=1.0)
+        if isinstance(worker, multiprocessing.process.BaseProcess) and worker.is_alive():
+            worker.terminate()
+    for block in blocks.values():
+        block.close()
+    blocks.clear()
@@ -1,7 +1,22 @@
 """
 Module implementing detector-based defences against evasion attacks.
 """
-from art.defences.detector.evasion.evasion_detector import EvasionDetector
-from art.defences.detector.evasion.binary_input_detector import BinaryInputDetector
-from art.defences.detector.evasion.binary_activation_detector import BinaryActivationDetector
-from art.defences.detector.evasion.subsetscanning.detector import SubsetScanningDetector
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.defences.detector.evasion.evasion_detector import EvasionDetector
+    from art.defences.detector.evasion.binary_input_detector import BinaryInputDetector
+    from art.defences.detector.evasion.binary_activation_detector import BinaryActivationDetector
+    from art.defences.detector.evasion.subsetscanning.detector import SubsetScanningDetector
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "evasion_detector": ["EvasionDetector"],
+        "binary_input_detector": ["BinaryInputDetector"],
+        "binary_activation_detector": ["BinaryActivationDetector"],
+        "subsetscanning.detector": ["SubsetScanningDetector"],
+    },
+)
@@ -1,9 +1,26 @@
 """
 Module implementing postprocessing defences against adversarial attacks.
 """
-from art.defences.postprocessor.class_labels import ClassLabels
-from art.defences.postprocessor.gaussian_noise import GaussianNoise
-from art.defences.postprocessor.high_confidence import HighConfidence
-from art.defences.postprocessor.postprocessor import Postprocessor
-from art.defences.postprocessor.reverse_sigmoid import ReverseSigmoid
-from art.defences.postprocessor.rounded import Rounded
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.defences.postprocessor.class_labels import ClassLabels
+    from art.defences.postprocessor.gaussian_noise import GaussianNoise
+    from art.defences.postprocessor.high_confidence import HighConfidence
+    from art.defences.postprocessor.postprocessor import Postprocessor
+    from art.defences.postprocessor.reverse_sigmoid import ReverseSigmoid
+    from art.defences.postprocessor.rounded import Rounded
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "class_labels": ["ClassLabels"],
+        "gaussian_noise": ["GaussianNoise"],
+        "high_confidence": ["HighConfidence"],
+        "postprocessor": ["Postprocessor"],
+        "reverse_sigmoid": ["ReverseSigmoid"],
+        "rounded": ["Rounded"],
+    },
+)
@@ -1,29 +1,66 @@
 """
 Module implementing preprocessing defences against adversarial attacks.
 """
-from art.defences.preprocessor.cutmix.cutmix import CutMix
-from art.defences.preprocessor.cutmix.cutmix_pytorch import CutMixPyTorch
-from art.defences.preprocessor.cutmix.cutmix_tensorflow import CutMixTensorFlowV2
-from art.defences.preprocessor.cutout.cutout import Cutout
-from art.defences.preprocessor.cutout.cutout_pytorch import CutoutPyTorch
-from art.defences.preprocessor.cutout.cutout_tensorflow import CutoutTensorFlowV2
-from art.defences.preprocessor.feature_squeezing import FeatureSqueezing
-from art.defences.preprocessor.gaussian_augmentation import GaussianAugmentation
-from art.defences.preprocessor.inverse_gan import DefenseGAN, InverseGAN
-from art.defences.preprocessor.jpeg_compression import JpegCompression
-from art.defences.preprocessor.label_smoothing import LabelSmoothing
-from art.defences.preprocessor.mixup.mixup import Mixup
-from art.defences.preprocessor.mixup.mixup_pytorch import MixupPyTorch
-from art.defences.preprocessor.mixup.mixup_tensorflow import MixupTensorFlowV2
-from art.defences.preprocessor.mp3_compression import Mp3Compression
-from art.defences.preprocessor.mp3_compression_pytorch import Mp3CompressionPyTorch
-from art.defences.preprocessor.pixel_defend import PixelDefend
-from art.defences.preprocessor.preprocessor import Preprocessor
-from art.defences.preprocessor.resample import Resample
-from art.defences.preprocessor.spatial_smoothing import SpatialSmoothing
-from art.defences.preprocessor.spatial_smoothing_pytorch import SpatialSmoothingPyTorch
-from art.defences.preprocessor.spatial_smoothing_tensorflow import SpatialSmoothingTensorFlowV2
-from art.defences.preprocessor.thermometer_encoding import ThermometerEncoding
-from art.defences.preprocessor.variance_minimization import TotalVarMin
-from art.defences.preprocessor.video_compression import VideoCompression
-from art.defences.preprocessor.video_compression_pytorch import VideoCompressionPyTorch
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.defences.preprocessor.cutmix.cutmix import CutMix
+    from art.defences.preprocessor.cutmix.cutmix_pytorch import CutMixPyTorch
+    from art.defences.preprocessor.cutmix.cutmix_tensorflow import CutMixTensorFlowV2
+    from art.defences.preprocessor.cutout.cutout import Cutout
+    from art.defences.preprocessor.cutout.cutout_pytorch import CutoutPyTorch
+    from art.defences.preprocessor.cutout.cutout_tensorflow import CutoutTensorFlowV2
+    from art.defences.preprocessor.feature_squeezing import FeatureSqueezing
+    from art.defences.preprocessor.gaussian_augmentation import GaussianAugmentation
+    from art.defences.preprocessor.inverse_gan import DefenseGAN, InverseGAN
+    from art.defences.preprocessor.jpeg_compression import JpegCompression
+    from art.defences.preprocessor.label_smoothing import LabelSmoothing
+    from art.defences.preprocessor.mixup.mixup import Mixup
+    from art.defences.preprocessor.mixup.mixup_pytorch import MixupPyTorch
+    from art.defences.preprocessor.mixup.mixup_tensorflow import MixupTensorFlowV2
+    from art.defences.preprocessor.mp3_compression import Mp3Compression
+    from art.defences.preprocessor.mp3_compression_pytorch import Mp3CompressionPyTorch
+    from art.defences.preprocessor.pixel_defend import PixelDefend
+    from art.defences.preprocessor.preprocessor import Preprocessor
+    from art.defences.preprocessor.resample import Resample
+    from art.defences.preprocessor.spatial_smoothing import SpatialSmoothing
+    from art.defences.preprocessor.spatial_smoothing_pytorch import SpatialSmoothingPyTorch
+    from art.defences.preprocessor.spatial_smoothing_tensorflow import SpatialSmoothingTensorFlowV2
+    from art.defences.preprocessor.thermometer_encoding import ThermometerEncoding
+    from art.defences.preprocessor.variance_minimization import TotalVarMin
+    from art.defences.preprocessor.video_compression import VideoCompression
+    from art.defences.preprocessor.video_compression_pytorch import VideoCompressionPyTorch
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "cutmix.cutmix": ["CutMix"],
+        "cutmix.cutmix_pytorch": ["CutMixPyTorch"],
+        "cutmix.cutmix_tensorflow": ["CutMixTensorFlowV2"],
+        "cutout.cutout": ["Cutout"],
+        "cutout.cutout_pytorch": ["CutoutPyTorch"],
+        "cutout.cutout_tensorflow": ["CutoutTensorFlowV2"],
+        "feature_squeezing": ["FeatureSqueezing"],
+        "gaussian_augmentation": ["GaussianAugmentation"],
+        "inverse_gan": ["DefenseGAN", "InverseGAN"],
+        "jpeg_compression": ["JpegCompression"],
+        "label_smoothing": ["LabelSmoothing"],
+        "mixup.mixup": ["Mixup"],
+        "mixup.mixup_pytorch": ["MixupPyTorch"],
+        "mixup.mixup_tensorflow": ["MixupTensorFlowV2"],
+        "mp3_compression": ["Mp3Compression"],
+        "mp3_compression_pytorch": ["Mp3CompressionPyTorch"],
+        "pixel_defend": ["PixelDefend"],
+        "preprocessor": ["Preprocessor"],
+        "resample": ["Resample"],
+        "spatial_smoothing": ["SpatialSmoothing"],
+        "spatial_smoothing_pytorch": ["SpatialSmoothingPyTorch"],
+        "spatial_smoothing_tensorflow": ["SpatialSmoothingTensorFlowV2"],
+        "thermometer_encoding": ["ThermometerEncoding"],
+        "variance_minimization": ["TotalVarMin"],
+        "video_compression": ["VideoCompression"],
+        "video_compression_pytorch": ["VideoCompressionPyTorch"],
+    },
+)
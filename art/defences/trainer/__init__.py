@@ -1,17 +1,42 @@
 """
 Module implementing train-based defences against adversarial attacks.
 """
-from art.defences.trainer.trainer import Trainer
-from art.defences.trainer.adversarial_trainer import AdversarialTrainer
-from art.defences.trainer.certified_adversarial_trainer_pytorch import AdversarialTrainerCertifiedPytorch
-from art.defences.trainer.ibp_certified_trainer_pytorch import AdversarialTrainerCertifiedIBPPyTorch
-from art.defences.trainer.adversarial_trainer_madry_pgd import AdversarialTrainerMadryPGD
-from art.defences.trainer.adversarial_trainer_fbf import AdversarialTrainerFBF
-from art.defences.trainer.adversarial_trainer_fbf_pytorch import AdversarialTrainerFBFPyTorch
-from art.defences.trainer.adversarial_trainer_trades import AdversarialTrainerTRADES
-from art.defences.trainer.adversarial_trainer_trades_pytorch import AdversarialTrainerTRADESPyTorch
-from art.defences.trainer.adversarial_trainer_awp import AdversarialTrainerAWP
-from art.defences.trainer.adversarial_trainer_awp_pytorch import AdversarialTrainerAWPPyTorch
-from art.defences.trainer.adversarial_trainer_oaat import AdversarialTrainerOAAT
-from art.defences.trainer.adversarial_trainer_oaat_pytorch import AdversarialTrainerOAATPyTorch
-from art.defences.trainer.dp_instahide_trainer import DPInstaHideTrainer
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.defences.trainer.trainer import Trainer
+    from art.defences.trainer.adversarial_trainer import AdversarialTrainer
+    from art.defences.trainer.certified_adversarial_trainer_pytorch import AdversarialTrainerCertifiedPytorch
+    from art.defences.trainer.ibp_certified_trainer_pytorch import AdversarialTrainerCertifiedIBPPyTorch
+    from art.defences.trainer.adversarial_trainer_madry_pgd import AdversarialTrainerMadryPGD
+    from art.defences.trainer.adversarial_trainer_fbf import AdversarialTrainerFBF
+    from art.defences.trainer.adversarial_trainer_fbf_pytorch import AdversarialTrainerFBFPyTorch
+    from art.defences.trainer.adversarial_trainer_trades import AdversarialTrainerTRADES
+    from art.defences.trainer.adversarial_trainer_trades_pytorch import AdversarialTrainerTRADESPyTorch
+    from art.defences.trainer.adversarial_trainer_awp import AdversarialTrainerAWP
+    from art.defences.trainer.adversarial_trainer_awp_pytorch import AdversarialTrainerAWPPyTorch
+    from art.defences.trainer.adversarial_trainer_oaat import AdversarialTrainerOAAT
+    from art.defences.trainer.adversarial_trainer_oaat_pytorch import AdversarialTrainerOAATPyTorch
+    from art.defences.trainer.dp_instahide_trainer import DPInstaHideTrainer
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "trainer": ["Trainer"],
+        "adversarial_trainer": ["AdversarialTrainer"],
+        "certified_adversarial_trainer_pytorch": ["AdversarialTrainerCertifiedPytorch"],
+        "ibp_certified_trainer_pytorch": ["AdversarialTrainerCertifiedIBPPyTorch"],
+        "adversarial_trainer_madry_pgd": ["AdversarialTrainerMadryPGD"],
+        "adversarial_trainer_fbf": ["AdversarialTrainerFBF"],
+        "adversarial_trainer_fbf_pytorch": ["AdversarialTrainerFBFPyTorch"],
+        "adversarial_trainer_trades": ["AdversarialTrainerTRADES"],
+        "adversarial_trainer_trades_pytorch": ["AdversarialTrainerTRADESPyTorch"],
+        "adversarial_trainer_awp": ["AdversarialTrainerAWP"],
+        "adversarial_trainer_awp_pytorch": ["AdversarialTrainerAWPPyTorch"],
+        "adversarial_trainer_oaat": ["AdversarialTrainerOAAT"],
+        "adversarial_trainer_oaat_pytorch": ["AdversarialTrainerOAATPyTorch"],
+        "dp_instahide_trainer": ["DPInstaHideTrainer"],
+    },
+)
@@ -20,7 +20,8 @@ This module implements adversarial training based on a model and one or multiple
 original adversarial training, ensemble adversarial training, training on all adversarial data and other common setups.
 If multiple attacks are specified, they are rotated for each batch. If the specified attacks have as target a different
 model, then the attack is transferred. The `ratio` determines how many of the clean samples in each batch are replaced
-with their adversarial counterpart.
+with their adversarial counterpart. Adversarial samples can be crafted by background workers against a periodically
+refreshed snapshot of the model while the model is trained.
 
 .. warning:: Both successful and unsuccessful adversarial samples are used for training. In the case of
               unbounded attacks (e.g., DeepFool), this can result in invalid (very noisy) samples being included.
@@ -33,8 +34,13 @@ with their adversarial counterpart.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import copy
 import logging
-from typing import List, Optional, Union, TYPE_CHECKING
+import queue
+import time
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
 from tqdm.auto import trange, tqdm
@@ -58,6 +64,11 @@ class AdversarialTrainer(Trainer):
     for each batch. If the specified attacks have as target a different model, then the attack is transferred. The
     `ratio` determines how many of the clean samples in each batch are replaced with their adversarial counterpart.
 
+    With `nb_workers` larger than 0, adversarial batches are crafted by background workers into a bounded queue while
+    the model is trained. The workers attack their own snapshot of the model, whose weights are refreshed every
+    `max_staleness` training steps, and transferred attacks are crafted batch by batch instead of upfront. The time
+    spent attacking, training and waiting is reported in `metrics` after training.
+
      .. warning:: Both successful and unsuccessful adversarial samples are used for training. In the case of
                   unbounded attacks (e.g., DeepFool), this can result in invalid (very noisy) samples being included.
 
@@ -73,6 +84,9 @@ class AdversarialTrainer(Trainer):
         classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE",
         attacks: Union["EvasionAttack", List["EvasionAttack"]],
         ratio: float = 0.5,
+        nb_workers: int = 0,
+        queue_size: int = 4,
+        max_staleness: int = 1,
     ) -> None:
         """
         Create an :class:`.AdversarialTrainer` instance.
@@ -81,6 +95,12 @@ class AdversarialTrainer(Trainer):
         :param attacks: attacks to use for data augmentation in adversarial training
         :param ratio: The proportion of samples in each batch to be replaced with their adversarial counterparts.
                       Setting this value to 1 allows to train only on adversarial samples.
+        :param nb_workers: Number of background threads crafting adversarial batches against snapshots of the model. If
+                           0, adversarial samples are crafted before each training step. Background workers require a
+                           classifier that can be copied and used from several threads, e.g. a `PyTorchClassifier`.
+        :param queue_size: Maximum number of batches crafted ahead of the training step.
+        :param max_staleness: Number of training steps after which the weights of the snapshots attacked by the
+                              background workers are refreshed.
         """
         from art.attacks.attack import EvasionAttack
 
@@ -96,9 +116,26 @@ class AdversarialTrainer(Trainer):
             raise ValueError("The `ratio` of adversarial samples in each batch has to be between 0 and 1.")
         self.ratio = ratio
 
+        if not isinstance(nb_workers, int) or nb_workers < 0:
+            raise ValueError("The number of workers `nb_workers` has to be a non-negative integer.")
+        self.nb_workers = nb_workers
+
+        if not isinstance(queue_size, int) or queue_size < 1:
+            raise ValueError("The size of the queue `queue_size` has to be a positive integer.")
+        self.queue_size = queue_size
+
+        if not isinstance(max_staleness, int) or max_staleness < 1:
+            raise ValueError("The staleness `max_staleness` has to be a positive integer.")
+        self.max_staleness = max_staleness
+
         self._precomputed_adv_samples: List[Optional[np.ndarray]] = []
         self.x_augmented: Optional[np.ndarray] = None
         self.y_augmented: Optional[np.ndarray] = None
+        self.metrics: Dict[str, float] = {}
+
+        self._producers: "queue.Queue[_AdversarialProducer]" = queue.Queue()
+        self._published: Tuple[int, Any] = (0, None)
+        self._transferred_cache: List[Optional[Tuple[np.ndarray, np.ndarray]]] = []
 
     def fit_generator(self, generator: "DataGenerator", nb_epochs: int = 20, **kwargs) -> None:
         """
@@ -118,6 +155,13 @@ class AdversarialTrainer(Trainer):
         ind = np.arange(generator.size)
         attack_id = 0
 
+        if self.nb_workers > 0:
+            self._check_attacks()
+            self._fit_async(self._generator_tasks(generator, nb_batches, nb_epochs), nb_batches * nb_epochs, **kwargs)
+            return
+
+        self._start_metrics()
+
         # Precompute adversarial samples for transferred attacks
         logged = False
         self._precomputed_adv_samples = []
@@ -135,7 +179,9 @@ class AdversarialTrainer(Trainer):
                 for batch_id in range(nb_batches):
                     # Create batch data
                     x_batch, y_batch = generator.get_batch()
+                    start = time.perf_counter()
                     x_adv_batch = attack.generate(x_batch, y=y_batch)
+                    self.metrics["attack_time"] += time.perf_counter() - start
                     if batch_id == 0:
                         next_precomputed_adv_samples = x_adv_batch
                     else:
@@ -168,7 +214,9 @@ class AdversarialTrainer(Trainer):
                         adv_ids = np.array(list(range(x_batch.shape[0])))
                         np.random.shuffle(adv_ids)
 
+                    start = time.perf_counter()
                     x_batch[adv_ids] = attack.generate(x_batch[adv_ids], y=y_batch[adv_ids])
+                    self.metrics["attack_time"] += time.perf_counter() - start
 
                 # Otherwise, use precomputed adversarial samples
                 else:
@@ -188,11 +236,11 @@ class AdversarialTrainer(Trainer):
                     x_batch[adv_ids] = x_adv
 
                 # Fit batch
-                self._classifier.fit(
-                    x_batch, y_batch, nb_epochs=1, batch_size=x_batch.shape[0], verbose=False, **kwargs
-                )
+                self._fit_batch(x_batch, y_batch, **kwargs)
                 attack_id = (attack_id + 1) % len(self.attacks)
 
+        self._stop_metrics()
+
     def fit(  # pylint: disable=W0221
         self, x: np.ndarray, y: np.ndarray, batch_size: int = 128, nb_epochs: int = 20, **kwargs
     ) -> None:
@@ -211,6 +259,18 @@ class AdversarialTrainer(Trainer):
         ind = np.arange(len(x))
         attack_id = 0
 
+        if self.nb_workers > 0:
+            self._check_attacks()
+            self._transferred_cache = [
+                None if attack.estimator == self._classifier else (np.zeros_like(x), np.zeros(len(x), dtype=bool))
+                for attack in self.attacks
+            ]
+            self._fit_async(self._array_tasks(x, y, batch_size, nb_epochs), nb_batches * nb_epochs, **kwargs)
+            self._transferred_cache = []
+            return
+
+        self._start_metrics()
+
         # Precompute adversarial samples for transferred attacks
         logged = False
         self._precomputed_adv_samples = []
@@ -224,7 +284,9 @@ class AdversarialTrainer(Trainer):
                 if not logged:
                     logger.info("Precomputing transferred adversarial samples.")
                     logged = True
+                start = time.perf_counter()
                 self._precomputed_adv_samples.append(attack.generate(x, y=y))
+                self.metrics["attack_time"] += time.perf_counter() - start
             else:
                 self._precomputed_adv_samples.append(None)
 
@@ -250,7 +312,9 @@ class AdversarialTrainer(Trainer):
 
                 # If source and target models are the same, craft fresh adversarial samples
                 if attack.estimator == self._classifier:
+                    start = time.perf_counter()
                     x_batch[adv_ids] = attack.generate(x_batch[adv_ids], y=y_batch[adv_ids])
+                    self.metrics["attack_time"] += time.perf_counter() - start
 
                 # Otherwise, use precomputed adversarial samples
                 else:
@@ -262,11 +326,11 @@ class AdversarialTrainer(Trainer):
                     x_batch[adv_ids] = x_adv
 
                 # Fit batch
-                self._classifier.fit(
-                    x_batch, y_batch, nb_epochs=1, batch_size=x_batch.shape[0], verbose=False, **kwargs
-                )
+                self._fit_batch(x_batch, y_batch, **kwargs)
                 attack_id = (attack_id + 1) % len(self.attacks)
 
+        self._stop_metrics()
+
     def predict(self, x: np.ndarray, **kwargs) -> np.ndarray:
         """
         Perform prediction using the adversarially trained classifier.
@@ -276,3 +340,227 @@ class AdversarialTrainer(Trainer):
         :return: Predictions for test set.
         """
         return self._classifier.predict(x, **kwargs)
+
+    def _fit_batch(self, x_batch: np.ndarray, y_batch: np.ndarray, **kwargs) -> None:
+        """
+        Fit the classifier on one batch and record the training time.
+        """
+        start = time.perf_counter()
+        self._classifier.fit(x_batch, y_batch, nb_epochs=1, batch_size=x_batch.shape[0], verbose=False, **kwargs)
+        self.metrics["train_time"] += time.perf_counter() - start
+        self.metrics["nb_batches"] += 1
+        self.metrics["nb_samples"] += x_batch.shape[0]
+
+    def _start_metrics(self) -> None:
+        """
+        Reset the throughput metrics at the start of training.
+        """
+        self.metrics = {
+            "wall_time": time.perf_counter(),
+            "attack_time": 0.0,
+            "train_time": 0.0,
+            "wait_time": 0.0,
+            "nb_batches": 0,
+            "nb_samples": 0,
+            "staleness_mean": 0.0,
+            "staleness_max": 0,
+        }
+
+    def _stop_metrics(self) -> None:
+        """
+        Compute the utilization of the attack workers and of the training loop at the end of training.
+        """
+        wall_time = time.perf_counter() - self.metrics["wall_time"]
+        self.metrics["wall_time"] = wall_time
+        self.metrics["attack_utilization"] = self.metrics["attack_time"] / (wall_time * max(self.nb_workers, 1))
+        self.metrics["train_utilization"] = self.metrics["train_time"] / wall_time
+        self.metrics["samples_per_second"] = self.metrics["nb_samples"] / wall_time
+        if self.metrics["nb_batches"] > 0:
+            self.metrics["staleness_mean"] /= self.metrics["nb_batches"]
+        logger.info(
+            "Adversarial training: attack utilization %.2f, train utilization %.2f, %.1f samples per second.",
+            self.metrics["attack_utilization"],
+            self.metrics["train_utilization"],
+            self.metrics["samples_per_second"],
+        )
+
+    def _check_attacks(self) -> None:
+        """
+        Check the attacks before crafting adversarial samples in background workers.
+        """
+        for attack in self.attacks:
+            if "verbose" in attack.attack_params:
+                attack.set_params(verbose=False)
+            if "targeted" in attack.attack_params and attack.targeted:  # type: ignore
+                raise NotImplementedError("Adversarial training with targeted attacks is currently not implemented")
+
+    def _adv_ids(self, nb_samples: int) -> np.ndarray:
+        """
+        Choose the indices of a batch to replace with adversarial samples.
+        """
+        if self.ratio < 1:
+            return np.random.choice(nb_samples, size=int(np.ceil(self.ratio * nb_samples)), replace=False)
+        adv_ids = np.arange(nb_samples)
+        np.random.shuffle(adv_ids)
+        return adv_ids
+
+    def _array_tasks(self, x: np.ndarray, y: np.ndarray, batch_size: int, nb_epochs: int) -> Iterator[Tuple]:
+        """
+        Create the batches of the training set to be attacked by the background workers.
+        """
+        ind = np.arange(len(x))
+        attack_id = 0
+        for _ in trange(nb_epochs, desc="Adversarial training epochs"):
+            np.random.shuffle(ind)
+            for batch_id in range(int(np.ceil(len(x) / batch_size))):
+                rows = ind[batch_id * batch_size : min((batch_id + 1) * batch_size, x.shape[0])]
+                yield x[rows].copy(), y[rows], attack_id, self._adv_ids(len(rows)), rows
+                attack_id = (attack_id + 1) % len(self.attacks)
+
+    def _generator_tasks(self, generator: "DataGenerator", nb_batches: int, nb_epochs: int) -> Iterator[Tuple]:
+        """
+        Create the batches of a data generator to be attacked by the background workers.
+        """
+        attack_id = 0
+        for _ in trange(nb_epochs, desc="Adversarial training epochs"):
+            for _ in range(nb_batches):
+                x_batch, y_batch = generator.get_batch()
+                yield x_batch.copy(), y_batch, attack_id, self._adv_ids(x_batch.shape[0]), None
+                attack_id = (attack_id + 1) % len(self.attacks)
+
+    def _fit_async(self, tasks: Iterator[Tuple], nb_steps: int, **kwargs) -> None:
+        """
+        Train the classifier on adversarial batches crafted by background workers into a bounded queue.
+
+        :param tasks: Iterator over the clean batches with the attack and the indices to replace with adversarial
+                      samples.
+        :param nb_steps: Number of training steps.
+        """
+        self._start_metrics()
+        self._published = (0, _get_weights(self._classifier))
+        self._producers = queue.Queue()
+        for _ in range(self.nb_workers):
+            self._producers.put(_AdversarialProducer(self._classifier, self.attacks))
+
+        pending: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=self.nb_workers) as executor:
+            try:
+                for step in range(nb_steps):
+                    while len(pending) < self.queue_size and len(pending) < nb_steps - step:
+                        pending.append(executor.submit(self._produce, *next(tasks)))
+
+                    start = time.perf_counter()
+                    x_batch, y_batch, version, attack_time = pending.popleft().result()
+                    self.metrics["wait_time"] += time.perf_counter() - start
+                    self.metrics["attack_time"] += attack_time
+                    self.metrics["staleness_mean"] += step - version
+                    self.metrics["staleness_max"] = max(self.metrics["staleness_max"], step - version)
+
+                    self._fit_batch(x_batch, y_batch, **kwargs)
+
+                    if (step + 1) % self.max_staleness == 0:
+                        self._published = (step + 1, _get_weights(self._classifier))
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        self._producers = queue.Queue()
+        self._published = (0, None)
+        self._stop_metrics()
+
+    def _produce(
+        self, x_batch: np.ndarray, y_batch: np.ndarray, attack_id: int, adv_ids: np.ndarray, rows: Optional[np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, int, float]:
+        """
+        Craft the adversarial samples of one batch in a background worker.
+
+        :return: Tuple of the adversarial batch, its labels, the number of training steps of the attacked weights and
+                 the time spent crafting.
+        """
+        producer = self._producers.get()
+        try:
+            start = time.perf_counter()
+            producer.refresh(self._published)
+            attack = producer.attacks[attack_id]
+            cache = self._transferred_cache[attack_id] if rows is not None and self._transferred_cache else None
+
+            # Transferred adversarial samples do not depend on the trained weights, craft them once per sample
+            if cache is not None and rows is not None:
+                x_cache, is_cached = cache
+                missing = adv_ids[~is_cached[rows[adv_ids]]]
+                if missing.size > 0:
+                    x_cache[rows[missing]] = attack.generate(x_batch[missing], y=y_batch[missing])
+                    is_cached[rows[missing]] = True
+                x_batch[adv_ids] = x_cache[rows[adv_ids]]
+            else:
+                x_batch[adv_ids] = attack.generate(x_batch[adv_ids], y=y_batch[adv_ids])
+
+            return x_batch, y_batch, producer.version, time.perf_counter() - start
+        finally:
+            self._producers.put(producer)
+
+
+class _AdversarialProducer:
+    """
+    Background worker state holding a snapshot of the trained classifier and copies of the attacks targeting it.
+    """
+
+    def __init__(self, classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE", attacks: List["EvasionAttack"]) -> None:
+        """
+        :param classifier: Classifier trained adversarially.
+        :param attacks: Attacks used for data augmentation.
+        """
+        try:
+            self.classifier = copy.deepcopy(classifier)
+        except TypeError as error:  # pragma: no cover
+            raise NotImplementedError(
+                "Crafting adversarial samples in background workers requires a classifier that can be copied."
+            ) from error
+        self.version = -1
+
+        # Attacks against the trained classifier target the snapshot, transferred attacks keep their estimator
+        memo: Dict[int, Any] = {id(classifier): self.classifier}
+        for attack in attacks:
+            if attack.estimator is not classifier:
+                memo[id(attack.estimator)] = attack.estimator
+        self.attacks = [copy.deepcopy(attack, memo) for attack in attacks]
+
+    def refresh(self, published: Tuple[int, Any]) -> None:
+        """
+        Load the latest published weights into the snapshot.
+
+        :param published: Tuple of the number of training steps and the weights of the trained classifier.
+        """
+        version, weights = published
+        if version != self.version:
+            _set_weights(self.classifier, weights)
+            self.version = version
+
+
+def _get_weights(classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE") -> Any:
+    """
+    Copy the weights of a PyTorch or Keras model.
+    """
+    model = classifier.model
+    if hasattr(model, "state_dict"):
+        return {name: tensor.detach().clone() for name, tensor in model.state_dict().items()}
+    if hasattr(model, "get_weights"):
+        return model.get_weights()
+    raise NotImplementedError(  # pragma: no cover
+        "Crafting adversarial samples in background workers requires a PyTorch or Keras model."
+    )
+
+
+def _set_weights(classifier: "CLASSIFIER_LOSS_GRADIENTS_TYPE", weights: Any) -> None:
+    """
+    Load weights copied with `_get_weights` into a PyTorch or Keras model.
+    """
+    model = classifier.model
+    if hasattr(model, "load_state_dict"):
+        model.load_state_dict(weights)
+    elif hasattr(model, "set_weights"):
+        model.set_weights(weights)
+    else:
+        raise NotImplementedError(  # pragma: no cover
+            "Crafting adversarial samples in background workers requires a PyTorch or Keras model."
+        )
@@ -1,7 +1,18 @@
 """
 Module implementing transformer-based defences against adversarial attacks.
 """
-from art.defences.transformer.transformer import Transformer
+from typing import TYPE_CHECKING
 
-from art.defences.transformer import evasion
-from art.defences.transformer import poisoning
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.defences.transformer import evasion, poisoning
+    from art.defences.transformer.transformer import Transformer
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["evasion", "poisoning"],
+    submod_attrs={
+        "transformer": ["Transformer"],
+    },
+)
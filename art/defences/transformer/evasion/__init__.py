@@ -1,4 +1,16 @@
 """
 Module implementing transformer-based defences against evasion attacks.
 """
-from art.defences.transformer.evasion.defensive_distillation import DefensiveDistillation
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.defences.transformer.evasion.defensive_distillation import DefensiveDistillation
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "defensive_distillation": ["DefensiveDistillation"],
+    },
+)
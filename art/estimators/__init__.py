@@ -1,24 +1,48 @@
 """
 This module contains the Estimator API.
 """
-from art.estimators.estimator import (
-    BaseEstimator,
-    LossGradientsMixin,
-    NeuralNetworkMixin,
-    DecisionTreeMixin,
-)
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
 
-from art.estimators.keras import KerasEstimator
-from art.estimators.mxnet import MXEstimator
-from art.estimators.pytorch import PyTorchEstimator
-from art.estimators.scikitlearn import ScikitlearnEstimator
-from art.estimators.tensorflow import TensorFlowEstimator, TensorFlowV2Estimator
+if TYPE_CHECKING:
+    from art.estimators import (
+        certification,
+        classification,
+        encoding,
+        generation,
+        object_detection,
+        poison_mitigation,
+        regression,
+        speech_recognition,
+    )
+    from art.estimators.estimator import BaseEstimator, LossGradientsMixin, NeuralNetworkMixin, DecisionTreeMixin
+    from art.estimators.instrumentation import EstimatorInstrumentation
+    from art.estimators.keras import KerasEstimator
+    from art.estimators.mxnet import MXEstimator
+    from art.estimators.pytorch import PyTorchEstimator
+    from art.estimators.scikitlearn import ScikitlearnEstimator
+    from art.estimators.tensorflow import TensorFlowEstimator, TensorFlowV2Estimator
 
-from art.estimators import certification
-from art.estimators import classification
-from art.estimators import encoding
-from art.estimators import generation
-from art.estimators import object_detection
-from art.estimators import poison_mitigation
-from art.estimators import regression
-from art.estimators import speech_recognition
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "certification",
+        "classification",
+        "encoding",
+        "generation",
+        "object_detection",
+        "poison_mitigation",
+        "regression",
+        "speech_recognition",
+    ],
+    submod_attrs={
+        "estimator": ["BaseEstimator", "LossGradientsMixin", "NeuralNetworkMixin", "DecisionTreeMixin"],
+        "instrumentation": ["EstimatorInstrumentation"],
+        "keras": ["KerasEstimator"],
+        "mxnet": ["MXEstimator"],
+        "pytorch": ["PyTorchEstimator"],
+        "scikitlearn": ["ScikitlearnEstimator"],
+        "tensorflow": ["TensorFlowEstimator", "TensorFlowV2Estimator"],
+    },
+)
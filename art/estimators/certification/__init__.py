@@ -2,28 +2,54 @@
 This module contains certified classifiers.
 """
 import importlib
-from art.estimators.certification.randomized_smoothing.randomized_smoothing import RandomizedSmoothingMixin
-from art.estimators.certification.randomized_smoothing.numpy import NumpyRandomizedSmoothing
-from art.estimators.certification.randomized_smoothing.tensorflow import TensorFlowV2RandomizedSmoothing
-from art.estimators.certification.randomized_smoothing.pytorch import PyTorchRandomizedSmoothing
-from art.estimators.certification.derandomized_smoothing.pytorch import PyTorchDeRandomizedSmoothing
-from art.estimators.certification.derandomized_smoothing.tensorflow import TensorFlowV2DeRandomizedSmoothing
-from art.estimators.certification.object_seeker.object_seeker import ObjectSeekerMixin
-from art.estimators.certification.object_seeker.pytorch import PyTorchObjectSeeker
+import warnings
+from typing import TYPE_CHECKING
 
-if importlib.util.find_spec("torch") is not None:
-    from art.estimators.certification.deep_z.deep_z import ZonoDenseLayer
-    from art.estimators.certification.deep_z.deep_z import ZonoBounds
-    from art.estimators.certification.deep_z.deep_z import ZonoConv
-    from art.estimators.certification.deep_z.deep_z import ZonoReLU
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.randomized_smoothing.randomized_smoothing import RandomizedSmoothingMixin
+    from art.estimators.certification.randomized_smoothing.numpy import NumpyRandomizedSmoothing
+    from art.estimators.certification.randomized_smoothing.tensorflow import TensorFlowV2RandomizedSmoothing
+    from art.estimators.certification.randomized_smoothing.pytorch import PyTorchRandomizedSmoothing
+    from art.estimators.certification.derandomized_smoothing.pytorch import PyTorchDeRandomizedSmoothing
+    from art.estimators.certification.derandomized_smoothing.tensorflow import TensorFlowV2DeRandomizedSmoothing
+    from art.estimators.certification.object_seeker.object_seeker import ObjectSeekerMixin
+    from art.estimators.certification.object_seeker.pytorch import PyTorchObjectSeeker
+    from art.estimators.certification.deep_z.deep_z import ZonoDenseLayer, ZonoBounds, ZonoConv, ZonoReLU
     from art.estimators.certification.deep_z.pytorch import PytorchDeepZ
-    from art.estimators.certification.interval.interval import PyTorchIntervalDense
-    from art.estimators.certification.interval.interval import PyTorchIntervalConv2D
-    from art.estimators.certification.interval.interval import PyTorchIntervalReLU
-    from art.estimators.certification.interval.interval import PyTorchIntervalFlatten
-    from art.estimators.certification.interval.interval import PyTorchIntervalBounds
+    from art.estimators.certification.interval.interval import (
+        PyTorchIntervalDense,
+        PyTorchIntervalConv2D,
+        PyTorchIntervalReLU,
+        PyTorchIntervalFlatten,
+        PyTorchIntervalBounds,
+    )
     from art.estimators.certification.interval.pytorch import PyTorchIBPClassifier
-else:
-    import warnings
 
+_SUBMOD_ATTRS = {
+    "randomized_smoothing.randomized_smoothing": ["RandomizedSmoothingMixin"],
+    "randomized_smoothing.numpy": ["NumpyRandomizedSmoothing"],
+    "randomized_smoothing.tensorflow": ["TensorFlowV2RandomizedSmoothing"],
+    "randomized_smoothing.pytorch": ["PyTorchRandomizedSmoothing"],
+    "derandomized_smoothing.pytorch": ["PyTorchDeRandomizedSmoothing"],
+    "derandomized_smoothing.tensorflow": ["TensorFlowV2DeRandomizedSmoothing"],
+    "object_seeker.object_seeker": ["ObjectSeekerMixin"],
+    "object_seeker.pytorch": ["PyTorchObjectSeeker"],
+}
+
+if importlib.util.find_spec("torch") is not None:
+    _SUBMOD_ATTRS["deep_z.deep_z"] = ["ZonoDenseLayer", "ZonoBounds", "ZonoConv", "ZonoReLU"]
+    _SUBMOD_ATTRS["deep_z.pytorch"] = ["PytorchDeepZ"]
+    _SUBMOD_ATTRS["interval.interval"] = [
+        "PyTorchIntervalDense",
+        "PyTorchIntervalConv2D",
+        "PyTorchIntervalReLU",
+        "PyTorchIntervalFlatten",
+        "PyTorchIntervalBounds",
+    ]
+    _SUBMOD_ATTRS["interval.pytorch"] = ["PyTorchIBPClassifier"]
+else:
     warnings.warn("PyTorch not found. Not importing DeepZ or Interval Bound Propagation functionality")
+
+__getattr__, __dir__, __all__ = attach(__name__, submod_attrs=_SUBMOD_ATTRS)
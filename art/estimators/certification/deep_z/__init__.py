@@ -1,8 +1,18 @@
 """
 DeepZ based certification estimators.
 """
-from art.estimators.certification.deep_z.deep_z import ZonoDenseLayer
-from art.estimators.certification.deep_z.deep_z import ZonoBounds
-from art.estimators.certification.deep_z.deep_z import ZonoConv
-from art.estimators.certification.deep_z.deep_z import ZonoReLU
-from art.estimators.certification.deep_z.pytorch import PytorchDeepZ
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.deep_z.deep_z import ZonoDenseLayer, ZonoBounds, ZonoConv, ZonoReLU
+    from art.estimators.certification.deep_z.pytorch import PytorchDeepZ
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "deep_z": ["ZonoDenseLayer", "ZonoBounds", "ZonoConv", "ZonoReLU"],
+        "pytorch": ["PytorchDeepZ"],
+    },
+)
@@ -1,5 +1,18 @@
 """
 DeRandomized smoothing estimators.
 """
-from art.estimators.certification.derandomized_smoothing.pytorch import PyTorchDeRandomizedSmoothing
-from art.estimators.certification.derandomized_smoothing.tensorflow import TensorFlowV2DeRandomizedSmoothing
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.derandomized_smoothing.pytorch import PyTorchDeRandomizedSmoothing
+    from art.estimators.certification.derandomized_smoothing.tensorflow import TensorFlowV2DeRandomizedSmoothing
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "pytorch": ["PyTorchDeRandomizedSmoothing"],
+        "tensorflow": ["TensorFlowV2DeRandomizedSmoothing"],
+    },
+)
@@ -2,11 +2,22 @@
 This module contains the ablators for the certified smoothing approaches.
 """
 import importlib
+from typing import TYPE_CHECKING
 
-from art.estimators.certification.derandomized_smoothing.ablators.tensorflow import ColumnAblator, BlockAblator
+from art.lazy_loading import attach
 
-if importlib.util.find_spec("torch") is not None:
+if TYPE_CHECKING:
+    from art.estimators.certification.derandomized_smoothing.ablators.tensorflow import ColumnAblator, BlockAblator
     from art.estimators.certification.derandomized_smoothing.ablators.pytorch import (
         ColumnAblatorPyTorch,
         BlockAblatorPyTorch,
     )
+
+_SUBMOD_ATTRS = {
+    "tensorflow": ["ColumnAblator", "BlockAblator"],
+}
+
+if importlib.util.find_spec("torch") is not None:
+    _SUBMOD_ATTRS["pytorch"] = ["ColumnAblatorPyTorch", "BlockAblatorPyTorch"]
+
+__getattr__, __dir__, __all__ = attach(__name__, submod_attrs=_SUBMOD_ATTRS)
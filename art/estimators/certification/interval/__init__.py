@@ -1,9 +1,30 @@
 """
 Interval based certification estimators.
 """
-from art.estimators.certification.interval.interval import PyTorchIntervalDense
-from art.estimators.certification.interval.interval import PyTorchIntervalConv2D
-from art.estimators.certification.interval.interval import PyTorchIntervalReLU
-from art.estimators.certification.interval.interval import PyTorchIntervalFlatten
-from art.estimators.certification.interval.interval import PyTorchIntervalBounds
-from art.estimators.certification.interval.pytorch import PyTorchIBPClassifier
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.certification.interval.interval import (
+        PyTorchIntervalDense,
+        PyTorchIntervalConv2D,
+        PyTorchIntervalReLU,
+        PyTorchIntervalFlatten,
+        PyTorchIntervalBounds,
+    )
+    from art.estimators.certification.interval.pytorch import PyTorchIBPClassifier
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "interval": [
+            "PyTorchIntervalDense",
+            "PyTorchIntervalConv2D",
+            "PyTorchIntervalReLU",
+            "PyTorchIntervalFlatten",
+            "PyTorchIntervalBounds",
+        ],
+        "pytorch": ["PyTorchIBPClassifier"],
+    },
+)
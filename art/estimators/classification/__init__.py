@@ -2,27 +2,48 @@
 Classifier API for applying all attacks. Use the :class:`.Classifier` wrapper to be able to apply an attack to a
 preexisting model.
 """
-from art.estimators.classification.classifier import (
-    ClassifierMixin,
-    ClassGradientsMixin,
-)
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.classification.classifier import ClassifierMixin, ClassGradientsMixin
+    from art.estimators.classification.blackbox import BlackBoxClassifier, BlackBoxClassifierNeuralNetwork
+    from art.estimators.classification.catboost import CatBoostARTClassifier
+    from art.estimators.classification.deep_partition_ensemble import DeepPartitionEnsemble
+    from art.estimators.classification.detector_classifier import DetectorClassifier
+    from art.estimators.classification.ensemble import EnsembleClassifier
+    from art.estimators.classification.GPy import GPyGaussianProcessClassifier
+    from art.estimators.classification.keras import KerasClassifier
+    from art.estimators.classification.lightgbm import LightGBMClassifier
+    from art.estimators.classification.mxnet import MXClassifier
+    from art.estimators.classification.pytorch import PyTorchClassifier
+    from art.estimators.classification.hugging_face import HuggingFaceClassifierPyTorch
+    from art.estimators.classification.query_cache import QueryCacheClassifier
+    from art.estimators.classification.query_efficient_bb import QueryEfficientGradientEstimationClassifier
+    from art.estimators.classification.scikitlearn import SklearnClassifier
+    from art.estimators.classification.tensorflow import TFClassifier, TensorFlowClassifier, TensorFlowV2Classifier
+    from art.estimators.classification.xgboost import XGBoostClassifier
 
-from art.estimators.classification.blackbox import BlackBoxClassifier, BlackBoxClassifierNeuralNetwork
-from art.estimators.classification.catboost import CatBoostARTClassifier
-from art.estimators.classification.deep_partition_ensemble import DeepPartitionEnsemble
-from art.estimators.classification.detector_classifier import DetectorClassifier
-from art.estimators.classification.ensemble import EnsembleClassifier
-from art.estimators.classification.GPy import GPyGaussianProcessClassifier
-from art.estimators.classification.keras import KerasClassifier
-from art.estimators.classification.lightgbm import LightGBMClassifier
-from art.estimators.classification.mxnet import MXClassifier
-from art.estimators.classification.pytorch import PyTorchClassifier
-from art.estimators.classification.hugging_face import HuggingFaceClassifierPyTorch
-from art.estimators.classification.query_efficient_bb import QueryEfficientGradientEstimationClassifier
-from art.estimators.classification.scikitlearn import SklearnClassifier
-from art.estimators.classification.tensorflow import (
-    TFClassifier,
-    TensorFlowClassifier,
-    TensorFlowV2Classifier,
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "classifier": ["ClassifierMixin", "ClassGradientsMixin"],
+        "blackbox": ["BlackBoxClassifier", "BlackBoxClassifierNeuralNetwork"],
+        "catboost": ["CatBoostARTClassifier"],
+        "deep_partition_ensemble": ["DeepPartitionEnsemble"],
+        "detector_classifier": ["DetectorClassifier"],
+        "ensemble": ["EnsembleClassifier"],
+        "GPy": ["GPyGaussianProcessClassifier"],
+        "keras": ["KerasClassifier"],
+        "lightgbm": ["LightGBMClassifier"],
+        "mxnet": ["MXClassifier"],
+        "pytorch": ["PyTorchClassifier"],
+        "hugging_face": ["HuggingFaceClassifierPyTorch"],
+        "query_cache": ["QueryCacheClassifier"],
+        "query_efficient_bb": ["QueryEfficientGradientEstimationClassifier"],
+        "scikitlearn": ["SklearnClassifier"],
+        "tensorflow": ["TFClassifier", "TensorFlowClassifier", "TensorFlowV2Classifier"],
+        "xgboost": ["XGBoostClassifier"],
+    },
 )
-from art.estimators.classification.xgboost import XGBoostClassifier
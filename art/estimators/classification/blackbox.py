@@ -20,13 +20,17 @@ This module implements the classifier `BlackBoxClassifier` for black-box classif
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from functools import total_ordering
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import inspect
 import logging
+import time
 from typing import Callable, List, Optional, Union, Tuple, TYPE_CHECKING
 
 import numpy as np
 
 from art.estimators.estimator import BaseEstimator, NeuralNetworkMixin
+from art.estimators.prediction_lookup import make_lookup_predict_fn
 from art.estimators.classification.classifier import ClassifierMixin, Classifier
 
 if TYPE_CHECKING:
@@ -42,7 +46,15 @@ class BlackBoxClassifier(ClassifierMixin, BaseEstimator):
     Class for black-box classifiers.
     """
 
-    estimator_params = Classifier.estimator_params + ["nb_classes", "input_shape", "predict_fn"]
+    estimator_params = Classifier.estimator_params + [
+        "nb_classes",
+        "input_shape",
+        "predict_fn",
+        "nb_workers",
+        "max_retries",
+        "retry_delay",
+        "retry_hook",
+    ]
 
     def __init__(
         self,
@@ -54,6 +66,10 @@ class BlackBoxClassifier(ClassifierMixin, BaseEstimator):
         postprocessing_defences: Union["Postprocessor", List["Postprocessor"], None] = None,
         preprocessing: "PREPROCESSING_TYPE" = (0.0, 1.0),
         fuzzy_float_compare: bool = False,
+        nb_workers: int = 1,
+        max_retries: int = 0,
+        retry_delay: float = 1.0,
+        retry_hook: Optional[Callable[[int, Exception], None]] = None,
     ):
         """
         Create a `Classifier` instance for a black-box model.
@@ -73,8 +89,15 @@ class BlackBoxClassifier(ClassifierMixin, BaseEstimator):
                used for data preprocessing. The first value will be subtracted from the input. The input will then
                be divided by the second one.
         :param fuzzy_float_compare: If `predict_fn` is a tuple mapping inputs to labels, and this is True, looking up
-               inputs in the table will be done using `numpy.isclose`. Only set to True if really needed, since this
-               severely affects performance.
+               inputs in the table will be done using `numpy.isclose` with a nearest-neighbour search instead of an
+               exact comparison.
+        :param nb_workers: Maximum number of batches sent concurrently to `predict_fn`. A coroutine function
+               `predict_fn` is run concurrently on an event loop, otherwise in a pool of `nb_workers` threads.
+        :param max_retries: Number of times a batch is sent again to `predict_fn` after it raised an exception.
+        :param retry_delay: Delay in seconds before the first retry of a batch, doubled for every further retry.
+        :param retry_hook: Function called with the number of the failed attempt and the exception before a batch is
+               retried, e.g. for logging or for refreshing credentials. An exception raised in the hook stops the
+               retries.
         """
         super().__init__(
             model=None,
@@ -86,9 +109,14 @@ class BlackBoxClassifier(ClassifierMixin, BaseEstimator):
         if callable(predict_fn):
             self._predict_fn = predict_fn
         else:
-            self._predict_fn = _make_lookup_predict_fn(predict_fn, fuzzy_float_compare)
+            self._predict_fn = make_lookup_predict_fn(predict_fn, fuzzy_float_compare)
         self._input_shape = input_shape
         self.nb_classes = nb_classes
+        self.nb_workers = nb_workers
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.retry_hook = retry_hook
+        self._check_params()
 
     @property
     def input_shape(self) -> Tuple[int, ...]:
@@ -124,12 +152,16 @@ class BlackBoxClassifier(ClassifierMixin, BaseEstimator):
 
         # Run predictions with batching
         predictions = np.zeros((x_preprocessed.shape[0], self.nb_classes), dtype=ART_NUMPY_DTYPE)
-        for batch_index in range(int(np.ceil(x_preprocessed.shape[0] / float(batch_size)))):
-            begin, end = (
-                batch_index * batch_size,
-                min((batch_index + 1) * batch_size, x_preprocessed.shape[0]),
-            )
-            predictions[begin:end] = self.predict_fn(x_preprocessed[begin:end])
+        _predict_batches(
+            self._predict_fn,
+            x_preprocessed,
+            predictions,
+            batch_size,
+            nb_workers=self.nb_workers,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            retry_hook=self.retry_hook,
+        )
 
         # Apply postprocessing
         predictions = self._apply_postprocessing(preds=predictions, fit=False)
@@ -160,6 +192,18 @@ class BlackBoxClassifier(ClassifierMixin, BaseEstimator):
         """
         raise NotImplementedError
 
+    def _check_params(self) -> None:
+        super()._check_params()
+
+        if not isinstance(self.nb_workers, int) or self.nb_workers < 1:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
+
+        if not isinstance(self.max_retries, int) or self.max_retries < 0:
+            raise ValueError("The number of retries `max_retries` has to be a non-negative integer.")
+
+        if self.retry_delay < 0:
+            raise ValueError("The retry delay `retry_delay` has to be non-negative.")
+
 
 class BlackBoxClassifierNeuralNetwork(NeuralNetworkMixin, ClassifierMixin, BaseEstimator):
     """
@@ -170,7 +214,7 @@ class BlackBoxClassifierNeuralNetwork(NeuralNetworkMixin, ClassifierMixin, BaseE
         NeuralNetworkMixin.estimator_params
         + ClassifierMixin.estimator_params
         + BaseEstimator.estimator_params
-        + ["nb_classes", "input_shape", "predict_fn"]
+        + ["nb_classes", "input_shape", "predict_fn", "nb_workers", "max_retries", "retry_delay", "retry_hook"]
     )
 
     def __init__(
@@ -184,6 +228,10 @@ class BlackBoxClassifierNeuralNetwork(NeuralNetworkMixin, ClassifierMixin, BaseE
         postprocessing_defences: Union["Postprocessor", List["Postprocessor"], None] = None,
         preprocessing: "PREPROCESSING_TYPE" = (0, 1),
         fuzzy_float_compare: bool = False,
+        nb_workers: int = 1,
+        max_retries: int = 0,
+        retry_delay: float = 1.0,
+        retry_hook: Optional[Callable[[int, Exception], None]] = None,
     ):
         """
         Create a `Classifier` instance for a black-box model.
@@ -204,8 +252,15 @@ class BlackBoxClassifierNeuralNetwork(NeuralNetworkMixin, ClassifierMixin, BaseE
                used for data preprocessing. The first value will be subtracted from the input. The input will then
                be divided by the second one.
         :param fuzzy_float_compare: If `predict_fn` is a tuple mapping inputs to labels, and this is True, looking up
-               inputs in the table will be done using `numpy.isclose`. Only set to True if really needed, since this
-               severely affects performance.
+               inputs in the table will be done using `numpy.isclose` with a nearest-neighbour search instead of an
+               exact comparison.
+        :param nb_workers: Maximum number of batches sent concurrently to `predict_fn`. A coroutine function
+               `predict_fn` is run concurrently on an event loop, otherwise in a pool of `nb_workers` threads.
+        :param max_retries: Number of times a batch is sent again to `predict_fn` after it raised an exception.
+        :param retry_delay: Delay in seconds before the first retry of a batch, doubled for every further retry.
+        :param retry_hook: Function called with the number of the failed attempt and the exception before a batch is
+               retried, e.g. for logging or for refreshing credentials. An exception raised in the hook stops the
+               retries.
         """
         super().__init__(
             model=None,
@@ -219,9 +274,14 @@ class BlackBoxClassifierNeuralNetwork(NeuralNetworkMixin, ClassifierMixin, BaseE
         if callable(predict_fn):
             self._predict_fn = predict_fn
         else:
-            self._predict_fn = _make_lookup_predict_fn(predict_fn, fuzzy_float_compare)
+            self._predict_fn = make_lookup_predict_fn(predict_fn, fuzzy_float_compare)
         self._input_shape = input_shape
         self.nb_classes = nb_classes
+        self.nb_workers = nb_workers
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.retry_hook = retry_hook
+        self._check_params()
         self._learning_phase = None
         self._layer_names = None
 
@@ -249,12 +309,16 @@ class BlackBoxClassifierNeuralNetwork(NeuralNetworkMixin, ClassifierMixin, BaseE
 
         # Run predictions with batching
         predictions = np.zeros((x_preprocessed.shape[0], self.nb_classes), dtype=ART_NUMPY_DTYPE)
-        for batch_index in range(int(np.ceil(x_preprocessed.shape[0] / float(batch_size)))):
-            begin, end = (
-                batch_index * batch_size,
-                min((batch_index + 1) * batch_size, x_preprocessed.shape[0]),
-            )
-            predictions[begin:end] = self._predict_fn(x_preprocessed[begin:end])
+        _predict_batches(
+            self._predict_fn,
+            x_preprocessed,
+            predictions,
+            batch_size,
+            nb_workers=self.nb_workers,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            retry_hook=self.retry_hook,
+        )
 
         # Apply postprocessing
         predictions = self._apply_postprocessing(preds=predictions, fit=False)
@@ -306,88 +370,128 @@ class BlackBoxClassifierNeuralNetwork(NeuralNetworkMixin, ClassifierMixin, BaseE
     def compute_loss(self, x: np.ndarray, y: np.ndarray, **kwargs) -> np.ndarray:
         raise NotImplementedError
 
+    def _check_params(self) -> None:
+        super()._check_params()
 
-@total_ordering
-class FuzzyMapping:
-    """
-    Class for a sample/label pair to be used in a `SortedList`.
-    """
-
-    def __init__(self, key: np.ndarray, value=None):
-        """
-        Create an instance of a key/value to pair to be used in a `SortedList`.
-
-        :param key: The sample to be matched against.
-        :param value: The mapped value.
-        """
-        self.key = key
-        self.value = value
-
-    def __eq__(self, other):
-        return np.all(np.isclose(self.key, other.key))
-
-    def __ge__(self, other):
-        # This implements >= comparison so we can use this class in a `SortedList`. The `total_ordering` decorator
-        # automatically generates the rest of the comparison magic functions based on this one
+        if not isinstance(self.nb_workers, int) or self.nb_workers < 1:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
 
-        close_cells = np.isclose(self.key, other.key)
-        if np.all(close_cells):
-            return True
+        if not isinstance(self.max_retries, int) or self.max_retries < 0:
+            raise ValueError("The number of retries `max_retries` has to be a non-negative integer.")
 
-        # If the keys are not exactly the same (up to floating-point inaccuracies), we compare the value of the first
-        # index which is not the same to decide on an ordering
+        if self.retry_delay < 0:
+            raise ValueError("The retry delay `retry_delay` has to be non-negative.")
 
-        compare_idx = np.unravel_index(np.argmin(close_cells), shape=self.key.shape)
-        return self.key[compare_idx] >= other.key[compare_idx]
 
-
-def _make_lookup_predict_fn(existing_predictions: Tuple[np.ndarray, np.ndarray], fuzzy_float_compare: bool) -> Callable:
+def _call_with_retries(
+    predict_fn: Callable,
+    batch: np.ndarray,
+    max_retries: int,
+    retry_delay: float,
+    retry_hook: Optional[Callable[[int, Exception], None]],
+) -> np.ndarray:
     """
-    Makes a predict_fn callback based on a table of existing predictions.
-
-    :param existing_predictions: Tuple of (samples, labels).
-    :param fuzzy_float_compare: Look up predictions using `np.isclose`, only set to True if really needed, since this
-                                severely affects performance.
-    :return: Prediction function.
+    Call a synchronous `predict_fn` on a batch and retry with exponential back-off if it raises an exception.
     """
+    attempt = 0
+    while True:
+        try:
+            return predict_fn(batch)
+        except Exception as exception:  # pylint: disable=W0703
+            if attempt >= max_retries:
+                raise
+            attempt += 1
+            if retry_hook is not None:
+                retry_hook(attempt, exception)
+            delay = retry_delay * 2 ** (attempt - 1)
+            logger.warning("Querying `predict_fn` failed, retry %d in %.2f seconds: %s", attempt, delay, exception)
+            time.sleep(delay)
+
+
+async def _call_with_retries_async(
+    predict_fn: Callable,
+    batch: np.ndarray,
+    max_retries: int,
+    retry_delay: float,
+    retry_hook: Optional[Callable[[int, Exception], None]],
+) -> np.ndarray:
+    """
+    Await a coroutine function `predict_fn` on a batch and retry with exponential back-off if it raises an exception.
+    """
+    attempt = 0
+    while True:
+        try:
+            return await predict_fn(batch)
+        except Exception as exception:  # pylint: disable=W0703
+            if attempt >= max_retries:
+                raise
+            attempt += 1
+            if retry_hook is not None:
+                retry_hook(attempt, exception)
+            delay = retry_delay * 2 ** (attempt - 1)
+            logger.warning("Querying `predict_fn` failed, retry %d in %.2f seconds: %s", attempt, delay, exception)
+            await asyncio.sleep(delay)
+
+
+def _predict_batches(
+    predict_fn: Callable,
+    x: np.ndarray,
+    predictions: np.ndarray,
+    batch_size: int,
+    nb_workers: int = 1,
+    max_retries: int = 0,
+    retry_delay: float = 1.0,
+    retry_hook: Optional[Callable[[int, Exception], None]] = None,
+) -> None:
+    """
+    Query `predict_fn` for all batches of `x` and write the results in order into the preallocated `predictions`.
+
+    :param predict_fn: Synchronous function or coroutine function returning the predictions for a batch.
+    :param x: Input samples.
+    :param predictions: Array of shape `(nb_inputs, nb_classes)` receiving the predictions.
+    :param batch_size: Size of batches.
+    :param nb_workers: Maximum number of batches queried concurrently.
+    :param max_retries: Number of retries of a failed batch.
+    :param retry_delay: Delay in seconds before the first retry, doubled for every further retry.
+    :param retry_hook: Function called with the number of the failed attempt and the exception before a retry.
+    """
+    batch_slices = [slice(begin, min(begin + batch_size, x.shape[0])) for begin in range(0, x.shape[0], batch_size)]
 
-    samples, labels = existing_predictions
-
-    if fuzzy_float_compare:
-        from sortedcontainers import SortedList
-
-        # Construct a search-tree of the predictions, using fuzzy float comparison
-        sorted_predictions = SortedList([FuzzyMapping(key, value) for key, value in zip(samples, labels)])
-
-        def fuzzy_predict_fn(batch):
-            predictions = []
-            for row in batch:
-                try:
-                    match_idx = sorted_predictions.index(FuzzyMapping(row))
-                except ValueError as err:  # pragma: no cover
-                    raise ValueError("No existing prediction for queried input") from err
-
-                predictions.append(sorted_predictions[match_idx].value)
-
-            return np.array(predictions)
-
-        return fuzzy_predict_fn
+    if inspect.iscoroutinefunction(predict_fn) or inspect.iscoroutinefunction(getattr(predict_fn, "__call__", None)):
 
-    # Construct a dictionary to map from samples to predictions. We use the bytes of the `ndarray` as the key,
-    # because the `ndarray` itself is not hashable
-    mapping = {}
-    for x, y in zip(samples, labels):
-        mapping[x.tobytes()] = y
+        async def predict_async() -> None:
+            semaphore = asyncio.Semaphore(nb_workers)
 
-    def predict_fn(batch):
-        predictions = []
-        for row in batch:
-            row_bytes = row.tobytes()
-            if row.tobytes() not in mapping:
-                raise ValueError("No existing prediction for queried input")
+            async def predict_batch(batch_slice: slice) -> None:
+                async with semaphore:
+                    predictions[batch_slice] = await _call_with_retries_async(
+                        predict_fn, x[batch_slice], max_retries, retry_delay, retry_hook
+                    )
 
-            predictions.append(mapping[row_bytes])
+            await asyncio.gather(*[predict_batch(batch_slice) for batch_slice in batch_slices])
 
-        return np.array(predictions)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(predict_async())
+        else:
+            # An event loop is already running in this thread, e.g. in a notebook, run the queries in a new thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                executor.submit(asyncio.run, predict_async()).result()
+
+    elif nb_workers > 1 and len(batch_slices) > 1:
+        with ThreadPoolExecutor(max_workers=min(nb_workers, len(batch_slices))) as executor:
+            results = executor.map(
+                lambda batch_slice: _call_with_retries(
+                    predict_fn, x[batch_slice], max_retries, retry_delay, retry_hook
+                ),
+                batch_slices,
+            )
+            for batch_slice, result in zip(batch_slices, results):
+                predictions[batch_slice] = result
 
-    return predict_fn
+    else:
+        for batch_slice in batch_slices:
+            predictions[batch_slice] = _call_with_retries(
+                predict_fn, x[batch_slice], max_retries, retry_delay, retry_hook
+            )
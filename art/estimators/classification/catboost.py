@@ -121,6 +121,7 @@ class CatBoostARTClassifier(ClassifierDecisionTree):
 
         self._model.fit(x_preprocessed, y_preprocessed, **kwargs)
         self.nb_classes = self._get_nb_classes()
+        self._reset_tree_ensemble()
 
     def predict(self, x: np.ndarray, **kwargs) -> np.ndarray:
         """
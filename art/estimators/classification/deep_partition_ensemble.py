@@ -60,6 +60,8 @@ class DeepPartitionEnsemble(EnsembleClassifier):
         preprocessing_defences: Union["Preprocessor", List["Preprocessor"], None] = None,
         postprocessing_defences: Union["Postprocessor", List["Postprocessor"], None] = None,
         preprocessing: "PREPROCESSING_TYPE" = (0.0, 1.0),
+        nb_workers: int = 1,
+        parallel_backend: str = "threads",
     ) -> None:
         """
         :param classifiers: The base model definition to use for defining the ensemble.
@@ -78,6 +80,12 @@ class DeepPartitionEnsemble(EnsembleClassifier):
         :param preprocessing: Tuple of the form `(subtrahend, divisor)` of floats or `np.ndarray` of values to be
                used for data preprocessing. The first value will be subtracted from the input. The input will then
                be divided by the second one. Not applicable in this classifier.
+        :param nb_workers: Number of classifiers evaluated concurrently. If 1, the classifiers are evaluated one after
+               the other.
+        :param parallel_backend: Either `threads` to evaluate the classifiers in a thread pool, which is efficient for
+               frameworks releasing the GIL, or `processes` to evaluate them in a process pool holding copies of the
+               classifiers. Classifiers bound to the graph of their thread (TensorFlow v1, Keras in graph mode) require
+               `processes`.
         """
         self.can_fit = False  # self.fit() cannot be used with models loaded from disk
         if not isinstance(classifiers, list):
@@ -109,6 +117,8 @@ class DeepPartitionEnsemble(EnsembleClassifier):
             preprocessing_defences=preprocessing_defences,
             postprocessing_defences=postprocessing_defences,
             preprocessing=preprocessing,
+            nb_workers=nb_workers,
+            parallel_backend=parallel_backend,
         )
 
         if hash_function is None:
@@ -123,7 +133,14 @@ class DeepPartitionEnsemble(EnsembleClassifier):
         self.ensemble_size = ensemble_size
 
     def predict(  # pylint: disable=W0221
-        self, x: np.ndarray, batch_size: int = 128, raw: bool = False, max_aggregate: bool = True, **kwargs
+        self,
+        x: np.ndarray,
+        batch_size: int = 128,
+        raw: bool = False,
+        max_aggregate: bool = True,
+        *,
+        early_exit: bool = False,
+        **kwargs,
     ) -> np.ndarray:
         """
         Perform prediction for a batch of inputs. Aggregation will be performed on the prediction from
@@ -136,6 +153,8 @@ class DeepPartitionEnsemble(EnsembleClassifier):
         :param raw: Return the individual classifier raw outputs (not aggregated).
         :param max_aggregate: Aggregate the predicted classes of each classifier if True. If false, aggregation
                is done using a sum. If raw is true, this arg is ignored
+        :param early_exit: Stop evaluating classifiers once the remaining ones cannot change the predicted class of
+               any input. The returned votes or scores are then aggregated over the evaluated classifiers only.
         :return: Array of predictions of shape `(nb_inputs, nb_classes)`, or of shape
                  `(nb_classifiers, nb_inputs, nb_classes)` if `raw=True`.
         """
@@ -145,14 +164,25 @@ class DeepPartitionEnsemble(EnsembleClassifier):
 
         # Aggregate based on top-1 prediction from each classifier
         if max_aggregate:
-            preds = super().predict(x, batch_size=batch_size, raw=True, **kwargs)
-            aggregated_preds = np.zeros_like(preds, shape=preds.shape[1:])  # pylint: disable=E1123
-            for i in range(preds.shape[0]):
-                aggregated_preds[np.arange(len(aggregated_preds)), np.argmax(preds[i], axis=1)] += 1
+            aggregated_preds: Optional[np.ndarray] = None
+            for i, preds in self._map_classifiers("predict", x=x):
+                if aggregated_preds is None:
+                    aggregated_preds = np.zeros_like(preds)
+                aggregated_preds[
+                    np.arange(len(aggregated_preds)), np.argmax(self.classifier_weights[i] * preds, axis=1)
+                ] += 1
+
+                # Stop once the remaining votes cannot change the majority class of any input
+                if early_exit and i < self.ensemble_size - 1 and self.nb_classes > 1:
+                    top_votes = np.partition(aggregated_preds, -2, axis=1)
+                    if np.all(top_votes[:, -1] - top_votes[:, -2] > self.ensemble_size - 1 - i):
+                        break
+
+            assert aggregated_preds is not None
             return aggregated_preds
 
         # Aggregate based on summing predictions from each classifier
-        return super().predict(x, batch_size=batch_size, raw=False, **kwargs)
+        return super().predict(x, batch_size=batch_size, raw=False, early_exit=early_exit, **kwargs)
 
     def fit(  # pylint: disable=W0221
         self,
@@ -161,7 +191,7 @@ class DeepPartitionEnsemble(EnsembleClassifier):
         batch_size: int = 128,
         nb_epochs: int = 20,
         train_dict: Optional[Dict] = None,
-        **kwargs
+        **kwargs,
     ) -> None:
         """
         Fit the classifier on the training set `(x, y)`. Each classifier will be trained with the
@@ -193,5 +223,8 @@ class DeepPartitionEnsemble(EnsembleClassifier):
                     self.classifiers[i].fit(current_x, current_y, **train_dict[i])
                 else:
                     self.classifiers[i].fit(current_x, current_y, batch_size=batch_size, nb_epochs=nb_epochs, **kwargs)
+
+            # Worker processes hold copies of the classifiers from before training
+            self._shutdown_executor()
         else:
             warnings.warn("Cannot call fit() for an ensemble of pre-trained classifiers.")
@@ -20,8 +20,10 @@ This module implements the classifier `EnsembleClassifier` for ensembles of mult
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 import logging
-from typing import List, Optional, Union, Tuple, TYPE_CHECKING
+import multiprocessing
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union, Tuple, TYPE_CHECKING
 
 import numpy as np
 
@@ -46,6 +48,8 @@ class EnsembleClassifier(ClassifierNeuralNetwork):
     estimator_params = ClassifierNeuralNetwork.estimator_params + [
         "classifiers",
         "classifier_weights",
+        "nb_workers",
+        "parallel_backend",
     ]
 
     def __init__(
@@ -57,6 +61,8 @@ class EnsembleClassifier(ClassifierNeuralNetwork):
         preprocessing_defences: Union["Preprocessor", List["Preprocessor"], None] = None,
         postprocessing_defences: Union["Postprocessor", List["Postprocessor"], None] = None,
         preprocessing: "PREPROCESSING_TYPE" = (0.0, 1.0),
+        nb_workers: int = 1,
+        parallel_backend: str = "threads",
     ) -> None:
         """
         Initialize a :class:`.EnsembleClassifier` object. The data range values and colour channel index have to
@@ -76,6 +82,13 @@ class EnsembleClassifier(ClassifierNeuralNetwork):
         :param preprocessing: Tuple of the form `(subtrahend, divisor)` of floats or `np.ndarray` of values to be
                used for data preprocessing. The first value will be subtracted from the input. The input will then
                be divided by the second one. Not applicable in this classifier.
+        :param nb_workers: Number of classifiers evaluated concurrently. If 1, the classifiers are evaluated one after
+               the other.
+        :param parallel_backend: Either `threads` to evaluate the classifiers in a thread pool, which is efficient for
+               frameworks releasing the GIL, or `processes` to evaluate them in a process pool holding copies of the
+               classifiers. Classifiers bound to the graph of their thread (TensorFlow v1, Keras in graph mode) require
+               `processes`. The processes hold snapshots of the classifiers taken when the pool is created, call
+               `set_params` after modifying the classifiers in place, e.g. by retraining them, to recreate the pool.
         """
         if preprocessing_defences is not None:
             raise NotImplementedError("Preprocessing is not applicable in this classifier.")
@@ -136,6 +149,10 @@ class EnsembleClassifier(ClassifierNeuralNetwork):
                 )
 
         self._classifiers = classifiers
+        self.nb_workers = nb_workers
+        self.parallel_backend = parallel_backend
+        self._executor: Optional[Executor] = None
+        self._check_params()
 
     @property
     def input_shape(self) -> Tuple[int, ...]:
@@ -165,7 +182,7 @@ class EnsembleClassifier(ClassifierNeuralNetwork):
         return self._classifier_weights  # type: ignore
 
     def predict(  # pylint: disable=W0221
-        self, x: np.ndarray, batch_size: int = 128, raw: bool = False, **kwargs
+        self, x: np.ndarray, batch_size: int = 128, raw: bool = False, *, early_exit: bool = False, **kwargs
     ) -> np.ndarray:
         """
         Perform prediction for a batch of inputs. Predictions from classifiers should only be aggregated if they all
@@ -176,17 +193,26 @@ class EnsembleClassifier(ClassifierNeuralNetwork):
         :param x: Input samples.
         :param batch_size: Size of batches.
         :param raw: Return the individual classifier raw outputs (not aggregated).
+        :param early_exit: Stop evaluating classifiers once the remaining ones cannot change the predicted class of
+               any input, assuming they output probabilities. The returned scores are then aggregated over the evaluated
+               classifiers only.
         :return: Array of predictions of shape `(nb_inputs, nb_classes)`, or of shape
                  `(nb_classifiers, nb_inputs, nb_classes)` if `raw=True`.
         """
-        preds = np.array(
-            [self.classifier_weights[i] * self.classifiers[i].predict(x) for i in range(self._nb_classifiers)]
-        )
         if raw:
-            return preds
+            return self._aggregate("predict", raw=True, x=x)
+
+        remaining_weights = np.sum(self.classifier_weights) - np.cumsum(self.classifier_weights)
+
+        def is_decided(i: int, var_z: np.ndarray) -> bool:
+            # The remaining classifiers cannot change the class with the highest aggregated score
+            top_scores = np.partition(var_z, -2, axis=1)
+            return bool(np.all(top_scores[:, -1] - top_scores[:, -2] > remaining_weights[i]))
 
         # Aggregate predictions only at probabilities level, as logits are not comparable between models
-        var_z = np.sum(preds, axis=0)
+        var_z = self._aggregate(
+            "predict", raw=False, early_stop=is_decided if early_exit and self.nb_classes > 1 else None, x=x
+        )
 
         # Apply postprocessing
         predictions = self._apply_postprocessing(preds=var_z, fit=False)
@@ -267,17 +293,7 @@ class EnsembleClassifier(ClassifierNeuralNetwork):
                  `(batch_size, 1, input_shape)` when `label` parameter is specified. If `raw=True`, an additional
                  dimension is added at the beginning of the array, indexing the different classifiers.
         """
-        grads = np.array(
-            [
-                self.classifier_weights[i]
-                * self.classifiers[i].class_gradient(x=x, label=label, training_mode=training_mode, **kwargs)
-                for i in range(self._nb_classifiers)
-            ]
-        )
-        if raw:
-            return grads
-
-        return np.sum(grads, axis=0)
+        return self._aggregate("class_gradient", raw=raw, x=x, label=label, training_mode=training_mode, **kwargs)
 
     def loss_gradient(  # pylint: disable=W0221
         self, x: np.ndarray, y: np.ndarray, training_mode: bool = False, raw: bool = False, **kwargs
@@ -292,17 +308,117 @@ class EnsembleClassifier(ClassifierNeuralNetwork):
         :param raw: Return the individual classifier raw outputs (not aggregated).
         :return: Array of gradients of the same shape as `x`. If `raw=True`, shape becomes `[nb_classifiers, x.shape]`.
         """
-        grads = np.array(
-            [
-                self.classifier_weights[i]
-                * self.classifiers[i].loss_gradient(x=x, y=y, training_mode=training_mode, **kwargs)
-                for i in range(self._nb_classifiers)
+        return self._aggregate("loss_gradient", raw=raw, x=x, y=y, training_mode=training_mode, **kwargs)
+
+    def _map_classifiers(self, method: str, **kwargs) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Call a method on all classifiers and yield their outputs in the order of the classifiers. With more than one
+        worker the classifiers are evaluated concurrently, and classifiers which have not started yet are cancelled if
+        the iteration is stopped early.
+
+        :param method: Name of the method of the classifiers.
+        :return: Iterator of the index of the classifier and its output.
+        """
+        if self.nb_workers == 1:
+            for i, classifier in enumerate(self.classifiers):
+                yield i, getattr(classifier, method)(**kwargs)
+            return
+
+        executor = self._get_executor()
+        if self.parallel_backend == "processes":
+            futures = [
+                executor.submit(_call_classifier_in_worker, i, method, kwargs) for i in range(self._nb_classifiers)
             ]
-        )
+        else:
+            futures = [executor.submit(getattr(classifier, method), **kwargs) for classifier in self.classifiers]
+
+        try:
+            for i, future in enumerate(futures):
+                yield i, future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _aggregate(
+        self,
+        method: str,
+        raw: bool,
+        early_stop: Optional[Callable[[int, np.ndarray], bool]] = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Compute the weighted sum of the outputs of a method of all classifiers. The sum is accumulated in place while
+        the classifiers are evaluated, unless the individual outputs are requested.
+
+        :param method: Name of the method of the classifiers.
+        :param raw: Return the individual weighted outputs of shape `(nb_classifiers, ...)` instead of their sum.
+        :param early_stop: Function called with the index of the last evaluated classifier and the current sum after
+                           every classifier, the remaining classifiers are skipped if it returns `True`.
+        :return: The weighted sum or the individual weighted outputs.
+        """
         if raw:
-            return grads
+            return np.array(
+                [self.classifier_weights[i] * output for i, output in self._map_classifiers(method, **kwargs)]
+            )
+
+        total = None
+        for i, output in self._map_classifiers(method, **kwargs):
+            if total is None:
+                total = self.classifier_weights[i] * output
+            else:
+                total += self.classifier_weights[i] * output
+            if early_stop is not None and i < self._nb_classifiers - 1 and early_stop(i, total):
+                break
+        return total  # type: ignore
+
+    def _get_executor(self) -> Executor:
+        """
+        Return the pool evaluating the classifiers, created on first use.
+        """
+        if self._executor is None:
+            if self.parallel_backend == "processes":
+                # Forking a process with initialised framework thread pools can deadlock, start fresh interpreters
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.nb_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self.classifiers,),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.nb_workers)
+        return self._executor
+
+    def set_params(self, **kwargs) -> None:
+        """
+        Take a dictionary of parameters and apply checks before setting them as attributes. The pool evaluating the
+        classifiers is shut down and recreated with the new parameters and classifiers on next use.
+
+        :param kwargs: A dictionary of attributes.
+        """
+        super().set_params(**kwargs)
+        self._shutdown_executor()
+
+    def _shutdown_executor(self) -> None:
+        """
+        Shut down the pool evaluating the classifiers, e.g. after the classifiers have been modified.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    def _check_params(self) -> None:
+        super()._check_params()
 
-        return np.sum(grads, axis=0)
+        if not isinstance(self.nb_workers, int) or self.nb_workers < 1:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
+
+        if self.parallel_backend not in ["threads", "processes"]:
+            raise ValueError("The parallel backend has to be either `threads` or `processes`.")
 
     def clone_for_refitting(self) -> "EnsembleClassifier":
         """
@@ -344,3 +460,21 @@ class EnsembleClassifier(ClassifierNeuralNetwork):
         :rtype: Format as expected by the `model`
         """
         raise NotImplementedError
+
+
+_WORKER_CLASSIFIERS: List["CLASSIFIER_NEURALNETWORK_TYPE"] = []
+
+
+def _init_worker(classifiers: List["CLASSIFIER_NEURALNETWORK_TYPE"]) -> None:
+    """
+    Store the classifiers of the ensemble in a worker process.
+    """
+    global _WORKER_CLASSIFIERS  # pylint: disable=W0603
+    _WORKER_CLASSIFIERS = classifiers
+
+
+def _call_classifier_in_worker(index: int, method: str, kwargs: Dict[str, Any]) -> np.ndarray:
+    """
+    Call a method of a classifier of the ensemble in a worker process.
+    """
+    return getattr(_WORKER_CLASSIFIERS[index], method)(**kwargs)
@@ -38,7 +38,7 @@ if TYPE_CHECKING:
     from art.utils import CLIP_VALUES_TYPE, PREPROCESSING_TYPE
     from art.defences.preprocessor import Preprocessor
     from art.defences.postprocessor import Postprocessor
-    from art.metrics.verification_decisions_trees import LeafNode
+    from art.metrics.verification_decisions_trees import LeafNode, TreeEnsemble
 
 logger = logging.getLogger(__name__)
 
@@ -180,6 +180,65 @@ class LightGBMClassifier(ClassifierDecisionTree):
 
         return trees
 
+    def _build_tree_ensemble(self) -> "TreeEnsemble":
+        """
+        Build the array-backed representation of the decision trees without creating intermediate box objects.
+
+        :return: The tree ensemble.
+        """
+        from art.metrics.verification_decisions_trees import TreeEnsemble, get_leaf_bounds
+
+        # pylint: disable=W0212
+        num_class = self._model._Booster__num_class
+        booster_dump = self._model.dump_model()["tree_info"]
+        tree_class_ids, tree_ids, node_ids, bounds, values = [], [], [], [], []
+
+        for i_tree, tree_dump in enumerate(booster_dump):
+            # Flatten the nested tree dump into node arrays, leaf nodes have no children
+            children_left: List[int] = []
+            children_right: List[int] = []
+            features: List[int] = []
+            thresholds: List[float] = []
+            leaf_indices: List[int] = []
+            leaf_values: List[float] = []
+            stack: List[Tuple[dict, Optional[int], bool]] = [(tree_dump["tree_structure"], None, False)]
+            while stack:
+                node, parent_id, is_left = stack.pop()
+                node_id = len(features)
+                if parent_id is not None:
+                    (children_left if is_left else children_right)[parent_id] = node_id
+
+                children_left.append(-1)
+                children_right.append(-1)
+                if "split_index" in node:
+                    features.append(node["split_feature"])
+                    thresholds.append(node["threshold"])
+                    leaf_indices.append(-1)
+                    leaf_values.append(0.0)
+                    stack.append((node["right_child"], node_id, False))
+                    stack.append((node["left_child"], node_id, True))
+                else:
+                    features.append(-1)
+                    thresholds.append(0.0)
+                    leaf_indices.append(node.get("leaf_index", 0))
+                    leaf_values.append(node["leaf_value"])
+
+            leaf_ids, leaf_bounds = get_leaf_bounds(
+                np.array(children_left),
+                np.array(children_right),
+                np.array(features),
+                np.array(thresholds),
+                self._model.num_feature(),
+            )
+
+            tree_class_ids.append(-1 if num_class == 2 else i_tree % num_class)
+            tree_ids.append(i_tree)
+            node_ids.append(np.array(leaf_indices)[leaf_ids])
+            bounds.append(leaf_bounds)
+            values.append(np.array(leaf_values)[leaf_ids])
+
+        return TreeEnsemble.from_leaves(tree_class_ids, tree_ids, node_ids, bounds, values)
+
     def _get_leaf_nodes(self, node, i_tree, class_label, box) -> List["LeafNode"]:
         from art.metrics.verification_decisions_trees import Box, Interval, LeafNode
 
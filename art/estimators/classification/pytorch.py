@@ -683,20 +683,15 @@ class PyTorchClassifier(ClassGradientsMixin, ClassifierMixin, PyTorchEstimator):
             )
             grads = np.swapaxes(np.array(grads_list), 0, 1)
         else:
-            unique_label = list(np.unique(label))
-            for i in unique_label:
-                torch.autograd.backward(
-                    preds[:, i],
-                    torch.tensor([1.0] * len(preds[:, 0])).to(self._device),
-                    retain_graph=True,
-                )
+            # Select the output of the target class of each sample to compute all gradients in a single backward pass
+            label_tensor = torch.from_numpy(label.astype(np.int64)).to(self._device)
+            torch.autograd.backward(
+                torch.gather(preds, 1, label_tensor[:, None])[:, 0],
+                torch.tensor([1.0] * len(preds[:, 0])).to(self._device),
+                retain_graph=True,
+            )
 
             grads = np.swapaxes(np.array(grads_list), 0, 1)
-            lst = [unique_label.index(i) for i in label]
-            grads = grads[np.arange(len(grads)), lst]
-
-            grads = grads[None, ...]
-            grads = np.swapaxes(np.array(grads), 0, 1)
 
         if not self.all_framework_preprocessing:
             grads = self._apply_preprocessing_gradient(x, grads)
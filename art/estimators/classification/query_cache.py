@@ -0,0 +1,252 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2023
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This module implements a classifier wrapper caching the predictions of a query-based classifier.
+"""
+from collections import OrderedDict
+import hashlib
+import logging
+import sqlite3
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from art.config import ART_NUMPY_DTYPE
+from art.estimators.estimator import BaseEstimator
+from art.estimators.classification.classifier import ClassifierMixin
+
+if TYPE_CHECKING:
+    from art.utils import CLASSIFIER_TYPE
+
+logger = logging.getLogger(__name__)
+
+
+class QueryCacheClassifier(ClassifierMixin, BaseEstimator):
+    """
+    Wrapper for query-based classifiers, e.g. `BlackBoxClassifier`, which caches predictions and accounts for the
+    queries sent to the wrapped classifier. Every input is identified by a content hash of its bytes. Inputs which have
+    been predicted before are answered from a least-recently-used in-memory cache and, optionally, from a persistent
+    SQLite store, so that only new inputs are sent to the wrapped classifier. The number of queries can be capped with
+    a budget. The wrapper can be used with every attack which only requires `predict`.
+    """
+
+    estimator_params = ["max_cache_size", "query_budget", "cache_path"]
+
+    def __init__(
+        self,
+        classifier: "CLASSIFIER_TYPE",
+        max_cache_size: Optional[int] = None,
+        query_budget: Optional[int] = None,
+        cache_path: Optional[str] = None,
+    ) -> None:
+        """
+        :param classifier: The classifier whose queries are cached.
+        :param max_cache_size: Maximum number of predictions kept in memory, the least recently used are evicted first.
+                               If `None`, the in-memory cache is unbounded.
+        :param query_budget: Maximum number of inputs sent to the classifier. A prediction exceeding the budget raises
+                             a `ValueError` before any input is sent. If `None`, the number of queries is unlimited.
+        :param cache_path: Path of a SQLite database storing all predictions persistently. Predictions in an existing
+                           database are reused, which requires that it was created for the same classifier.
+        """
+        super().__init__(model=classifier.model, clip_values=classifier.clip_values)
+        self._classifier = classifier
+        self._nb_classes = classifier.nb_classes
+        self.max_cache_size = max_cache_size
+        self.query_budget = query_budget
+        self.cache_path = cache_path
+        self._cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self.nb_queries = 0
+        self.nb_batches = 0
+        self.nb_cache_hits = 0
+        self._check_params()
+
+        self._connection: Optional[sqlite3.Connection] = None
+        if self.cache_path is not None:
+            self._connection = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS predictions (key BLOB PRIMARY KEY, prediction BLOB NOT NULL)"
+            )
+            self._connection.commit()
+
+    @property
+    def input_shape(self) -> Tuple[int, ...]:
+        """
+        Return the shape of one input sample.
+
+        :return: Shape of one input sample.
+        """
+        return self._classifier.input_shape  # type: ignore
+
+    @property
+    def channels_first(self) -> Optional[bool]:
+        """
+        :return: Boolean to indicate index of the color channels of the wrapped classifier, `None` if not defined.
+        """
+        return getattr(self._classifier, "channels_first", None)
+
+    @property
+    def classifier(self) -> "CLASSIFIER_TYPE":
+        """
+        Return the wrapped classifier.
+
+        :return: The wrapped classifier.
+        """
+        return self._classifier
+
+    @property
+    def cache_size(self) -> int:
+        """
+        Return the number of predictions in the in-memory cache.
+
+        :return: Number of cached predictions.
+        """
+        return len(self._cache)
+
+    def predict(self, x: np.ndarray, batch_size: int = 128, **kwargs) -> np.ndarray:  # pylint: disable=W0221
+        """
+        Perform prediction for a batch of inputs. Only inputs without cached prediction are sent to the classifier,
+        every distinct input at most once.
+
+        :param x: Input samples.
+        :param batch_size: Size of batches.
+        :return: Array of predictions of shape `(nb_inputs, nb_classes)`.
+        :raises `ValueError`: If the predictions would exceed the query budget.
+        """
+        keys = [self._get_key(row) for row in x]
+        predictions = np.zeros((x.shape[0], self.nb_classes), dtype=ART_NUMPY_DTYPE)
+
+        missing: Dict[bytes, List[int]] = OrderedDict()
+        for i, key in enumerate(keys):
+            prediction = self._cache.get(key)
+            if prediction is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                self._cache.move_to_end(key)
+                predictions[i] = prediction
+        self.nb_cache_hits += x.shape[0] - sum(len(indices) for indices in missing.values())
+
+        if missing and self._connection is not None:
+            for key, prediction in self._load(list(missing.keys())).items():
+                predictions[missing.pop(key)] = prediction
+                self._add_to_cache(key, prediction)
+
+        if missing:
+            if self.query_budget is not None and self.nb_queries + len(missing) > self.query_budget:
+                raise ValueError(
+                    f"Predicting {len(missing)} new inputs exceeds the query budget of {self.query_budget} with "
+                    f"{self.nb_queries} queries already used."
+                )
+
+            first_indices = [indices[0] for indices in missing.values()]
+            new_predictions = self._classifier.predict(x[first_indices], batch_size=batch_size, **kwargs)
+            self.nb_queries += len(first_indices)
+            self.nb_batches += int(np.ceil(len(first_indices) / batch_size))
+
+            for (key, indices), prediction in zip(missing.items(), new_predictions):
+                predictions[indices] = prediction
+                self._add_to_cache(key, predictions[indices[0]].copy())
+            if self._connection is not None:
+                self._store(list(missing.keys()), predictions[first_indices])
+
+        return predictions
+
+    def fit(self, x: np.ndarray, y: np.ndarray, **kwargs) -> None:
+        """
+        Fit the classifier using the training data `(x, y)`.
+
+        :param x: Features in array of shape (nb_samples, nb_features) or (nb_samples, nb_pixels_1, nb_pixels_2,
+                  nb_channels) or (nb_samples, nb_channels, nb_pixels_1, nb_pixels_2).
+        :param y: Target values (class labels in classification) in array of shape (nb_samples, nb_classes) in
+                  one-hot encoding format.
+        :param kwargs: Dictionary of framework-specific arguments.
+        """
+        raise NotImplementedError
+
+    def reset_counters(self) -> None:
+        """
+        Reset the counters of queries, batches and cache hits.
+        """
+        self.nb_queries = 0
+        self.nb_batches = 0
+        self.nb_cache_hits = 0
+
+    def clear_cache(self) -> None:
+        """
+        Remove all predictions from the in-memory cache. The persistent store is not modified.
+        """
+        self._cache.clear()
+
+    def close(self) -> None:
+        """
+        Close the connection to the persistent store.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def _get_key(row: np.ndarray) -> bytes:
+        """
+        Compute the content hash of an input, including its data type.
+        """
+        row = np.ascontiguousarray(row)
+        return hashlib.blake2b(row.tobytes(), digest_size=16, person=row.dtype.str.encode()).digest()
+
+    def _add_to_cache(self, key: bytes, prediction: np.ndarray) -> None:
+        """
+        Add a prediction to the in-memory cache and evict the least recently used ones beyond the maximum size.
+        """
+        self._cache[key] = prediction
+        self._cache.move_to_end(key)
+        if self.max_cache_size is not None:
+            while len(self._cache) > self.max_cache_size:
+                self._cache.popitem(last=False)
+
+    def _load(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        Load the stored predictions for the given keys from the persistent store.
+        """
+        stored = {}
+        for begin in range(0, len(keys), 500):
+            keys_batch = keys[begin : begin + 500]
+            rows = self._connection.execute(  # type: ignore
+                f"SELECT key, prediction FROM predictions WHERE key IN ({','.join('?' * len(keys_batch))})",
+                keys_batch,
+            )
+            for key, prediction in rows:
+                stored[key] = np.frombuffer(prediction, dtype=ART_NUMPY_DTYPE)
+        return stored
+
+    def _store(self, keys: List[bytes], predictions: np.ndarray) -> None:
+        """
+        Write predictions to the persistent store.
+        """
+        self._connection.executemany(  # type: ignore
+            "INSERT OR REPLACE INTO predictions (key, prediction) VALUES (?, ?)",
+            [(key, prediction.tobytes()) for key, prediction in zip(keys, predictions)],
+        )
+        self._connection.commit()  # type: ignore
+
+    def _check_params(self) -> None:
+        super()._check_params()
+
+        if self.max_cache_size is not None and self.max_cache_size < 0:
+            raise ValueError("The maximum cache size must be non-negative.")
+
+        if self.query_budget is not None and self.query_budget < 0:
+            raise ValueError("The query budget must be non-negative.")
@@ -22,7 +22,7 @@ import logging
 from typing import List, Optional, Tuple, Union, TYPE_CHECKING
 
 import numpy as np
-from scipy.stats import entropy
+from scipy.special import rel_entr
 
 from art.estimators.estimator import BaseEstimator
 from art.estimators.classification.classifier import ClassifierMixin, ClassifierLossGradients
@@ -42,7 +42,7 @@ class QueryEfficientGradientEstimationClassifier(ClassifierLossGradients, Classi
     | Paper link: https://arxiv.org/abs/1712.07113
     """
 
-    estimator_params = ["num_basis", "sigma", "round_samples"]
+    estimator_params = ["num_basis", "sigma", "round_samples", "max_batch_memory"]
 
     def __init__(
         self,
@@ -50,6 +50,7 @@ class QueryEfficientGradientEstimationClassifier(ClassifierLossGradients, Classi
         num_basis: int,
         sigma: float,
         round_samples: float = 0.0,
+        max_batch_memory: int = 2 ** 28,
     ) -> None:
         """
         :param classifier: An instance of a classification estimator whose loss_gradient is being approximated.
@@ -57,6 +58,8 @@ class QueryEfficientGradientEstimationClassifier(ClassifierLossGradients, Classi
         :param sigma: Scaling on the Gaussian noise N(0,1).
         :param round_samples: The resolution of the input domain to round the data to, e.g., 1.0, or 1/255. Set to 0 to
                               disable.
+        :param max_batch_memory: Maximum size in bytes of the samples of several inputs which are stacked into a single
+                                 call of `predict` when estimating the loss gradient.
         """
         super().__init__(model=classifier.model, clip_values=classifier.clip_values)
         # pylint: disable=E0203
@@ -64,6 +67,7 @@ class QueryEfficientGradientEstimationClassifier(ClassifierLossGradients, Classi
         self.num_basis = num_basis
         self.sigma = sigma
         self.round_samples = round_samples
+        self.max_batch_memory = max_batch_memory
         self._nb_classes = self._classifier.nb_classes
 
     @property
@@ -98,25 +102,19 @@ class QueryEfficientGradientEstimationClassifier(ClassifierLossGradients, Classi
         """
         raise NotImplementedError
 
-    def _generate_samples(self, x: np.ndarray, epsilon_map: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def _generate_samples(self, x: np.ndarray, epsilon_map: np.ndarray, out: np.ndarray) -> np.ndarray:
         """
-        Generate samples around the current image.
+        Generate the antithetic samples around a batch of inputs.
 
-        :param x: Sample input with shape as expected by the model.
+        :param x: Sample inputs with shape as expected by the model.
         :param epsilon_map: Samples drawn from search space.
-        :return: Two arrays of new input samples to approximate gradient.
-        """
-        minus = clip_and_round(
-            np.repeat(x, self.num_basis, axis=0) - epsilon_map,
-            self.clip_values,
-            self.round_samples,
-        )
-        plus = clip_and_round(
-            np.repeat(x, self.num_basis, axis=0) + epsilon_map,
-            self.clip_values,
-            self.round_samples,
-        )
-        return minus, plus
+        :param out: Buffer of shape `(2, nb_inputs, num_basis) + input_shape` for the samples with the noise subtracted
+                    and added.
+        :return: Array of all samples of shape `(2 * nb_inputs * num_basis,) + input_shape`.
+        """
+        np.subtract(x[:, np.newaxis], epsilon_map, out=out[0])
+        np.add(x[:, np.newaxis], epsilon_map, out=out[1])
+        return clip_and_round(out.reshape((-1,) + out.shape[3:]), self.clip_values, self.round_samples)
 
     def class_gradient(
         self, x: np.ndarray, label: Optional[Union[int, List[int], np.ndarray]] = None, **kwargs
@@ -144,26 +142,29 @@ class QueryEfficientGradientEstimationClassifier(ClassifierLossGradients, Classi
         :return: Array of gradients of the same shape as `x`.
         """
         epsilon_map = self.sigma * np.random.normal(size=([self.num_basis] + list(self.input_shape)))
-        grads = []
-        for i in range(len(x)):
-            minus, plus = self._generate_samples(x[i : i + 1], epsilon_map)
-
-            # Vectorized; small tests weren't faster
-            # ent_vec = np.vectorize(lambda p: entropy(y[i], p), signature='(n)->()')
-            # new_y_minus = ent_vec(self.predict(minus))
-            # new_y_plus = ent_vec(self.predict(plus))
-            # Vanilla
-            new_y_minus = np.array([entropy(y[i], p) for p in self.predict(minus)])
-            new_y_plus = np.array([entropy(y[i], p) for p in self.predict(plus)])
-            query_efficient_grad = 2 * np.mean(
-                np.multiply(
-                    epsilon_map.reshape(self.num_basis, -1),
-                    (new_y_plus - new_y_minus).reshape(self.num_basis, -1) / (2 * self.sigma),
-                ).reshape([-1] + list(self.input_shape)),
-                axis=0,
-            )
-            grads.append(query_efficient_grad)
-        grads_array = self._apply_preprocessing_gradient(x, np.array(grads))
+        epsilon_flat = epsilon_map.reshape(self.num_basis, -1)
+
+        # Stack the samples of as many inputs as the memory cap allows into a single query and reuse the buffer
+        dtype = np.result_type(x, epsilon_map)
+        sample_size = 2 * epsilon_map.size * dtype.itemsize
+        batch_size = int(np.clip(self.max_batch_memory // sample_size, 1, max(len(x), 1)))
+        buffer = np.empty((2, batch_size) + epsilon_map.shape, dtype=dtype)
+
+        grads = np.zeros((len(x), epsilon_flat.shape[1]), dtype=dtype)
+        for begin in range(0, len(x), batch_size):
+            x_batch = x[begin : begin + batch_size]
+            samples = self._generate_samples(x_batch, epsilon_map, buffer[:, : len(x_batch)])
+            predictions = self.predict(samples).reshape(2, len(x_batch), self.num_basis, -1)
+
+            # Kullback-Leibler divergence of the normalised labels and predictions, as `scipy.stats.entropy`
+            y_batch = y[begin : begin + batch_size]
+            y_batch = y_batch / np.sum(y_batch, axis=1, keepdims=True)
+            predictions = predictions / np.sum(predictions, axis=-1, keepdims=True)
+            new_y = np.sum(rel_entr(y_batch[np.newaxis, :, np.newaxis], predictions), axis=-1)
+
+            grads[begin : begin + batch_size] = (new_y[1] - new_y[0]) @ epsilon_flat / (self.num_basis * self.sigma)
+
+        grads_array = self._apply_preprocessing_gradient(x, grads.reshape(x.shape))
         return grads_array
 
     def get_activations(self, x: np.ndarray, layer: Union[int, str], batch_size: int) -> np.ndarray:
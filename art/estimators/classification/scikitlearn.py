@@ -47,7 +47,7 @@ if TYPE_CHECKING:
     from art.utils import CLIP_VALUES_TYPE, PREPROCESSING_TYPE
     from art.defences.preprocessor import Preprocessor
     from art.defences.postprocessor import Postprocessor
-    from art.metrics.verification_decisions_trees import LeafNode, Tree
+    from art.metrics.verification_decisions_trees import LeafNode, Tree, TreeEnsemble
 
 logger = logging.getLogger(__name__)
 
@@ -177,6 +177,9 @@ class ScikitlearnClassifier(ClassifierMixin, ScikitlearnEstimator):
         self._input_shape = self._get_input_shape(self.model)
         self.nb_classes = self._get_nb_classes()
 
+        if isinstance(self, DecisionTreeMixin):
+            self._reset_tree_ensemble()
+
     def predict(self, x: np.ndarray, **kwargs) -> np.ndarray:
         """
         Perform prediction for a batch of inputs.
@@ -598,6 +601,14 @@ class ScikitlearnExtraTreesClassifier(ScikitlearnClassifier, DecisionTreeMixin):
 
         return trees
 
+    def _build_tree_ensemble(self) -> "TreeEnsemble":
+        """
+        Build the array-backed representation of the decision trees directly from the `tree_` arrays.
+
+        :return: The tree ensemble.
+        """
+        return _get_forest_tree_ensemble(self.model)
+
 
 class ScikitlearnGradientBoostingClassifier(ScikitlearnClassifier, DecisionTreeMixin):
     """
@@ -672,8 +683,34 @@ class ScikitlearnGradientBoostingClassifier(ScikitlearnClassifier, DecisionTreeM
 
         return trees
 
+    def _build_tree_ensemble(self) -> "TreeEnsemble":
+        """
+        Build the array-backed representation of the decision trees directly from the `tree_` arrays.
+
+        :return: The tree ensemble.
+        """
+        from art.metrics.verification_decisions_trees import TreeEnsemble, get_leaf_bounds
+
+        num_trees, num_classes = self.model.estimators_.shape
+        tree_class_ids, tree_ids, node_ids, bounds, values = [], [], [], [], []
+
+        for i_tree in range(num_trees):
+            for i_class in range(num_classes):
+                tree = self.model.estimators_[i_tree, i_class].tree_
+                leaf_ids, leaf_bounds = get_leaf_bounds(
+                    tree.children_left, tree.children_right, tree.feature, tree.threshold, self.model.n_features_in_
+                )
+
+                tree_class_ids.append(-1 if num_classes == 2 else i_class)
+                tree_ids.append(i_tree)
+                node_ids.append(leaf_ids)
+                bounds.append(leaf_bounds)
+                values.append(tree.value[leaf_ids, 0, 0])
+
+        return TreeEnsemble.from_leaves(tree_class_ids, tree_ids, node_ids, bounds, values)
 
-class ScikitlearnRandomForestClassifier(ScikitlearnClassifier):
+
+class ScikitlearnRandomForestClassifier(ScikitlearnClassifier, DecisionTreeMixin):
     """
     Class for scikit-learn Random Forest Classifier models.
     """
@@ -745,6 +782,14 @@ class ScikitlearnRandomForestClassifier(ScikitlearnClassifier):
 
         return trees
 
+    def _build_tree_ensemble(self) -> "TreeEnsemble":
+        """
+        Build the array-backed representation of the decision trees directly from the `tree_` arrays.
+
+        :return: The tree ensemble.
+        """
+        return _get_forest_tree_ensemble(self.model)
+
 
 class ScikitlearnLogisticRegression(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassifier):
     """
@@ -1426,3 +1471,33 @@ class ScikitlearnSVC(ClassGradientsMixin, LossGradientsMixin, ScikitlearnClassif
 
 
 ScikitlearnLinearSVC = ScikitlearnSVC
+
+
+def _get_forest_tree_ensemble(model) -> "TreeEnsemble":
+    """
+    Build the array-backed representation of a scikit-learn forest of decision tree classifiers. Every decision tree of
+    the forest contributes one tree per class with the normalized class values of its leaves.
+
+    :param model: A fitted scikit-learn Random Forest or Extra Trees Classifier model.
+    :return: The tree ensemble.
+    """
+    from art.metrics.verification_decisions_trees import TreeEnsemble, get_leaf_bounds
+
+    tree_class_ids, tree_ids, node_ids, bounds, values = [], [], [], [], []
+
+    for i_tree, decision_tree_model in enumerate(model.estimators_):
+        tree = decision_tree_model.tree_
+        leaf_ids, leaf_bounds = get_leaf_bounds(
+            tree.children_left, tree.children_right, tree.feature, tree.threshold, model.n_features_in_
+        )
+        leaf_values = tree.value[leaf_ids, 0, :]
+        leaf_values = leaf_values / np.linalg.norm(leaf_values, axis=1, keepdims=True)
+
+        for i_class in range(model.n_classes_):
+            tree_class_ids.append(i_class)
+            tree_ids.append(i_tree)
+            node_ids.append(leaf_ids)
+            bounds.append(leaf_bounds)
+            values.append(leaf_values[:, i_class])
+
+    return TreeEnsemble.from_leaves(tree_class_ids, tree_ids, node_ids, bounds, values)
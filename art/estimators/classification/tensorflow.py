@@ -1173,21 +1173,14 @@ class TensorFlowV2Classifier(ClassGradientsMixin, ClassifierMixin, TensorFlowV2E
                     gradients = np.expand_dims(class_gradient, axis=1)
 
                 else:
-                    # For each sample, compute the gradients w.r.t. the indicated target class (possibly distinct)
-                    class_gradients = []
-                    unique_labels = list(np.unique(label))
-
-                    for unique_label in unique_labels:
-                        predictions = self.model(x_input, training=training_mode)
-                        prediction = predictions[:, unique_label]
-                        tape.watch(prediction)
-
-                        class_gradient = tape.gradient(prediction, x_grad).numpy()
-                        class_gradients.append(class_gradient)
+                    # For each sample, compute the gradients w.r.t. the indicated target class (possibly distinct) by
+                    # selecting the corresponding outputs and computing all gradients in a single backward pass
+                    predictions = self.model(x_input, training=training_mode)
+                    prediction = tf.gather(predictions, np.array(label, dtype=np.int64), axis=1, batch_dims=1)
+                    tape.watch(prediction)
 
-                    gradients = np.swapaxes(np.array(class_gradients), 0, 1)
-                    lst = [unique_labels.index(i) for i in label]
-                    gradients = np.expand_dims(gradients[np.arange(len(gradients)), lst], axis=1)
+                    class_gradient = tape.gradient(prediction, x_grad).numpy()
+                    gradients = np.expand_dims(class_gradient, axis=1)
 
                 if not self.all_framework_preprocessing:
                     gradients = self._apply_preprocessing_gradient(x, gradients)
@@ -40,7 +40,7 @@ if TYPE_CHECKING:
     from art.utils import CLIP_VALUES_TYPE, PREPROCESSING_TYPE
     from art.defences.preprocessor import Preprocessor
     from art.defences.postprocessor import Postprocessor
-    from art.metrics.verification_decisions_trees import LeafNode, Tree
+    from art.metrics.verification_decisions_trees import LeafNode, Tree, TreeEnsemble
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +131,7 @@ class XGBoostClassifier(ClassifierDecisionTree):
             _nb_classes = self._get_nb_classes(self._nb_classes)
             if _nb_classes is not None:
                 self._nb_classes = _nb_classes
+            self._reset_tree_ensemble()
         else:
             raise NotImplementedError
 
@@ -253,6 +254,43 @@ class XGBoostClassifier(ClassifierDecisionTree):
 
         return trees
 
+    def _build_tree_ensemble(self) -> "TreeEnsemble":
+        """
+        Build the array-backed representation of the decision trees from a single JSON dump of the booster, which
+        stores the nodes of every tree as arrays.
+
+        :return: The tree ensemble.
+        """
+        from art.metrics.verification_decisions_trees import TreeEnsemble, get_leaf_bounds
+
+        booster = self._model.get_booster()
+        gradient_booster = json.loads(booster.save_raw(raw_format="json"))["learner"]["gradient_booster"]
+        if gradient_booster["name"] == "dart":
+            gradient_booster = gradient_booster["gbtree"]
+        tree_dumps = gradient_booster["model"]["trees"]
+        tree_info = gradient_booster["model"]["tree_info"]
+
+        tree_class_ids, tree_ids, node_ids, bounds, values = [], [], [], [], []
+
+        for i_tree, tree_dump in enumerate(tree_dumps):
+            # XGBoost stores the thresholds and leaf values as float32
+            split_conditions = np.array(tree_dump["split_conditions"], dtype=np.float32).astype(np.float64)
+            leaf_ids, leaf_bounds = get_leaf_bounds(
+                tree_dump["left_children"],
+                tree_dump["right_children"],
+                tree_dump["split_indices"],
+                split_conditions,
+                booster.num_features(),
+            )
+
+            tree_class_ids.append(-1 if self._model.n_classes_ == 2 else tree_info[i_tree])
+            tree_ids.append(i_tree)
+            node_ids.append(leaf_ids)
+            bounds.append(leaf_bounds)
+            values.append(split_conditions[leaf_ids])
+
+        return TreeEnsemble.from_leaves(tree_class_ids, tree_ids, node_ids, bounds, values)
+
     def _get_leaf_nodes(self, node, i_tree, class_label, box) -> List["LeafNode"]:
         from art.metrics.verification_decisions_trees import LeafNode, Box, Interval
 
@@ -30,7 +30,7 @@ if TYPE_CHECKING:
     # pylint: disable=R0401
     from art.utils import CLIP_VALUES_TYPE, PREPROCESSING_TYPE, ESTIMATOR_TYPE
     from art.data_generators import DataGenerator
-    from art.metrics.verification_decisions_trees import Tree
+    from art.metrics.verification_decisions_trees import Tree, TreeEnsemble
     from art.defences.postprocessor.postprocessor import Postprocessor
     from art.defences.preprocessor.preprocessor import Preprocessor
 
@@ -535,6 +535,8 @@ class DecisionTreeMixin(ABC):
     base class has to be mixed in with class `BaseEstimator`.
     """
 
+    _tree_ensemble: Optional["TreeEnsemble"] = None
+
     @abstractmethod
     def get_trees(self) -> List["Tree"]:
         """
@@ -543,3 +545,31 @@ class DecisionTreeMixin(ABC):
         :return: A list of decision trees.
         """
         raise NotImplementedError
+
+    def get_tree_ensemble(self) -> "TreeEnsemble":
+        """
+        Get the array-backed representation of the decision trees. It is built on the first call and cached until the
+        estimator is fitted again.
+
+        :return: The tree ensemble.
+        """
+        if self._tree_ensemble is None:
+            self._tree_ensemble = self._build_tree_ensemble()
+        return self._tree_ensemble
+
+    def _build_tree_ensemble(self) -> "TreeEnsemble":
+        """
+        Build the array-backed representation of the decision trees. Subclasses should override this method to avoid
+        creating the intermediate objects of `get_trees`.
+
+        :return: The tree ensemble.
+        """
+        from art.metrics.verification_decisions_trees import TreeEnsemble
+
+        return TreeEnsemble.from_trees(self.get_trees())
+
+    def _reset_tree_ensemble(self) -> None:
+        """
+        Discard the cached tree ensemble, e.g. after the model has been fitted.
+        """
+        self._tree_ensemble = None
@@ -1,4 +1,16 @@
 """
 GAN Estimator API.
 """
-from art.estimators.gan.tensorflow import TensorFlowV2GAN
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.gan.tensorflow import TensorFlowV2GAN
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "tensorflow": ["TensorFlowV2GAN"],
+    },
+)
@@ -1,7 +1,18 @@
 """
 Generator API.
 """
-from art.estimators.generation.generator import GeneratorMixin
+from typing import TYPE_CHECKING
 
-from art.estimators.generation.tensorflow import TensorFlowGenerator
-from art.estimators.generation.tensorflow import TensorFlowV2Generator
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.generation.generator import GeneratorMixin
+    from art.estimators.generation.tensorflow import TensorFlowGenerator, TensorFlowV2Generator
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "generator": ["GeneratorMixin"],
+        "tensorflow": ["TensorFlowGenerator", "TensorFlowV2Generator"],
+    },
+)
@@ -0,0 +1,401 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2020
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This module implements the opt-in instrumentation of estimators. It records the number of calls of the estimator
+methods, the number of samples they process and their latency, split into preprocessing, forward pass, backward pass
+and postprocessing, to compare the cost of attacks and defences and to find their hot spots.
+"""
+import bisect
+import functools
+import json
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from art.estimators.estimator import BaseEstimator
+    from art.summary_writer import SummaryWriter
+
+logger = logging.getLogger(__name__)
+
+PHASES = ["preprocessing", "forward", "backward", "postprocessing"]
+
+
+class _MethodStatistics:
+    """
+    Statistics of the calls of one method of an estimator.
+    """
+
+    def __init__(self, bin_edges: List[float]) -> None:
+        self.bin_edges = bin_edges
+        self.nb_calls = 0
+        self.nb_samples = 0
+        self.total_time = 0.0
+        self.sum_squares = 0.0
+        self.min_time = float("inf")
+        self.max_time = 0.0
+        self.phase_times = dict.fromkeys(PHASES, 0.0)
+        self.histogram = [0] * (len(bin_edges) + 1)
+
+    def record(self, nb_samples: int, duration: float, phase_times: Dict[str, float]) -> None:
+        """
+        Record a single call.
+        """
+        self.nb_calls += 1
+        self.nb_samples += nb_samples
+        self.total_time += duration
+        self.sum_squares += duration ** 2
+        self.min_time = min(self.min_time, duration)
+        self.max_time = max(self.max_time, duration)
+        for phase, phase_time in phase_times.items():
+            self.phase_times[phase] += phase_time
+        self.histogram[bisect.bisect_right(self.bin_edges, duration)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the statistics as a dictionary.
+        """
+        return {
+            "nb_calls": self.nb_calls,
+            "nb_samples": self.nb_samples,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.nb_calls if self.nb_calls > 0 else 0.0,
+            "min_time": self.min_time if self.nb_calls > 0 else 0.0,
+            "max_time": self.max_time,
+            "phase_times": dict(self.phase_times),
+            "histogram": {"bin_edges": list(self.bin_edges), "counts": list(self.histogram)},
+        }
+
+
+class EstimatorInstrumentation:
+    """
+    Opt-in instrumentation of estimators. While attached, the instrumentation records for every estimator and method
+    the number of calls, the number of samples, the total latency split into preprocessing, forward pass, backward pass
+    and postprocessing, and a histogram of the latency of the calls. The statistics are recorded for the whole lifetime
+    of the instrumentation and additionally for every active scope, so that e.g. the `generate` of an attack reports
+    its own totals:
+
+    .. code-block:: python
+
+        with EstimatorInstrumentation(classifier) as instrumentation:
+            with instrumentation.scope("pgd"):
+                attack.generate(x)
+        print(instrumentation.to_json())
+
+    The methods are wrapped on the estimator instances only while the instrumentation is attached, therefore detached
+    estimators run without any overhead. Calls of an estimator from within one of its own instrumented methods are
+    accounted to the outer call. The forward and backward passes of gradient computations are timed separately for
+    PyTorch models only, the other frameworks report both passes as backward pass. Estimators should be detached
+    before they are copied or pickled.
+    """
+
+    gradient_methods = ["loss_gradient", "class_gradient"]
+
+    def __init__(
+        self,
+        estimators: Union["BaseEstimator", Sequence["BaseEstimator"]],
+        methods: Optional[List[str]] = None,
+        names: Optional[List[str]] = None,
+        bin_edges: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        Create an instrumentation of estimators.
+
+        :param estimators: An estimator or a list of estimators to instrument.
+        :param methods: Names of the methods to instrument. The default instruments `predict`, `fit`, `loss_gradient`,
+                        `class_gradient`, `compute_loss` and `get_activations`, where available.
+        :param names: Names of the estimators in the statistics. The default uses the class names of the estimators.
+        :param bin_edges: Increasing edges in seconds of the bins of the latency histograms. The default uses bins
+                          spaced logarithmically from 10 microseconds to 100 seconds.
+        """
+        self.estimators: List["BaseEstimator"] = list(estimators) if isinstance(estimators, Sequence) else [estimators]
+        self.methods = (
+            methods
+            if methods is not None
+            else ["predict", "fit", "loss_gradient", "class_gradient", "compute_loss", "get_activations"]
+        )
+        if names is None:
+            names = [type(estimator).__name__ for estimator in self.estimators]
+            names = [
+                name if names.count(name) == 1 else f"{name}_{names[:i].count(name)}" for i, name in enumerate(names)
+            ]
+        self.names = names
+        self.bin_edges: List[float]
+        if bin_edges is None:
+            self.bin_edges = [float(edge) for edge in 10.0 ** np.arange(-5.0, 2.5, 0.5)]
+        else:
+            self.bin_edges = [float(edge) for edge in bin_edges]
+        self._check_params()
+
+        self._statistics: Dict[str, Dict[str, Dict[str, _MethodStatistics]]] = {}
+        self._scopes: List[str] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._attached: List[Any] = []
+
+    @property
+    def attached(self) -> bool:
+        """
+        Return whether the instrumentation is attached to its estimators.
+        """
+        return len(self._attached) > 0
+
+    def attach(self) -> "EstimatorInstrumentation":
+        """
+        Wrap the methods of the estimators to record their statistics.
+
+        :return: The instrumentation.
+        """
+        if self.attached:
+            return self
+
+        phase_methods = {
+            "_apply_preprocessing": "preprocessing",
+            "_apply_preprocessing_gradient": "preprocessing",
+            "_apply_postprocessing": "postprocessing",
+        }
+        for estimator, name in zip(self.estimators, self.names):
+            attributes = []
+            for method in self.methods:
+                if callable(getattr(estimator, method, None)):
+                    setattr(estimator, method, self._wrap_method(estimator, name, method, getattr(estimator, method)))
+                    attributes.append(method)
+            for method, phase in phase_methods.items():
+                if callable(getattr(estimator, method, None)):
+                    setattr(estimator, method, self._wrap_phase(estimator, phase, getattr(estimator, method)))
+                    attributes.append(method)
+            self._attached.append((estimator, attributes, self._register_forward_hooks(estimator)))
+
+        return self
+
+    def detach(self) -> None:
+        """
+        Restore the original methods of the estimators. The recorded statistics are kept.
+        """
+        for estimator, attributes, handles in self._attached:
+            for attribute in attributes:
+                delattr(estimator, attribute)
+            for handle in handles:
+                handle.remove()
+        self._attached = []
+
+    def __enter__(self) -> "EstimatorInstrumentation":
+        return self.attach()
+
+    def __exit__(self, *args) -> None:
+        self.detach()
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator["EstimatorInstrumentation"]:
+        """
+        Context manager recording the statistics of all calls made in its context under the scope `name` in addition
+        to the totals. Scopes can be nested and a scope used repeatedly accumulates its statistics.
+
+        :param name: Name of the scope.
+        """
+        self._scopes.append(name)
+        try:
+            yield self
+        finally:
+            self._scopes.remove(name)
+
+    def reset(self) -> None:
+        """
+        Delete all recorded statistics.
+        """
+        with self._lock:
+            self._statistics = {}
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """
+        Return the recorded statistics as a dictionary indexed by scope, estimator name and method. The statistics of
+        all calls are recorded in the scope `total`.
+
+        :return: Dictionary of the statistics.
+        """
+        with self._lock:
+            return {
+                scope: {
+                    name: {method: statistics.to_dict() for method, statistics in methods.items()}
+                    for name, methods in estimators.items()
+                }
+                for scope, estimators in self._statistics.items()
+            }
+
+    def to_json(self, path: Optional[str] = None, indent: Optional[int] = 2) -> str:
+        """
+        Return the recorded statistics as JSON string and optionally write them to a file.
+
+        :param path: Path of the JSON file to write.
+        :param indent: Indentation of the JSON string.
+        :return: JSON string of the statistics.
+        """
+        output = json.dumps(self.to_dict(), indent=indent)
+        if path is not None:
+            with open(path, "w", encoding="utf8") as file_:
+                file_.write(output)
+        return output
+
+    def to_summary_writer(self, summary_writer: "SummaryWriter", global_step: int = 0) -> None:
+        """
+        Write the recorded statistics to TensorBoard, the counters and times as scalars and the latencies as
+        histograms tagged `<scope>/<estimator>/<method>`.
+
+        :param summary_writer: The summary writer of an attack or a TensorBoardX summary writer.
+        :param global_step: Global step of the statistics.
+        """
+        from art.summary_writer import SummaryWriter
+
+        writer = summary_writer.summary_writer if isinstance(summary_writer, SummaryWriter) else summary_writer
+        for scope, estimators in self.to_dict().items():
+            for name, methods in estimators.items():
+                for method, statistics in methods.items():
+                    tag = f"instrumentation/{scope}/{name}/{method}"
+                    scalars = {key: statistics[key] for key in ["nb_calls", "nb_samples", "total_time", "mean_time"]}
+                    scalars.update(statistics["phase_times"])
+                    writer.add_scalars(tag, scalars, global_step)
+                    if statistics["nb_calls"] > 0:
+                        sum_squares = self._statistics[scope][name][method].sum_squares
+                        writer.add_histogram_raw(
+                            tag=tag + "/latency",
+                            min=statistics["min_time"],
+                            max=statistics["max_time"],
+                            num=statistics["nb_calls"],
+                            sum=statistics["total_time"],
+                            sum_squares=sum_squares,
+                            bucket_limits=self.bin_edges + [max(statistics["max_time"], self.bin_edges[-1])],
+                            bucket_counts=statistics["histogram"]["counts"],
+                            global_step=global_step,
+                        )
+
+    def _frames(self) -> List[Dict[str, Any]]:
+        """
+        Return the stack of the instrumented calls running in the current thread.
+        """
+        frames = getattr(self._local, "frames", None)
+        if frames is None:
+            frames = []
+            self._local.frames = frames
+        return frames
+
+    def _wrap_method(self, estimator: "BaseEstimator", name: str, method: str, function: Callable) -> Callable:
+        """
+        Wrap a method of an estimator to record the statistics of its calls.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            frames = self._frames()
+            if frames and frames[-1]["estimator"] is estimator:
+                return function(*args, **kwargs)
+
+            frame = {"estimator": estimator, "phases": dict.fromkeys(PHASES, 0.0), "forward_start": 0.0}
+            frames.append(frame)
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                frames.pop()
+                x = kwargs["x"] if "x" in kwargs else args[0] if len(args) > 0 else None
+                try:
+                    nb_samples = len(x)  # type: ignore
+                except TypeError:
+                    nb_samples = 0
+                self._record(name, method, nb_samples, duration, frame["phases"])
+
+        return wrapper
+
+    def _wrap_phase(self, estimator: "BaseEstimator", phase: str, function: Callable) -> Callable:
+        """
+        Wrap a preprocessing or postprocessing method of an estimator to time it within the instrumented calls.
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            frames = self._frames()
+            if not frames or frames[-1]["estimator"] is not estimator:
+                return function(*args, **kwargs)
+
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                frames[-1]["phases"][phase] += time.perf_counter() - start
+
+        return wrapper
+
+    def _register_forward_hooks(self, estimator: "BaseEstimator") -> list:
+        """
+        Register hooks timing the forward pass of the model of a PyTorch estimator.
+        """
+        if "torch" not in sys.modules:
+            return []
+        import torch
+
+        try:
+            model = estimator.model
+        except (AttributeError, NotImplementedError):  # pragma: no cover
+            return []
+        if not isinstance(model, torch.nn.Module):
+            return []
+
+        def forward_pre_hook(module, inputs):  # pylint: disable=W0613
+            frames = self._frames()
+            if frames and frames[-1]["estimator"] is estimator:
+                frames[-1]["forward_start"] = time.perf_counter()
+
+        def forward_hook(module, inputs, outputs):  # pylint: disable=W0613
+            frames = self._frames()
+            if frames and frames[-1]["estimator"] is estimator:
+                frames[-1]["phases"]["forward"] += time.perf_counter() - frames[-1]["forward_start"]
+
+        return [model.register_forward_pre_hook(forward_pre_hook), model.register_forward_hook(forward_hook)]
+
+    def _record(self, name: str, method: str, nb_samples: int, duration: float, phases: Dict[str, float]) -> None:
+        """
+        Record a call in the totals and in all active scopes.
+        """
+        # The time not spent in preprocessing and postprocessing is spent in the model, split into forward and
+        # backward pass for gradient computations if the forward pass has been timed by hooks
+        model_time = max(duration - phases["preprocessing"] - phases["postprocessing"], 0.0)
+        if method in self.gradient_methods:
+            phases["forward"] = min(phases["forward"], model_time)
+            phases["backward"] = model_time - phases["forward"]
+        else:
+            phases["forward"] = model_time
+
+        with self._lock:
+            for scope in dict.fromkeys(["total"] + self._scopes):
+                methods = self._statistics.setdefault(scope, {}).setdefault(name, {})
+                if method not in methods:
+                    methods[method] = _MethodStatistics(self.bin_edges)
+                methods[method].record(nb_samples, duration, phases)
+
+    def _check_params(self) -> None:
+        if len(self.names) != len(self.estimators):
+            raise ValueError("The number of names must match the number of estimators.")
+        if len(set(self.names)) != len(self.names):
+            raise ValueError("The names of the estimators must be unique.")
+        if len(self.bin_edges) == 0 or np.any(np.diff(self.bin_edges) <= 0):
+            raise ValueError("The edges of the histogram bins must be a non-empty increasing sequence.")
@@ -1,11 +1,28 @@
 """
 Module containing estimators for object detection.
 """
-from art.estimators.object_detection.object_detector import ObjectDetectorMixin
+from typing import TYPE_CHECKING
 
-from art.estimators.object_detection.pytorch_object_detector import PyTorchObjectDetector
-from art.estimators.object_detection.pytorch_faster_rcnn import PyTorchFasterRCNN
-from art.estimators.object_detection.pytorch_yolo import PyTorchYolo
-from art.estimators.object_detection.tensorflow_faster_rcnn import TensorFlowFasterRCNN
-from art.estimators.object_detection.tensorflow_v2_faster_rcnn import TensorFlowV2FasterRCNN
-from art.estimators.object_detection.pytorch_detection_transformer import PyTorchDetectionTransformer
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.object_detection.object_detector import ObjectDetectorMixin
+    from art.estimators.object_detection.pytorch_object_detector import PyTorchObjectDetector
+    from art.estimators.object_detection.pytorch_faster_rcnn import PyTorchFasterRCNN
+    from art.estimators.object_detection.pytorch_yolo import PyTorchYolo
+    from art.estimators.object_detection.tensorflow_faster_rcnn import TensorFlowFasterRCNN
+    from art.estimators.object_detection.tensorflow_v2_faster_rcnn import TensorFlowV2FasterRCNN
+    from art.estimators.object_detection.pytorch_detection_transformer import PyTorchDetectionTransformer
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "object_detector": ["ObjectDetectorMixin"],
+        "pytorch_object_detector": ["PyTorchObjectDetector"],
+        "pytorch_faster_rcnn": ["PyTorchFasterRCNN"],
+        "pytorch_yolo": ["PyTorchYolo"],
+        "tensorflow_faster_rcnn": ["TensorFlowFasterRCNN"],
+        "tensorflow_v2_faster_rcnn": ["TensorFlowV2FasterRCNN"],
+        "pytorch_detection_transformer": ["PyTorchDetectionTransformer"],
+    },
+)
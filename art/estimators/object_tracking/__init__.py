@@ -1,6 +1,18 @@
 """
 Module containing estimators for object tracking.
 """
-from art.estimators.object_tracking.object_tracker import ObjectTrackerMixin
+from typing import TYPE_CHECKING
 
-from art.estimators.object_tracking.pytorch_goturn import PyTorchGoturn
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.object_tracking.object_tracker import ObjectTrackerMixin
+    from art.estimators.object_tracking.pytorch_goturn import PyTorchGoturn
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "object_tracker": ["ObjectTrackerMixin"],
+        "pytorch_goturn": ["PyTorchGoturn"],
+    },
+)
@@ -1,7 +1,20 @@
 """
 This module implements all poison mitigation models in ART.
 """
-from art.estimators.poison_mitigation import neural_cleanse
-from art.estimators.poison_mitigation.strip import strip
-from art.estimators.poison_mitigation.neural_cleanse.keras import KerasNeuralCleanse
-from art.estimators.poison_mitigation.strip.strip import STRIPMixin
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.poison_mitigation import neural_cleanse, strip
+    from art.estimators.poison_mitigation.neural_cleanse.keras import KerasNeuralCleanse
+    from art.estimators.poison_mitigation.strip.strip import STRIPMixin
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["neural_cleanse", "strip"],
+    submod_attrs={
+        "neural_cleanse.keras": ["KerasNeuralCleanse"],
+        "strip.strip": ["STRIPMixin"],
+    },
+)
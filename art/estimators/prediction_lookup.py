@@ -0,0 +1,199 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2024
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This module implements the look-up of existing predictions used by the black-box estimators.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import logging
+import tempfile
+from typing import Callable, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class ExactPredictionLookup:
+    """
+    Look up existing predictions for a batch of inputs which match the stored samples exactly. The rows of the samples
+    are hashed in a vectorized manner and the hashes are kept sorted, so that a whole batch is answered with a binary
+    search followed by a byte-wise comparison of the candidate rows. If the samples are a `numpy.memmap`, the index is
+    memory-mapped as well.
+    """
+
+    def __init__(self, samples: np.ndarray, labels: np.ndarray, batch_size: int = 4096) -> None:
+        """
+        Create the index of the samples.
+
+        :param samples: Array of the samples with existing predictions.
+        :param labels: Array of the predictions for the samples.
+        :param batch_size: Number of samples hashed at once while building the index.
+        """
+        self.samples = samples.reshape((samples.shape[0], -1))
+        self.labels = labels
+        self.row_nbytes = self.samples.shape[1] * self.samples.dtype.itemsize
+
+        nb_words = int(np.ceil(self.row_nbytes / 8))
+        self.multipliers = np.random.RandomState(seed=1234).randint(
+            0, np.iinfo(np.int64).max, size=nb_words, dtype=np.int64
+        ).astype(np.uint64) | np.uint64(1)
+
+        hashes = np.zeros(self.samples.shape[0], dtype=np.uint64)
+        for begin in range(0, self.samples.shape[0], batch_size):
+            hashes[begin : begin + batch_size] = self._hash_rows(self.samples[begin : begin + batch_size])
+        order = np.argsort(hashes, kind="stable")
+
+        if isinstance(samples, np.memmap) and samples.shape[0] > 0:
+            self.sorted_hashes: np.ndarray = np.memmap(
+                tempfile.TemporaryFile(), dtype=np.uint64, mode="w+", shape=hashes.shape
+            )
+            self.order: np.ndarray = np.memmap(tempfile.TemporaryFile(), dtype=np.int64, mode="w+", shape=order.shape)
+            self.sorted_hashes[:] = hashes[order]
+            self.order[:] = order
+        else:
+            self.sorted_hashes = hashes[order]
+            self.order = order
+
+    @staticmethod
+    def _get_row_bytes(rows: np.ndarray) -> np.ndarray:
+        """
+        Return the rows as a 2D array of bytes.
+        """
+        rows = np.ascontiguousarray(rows)
+        return rows.view(np.uint8).reshape((rows.shape[0], -1))
+
+    def _hash_rows(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Compute a 64-bit multiplicative hash of the bytes of every row.
+        """
+        row_bytes = self._get_row_bytes(rows)
+        padding = 8 * len(self.multipliers) - row_bytes.shape[1]
+        if padding > 0:
+            row_bytes = np.pad(row_bytes, ((0, 0), (0, padding)))
+        words = np.ascontiguousarray(row_bytes).view(np.uint64)
+        hashes = (words * self.multipliers).sum(axis=1, dtype=np.uint64)
+        return hashes ^ (hashes >> np.uint64(29))
+
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Look up the existing predictions for a batch of inputs.
+
+        :param batch: Input samples.
+        :return: Array of the existing predictions.
+        :raises `ValueError`: If there is no existing prediction for any of the inputs.
+        """
+        rows = np.asarray(batch).reshape((batch.shape[0], -1))
+        if rows.shape[1] * rows.dtype.itemsize != self.row_nbytes:
+            raise ValueError("No existing prediction for queried input")
+
+        hashes = self._hash_rows(rows)
+        lower = np.searchsorted(self.sorted_hashes, hashes, side="left")
+        upper = np.searchsorted(self.sorted_hashes, hashes, side="right")
+
+        # Compare all candidates with the same hash, later samples take precedence as for a dictionary
+        matches = np.full(rows.shape[0], -1, dtype=np.int64)
+        row_bytes = self._get_row_bytes(rows)
+        for offset in range(int(np.max(upper - lower, initial=0))):
+            (indices,) = np.where(lower + offset < upper)
+            candidates = np.asarray(self.order[lower[indices] + offset])
+            is_equal = np.all(self._get_row_bytes(self.samples[candidates]) == row_bytes[indices], axis=1)
+            matches[indices[is_equal]] = candidates[is_equal]
+
+        if np.any(matches == -1):
+            raise ValueError("No existing prediction for queried input")
+
+        return np.asarray(self.labels[matches])
+
+
+class FuzzyPredictionLookup:
+    """
+    Look up existing predictions for a batch of inputs which match the stored samples up to `numpy.isclose`. The samples
+    are indexed with a KD-tree in the Chebyshev distance, and every input is matched against its nearest stored sample.
+    If the samples are a C-contiguous `numpy.memmap` of type float64, the KD-tree uses them without copying.
+    """
+
+    def __init__(self, samples: np.ndarray, labels: np.ndarray, rtol: float = 1e-05, atol: float = 1e-08) -> None:
+        """
+        Create the index of the samples.
+
+        :param samples: Array of the samples with existing predictions.
+        :param labels: Array of the predictions for the samples.
+        :param rtol: The relative tolerance of `numpy.isclose`.
+        :param atol: The absolute tolerance of `numpy.isclose`.
+        """
+        from scipy.spatial import cKDTree
+
+        self.samples = np.asarray(samples.reshape((samples.shape[0], -1)), dtype=np.float64)
+        self.labels = labels
+        self.rtol = rtol
+        self.atol = atol
+
+        # Largest distance at which `numpy.isclose` may accept a stored sample
+        max_abs = np.max(np.abs(self.samples), initial=0.0)
+        self.radius = atol + rtol * max_abs
+        self.tree = cKDTree(self.samples, copy_data=False)
+
+    def __call__(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Look up the existing predictions for a batch of inputs.
+
+        :param batch: Input samples.
+        :return: Array of the existing predictions.
+        :raises `ValueError`: If there is no existing prediction for any of the inputs.
+        """
+        rows = np.asarray(batch, dtype=np.float64).reshape((batch.shape[0], -1))
+        _, matches = self.tree.query(rows, k=1, p=np.inf, distance_upper_bound=self.radius)
+
+        is_found = matches < self.samples.shape[0]
+        is_found[is_found] = np.all(
+            np.isclose(rows[is_found], self.samples[matches[is_found]], rtol=self.rtol, atol=self.atol), axis=1
+        )
+
+        # The nearest sample can fail the relative tolerance where another one within the radius passes it
+        for i in np.where(~is_found)[0]:
+            for candidate in sorted(self.tree.query_ball_point(rows[i], r=self.radius, p=np.inf)):
+                if np.all(np.isclose(rows[i], self.samples[candidate], rtol=self.rtol, atol=self.atol)):
+                    matches[i] = candidate
+                    is_found[i] = True
+                    break
+
+        if not np.all(is_found):
+            raise ValueError("No existing prediction for queried input")
+
+        return np.asarray(self.labels[matches])
+
+
+def make_lookup_predict_fn(existing_predictions: Tuple[np.ndarray, np.ndarray], fuzzy_float_compare: bool) -> Callable:
+    """
+    Makes a predict_fn callback based on a table of existing predictions.
+
+    :param existing_predictions: Tuple of (samples, labels).
+    :param fuzzy_float_compare: Look up predictions using `np.isclose` and a nearest-neighbour search instead of an
+                                exact comparison.
+    :return: Prediction function.
+    """
+
+    samples, labels = existing_predictions
+    if not isinstance(samples, np.ndarray):
+        samples = np.asarray(samples)
+
+    if fuzzy_float_compare:
+        return FuzzyPredictionLookup(samples, labels)
+
+    return ExactPredictionLookup(samples, labels)
@@ -20,7 +20,6 @@ This module implements the classifier `BlackBoxRegressor` for black-box regresso
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from functools import total_ordering
 import logging
 from typing import Callable, List, Optional, Union, Tuple, TYPE_CHECKING
 
@@ -29,6 +28,7 @@ import numpy as np
 from art.estimators.estimator import BaseEstimator
 from art.estimators.regression.regressor import RegressorMixin, Regressor
 from art.estimators.classification import BlackBoxClassifier
+from art.estimators.prediction_lookup import make_lookup_predict_fn
 
 if TYPE_CHECKING:
     from art.utils import CLIP_VALUES_TYPE, PREPROCESSING_TYPE
@@ -74,8 +74,8 @@ class BlackBoxRegressor(RegressorMixin, BaseEstimator):
                used for data preprocessing. The first value will be subtracted from the input. The input will then
                be divided by the second one.
         :param fuzzy_float_compare: If `predict_fn` is a tuple mapping inputs to values, and this is True, looking up
-               inputs in the table will be done using `numpy.isclose`. Only set to True if really needed, since this
-               severely affects performance.
+               inputs in the table will be done using `numpy.isclose` with a nearest-neighbour search instead of an
+               exact comparison.
         """
         super().__init__(
             model=None,
@@ -87,7 +87,7 @@ class BlackBoxRegressor(RegressorMixin, BaseEstimator):
         if callable(predict_fn):
             self._predict_fn = predict_fn
         else:
-            self._predict_fn = _make_lookup_predict_fn(predict_fn, fuzzy_float_compare)
+            self._predict_fn = make_lookup_predict_fn(predict_fn, fuzzy_float_compare)
         self._fuzzy_float_compare = fuzzy_float_compare
         self._input_shape = input_shape
         self._loss_fn = loss_fn
@@ -211,89 +211,3 @@ class BlackBoxRegressor(RegressorMixin, BaseEstimator):
             return self._loss_fn(y, pred)
         # default MSE loss
         return (y - pred) ** 2
-
-
-@total_ordering
-class FuzzyMapping:
-    """
-    Class for a sample/label pair to be used in a `SortedList`.
-    """
-
-    def __init__(self, key: np.ndarray, value=None):
-        """
-        Create an instance of a key/value to pair to be used in a `SortedList`.
-
-        :param key: The sample to be matched against.
-        :param value: The mapped value.
-        """
-        self.key = key
-        self.value = value
-
-    def __eq__(self, other):
-        return np.all(np.isclose(self.key, other.key))
-
-    def __ge__(self, other):
-        # This implements >= comparison so we can use this class in a `SortedList`. The `total_ordering` decorator
-        # automatically generates the rest of the comparison magic functions based on this one
-
-        close_cells = np.isclose(self.key, other.key)
-        if np.all(close_cells):
-            return True
-
-        # If the keys are not exactly the same (up to floating-point inaccuracies), we compare the value of the first
-        # index which is not the same to decide on an ordering
-
-        compare_idx = np.unravel_index(np.argmin(close_cells), shape=self.key.shape)
-        return self.key[compare_idx] >= other.key[compare_idx]
-
-
-def _make_lookup_predict_fn(existing_predictions: Tuple[np.ndarray, np.ndarray], fuzzy_float_compare: bool) -> Callable:
-    """
-    Makes a predict_fn callback based on a table of existing predictions.
-
-    :param existing_predictions: Tuple of (samples, labels).
-    :param fuzzy_float_compare: Look up predictions using `np.isclose`, only set to True if really needed, since this
-                                severely affects performance.
-    :return: Prediction function.
-    """
-
-    samples, labels = existing_predictions
-
-    if fuzzy_float_compare:
-        from sortedcontainers import SortedList
-
-        # Construct a search-tree of the predictions, using fuzzy float comparison
-        sorted_predictions = SortedList([FuzzyMapping(key, value) for key, value in zip(samples, labels)])
-
-        def fuzzy_predict_fn(batch):
-            predictions = []
-            for row in batch:
-                try:
-                    match_idx = sorted_predictions.index(FuzzyMapping(row))
-                except ValueError as err:  # pragma: no cover
-                    raise ValueError("No existing prediction for queried input") from err
-
-                predictions.append(sorted_predictions[match_idx].value)
-
-            return np.array(predictions)
-
-        return fuzzy_predict_fn
-
-    # Construct a dictionary to map from samples to predictions. We use the bytes of the `ndarray` as the key,
-    # because the `ndarray` itself is not hashable
-    mapping = {}
-    for x, y in zip(samples, labels):
-        mapping[x.tobytes()] = y
-
-    def predict_fn(batch):
-        predictions = []
-        for row in batch:
-            row_bytes = row.tobytes()
-            if row.tobytes() not in mapping:
-                raise ValueError("No existing prediction for queried input")
-
-            predictions.append(mapping[row_bytes])
-
-        return np.array(predictions)
-
-    return predict_fn
@@ -1,8 +1,22 @@
 """
 Module containing estimators for speech recognition.
 """
-from art.estimators.speech_recognition.speech_recognizer import SpeechRecognizerMixin
+from typing import TYPE_CHECKING
 
-from art.estimators.speech_recognition.pytorch_deep_speech import PyTorchDeepSpeech
-from art.estimators.speech_recognition.pytorch_espresso import PyTorchEspresso
-from art.estimators.speech_recognition.tensorflow_lingvo import TensorFlowLingvoASR
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.estimators.speech_recognition.speech_recognizer import SpeechRecognizerMixin
+    from art.estimators.speech_recognition.pytorch_deep_speech import PyTorchDeepSpeech
+    from art.estimators.speech_recognition.pytorch_espresso import PyTorchEspresso
+    from art.estimators.speech_recognition.tensorflow_lingvo import TensorFlowLingvoASR
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "speech_recognizer": ["SpeechRecognizerMixin"],
+        "pytorch_deep_speech": ["PyTorchDeepSpeech"],
+        "pytorch_espresso": ["PyTorchEspresso"],
+        "tensorflow_lingvo": ["TensorFlowLingvoASR"],
+    },
+)
@@ -1,4 +1,16 @@
 """
 This module contains the experimental Estimator API.
 """
-from art.experimental.estimators.jax import JaxEstimator
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.experimental.estimators.jax import JaxEstimator
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "estimators.jax": ["JaxEstimator"],
+    },
+)
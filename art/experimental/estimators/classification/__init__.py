@@ -1,4 +1,16 @@
 """
 Experimental classifiers.
 """
-from art.experimental.estimators.classification.jax import JaxClassifier
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.experimental.estimators.classification.jax import JaxClassifier
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "jax": ["JaxClassifier"],
+    },
+)
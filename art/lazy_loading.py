@@ -0,0 +1,71 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2024
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This module implements the lazy loading of the ART packages following PEP 562. The public names of a package are
+declared in its `__init__` together with the submodule defining them, and the submodule is only imported when one of
+its names is accessed for the first time.
+"""
+import importlib
+import importlib.util
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def attach(
+    package_name: str, submodules: Optional[List[str]] = None, submod_attrs: Optional[Dict[str, List[str]]] = None
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Create the module level `__getattr__`, `__dir__` and `__all__` of a lazily loaded package.
+
+    Usage in the `__init__` of a package::
+
+        __getattr__, __dir__, __all__ = attach(
+            __name__, submodules=["evasion"], submod_attrs={"attack": ["Attack", "EvasionAttack"]}
+        )
+
+    :param package_name: Name of the package, usually `__name__`.
+    :param submodules: Subpackages or submodules exposed as attributes of the package.
+    :param submod_attrs: Dictionary mapping the name of a submodule, relative to the package, to the public names it
+                         defines.
+    :return: Tuple of the functions `__getattr__` and `__dir__` and the list `__all__` of the package.
+    """
+    submodules = list(submodules) if submodules is not None else []
+    submod_attrs = submod_attrs if submod_attrs is not None else {}
+    attr_to_module = {attr: module for module, attrs in submod_attrs.items() for attr in attrs}
+    __all__ = submodules + list(attr_to_module)
+
+    def __getattr__(name: str) -> Any:
+        package = importlib.import_module(package_name)
+
+        if name in attr_to_module:
+            module = importlib.import_module(f"{package_name}.{attr_to_module[name]}")
+            attr = getattr(module, name)
+        elif name in submodules or (
+            not name.startswith("__") and importlib.util.find_spec(f"{package_name}.{name}") is not None
+        ):
+            attr = importlib.import_module(f"{package_name}.{name}")
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+        # Cache the attribute so that later lookups do not go through this function
+        setattr(package, name, attr)
+        return attr
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(importlib.import_module(package_name))) | set(__all__))
+
+    return __getattr__, __dir__, __all__
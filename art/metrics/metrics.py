@@ -286,13 +286,22 @@ def clever(
     else:
         # Assume it's iterable
         target_classes = target
-    score_list: List[Optional[float]] = []
-    for j in tqdm(target_classes, desc="CLEVER untargeted", disable=not verbose):
-        if j == pred_class:
-            score_list.append(None)
-            continue
-        score = clever_t(classifier, x, j, nb_batches, batch_size, radius, norm, c_init, pool_factor)
-        score_list.append(score)
+
+    # The scores of all target classes are estimated from the same pool of random samples
+    scores = clever_scores(
+        classifier,
+        np.array([x]),
+        nb_batches,
+        batch_size,
+        radius,
+        norm,
+        target=[j for j in target_classes if j != pred_class],
+        c_init=c_init,
+        pool_factor=pool_factor,
+        verbose=verbose,
+    )[0]
+
+    score_list: List[Optional[float]] = [None if j == pred_class else scores[j] for j in target_classes]
     return np.array(score_list)
 
 
@@ -323,18 +332,18 @@ def clever_u(
     :param verbose: Show progress bars.
     :return: CLEVER score.
     """
-    # Get a list of untargeted classes
-    y_pred = classifier.predict(np.array([x]))
-    pred_class = np.argmax(y_pred, axis=1)[0]
-    untarget_classes = [i for i in range(classifier.nb_classes) if i != pred_class]
-
-    # Compute CLEVER score for each untargeted class
-    score_list = []
-    for j in tqdm(untarget_classes, desc="CLEVER untargeted", disable=not verbose):
-        score = clever_t(classifier, x, j, nb_batches, batch_size, radius, norm, c_init, pool_factor)
-        score_list.append(score)
-
-    return np.min(score_list)
+    scores = clever_scores(
+        classifier,
+        np.array([x]),
+        nb_batches,
+        batch_size,
+        radius,
+        norm,
+        c_init=c_init,
+        pool_factor=pool_factor,
+        verbose=verbose,
+    )
+    return np.nanmin(scores[0])
 
 
 def clever_t(
@@ -370,26 +379,91 @@ def clever_t(
     if target_class == pred_class:  # pragma: no cover
         raise ValueError("The targeted class is the predicted class.")
 
+    scores = clever_scores(
+        classifier,
+        np.array([x]),
+        nb_batches,
+        batch_size,
+        radius,
+        norm,
+        target=target_class,
+        c_init=c_init,
+        pool_factor=pool_factor,
+        verbose=False,
+    )
+    return scores[0, target_class]
+
+
+def clever_scores(
+    classifier: "CLASSIFIER_CLASS_LOSS_GRADIENTS_TYPE",
+    x: np.ndarray,
+    nb_batches: int,
+    batch_size: int,
+    radius: float,
+    norm: float,
+    target: Union[int, List[int], np.ndarray, None] = None,
+    c_init: float = 1.0,
+    pool_factor: int = 10,
+    nb_gradients: int = 10000,
+    verbose: bool = True,
+) -> np.ndarray:
+    """
+    Compute the targeted CLEVER scores of a batch of samples for several target classes. The scores of all target
+    classes of a sample are estimated from a single pool of random samples around it, and the class gradients of the
+    pools of all samples are computed in as few calls of `class_gradient` as allowed by `nb_gradients`. The untargeted
+    CLEVER scores are the minima over the target classes, `np.nanmin(scores, axis=1)`.
+
+    | Paper link: https://arxiv.org/abs/1801.10578
+
+    :param classifier: A trained model.
+    :param x: Input samples.
+    :param nb_batches: Number of repetitions of the estimate.
+    :param batch_size: Number of random examples to sample per batch.
+    :param radius: Radius of the maximum perturbation.
+    :param norm: Current support: 1, 2, np.inf.
+    :param target: Class or classes to target. If `None`, targets all classes.
+    :param c_init: Initialization of Weibull distribution.
+    :param pool_factor: The factor to create a pool of random samples with size pool_factor x n_s.
+    :param nb_gradients: Maximum number of class gradients computed per call of `class_gradient`.
+    :param verbose: Show progress bars.
+    :return: Array of shape `(nb_samples, nb_classes)` with the CLEVER score of each sample and target class, NaN for
+             the predicted class of a sample and for the classes not targeted.
+    """
     # Check if pool_factor is smaller than 1
     if pool_factor < 1:  # pragma: no cover
         raise ValueError("The `pool_factor` must be larger than 1.")
 
-    # Some auxiliary vars
-    rand_pool_grad_set = []
-    grad_norm_set = []
-    dim = reduce(lambda x_, y: x_ * y, x.shape, 1)
-    shape = [pool_factor * batch_size]
-    shape.extend(x.shape)
+    if nb_gradients < 1:  # pragma: no cover
+        raise ValueError("The `nb_gradients` must be a positive integer.")
+
+    nb_samples = x.shape[0]
+    nb_classes = classifier.nb_classes
+    pool_size = pool_factor * batch_size
+
+    # Find the predicted classes first
+    values = classifier.predict(x)
+    pred_classes = np.argmax(values, axis=1)
 
-    # Generate a pool of samples
+    if target is None:
+        target_classes = np.arange(nb_classes)
+    else:
+        target_classes = np.unique(np.atleast_1d(np.array(target, dtype=int)))
+
+    scores = np.full((nb_samples, nb_classes), np.nan)
+    if target_classes.shape[0] == 0:
+        return scores
+
+    # Generate a pool of samples for every input sample
+    dim = reduce(lambda x_, y: x_ * y, x.shape[1:], 1)
     rand_pool = np.reshape(
-        random_sphere(nb_points=pool_factor * batch_size, nb_dims=dim, radius=radius, norm=norm),
-        shape,
+        random_sphere(nb_points=nb_samples * pool_size, nb_dims=dim, radius=radius, norm=norm),
+        (nb_samples, pool_size) + x.shape[1:],
     )
-    rand_pool += np.repeat(np.array([x]), pool_factor * batch_size, 0)
-    rand_pool = rand_pool.astype(ART_NUMPY_DTYPE)
+    rand_pool += x[:, np.newaxis]
+    rand_pool = rand_pool.reshape((nb_samples * pool_size,) + x.shape[1:]).astype(ART_NUMPY_DTYPE)
     if hasattr(classifier, "clip_values") and classifier.clip_values is not None:
         np.clip(rand_pool, classifier.clip_values[0], classifier.clip_values[1], out=rand_pool)
+    pool_pred_classes = np.repeat(pred_classes, pool_size)
 
     # Change norm since q = p / (p-1)
     if norm == 1:
@@ -399,42 +473,58 @@ def clever_t(
     elif norm != 2:  # pragma: no cover
         raise ValueError(f"Norm {norm} not supported")
 
-    # Compute gradients for all samples in rand_pool
-    for i in range(batch_size):
-        rand_pool_batch = rand_pool[i * pool_factor : (i + 1) * pool_factor]
-
-        # Compute gradients
-        grad_pred_class = classifier.class_gradient(rand_pool_batch, label=pred_class)
-        grad_target_class = classifier.class_gradient(rand_pool_batch, label=target_class)
+    # Compute the gradient norms of the differences between the predicted and the target classes for the pool, the
+    # gradients of all classes are requested at once if most classes are needed
+    all_classes = target_classes.shape[0] + 1 >= nb_classes
+    nb_gradients_per_sample = nb_classes if all_classes else target_classes.shape[0] + 1
+    chunk_size = max(1, nb_gradients // nb_gradients_per_sample)
+    grad_norms = np.zeros((nb_samples * pool_size, target_classes.shape[0]))
+
+    for i_start in tqdm(range(0, rand_pool.shape[0], chunk_size), desc="CLEVER", disable=not verbose):
+        i_end = min(i_start + chunk_size, rand_pool.shape[0])
+        pool_batch = rand_pool[i_start:i_end]
+        pred_batch = pool_pred_classes[i_start:i_end]
+
+        if all_classes:
+            grads = classifier.class_gradient(pool_batch, label=None)
+            grads = grads.reshape(grads.shape[0], nb_classes, -1)
+            grad_pred_class = grads[np.arange(grads.shape[0]), pred_batch][:, np.newaxis]
+            grad_target_class = grads[:, target_classes]
+        else:
+            labels = np.concatenate(
+                [pred_batch[:, np.newaxis], np.tile(target_classes, (pool_batch.shape[0], 1))], axis=1
+            )
+            grads = classifier.class_gradient(np.repeat(pool_batch, labels.shape[1], axis=0), label=labels.reshape(-1))
+            grads = grads.reshape(pool_batch.shape[0], labels.shape[1], -1)
+            grad_pred_class = grads[:, :1]
+            grad_target_class = grads[:, 1:]
 
-        if np.isnan(grad_pred_class).any() or np.isnan(grad_target_class).any():  # pragma: no cover
+        if np.isnan(grads).any():  # pragma: no cover
             raise Exception("The classifier results NaN gradients.")
 
-        grad = grad_pred_class - grad_target_class
-        grad = np.reshape(grad, (pool_factor, -1))
-        grad = np.linalg.norm(grad, ord=norm, axis=1)
-        rand_pool_grad_set.extend(grad)
+        grad_norms[i_start:i_end] = np.linalg.norm(grad_pred_class - grad_target_class, ord=norm, axis=2)
+
+    grad_norms = grad_norms.reshape(nb_samples, pool_size, target_classes.shape[0])
 
-    rand_pool_grads = np.array(rand_pool_grad_set)
+    for i_sample in range(nb_samples):
+        # Random selection of gradients, shared by all target classes of the sample
+        indices = np.random.choice(pool_size, (nb_batches, batch_size))
+        grad_norm_set = np.max(grad_norms[i_sample][indices], axis=1)
 
-    # Loop over the batches
-    for _ in range(nb_batches):
-        # Random selection of gradients
-        grad_norm = rand_pool_grads[np.random.choice(pool_factor * batch_size, batch_size)]
-        grad_norm = np.max(grad_norm)
-        grad_norm_set.append(grad_norm)
+        for i_target, target_class in enumerate(target_classes):
+            if target_class == pred_classes[i_sample]:
+                continue
 
-    # Maximum likelihood estimation for max gradient norms
-    [_, loc, _] = weibull_min.fit(-np.array(grad_norm_set), c_init, optimizer=scipy_optimizer)
+            # Maximum likelihood estimation for max gradient norms
+            [_, loc, _] = weibull_min.fit(-grad_norm_set[:, i_target], c_init, optimizer=scipy_optimizer)
 
-    # Compute function value
-    values = classifier.predict(np.array([x]))
-    value = values[:, pred_class] - values[:, target_class]
+            # Compute function value
+            value = values[i_sample, pred_classes[i_sample]] - values[i_sample, target_class]
 
-    # Compute scores
-    score = np.min([-value[0] / loc, radius])
+            # Compute scores
+            scores[i_sample, target_class] = np.min([-value / loc, radius])
 
-    return score
+    return scores
 
 
 def wasserstein_distance(
@@ -442,18 +532,20 @@ def wasserstein_distance(
     v_values: np.ndarray,
     u_weights: Optional[np.ndarray] = None,
     v_weights: Optional[np.ndarray] = None,
+    batch_size: int = 1024,
 ) -> np.ndarray:
     """
-    Compute the first Wasserstein distance between two 1D distributions.
+    Compute the first Wasserstein distance between two 1D distributions. The distance of each pair of samples is the
+    integral of the absolute difference of the two cumulative distribution functions, which is computed for a batch of
+    samples at once from the sorted values of both distributions. The results match `scipy.stats.wasserstein_distance`.
 
     :param u_values: Values of first distribution with shape (nb_samples, feature_dim_1, ..., feature_dim_n).
     :param v_values: Values of second distribution with shape (nb_samples, feature_dim_1, ..., feature_dim_n).
     :param u_weights: Weight for each value. If None, equal weights will be used.
     :param v_weights: Weight for each value. If None, equal weights will be used.
+    :param batch_size: Number of samples processed at once.
     :return: The Wasserstein distance between the two distributions.
     """
-    import scipy
-
     assert u_values.shape == v_values.shape
     if u_weights is not None:
         assert v_weights is not None
@@ -464,19 +556,41 @@ def wasserstein_distance(
     if u_weights is not None:
         assert u_values.shape[0] == u_weights.shape[0]
 
-    u_values = u_values.flatten().reshape(u_values.shape[0], -1)
-    v_values = v_values.flatten().reshape(v_values.shape[0], -1)
+    nb_samples = u_values.shape[0]
+    u_values = u_values.reshape(nb_samples, -1)
+    v_values = v_values.reshape(nb_samples, -1)
 
     if u_weights is not None and v_weights is not None:
-        u_weights = u_weights.flatten().reshape(u_weights.shape[0], -1)
-        v_weights = v_weights.flatten().reshape(v_weights.shape[0], -1)
+        u_weights = u_weights.reshape(nb_samples, -1)
+        v_weights = v_weights.reshape(nb_samples, -1)
 
-    w_d = np.zeros(u_values.shape[0])
+    w_d = np.zeros(nb_samples)
+
+    for i_start in range(0, nb_samples, batch_size):
+        i_end = min(i_start + batch_size, nb_samples)
+
+        if u_weights is None or v_weights is None:
+            # With equal weights and the same number of values in u and v the CDFs are inverted by the sorted values and
+            # the distance is the mean absolute difference between them
+            u_sorted = np.sort(u_values[i_start:i_end], axis=1).astype(np.float64)
+            v_sorted = np.sort(v_values[i_start:i_end], axis=1).astype(np.float64)
+            w_d[i_start:i_end] = np.mean(np.abs(u_sorted - v_sorted), axis=1)
+            continue
 
-    for i in range(u_values.shape[0]):
-        if u_weights is None and v_weights is None:
-            w_d[i] = scipy.stats.wasserstein_distance(u_values[i], v_values[i])
-        elif u_weights is not None and v_weights is not None:
-            w_d[i] = scipy.stats.wasserstein_distance(u_values[i], v_values[i], u_weights[i], v_weights[i])
+        # Sort the values of both distributions together, the order of equal values does not change the result
+        all_values = np.concatenate([u_values[i_start:i_end], v_values[i_start:i_end]], axis=1).astype(np.float64)
+        sorter = np.argsort(all_values, axis=1)
+        all_values = np.take_along_axis(all_values, sorter, axis=1)
+        deltas = np.diff(all_values, axis=1)
+
+        # Normalised weights of the values in u minus the normalised weights of the values in v
+        u_mass = u_weights[i_start:i_end] / np.sum(u_weights[i_start:i_end], axis=1, keepdims=True)
+        v_mass = v_weights[i_start:i_end] / np.sum(v_weights[i_start:i_end], axis=1, keepdims=True)
+        mass_diff = np.take_along_axis(np.concatenate([u_mass, -v_mass], axis=1).astype(np.float64), sorter, axis=1)
+
+        # The difference of the CDFs is constant between successive values, within groups of equal values the deltas are
+        # zero and only the last value of a group, for which the CDFs count the whole group, contributes
+        cdf_diff = np.cumsum(mass_diff, axis=1)[:, :-1]
+        w_d[i_start:i_end] = np.sum(np.abs(cdf_diff) * deltas, axis=1)
 
     return w_d
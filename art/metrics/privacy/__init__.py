@@ -1,5 +1,18 @@
 """
 Module providing metrics and verifications.
 """
-from art.metrics.privacy.membership_leakage import PDTP, SHAPr, ComparisonType
-from art.metrics.privacy.worst_case_mia_score import get_roc_for_fpr, get_roc_for_multi_fprs
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.metrics.privacy.membership_leakage import PDTP, SHAPr, ComparisonType
+    from art.metrics.privacy.worst_case_mia_score import get_roc_for_fpr, get_roc_for_multi_fprs
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "membership_leakage": ["PDTP", "SHAPr", "ComparisonType"],
+        "worst_case_mia_score": ["get_roc_for_fpr", "get_roc_for_multi_fprs"],
+    },
+)
@@ -0,0 +1,202 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2024
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+"""
+This module implements a report of several robustness metrics that share the adversarial examples and predictions
+computed on the same data.
+"""
+import logging
+from typing import Any, Dict, List, Optional, Union, TYPE_CHECKING
+
+import numpy as np
+import numpy.linalg as la
+from tqdm.auto import trange
+
+from art.attacks.attack import EvasionAttack
+from art.metrics.metrics import get_crafter
+
+if TYPE_CHECKING:
+    from art.utils import CLASSIFIER_TYPE
+
+logger = logging.getLogger(__name__)
+
+
+class RobustnessReport:
+    """
+    Evaluate the empirical robustness and the adversarial accuracy for several attacks and the loss sensitivity of a
+    classifier on the same data. The adversarial examples of every attack and the clean predictions are computed only
+    once per batch and reduced to per-sample predictions and norms, from which all metrics are derived. The results of
+    `art.metrics.empirical_robustness`, `art.metrics.adversarial_accuracy` and `art.metrics.loss_sensitivity` are
+    reproduced for deterministic attacks.
+    """
+
+    def __init__(
+        self,
+        classifier: "CLASSIFIER_TYPE",
+        attacks: Union[List[str], Dict[str, EvasionAttack]],
+        attack_params: Optional[Dict[str, Dict[str, Any]]] = None,
+        loss_sensitivity: bool = True,
+        batch_size: int = 128,
+        verbose: bool = True,
+    ):
+        """
+        Create a robustness report.
+
+        :param classifier: A trained model.
+        :param attacks: Either a list of attack names, used as keys to `art.metrics.metrics.SUPPORTED_METHODS` and
+                        crafting minimal perturbations, or a dictionary of attack names and `EvasionAttack` instances.
+        :param attack_params: A dictionary of attack names and attack-specific parameters for the attacks given by name.
+        :param loss_sensitivity: Compute the loss sensitivity, requires the loss gradients of the classifier and `y`.
+        :param batch_size: Number of samples processed at once, the memory usage is bounded by the adversarial examples
+                           of a single batch.
+        :param verbose: Show progress bars.
+        """
+        self.classifier = classifier
+        self.batch_size = batch_size
+        self.loss_sensitivity = loss_sensitivity
+        self.verbose = verbose
+
+        if batch_size < 1:
+            raise ValueError("The batch size `batch_size` has to be positive.")
+
+        if isinstance(attacks, dict):
+            self.attacks = dict(attacks)
+        else:
+            attack_params = attack_params if attack_params is not None else {}
+            self.attacks = {}
+            for attack_name in attacks:
+                crafter = get_crafter(classifier, attack_name, attack_params.get(attack_name))
+                crafter.set_params(**{"minimal": True})
+                self.attacks[attack_name] = crafter
+
+        if not self.attacks:
+            raise ValueError("At least one attack has to be provided in `attacks`.")
+
+        self.predictions: Optional[np.ndarray] = None
+        self.labels: Optional[np.ndarray] = None
+        self.adversarial_predictions: Dict[str, np.ndarray] = {}
+        self.perturbation_norms: Dict[str, np.ndarray] = {}
+        self.input_norms: Dict[Union[int, float], np.ndarray] = {}
+        self.loss_gradient_norms: Optional[np.ndarray] = None
+
+    def evaluate(self, x: np.ndarray, y: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """
+        Generate the adversarial examples of every attack and compute all metrics on `x`.
+
+        :param x: Input samples of shape that can be fed into `classifier`.
+        :param y: True labels of `x`, one-hot encoded or as indices.
+        :return: Dictionary with the clean accuracy and loss sensitivity, if `y` is provided, and a dictionary of the
+                 adversarial accuracy and empirical robustness for each attack under the key `attacks`.
+        """
+        nb_samples = x.shape[0]
+        norm_types = {name: self._get_norm_type(attack) for name, attack in self.attacks.items()}
+
+        self.labels = None
+        if y is not None:
+            self.labels = np.argmax(y, axis=1) if y.ndim > 1 else y
+        self.predictions = np.zeros(nb_samples, dtype=int)
+        self.adversarial_predictions = {name: np.zeros(nb_samples, dtype=int) for name in self.attacks}
+        self.perturbation_norms = {name: np.zeros(nb_samples) for name in self.attacks}
+        self.input_norms = {norm_type: np.zeros(nb_samples) for norm_type in set(norm_types.values())}
+        self.loss_gradient_norms = np.zeros(nb_samples) if self.loss_sensitivity and y is not None else None
+
+        for i_start in trange(0, nb_samples, self.batch_size, desc="Robustness report", disable=not self.verbose):
+            i_end = min(i_start + self.batch_size, nb_samples)
+            x_batch = x[i_start:i_end]
+            x_batch_flat = x_batch.reshape(x_batch.shape[0], -1)
+
+            # The clean predictions and input norms are shared by all attacks
+            self.predictions[i_start:i_end] = np.argmax(self.classifier.predict(x_batch), axis=1)
+            for norm_type, input_norms in self.input_norms.items():
+                input_norms[i_start:i_end] = la.norm(x_batch_flat, ord=norm_type, axis=1)
+
+            for name, attack in self.attacks.items():
+                x_adv = attack.generate(x_batch)
+                self.adversarial_predictions[name][i_start:i_end] = np.argmax(self.classifier.predict(x_adv), axis=1)
+                self.perturbation_norms[name][i_start:i_end] = la.norm(
+                    (x_adv - x_batch).reshape(x_batch.shape[0], -1), ord=norm_types[name], axis=1
+                )
+
+            if self.loss_gradient_norms is not None:
+                grads = self.classifier.loss_gradient(x_batch, y[i_start:i_end])  # type: ignore
+                self.loss_gradient_norms[i_start:i_end] = la.norm(grads.reshape(grads.shape[0], -1), ord=2, axis=1)
+
+        report: Dict[str, Any] = {}
+        if self.labels is not None:
+            report["clean_accuracy"] = float(np.mean(self.predictions == self.labels))
+        if self.loss_gradient_norms is not None:
+            report["loss_sensitivity"] = float(np.mean(self.loss_gradient_norms))
+        report["attacks"] = {
+            name: {
+                "adversarial_accuracy": self.adversarial_accuracy(name),
+                "empirical_robustness": self.empirical_robustness(name),
+            }
+            for name in self.attacks
+        }
+
+        return report
+
+    def adversarial_accuracy(self, attack_name: str) -> float:
+        """
+        Compute the adversarial accuracy from the cached predictions, see `art.metrics.adversarial_accuracy`.
+
+        :param attack_name: Name of the attack.
+        :return: The adversarial accuracy of the classifier.
+        """
+        predictions = self._check_evaluated(attack_name)
+        y_adv = self.adversarial_predictions[attack_name]
+
+        if self.labels is None:
+            return float(np.sum(y_adv == predictions) / len(predictions))
+
+        y_corr = predictions == self.labels
+        return float(np.sum((y_adv == predictions) & y_corr) / np.sum(y_corr))
+
+    def empirical_robustness(self, attack_name: str) -> float:
+        """
+        Compute the empirical robustness from the cached predictions and norms, see `art.metrics.empirical_robustness`.
+
+        :param attack_name: Name of the attack.
+        :return: The average empirical robustness.
+        """
+        predictions = self._check_evaluated(attack_name)
+        idxs = self.adversarial_predictions[attack_name] != predictions
+        if np.sum(idxs) == 0.0:
+            return 0.0
+
+        input_norms = self.input_norms[self._get_norm_type(self.attacks[attack_name])]
+        return float(np.mean(self.perturbation_norms[attack_name][idxs] / input_norms[idxs]))
+
+    @staticmethod
+    def _get_norm_type(attack: EvasionAttack) -> Union[int, float]:
+        """
+        Return the norm of the perturbations of an attack, the Euclidean norm if the attack has no norm attribute.
+        """
+        norm_type = getattr(attack, "norm", 2)
+        if norm_type in ["inf", "np.inf"]:
+            norm_type = np.inf
+        return norm_type
+
+    def _check_evaluated(self, attack_name: str) -> np.ndarray:
+        """
+        Check that the report has been evaluated for an attack and return the clean predictions.
+        """
+        if attack_name not in self.attacks:
+            raise ValueError(f"Unknown attack {attack_name}.")
+        if self.predictions is None:
+            raise ValueError("The report has not been evaluated, call `evaluate` first.")
+        return self.predictions
@@ -20,11 +20,12 @@ This module implements robustness verifications for decision-tree-based models.
 """
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+from concurrent.futures import ProcessPoolExecutor
 import logging
-from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
-from tqdm.auto import trange
+from tqdm.auto import tqdm
 
 from art.utils import check_and_transform_label_format
 
@@ -39,6 +40,8 @@ class Interval:
     Representation of an intervals bound.
     """
 
+    __slots__ = ("lower_bound", "upper_bound")
+
     def __init__(self, lower_bound: float, upper_bound: float) -> None:
         """
         An interval of a feature.
@@ -55,6 +58,8 @@ class Box:
     Representation of a box of intervals bounds.
     """
 
+    __slots__ = ("intervals",)
+
     def __init__(self, intervals: Optional[Dict[int, Interval]] = None) -> None:
         """
         A box of intervals.
@@ -117,6 +122,8 @@ class LeafNode:
     Representation of a leaf node of a decision tree.
     """
 
+    __slots__ = ("tree_id", "class_label", "node_id", "box", "value")
+
     def __init__(
         self,
         tree_id: Optional[int],
@@ -150,6 +157,8 @@ class Tree:
     Representation of a decision tree.
     """
 
+    __slots__ = ("class_id", "leaf_nodes")
+
     def __init__(self, class_id: Optional[int], leaf_nodes: List[LeafNode]) -> None:
         """
         Create a decision tree representation.
@@ -161,6 +170,193 @@ class Tree:
         self.leaf_nodes = leaf_nodes
 
 
+class TreeEnsemble:
+    """
+    Compact, array-backed representation of the leaf nodes of an ensemble of decision trees.
+
+    The leaves of all trees are stored contiguously, the leaves of tree `i` are the rows
+    `tree_offsets[i]:tree_offsets[i + 1]`. Unconstrained features of a leaf have the bounds `(-inf, inf)` and a class
+    label or class ID of `-1` means that the tree does not contribute to a specific class.
+    """
+
+    __slots__ = ("bounds", "values", "class_labels", "tree_ids", "node_ids", "tree_class_ids", "tree_offsets")
+
+    def __init__(
+        self,
+        bounds: np.ndarray,
+        values: np.ndarray,
+        class_labels: np.ndarray,
+        tree_ids: np.ndarray,
+        node_ids: np.ndarray,
+        tree_class_ids: np.ndarray,
+        tree_offsets: np.ndarray,
+    ) -> None:
+        """
+        Create an array-backed tree ensemble.
+
+        :param bounds: Lower and upper bounds of the leaves of shape `(nb_leaves, nb_features, 2)`.
+        :param values: Prediction values of the leaves of shape `(nb_leaves,)`.
+        :param class_labels: IDs of the classes to which the leaves are contributing of shape `(nb_leaves,)`.
+        :param tree_ids: IDs of the decision trees of the leaves of shape `(nb_leaves,)`.
+        :param node_ids: IDs of the leaves within their decision tree of shape `(nb_leaves,)`.
+        :param tree_class_ids: IDs of the classes to which the trees contribute of shape `(nb_trees,)`.
+        :param tree_offsets: Index of the first leaf of every tree and the total number of leaves of shape
+                             `(nb_trees + 1,)`.
+        """
+        self.bounds = bounds
+        self.values = values
+        self.class_labels = class_labels
+        self.tree_ids = tree_ids
+        self.node_ids = node_ids
+        self.tree_class_ids = tree_class_ids
+        self.tree_offsets = tree_offsets
+
+    @property
+    def nb_trees(self) -> int:
+        """
+        Return the number of decision trees.
+
+        :return: Number of decision trees.
+        """
+        return len(self.tree_class_ids)
+
+    @property
+    def nb_features(self) -> int:
+        """
+        Return the number of features.
+
+        :return: Number of features.
+        """
+        return self.bounds.shape[1]
+
+    def get_tree_leaves(self, i_tree: int) -> slice:
+        """
+        Return the rows of the leaves of a decision tree.
+
+        :param i_tree: Index of the decision tree.
+        :return: Slice selecting the leaves of the decision tree.
+        """
+        return slice(self.tree_offsets[i_tree], self.tree_offsets[i_tree + 1])
+
+    @classmethod
+    def from_leaves(
+        cls,
+        tree_class_ids: List[int],
+        tree_ids: List[int],
+        node_ids: List[np.ndarray],
+        bounds: List[np.ndarray],
+        values: List[np.ndarray],
+    ) -> "TreeEnsemble":
+        """
+        Create an array-backed tree ensemble from the leaf arrays of every decision tree.
+
+        :param tree_class_ids: IDs of the classes to which the trees contribute, `-1` for none.
+        :param tree_ids: IDs of the decision trees.
+        :param node_ids: IDs of the leaves for every decision tree.
+        :param bounds: Bounds of shape `(nb_leaves, nb_features, 2)` of the leaves for every decision tree.
+        :param values: Prediction values of the leaves for every decision tree.
+        :return: The tree ensemble.
+        """
+        nb_leaves = np.array([len(tree_values) for tree_values in values], dtype=np.int64)
+        tree_class_ids_array = np.array(tree_class_ids, dtype=np.int64)
+
+        return cls(
+            bounds=np.concatenate(bounds, axis=0).astype(np.float64, copy=False),
+            values=np.concatenate(values).astype(np.float64, copy=False),
+            class_labels=np.repeat(tree_class_ids_array, nb_leaves),
+            tree_ids=np.repeat(np.array(tree_ids, dtype=np.int64), nb_leaves),
+            node_ids=np.concatenate(node_ids).astype(np.int64, copy=False),
+            tree_class_ids=tree_class_ids_array,
+            tree_offsets=np.concatenate([[0], np.cumsum(nb_leaves)]),
+        )
+
+    @classmethod
+    def from_trees(cls, trees: List[Tree], nb_features: Optional[int] = None) -> "TreeEnsemble":
+        """
+        Create an array-backed tree ensemble from a list of decision tree objects.
+
+        :param trees: A list of decision trees.
+        :param nb_features: The number of features, inferred from the leaf boxes if `None`.
+        :return: The tree ensemble.
+        """
+        if nb_features is None:
+            nb_features = 1 + max(
+                (max(leaf.box.intervals, default=-1) for tree in trees for leaf in tree.leaf_nodes), default=-1
+            )
+
+        tree_ids, node_ids, bounds, values = [], [], [], []
+        for tree in trees:
+            tree_bounds = np.empty((len(tree.leaf_nodes), nb_features, 2))
+            tree_bounds[:, :, 0] = -np.inf
+            tree_bounds[:, :, 1] = np.inf
+            for i_leaf, leaf in enumerate(tree.leaf_nodes):
+                for feature, interval in leaf.box.intervals.items():
+                    tree_bounds[i_leaf, feature] = (interval.lower_bound, interval.upper_bound)
+
+            tree_ids.append(
+                -1 if not tree.leaf_nodes or tree.leaf_nodes[0].tree_id is None else tree.leaf_nodes[0].tree_id
+            )
+            node_ids.append(np.array([-1 if leaf.node_id is None else leaf.node_id for leaf in tree.leaf_nodes]))
+            bounds.append(tree_bounds)
+            values.append(np.array([leaf.value for leaf in tree.leaf_nodes], dtype=np.float64))
+
+        return cls.from_leaves(
+            tree_class_ids=[-1 if tree.class_id is None else tree.class_id for tree in trees],
+            tree_ids=tree_ids,
+            node_ids=node_ids,
+            bounds=bounds,
+            values=values,
+        )
+
+
+def get_leaf_bounds(
+    children_left: np.ndarray,
+    children_right: np.ndarray,
+    feature: np.ndarray,
+    threshold: np.ndarray,
+    nb_features: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the bounds of the leaves of a binary decision tree given as node arrays. Samples with
+    `x[feature] < threshold` go to the left child and leaves have the same left and right child. The leaves are
+    returned in depth-first order, visiting left children first.
+
+    :param children_left: Index of the left child of every node.
+    :param children_right: Index of the right child of every node.
+    :param feature: Index of the split feature of every node.
+    :param threshold: Split threshold of every node.
+    :param nb_features: The number of features.
+    :return: A tuple of the node indices of the leaves and their bounds of shape `(nb_leaves, nb_features, 2)`.
+    """
+    node_bounds = np.empty((len(children_left), nb_features, 2))
+    node_bounds[0, :, 0] = -np.inf
+    node_bounds[0, :, 1] = np.inf
+
+    leaf_ids = []
+    stack = [0]
+    while stack:
+        node_id = stack.pop()
+        node_left = children_left[node_id]
+        node_right = children_right[node_id]
+
+        if node_left == node_right:
+            leaf_ids.append(node_id)
+            continue
+
+        split_feature = feature[node_id]
+        node_bounds[node_left] = node_bounds[node_id]
+        node_bounds[node_left, split_feature, 1] = min(node_bounds[node_id, split_feature, 1], threshold[node_id])
+        node_bounds[node_right] = node_bounds[node_id]
+        node_bounds[node_right, split_feature, 0] = max(node_bounds[node_id, split_feature, 0], threshold[node_id])
+
+        stack.append(node_right)
+        stack.append(node_left)
+
+    leaf_ids_array = np.array(leaf_ids, dtype=np.int64)
+
+    return leaf_ids_array, node_bounds[leaf_ids_array]
+
+
 class RobustnessVerificationTreeModelsCliqueMethod:
     """
     Robustness verification for decision-tree-based models.
@@ -178,7 +374,41 @@ class RobustnessVerificationTreeModelsCliqueMethod:
         """
         self._classifier = classifier
         self.verbose = verbose
-        self._trees = self._classifier.get_trees()
+        self._nb_classes: int = classifier.nb_classes
+        self._tree_ensemble = self._classifier.get_tree_ensemble()
+
+        # Restrict the leaf bounds of every tree to the features of its splits, all other features are unconstrained
+        self._tree_class_ids: List[int] = self._tree_ensemble.tree_class_ids.tolist()
+        self._tree_features: List[np.ndarray] = []
+        self._tree_boxes: List[np.ndarray] = []
+        self._tree_values: List[np.ndarray] = []
+        for i_tree in range(self._tree_ensemble.nb_trees):
+            leaves = self._tree_ensemble.get_tree_leaves(i_tree)
+            tree_bounds = self._tree_ensemble.bounds[leaves]
+            tree_features = np.flatnonzero(np.isfinite(tree_bounds).any(axis=(0, 2)))
+            self._tree_features.append(tree_features)
+            self._tree_boxes.append(np.stack([tree_bounds[:, tree_features, 0], -tree_bounds[:, tree_features, 1]], -1))
+            self._tree_values.append(self._tree_ensemble.values[leaves])
+
+        # Index of the constrained feature intervals of all leaves, sorted by leaf, for computing the distances between
+        # a sample and all leaves at once
+        interval_leaves, self._interval_features = np.nonzero(np.isfinite(self._tree_ensemble.bounds).any(axis=2))
+        self._interval_bounds = self._tree_ensemble.bounds[interval_leaves, self._interval_features]
+        self._interval_starts = np.flatnonzero(np.diff(interval_leaves, prepend=-1))
+        self._interval_leaves = interval_leaves[self._interval_starts]
+
+        self._leaf_distances = np.zeros(len(self._tree_ensemble.values))
+        self._accessible_eps: Optional[float] = None
+        self._accessible_leaves: List[Tuple[Any, np.ndarray, np.ndarray, np.ndarray]] = []
+        self._clique_features: Dict[Any, Tuple[np.ndarray, List[Optional[np.ndarray]]]] = {}
+
+    def __getstate__(self) -> dict:
+        """
+        Get the state for pickling to worker processes, which do not need the classifier.
+        """
+        state = self.__dict__.copy()
+        state["_classifier"] = None
+        return state
 
     def verify(
         self,
@@ -189,6 +419,7 @@ class RobustnessVerificationTreeModelsCliqueMethod:
         nb_search_steps: int = 10,
         max_clique: int = 2,
         max_level: int = 2,
+        nb_workers: int = 1,
     ) -> Tuple[float, float]:
         """
         Verify the robustness of the classifier on the dataset `(x, y)`.
@@ -201,81 +432,53 @@ class RobustnessVerificationTreeModelsCliqueMethod:
         :param nb_search_steps: The number of search steps.
         :param max_clique: The maximum number of nodes in a clique.
         :param max_level: The maximum number of clique search levels.
+        :param nb_workers: The number of worker processes verifying samples in parallel. Use 1 for verifying all samples
+                           in the current process.
         :return: A tuple of the average robustness bound and the verification error at `eps`.
         """
+        if nb_workers < 1:
+            raise ValueError("The number of workers `nb_workers` has to be a positive integer.")
+
         if np.min(x) < 0 or np.max(x) > 1:
             raise ValueError(
                 "There are features not in the range [0, 1]. The current implementation only supports normalized input"
                 "values in range [0 1]."
             )
 
+        self._nb_classes = self._classifier.nb_classes
         self.x: np.ndarray = x
-        self.y: np.ndarray = check_and_transform_label_format(
-            y, nb_classes=self._classifier.nb_classes, return_one_hot=False
-        )
+        self.y: np.ndarray = check_and_transform_label_format(y, nb_classes=self._nb_classes, return_one_hot=False)
         self.max_clique: int = max_clique
         self.max_level: int = max_level
 
-        average_bound: float = 0.0
-        num_initial_successes: int = 0
         num_samples: int = x.shape[0]
-
-        # pylint: disable=R1702
-        pbar = trange(num_samples, desc="Decision tree verification", disable=not self.verbose)
-        for i_sample in pbar:
-
-            eps: float = eps_init
-            robust_log: List[bool] = []
-            i_robust = None
-            i_not_robust = None
-            eps_robust: float = 0.0
-            eps_not_robust: float = 0.0
-            best_score: Optional[float]
-
-            for i_step in range(nb_search_steps):
-                logger.info("Search step %d: eps = %.4g", i_step, eps)
-
-                is_robust = True
-
-                if self._classifier.nb_classes <= 2:
-                    best_score = self._get_best_score(i_sample, eps, norm, target_label=None)
-                    is_robust = (self.y[i_sample] < 0.5 and best_score < 0) or (
-                        self.y[i_sample] > 0.5 and best_score > 0.0
+        args = [(i_sample, eps_init, norm, nb_search_steps) for i_sample in range(num_samples)]
+
+        if nb_workers > 1:
+            with ProcessPoolExecutor(max_workers=nb_workers, initializer=_init_worker, initargs=(self,)) as executor:
+                chunksize = max(1, num_samples // (4 * nb_workers))
+                results = list(
+                    tqdm(
+                        executor.map(_verify_sample_in_worker, args, chunksize=chunksize),
+                        total=num_samples,
+                        desc="Decision tree verification",
+                        disable=not self.verbose,
                     )
-                else:
-                    for i_class in range(self._classifier.nb_classes):
-                        if i_class != self.y[i_sample]:
-                            best_score = self._get_best_score(i_sample, eps, norm, target_label=i_class)
-                            is_robust = is_robust and (best_score > 0.0)
-                            if not is_robust:
-                                break
-
-                robust_log.append(is_robust)
-
-                if is_robust:
-                    if i_step == 0:
-                        num_initial_successes += 1
-                    logger.info("Model is robust at eps = %.4g", eps)
-                    i_robust = i_step
-                    eps_robust = eps
-                else:
-                    logger.info("Model is not robust at eps = %.4g", eps)
-                    i_not_robust = i_step
-                    eps_not_robust = eps
+                )
+        else:
+            results = [
+                self._verify_sample(*arg)
+                for arg in tqdm(args, desc="Decision tree verification", disable=not self.verbose)
+            ]
 
-                if i_robust is None:
-                    eps /= 2.0
-                else:
-                    if i_not_robust is None:
-                        if eps >= 1.0:  # pragma: no cover
-                            logger.info("Abort binary search because eps increased above 1.0")
-                            break
-                        eps = min(eps * 2.0, 1.0)
-                    else:
-                        eps = (eps_robust + eps_not_robust) / 2.0
+        average_bound: float = 0.0
+        num_initial_successes: int = 0
 
-            if i_robust is not None:
-                clique_bound = eps_robust
+        for i_sample, (clique_bound, is_initial_success) in enumerate(results):
+            if is_initial_success:
+                num_initial_successes += 1
+
+            if clique_bound is not None:
                 average_bound += clique_bound
             else:
                 logger.info(
@@ -291,113 +494,179 @@ class RobustnessVerificationTreeModelsCliqueMethod:
 
         return average_bound, verified_error
 
+    def _verify_sample(
+        self, i_sample: int, eps_init: float, norm: float, nb_search_steps: int
+    ) -> Tuple[Optional[float], bool]:
+        """
+        Run the binary search for the robustness bound of a single sample.
+
+        :param i_sample: Index of training sample in `x`.
+        :param eps_init: Attack budget for the first search step.
+        :param norm: The norm to apply epsilon.
+        :param nb_search_steps: The number of search steps.
+        :return: A tuple of the robustness bound, `None` if no robust eps has been found, and whether the model is
+                 robust at `eps_init`.
+        """
+        # The distances between the sample and the leaves do not depend on eps, the accessible leaves of all search
+        # steps and targets are selected from them
+        self._leaf_distances = self._get_leaf_distances(i_sample, norm)
+        self._accessible_eps = None
+
+        eps: float = eps_init
+        i_robust = None
+        i_not_robust = None
+        eps_robust: float = 0.0
+        eps_not_robust: float = 0.0
+        is_initial_success = False
+        best_score: Optional[float]
+
+        for i_step in range(nb_search_steps):
+            logger.info("Search step %d: eps = %.4g", i_step, eps)
+
+            is_robust = True
+
+            if self._nb_classes <= 2:
+                best_score = self._get_best_score(i_sample, eps, target_label=None)
+                is_robust = (self.y[i_sample] < 0.5 and best_score < 0) or (self.y[i_sample] > 0.5 and best_score > 0.0)
+            else:
+                for i_class in range(self._nb_classes):
+                    if i_class != self.y[i_sample]:
+                        best_score = self._get_best_score(i_sample, eps, target_label=i_class)
+                        is_robust = is_robust and (best_score > 0.0)
+                        if not is_robust:
+                            break
+
+            if is_robust:
+                if i_step == 0:
+                    is_initial_success = True
+                logger.info("Model is robust at eps = %.4g", eps)
+                i_robust = i_step
+                eps_robust = eps
+            else:
+                logger.info("Model is not robust at eps = %.4g", eps)
+                i_not_robust = i_step
+                eps_not_robust = eps
+
+            if i_robust is None:
+                eps /= 2.0
+            else:
+                if i_not_robust is None:
+                    if eps >= 1.0:  # pragma: no cover
+                        logger.info("Abort binary search because eps increased above 1.0")
+                        break
+                    eps = min(eps * 2.0, 1.0)
+                else:
+                    eps = (eps_robust + eps_not_robust) / 2.0
+
+        if i_robust is None:
+            return None, is_initial_success
+
+        return eps_robust, is_initial_success
+
     def _get_k_partite_clique(
         self,
-        accessible_leaves: List[List[LeafNode]],
+        accessible_leaves: List[Tuple[Any, np.ndarray, np.ndarray, np.ndarray]],
         label: int,
-        target_label: Optional[int],
-    ) -> Tuple[float, List]:
+    ) -> Tuple[float, List[Tuple[Any, np.ndarray, np.ndarray, np.ndarray]]]:
         """
-        Find the K partite cliques among the accessible leaf nodes.
+        Find the K partite cliques among the accessible leaf nodes. The boxes of the nodes are represented by the
+        bounds `(lower_bound, -upper_bound)` of their constrained features, which turns the intersection of boxes into
+        an element-wise maximum.
 
-        :param accessible_leaves: List of lists of accessible leaf nodes.
+        :param accessible_leaves: List of tuples of the key, constrained features, boxes and values of the accessible
+                                  leaf nodes of every tree.
         :param label: The try label of the current sample.
-        :param target_label: The target label.
-        :return: The best score and a list of new cliques.
+        :return: The best score and a list of tuples of the key, constrained features, boxes and values of the new
+                 cliques.
         """
         new_nodes_list = []
         best_scores_sum = 0.0
 
-        # pylint: disable=R1702
         for start_tree in range(0, len(accessible_leaves), self.max_clique):
-            cliques_old: List[Dict[str, Union[Box, float]]] = []
-            cliques_new: List[Dict[str, Union[Box, float]]] = []
-
-            # Start searching for cliques
-            for accessible_leaf in accessible_leaves[start_tree]:
-                if (
-                    self._classifier.nb_classes > 2
-                    and target_label is not None
-                    and target_label == accessible_leaf.class_label
-                ):
-                    new_leaf_value = -accessible_leaf.value
-                else:
-                    new_leaf_value = accessible_leaf.value
-                cliques_old.append({"box": accessible_leaf.box, "value": new_leaf_value})
-
-            # Loop over all all trees
-            for i_tree in range(
-                start_tree + 1,
-                min(len(accessible_leaves), start_tree + self.max_clique),
-            ):
-                cliques_new.clear()
-                # Loop over all existing cliques
-                for clique in cliques_old:
-                    # Loop over leaf nodes in tree
-                    for accessible_leaf in accessible_leaves[i_tree]:
-                        leaf_box = accessible_leaf.box.get_intersection(clique["box"])  # type: ignore
-                        if leaf_box.intervals:
-                            if (
-                                self._classifier.nb_classes > 2
-                                and target_label is not None
-                                and target_label == accessible_leaf.class_label
-                            ):
-                                new_leaf_value = -accessible_leaf.value
-                            else:
-                                new_leaf_value = accessible_leaf.value
-                            cliques_new.append(
-                                {
-                                    "box": leaf_box,
-                                    "value": new_leaf_value + clique["value"],  # type: ignore
-                                }
-                            )
-
-                cliques_old = cliques_new.copy()
-
-            new_nodes = []
-            best_score = 0.0
-            for i, clique in enumerate(cliques_old):
-                # Create a new node without tree_id and node_id to represent clique
-                new_nodes.append(
-                    LeafNode(
-                        tree_id=None,
-                        class_label=label,
-                        node_id=None,
-                        box=clique["box"],  # type: ignore
-                        value=clique["value"],  # type: ignore
+            group = accessible_leaves[start_tree : start_tree + self.max_clique]
+            clique_key = tuple(node[0] for node in group)
+
+            # The features of a clique only depend on its trees, which repeat across search steps and samples
+            if clique_key not in self._clique_features:
+                clique_features = group[0][1]
+                for node in group[1:]:
+                    clique_features = np.union1d(clique_features, node[1])
+                positions = [
+                    None if len(node[1]) == len(clique_features) else np.searchsorted(clique_features, node[1])
+                    for node in group
+                ]
+                self._clique_features[clique_key] = (clique_features, positions)
+
+            clique_features, positions = self._clique_features[clique_key]
+            clique_boxes = self._expand_boxes(group[0][2], positions[0], len(clique_features))
+            clique_values = group[0][3]
+
+            # Intersect the boxes of all combinations of the existing cliques and the leaf nodes of the next tree
+            for node, node_positions in zip(group[1:], positions[1:]):
+                leaf_boxes = self._expand_boxes(node[2], node_positions, len(clique_features))
+                leaf_values = node[3]
+
+                # Limit the size of the intermediate arrays to about 2**22 elements
+                chunk_size = max(1, 2 ** 22 // max(1, leaf_boxes.size))
+                new_boxes = []
+                new_values = []
+                for i_chunk in range(0, clique_boxes.shape[0], chunk_size):
+                    boxes = np.maximum(
+                        clique_boxes[i_chunk : i_chunk + chunk_size, np.newaxis], leaf_boxes[np.newaxis, :]
                     )
-                )
+                    non_empty = (boxes[..., 0] < -boxes[..., 1]).all(axis=-1)
 
-                if i == 0:
-                    best_score = clique["value"]  # type: ignore
+                    new_boxes.append(boxes[non_empty])
+                    values = leaf_values[np.newaxis, :] + clique_values[i_chunk : i_chunk + chunk_size, np.newaxis]
+                    new_values.append(values[non_empty])
+
+                clique_boxes = np.concatenate(new_boxes, axis=0)
+                clique_values = np.concatenate(new_values)
+
+            best_score = 0.0
+            if clique_values.size > 0:
+                if label < 0.5 and self._nb_classes <= 2:
+                    best_score = clique_values.max()
                 else:
-                    if label < 0.5 and self._classifier.nb_classes <= 2:
-                        best_score = max(best_score, clique["value"])  # type: ignore
-                    else:
-                        best_score = min(best_score, clique["value"])  # type: ignore
+                    best_score = clique_values.min()
 
-            new_nodes_list.append(new_nodes)
+            new_nodes_list.append((clique_key, clique_features, clique_boxes, clique_values))
             best_scores_sum += best_score
 
         return best_scores_sum, new_nodes_list
 
-    def _get_best_score(self, i_sample: int, eps: float, norm: float, target_label: Optional[int]) -> float:
+    @staticmethod
+    def _expand_boxes(boxes: np.ndarray, positions: Optional[np.ndarray], nb_features: int) -> np.ndarray:
+        """
+        Expand boxes to a superset of their constrained features.
+
+        :param boxes: Boxes of shape `(nb_boxes, nb_constrained_features, 2)`.
+        :param positions: Positions of the constrained features in the superset, `None` if the sets are equal.
+        :param nb_features: The number of features of the superset.
+        :return: The expanded boxes of shape `(nb_boxes, nb_features, 2)`.
+        """
+        if positions is None:
+            return boxes
+
+        expanded_boxes = np.full((boxes.shape[0], nb_features, 2), -np.inf)
+        expanded_boxes[:, positions] = boxes
+
+        return expanded_boxes
+
+    def _get_best_score(self, i_sample: int, eps: float, target_label: Optional[int]) -> float:
         """
         Get the list of best scores.
 
         :param i_sample: Index of training sample in `x`.
         :param eps: Attack budget epsilon.
-        :param norm: The norm to apply epsilon.
         :param target_label: The target label.
         :return: The best scores.
         """
-        nodes = self._get_accessible_leaves(i_sample, eps, norm, target_label)
+        nodes = self._get_accessible_leaves(i_sample, eps, target_label)
         best_score: float = 0.0
 
-        for i_level in range(self.max_level):
-            if self._classifier.nb_classes > 2 and i_level > 0:
-                target_label = None
-            best_score, nodes = self._get_k_partite_clique(nodes, label=self.y[i_sample], target_label=target_label)
+        for _ in range(self.max_level):
+            best_score, nodes = self._get_k_partite_clique(nodes, label=self.y[i_sample])
 
             # Stop if the root node has been reached
             if len(nodes) <= 1:
@@ -405,75 +674,91 @@ class RobustnessVerificationTreeModelsCliqueMethod:
 
         return best_score
 
-    def _get_distance(self, box: Box, i_sample: int, norm: float) -> float:
+    def _get_leaf_distances(self, i_sample: int, norm: float) -> np.ndarray:
         """
-        Determine the distance between sample and interval box.
+        Determine the distances between a sample and the interval boxes of all leaves.
 
-        :param box: Interval box.
         :param i_sample: Index of training sample in `x`.
         :param norm: The norm to apply epsilon.
-        :return: The distance.
+        :return: The distances of shape `(nb_leaves,)`.
         """
-        resulting_distance = 0.0
+        distances = np.zeros(len(self._tree_ensemble.values))
+        if self._interval_features.size == 0:
+            return distances
 
-        for feature, interval in box.intervals.items():
-            feature_value = self.x[i_sample, feature]
+        feature_values = self.x[i_sample, self._interval_features]
+        lower_bounds = self._interval_bounds[:, 0]
+        upper_bounds = self._interval_bounds[:, 1]
 
-            if interval.lower_bound < feature_value < interval.upper_bound:
-                distance = 0.0
-            else:
-                difference = max(
-                    feature_value - interval.upper_bound,
-                    interval.lower_bound - feature_value,
-                )
-                if norm == 0:
-                    distance = 1.0
-                elif norm == np.inf:
-                    distance = difference
-                else:
-                    distance = pow(difference, norm)
-
-            if norm == np.inf:
-                resulting_distance = max(resulting_distance, distance)
-            else:
-                resulting_distance += distance
+        inside = (lower_bounds < feature_values) & (feature_values < upper_bounds)
+        difference = np.where(inside, 0.0, np.maximum(feature_values - upper_bounds, lower_bounds - feature_values))
 
-        if norm not in [0, np.inf]:
-            resulting_distance = pow(resulting_distance, 1.0 / norm)
+        if norm == 0:
+            distances[self._interval_leaves] = np.add.reduceat((~inside).astype(np.float64), self._interval_starts)
+        elif norm == np.inf:
+            distances[self._interval_leaves] = np.maximum.reduceat(difference, self._interval_starts)
+        else:
+            distances[self._interval_leaves] = np.power(
+                np.add.reduceat(np.power(difference, norm), self._interval_starts), 1.0 / norm
+            )
 
-        return resulting_distance
+        return distances
 
     def _get_accessible_leaves(
-        self, i_sample: int, eps: float, norm: float, target_label: Optional[int]
-    ) -> List[List[LeafNode]]:
+        self, i_sample: int, eps: float, target_label: Optional[int]
+    ) -> List[Tuple[Any, np.ndarray, np.ndarray, np.ndarray]]:
         """
         Determine the leaf nodes accessible within the attack budget.
 
         :param i_sample: Index of training sample in `x`.
         :param eps: Attack budget epsilon.
-        :param norm: The norm to apply epsilon.
         :param target_label: The target label.
-        :return: A list of lists of leaf nodes.
+        :return: A list of tuples of the index, constrained features, boxes and values of the accessible leaf nodes of
+                 every tree.
         """
+        # All targets of a search step share the accessible leaves of every tree
+        if self._accessible_eps != eps:
+            is_accessible = np.split(self._leaf_distances <= eps, self._tree_ensemble.tree_offsets[1:-1])
+            self._accessible_leaves = [
+                (i_tree, self._tree_features[i_tree], self._tree_boxes[i_tree][mask], self._tree_values[i_tree][mask])
+                for i_tree, mask in enumerate(is_accessible)
+            ]
+            self._accessible_eps = eps
+
         accessible_leaves = []
 
-        for tree in self._trees:
-            if (
-                self._classifier.nb_classes <= 2
-                or target_label is None
-                or tree.class_id in [self.y[i_sample], target_label]
-            ):
+        for tree_class_id, node in zip(self._tree_class_ids, self._accessible_leaves):
+            if self._nb_classes <= 2 or target_label is None or tree_class_id in [self.y[i_sample], target_label]:
+                if node[3].size == 0:  # pragma: no cover
+                    raise ValueError("No accessible leaves found.")
 
-                leaves = []
+                # The leaves of the target class contribute with negative sign to the score of the true class
+                if self._nb_classes > 2 and tree_class_id == target_label:
+                    node = (node[0], node[1], node[2], -node[3])
 
-                for leaf_node in tree.leaf_nodes:
-                    distance = self._get_distance(leaf_node.box, i_sample, norm)
-                    if leaf_node.box and distance <= eps:
-                        leaves.append(leaf_node)
+                accessible_leaves.append(node)
 
-                if not leaves:  # pragma: no cover
-                    raise ValueError("No accessible leaves found.")
+        return accessible_leaves
 
-                accessible_leaves.append(leaves)
 
-        return accessible_leaves
+_WORKER_VERIFIER: Optional[RobustnessVerificationTreeModelsCliqueMethod] = None
+
+
+def _init_worker(verifier: RobustnessVerificationTreeModelsCliqueMethod) -> None:
+    """
+    Store the verifier in a worker process.
+
+    :param verifier: The verifier including the data to verify.
+    """
+    global _WORKER_VERIFIER  # pylint: disable=W0603
+    _WORKER_VERIFIER = verifier
+
+
+def _verify_sample_in_worker(args: Tuple[int, float, float, int]) -> Tuple[Optional[float], bool]:
+    """
+    Verify a single sample with the verifier of a worker process.
+
+    :param args: The arguments of `RobustnessVerificationTreeModelsCliqueMethod._verify_sample`.
+    :return: A tuple of the robustness bound and whether the model is robust at `eps_init`.
+    """
+    return _WORKER_VERIFIER._verify_sample(*args)  # type: ignore  # pylint: disable=W0212
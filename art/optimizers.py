@@ -87,3 +87,40 @@ class Adam:
             num_iter += 1
 
         return x_0
+
+    def optimize_batch(self, func, jac, x_0, max_iter, loss_converged):
+        """
+        Optimize a batch of independent samples for max. iterations. Samples which reached the target loss are removed
+        from the optimization, `func` and `jac` are only evaluated on the remaining samples.
+
+        :param func: A callable returning the function value of each sample, called with the current values and the
+                     indices of the corresponding samples in the batch.
+        :param jac: A callable returning the Jacobian value of each sample, called with the current values and the
+                    indices of the corresponding samples in the batch.
+        :param x_0: Initial values with the samples along the first axis.
+        :param max_iter: Number of optimisation iterations.
+        :param loss_converged: Target loss.
+        :return: Optimized values.
+        """
+        x_0 = x_0.copy()
+        m_dx = np.zeros_like(x_0)
+        v_dx = np.zeros_like(x_0)
+        active = np.arange(x_0.shape[0])
+
+        num_iter = 1
+
+        while active.size > 0 and num_iter <= max_iter:
+
+            delta_x = jac(x_0[active], active)
+
+            self.m_dx, self.v_dx = m_dx[active], v_dx[active]
+            x_0[active] = self.update(num_iter, x=x_0[active], delta_x=delta_x)
+            m_dx[active], v_dx[active] = self.m_dx, self.v_dx
+
+            loss = func(x_0[active], active)
+
+            active = active[loss >= loss_converged]
+
+            num_iter += 1
+
+        return x_0
@@ -1,6 +1,16 @@
 """
 Module for preprocessing operations.
 """
-from art.preprocessing.preprocessing import Preprocessor
-from art.preprocessing.preprocessing import PreprocessorPyTorch
-from art.preprocessing.preprocessing import PreprocessorTensorFlowV2
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.preprocessing.preprocessing import Preprocessor, PreprocessorPyTorch, PreprocessorTensorFlowV2
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "preprocessing": ["Preprocessor", "PreprocessorPyTorch", "PreprocessorTensorFlowV2"],
+    },
+)
@@ -1,5 +1,18 @@
 """
 This module contains audio preprocessing tools.
 """
-from art.preprocessing.audio.l_filter.numpy import LFilter
-from art.preprocessing.audio.l_filter.pytorch import LFilterPyTorch
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.preprocessing.audio.l_filter.numpy import LFilter
+    from art.preprocessing.audio.l_filter.pytorch import LFilterPyTorch
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "l_filter.numpy": ["LFilter"],
+        "l_filter.pytorch": ["LFilterPyTorch"],
+    },
+)
@@ -1,9 +1,26 @@
 """
 This module contains image preprocessing tools.
 """
-from art.preprocessing.image.image_resize.numpy import ImageResize
-from art.preprocessing.image.image_resize.pytorch import ImageResizePyTorch
-from art.preprocessing.image.image_resize.tensorflow import ImageResizeTensorFlowV2
-from art.preprocessing.image.image_square_pad.numpy import ImageSquarePad
-from art.preprocessing.image.image_square_pad.pytorch import ImageSquarePadPyTorch
-from art.preprocessing.image.image_square_pad.tensorflow import ImageSquarePadTensorFlowV2
+from typing import TYPE_CHECKING
+
+from art.lazy_loading import attach
+
+if TYPE_CHECKING:
+    from art.preprocessing.image.image_resize.numpy import ImageResize
+    from art.preprocessing.image.image_resize.pytorch import ImageResizePyTorch
+    from art.preprocessing.image.image_resize.tensorflow import ImageResizeTensorFlowV2
+    from art.preprocessing.image.image_square_pad.numpy import ImageSquarePad
+    from art.preprocessing.image.image_square_pad.pytorch import ImageSquarePadPyTorch
+    from art.preprocessing.image.image_square_pad.tensorflow import ImageSquarePadTensorFlowV2
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "image_resize.numpy": ["ImageResize"],
+        "image_resize.pytorch": ["ImageResizePyTorch"],
+        "image_resize.tensorflow": ["ImageResizeTensorFlowV2"],
+        "image_square_pad.numpy": ["ImageSquarePad"],
+        "image_square_pad.pytorch": ["ImageSquarePadPyTorch"],
+        "image_square_pad.tensorflow": ["ImageSquarePadTensorFlowV2"],
+    },
+)
@@ -19,6 +19,8 @@
 This module defines and implements the summary writers for TensorBoard output.
 """
 
+import queue
+import threading
 from abc import ABC, abstractmethod
 from math import sqrt
 from typing import Dict, List, Optional, Union
@@ -105,6 +107,10 @@ class SummaryWriter(ABC):
 class SummaryWriterDefault(SummaryWriter):
     """
     Implementation of the default ART Summary Writer.
+
+    The losses and the attack failure indicators 1 to 3 query the estimator and are therefore computed in the thread of
+    the attack, their cost can be reduced with `indicator_interval` and `nb_samples`. All other metrics and the events
+    are computed and written in a background thread if `asynchronous` is `True`.
     """
 
     def __init__(
@@ -114,13 +120,48 @@ class SummaryWriterDefault(SummaryWriter):
         ind_2: bool = False,
         ind_3: bool = False,
         ind_4: bool = False,
+        asynchronous: bool = False,
+        indicator_interval: int = 1,
+        nb_samples: Optional[int] = None,
+        histogram: bool = False,
+        max_queue_size: int = 32,
     ):
+        """
+        Create summary writer.
+
+        :param summary_writer: Activate summary writer for TensorBoard.
+                       Default is `False` and deactivated summary writer.
+                       If `True` save runs/CURRENT_DATETIME_HOSTNAME in current directory.
+                       If of type `str` save in path.
+                       Use hierarchical folder structure to compare between runs easily. e.g. pass in
+                       ‘runs/exp1’, ‘runs/exp2’, etc. for each new experiment to compare across them.
+        :param ind_1: Write the attack failure indicator 1, silent success.
+        :param ind_2: Write the attack failure indicator 2, break-point angle.
+        :param ind_3: Write the attack failure indicator 3, diverging loss.
+        :param ind_4: Write the attack failure indicator 4, zero gradients.
+        :param asynchronous: Compute the metrics and write the events in a background thread. `update` only queries the
+                             estimator and queues copies of the arrays, the queued updates are written at the latest by
+                             `flush`, `reset` or `close`.
+        :param indicator_interval: Compute the losses and the attack failure indicators 1 to 3 only every
+                                   `indicator_interval` global steps.
+        :param nb_samples: Compute the losses and the attack failure indicators 1 to 3 only on the first `nb_samples`
+                           samples of each batch. If `None` all samples are used.
+        :param histogram: Write the values of the samples of a batch as a histogram instead of one scalar per sample.
+        :param max_queue_size: Maximum number of updates waiting for the background thread, `update` blocks if the
+                               queue is full.
+        """
         super().__init__(summary_writer=summary_writer)
 
         self.ind_1 = ind_1
         self.ind_2 = ind_2
         self.ind_3 = ind_3
         self.ind_4 = ind_4
+        self.asynchronous = asynchronous
+        self.indicator_interval = indicator_interval
+        self.nb_samples = nb_samples
+        self.histogram = histogram
+        self.max_queue_size = max_queue_size
+        self._check_params()
 
         self.loss = None
         self.loss_prev: Dict[str, np.ndarray] = {}
@@ -129,6 +170,10 @@ class SummaryWriterDefault(SummaryWriter):
         self.i_3: Dict[str, np.ndarray] = {}
         self.i_4: Dict[str, np.ndarray] = {}
 
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
     def update(
         self,
         batch_id: int,
@@ -153,29 +198,109 @@ class SummaryWriterDefault(SummaryWriter):
         :param y: True or target labels.
         :param targeted: Indicates whether the attack is targeted (True) or untargeted (False).
         """
+        self._raise_error()
 
-        # Gradients
-        if grad is not None:
+        if self.ind_1:
+            from art.estimators.classification.classifier import ClassifierMixin
 
-            l_1 = np.linalg.norm(grad.reshape(grad.shape[0], -1), axis=1, ord=1)
-            self.summary_writer.add_scalars(
-                f"gradients/norm-L1/batch-{batch_id}",
-                {str(i): v for i, v in enumerate(l_1)},
-                global_step=global_step,
+            if not isinstance(estimator, ClassifierMixin):
+                raise ValueError(
+                    "Attack Failure Indicator 1 is only supported for classification, for the current "
+                    "`estimator` set `ind_1=False`."
+                )
+            if y is None:
+                raise ValueError("Attack Failure Indicator 1 requires `y`.")
+
+        if self.ind_4 and grad is None:
+            raise ValueError("Attack Failure Indicator 4 requires `grad`.")
+
+        # The estimator is queried in the calling thread, the estimators are not guaranteed to be thread-safe. Every
+        # indicator queries the estimator separately, as the losses of some estimators are not deterministic.
+        losses = None
+        loss = None
+        loss_2 = None
+        loss_3 = None
+        y_pred = None
+        y_true = None
+        if estimator is not None and x is not None and global_step % self.indicator_interval == 0:
+            if self.nb_samples is not None:
+                x = x[: self.nb_samples]
+                y = y[: self.nb_samples] if y is not None else None
+
+            # Losses
+            if y is not None:
+                if hasattr(estimator, "compute_losses"):
+                    losses = estimator.compute_losses(x=x, y=y)
+                elif hasattr(estimator, "compute_loss"):
+                    loss = estimator.compute_loss(x=x, y=y)
+
+            if self.ind_1 and y is not None:
+                y_pred = estimator.predict(x)
+                y_true = np.argmax(y, axis=1)
+
+            if self.ind_2:
+                loss_2 = estimator.compute_loss(x=x, y=y)
+
+            if self.ind_3:
+                loss_3 = estimator.compute_loss(x=x, y=y)
+
+        if self.asynchronous:
+            # The attacks may modify the arrays in-place after the update
+            if grad is not None:
+                grad = np.array(grad, copy=True)
+            if patch is not None:
+                patch = np.array(patch, copy=True)
+
+            if self._worker is None:
+                self._queue = queue.Queue(maxsize=self.max_queue_size)
+                self._worker = threading.Thread(target=self._process_queue, daemon=True)
+                self._worker.start()
+            self._queue.put(  # type: ignore
+                (batch_id, global_step, targeted, grad, patch, losses, loss, loss_2, loss_3, y_pred, y_true)
             )
-
-            l_2 = np.linalg.norm(grad.reshape(grad.shape[0], -1), axis=1, ord=2)
-            self.summary_writer.add_scalars(
-                f"gradients/norm-L2/batch-{batch_id}",
-                {str(i): v for i, v in enumerate(l_2)},
+        else:
+            self._write(
+                batch_id=batch_id,
                 global_step=global_step,
+                targeted=targeted,
+                grad=grad,
+                patch=patch,
+                losses=losses,
+                loss=loss,
+                loss_2=loss_2,
+                loss_3=loss_3,
+                y_pred=y_pred,
+                y_true=y_true,
             )
 
-            l_inf = np.linalg.norm(grad.reshape(grad.shape[0], -1), axis=1, ord=np.inf)
-            self.summary_writer.add_scalars(
-                f"gradients/norm-Linf/batch-{batch_id}",
-                {str(i): v for i, v in enumerate(l_inf)},
-                global_step=global_step,
+    def _write(
+        self,
+        batch_id: int,
+        global_step: int,
+        targeted: bool,
+        grad: Optional[np.ndarray],
+        patch: Optional[np.ndarray],
+        losses: Optional[Dict[str, np.ndarray]],
+        loss: Optional[np.ndarray],
+        loss_2: Optional[np.ndarray],
+        loss_3: Optional[np.ndarray],
+        y_pred: Optional[np.ndarray],
+        y_true: Optional[np.ndarray],
+    ) -> None:
+        """
+        Compute the metrics of an update and write them to the TensorBoard summary writer.
+        """
+        # Gradients
+        if grad is not None:
+            grad_flat = grad.reshape(grad.shape[0], -1)
+            l_2 = np.linalg.norm(grad_flat, axis=1, ord=2)
+
+            self._add_values(
+                f"gradients/norm-L1/batch-{batch_id}", np.linalg.norm(grad_flat, axis=1, ord=1), global_step
+            )
+            self._add_values(f"gradients/norm-L2/batch-{batch_id}", l_2, global_step)
+            self._add_values(
+                f"gradients/norm-Linf/batch-{batch_id}", np.linalg.norm(grad_flat, axis=1, ord=np.inf), global_step
             )
 
         # Patch
@@ -189,71 +314,25 @@ class SummaryWriterDefault(SummaryWriter):
             )
 
         # Losses
-        if estimator is not None and x is not None and y is not None:
-            if hasattr(estimator, "compute_losses"):
-                losses = estimator.compute_losses(x=x, y=y)
-
-                for key, value in losses.items():
-                    if np.ndim(value) == 0:
-                        self.summary_writer.add_scalar(
-                            f"loss/{key}/batch-{batch_id}",
-                            value,
-                            global_step=global_step,
-                        )
-                    else:
-                        self.summary_writer.add_scalars(
-                            f"loss/{key}/batch-{batch_id}",
-                            {str(i): v for i, v in enumerate(value)},
-                            global_step=global_step,
-                        )
-
-            elif hasattr(estimator, "compute_loss"):
-                loss = estimator.compute_loss(x=x, y=y)
-
-                if np.ndim(loss) == 0:
-                    self.summary_writer.add_scalar(
-                        f"loss/batch-{batch_id}",
-                        loss,
-                        global_step=global_step,
-                    )
-                else:
-                    self.summary_writer.add_scalars(
-                        f"loss/batch-{batch_id}",
-                        {str(i): v for i, v in enumerate(loss)},
-                        global_step=global_step,
-                    )
+        if losses is not None:
+            for key, value in losses.items():
+                self._add_values(f"loss/{key}/batch-{batch_id}", value, global_step)
+        elif loss is not None:
+            self._add_values(f"loss/batch-{batch_id}", loss, global_step)
 
         # Indicators of Attack Failure by Pintor et al. (2021)
         # Paper link: https://arxiv.org/abs/2106.09947
-        if self.ind_1:  # Silent Success
-            from art.estimators.classification.classifier import ClassifierMixin
-
-            if isinstance(estimator, ClassifierMixin):
-                if y is not None:
-                    y_pred = estimator.predict(x)  # type: ignore
-                    self.i_1 = np.argmax(y_pred, axis=1) == np.argmax(y, axis=1)
-                    self.summary_writer.add_scalars(
-                        f"Attack Failure Indicator 1 - Silent Success/batch-{batch_id}",
-                        {str(i): v for i, v in enumerate(self.i_1)},
-                        global_step=global_step,
-                    )
-                else:
-                    raise ValueError("Attack Failure Indicator 1 requires `y`.")
-            else:
-                raise ValueError(
-                    "Attack Failure Indicator 1 is only supported for classification, for the current "
-                    "`estimator` set `ind_1=False`."
-                )
-
-        if self.ind_2:  # Break-point Angle
-            losses = estimator.compute_loss(x=x, y=y)
+        if self.ind_1 and y_pred is not None:  # Silent Success
+            self.i_1 = np.argmax(y_pred, axis=1) == y_true
+            self._add_values(f"Attack Failure Indicator 1 - Silent Success/batch-{batch_id}", self.i_1, global_step)
 
+        if self.ind_2 and loss_2 is not None:  # Break-point Angle
             if str(batch_id) not in self.losses:
                 self.losses[str(batch_id)] = []
 
-            self.losses[str(batch_id)].append(losses)
+            self.losses[str(batch_id)].append(loss_2)
 
-            self.i_2 = np.ones_like(losses)
+            self.i_2 = np.ones_like(loss_2)
 
             if len(self.losses[str(batch_id)]) >= 3:
 
@@ -264,83 +343,145 @@ class SummaryWriterDefault(SummaryWriter):
 
                 for i_step in range(1, len(self.losses[str(batch_id)]) - 1):
 
+                    # The losses are only recorded every `indicator_interval` steps
+                    step = i_step * self.indicator_interval
+
                     side_a = np.sqrt(
                         np.square((self.losses[str(batch_id)][0] - self.losses[str(batch_id)][i_step]) / delta_loss)
-                        + (i_step / delta_step) ** 2
+                        + (step / delta_step) ** 2
                     )
                     side_c = np.sqrt(
                         np.square((self.losses[str(batch_id)][i_step] - self.losses[str(batch_id)][-1]) / delta_loss)
-                        + ((delta_step - i_step) / delta_step) ** 2
+                        + ((delta_step - step) / delta_step) ** 2
                     )
                     cos_beta = -(side_b ** 2 - (side_a ** 2 + side_c ** 2)) / (2 * side_a * side_c)
 
                     i_2_step = 1 - np.abs(cos_beta)
                     self.i_2 = np.minimum(self.i_2, i_2_step)
 
-                if np.ndim(self.i_2) == 0:
-                    self.summary_writer.add_scalar(
-                        f"Attack Failure Indicator 2 - Break-point Angle/batch-{batch_id}",
-                        self.i_2,
-                        global_step=global_step,
-                    )
-                else:
-                    self.summary_writer.add_scalars(
-                        f"Attack Failure Indicator 2 - Break-point Angle/batch-{batch_id}",
-                        {str(i): v for i, v in enumerate(self.i_2)},
-                        global_step=global_step,
-                    )
-
-        if self.ind_3:  # Diverging (Increasing) Loss
-            loss = estimator.compute_loss(x=x, y=y)
+                self._add_values(
+                    f"Attack Failure Indicator 2 - Break-point Angle/batch-{batch_id}", self.i_2, global_step
+                )
 
+        if self.ind_3 and loss_3 is not None:  # Diverging (Increasing) Loss
             if str(batch_id) in self.i_3:
                 if targeted:
-                    if isinstance(loss, float):
-                        loss_add = loss
+                    if isinstance(loss_3, float):
+                        loss_add = loss_3
                     else:
-                        loss_add = loss[loss > self.loss_prev[str(batch_id)]]
-                    self.i_3[str(batch_id)][loss > self.loss_prev[str(batch_id)]] += loss_add
+                        loss_add = loss_3[loss_3 > self.loss_prev[str(batch_id)]]
+                    self.i_3[str(batch_id)][loss_3 > self.loss_prev[str(batch_id)]] += loss_add
                 else:
-                    if isinstance(loss, float):
-                        loss_add = loss
+                    if isinstance(loss_3, float):
+                        loss_add = loss_3
                     else:
-                        loss_add = loss[loss < self.loss_prev[str(batch_id)]]
-                    self.i_3[str(batch_id)][loss < self.loss_prev[str(batch_id)]] += loss_add
+                        loss_add = loss_3[loss_3 < self.loss_prev[str(batch_id)]]
+                    self.i_3[str(batch_id)][loss_3 < self.loss_prev[str(batch_id)]] += loss_add
             else:
-                self.i_3[str(batch_id)] = np.zeros_like(loss)
+                self.i_3[str(batch_id)] = np.zeros_like(loss_3)
 
-            if np.ndim(self.i_3[str(batch_id)]) == 0:
-                self.summary_writer.add_scalar(
-                    f"Attack Failure Indicator 3 - Diverging Loss/batch-{batch_id}",
-                    self.i_3[str(batch_id)],
-                    global_step=global_step,
-                )
-            else:
-                self.summary_writer.add_scalars(
-                    f"Attack Failure Indicator 3 - Diverging Loss/batch-{batch_id}",
-                    {str(i): v for i, v in enumerate(self.i_3[str(batch_id)])},
-                    global_step=global_step,
-                )
+            self._add_values(
+                f"Attack Failure Indicator 3 - Diverging Loss/batch-{batch_id}", self.i_3[str(batch_id)], global_step
+            )
 
-            self.loss_prev[str(batch_id)] = loss
+            self.loss_prev[str(batch_id)] = loss_3
 
-        if self.ind_4:  # Zero Gradients
+        if self.ind_4 and grad is not None:  # Zero Gradients
 
             threshold = 0.0
 
-            if grad is not None:
+            if str(batch_id) not in self.i_4:
+                self.i_4[str(batch_id)] = np.zeros(grad.shape[0])
 
-                if str(batch_id) not in self.i_4:
-                    self.i_4[str(batch_id)] = np.zeros(grad.shape[0])
+            self.i_4[str(batch_id)][l_2 <= threshold] += 1
 
-                self.i_4[str(batch_id)][
-                    np.linalg.norm(grad.reshape(grad.shape[0], -1), axis=1, ord=2) <= threshold
-                ] += 1
+            self._add_values(
+                f"Attack Failure Indicator 4 - Zero Gradients/batch-{batch_id}",
+                self.i_4[str(batch_id)] / global_step,
+                global_step,
+            )
 
-                self.summary_writer.add_scalars(
-                    f"Attack Failure Indicator 4 - Zero Gradients/batch-{batch_id}",
-                    {str(i): v for i, v in enumerate(self.i_4[str(batch_id)] / global_step)},
-                    global_step=global_step,
-                )
-            else:
-                raise ValueError("Attack Failure Indicator 4 requires `grad`.")
+    def _add_values(self, tag: str, values: Union[float, np.ndarray], global_step: int) -> None:
+        """
+        Write a scalar or the values of the samples of a batch, either as a histogram or as one scalar per sample.
+        """
+        if np.ndim(values) == 0:
+            self.summary_writer.add_scalar(tag, values, global_step=global_step)
+        elif self.histogram:
+            # Histograms are only defined for finite values, e.g. indicator 4 is NaN at step 0
+            array = np.asarray(values, dtype=np.float64)
+            array = array[np.isfinite(array)]
+            if array.size > 0:
+                self.summary_writer.add_histogram(tag, array, global_step=global_step)
+        else:
+            array = np.asarray(values)
+            self.summary_writer.add_scalars(tag, {str(i): v for i, v in enumerate(array)}, global_step=global_step)
+
+    def _process_queue(self) -> None:
+        """
+        Write the queued updates until the stop signal `None` is received.
+        """
+        while True:
+            args_write = self._queue.get()  # type: ignore
+            try:
+                if args_write is None:
+                    return
+                # Skip the remaining updates after an error, it is raised in the thread of the attack
+                if self._error is None:
+                    self._write(*args_write)
+            except Exception as exception:  # pylint: disable=W0703
+                self._error = exception
+            finally:
+                self._queue.task_done()  # type: ignore
+
+    def _stop_worker(self) -> None:
+        """
+        Write the queued updates and stop the background thread.
+        """
+        if self._worker is not None:
+            self._queue.put(None)  # type: ignore
+            self._worker.join()
+            self._worker = None
+            self._queue = None
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        """
+        Raise the error that occurred in the background thread, if any.
+        """
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def flush(self) -> None:
+        """
+        Write the queued updates and flush the events to disk.
+        """
+        if self._queue is not None:
+            self._queue.join()
+        self._raise_error()
+        self.summary_writer.flush()
+
+    def close(self) -> None:
+        """
+        Write the queued updates, stop the background thread and close the summary writer.
+        """
+        self._stop_worker()
+        self.summary_writer.close()
+
+    def reset(self):
+        """
+        Write the queued updates, stop the background thread, flush and reset the summary writer.
+        """
+        self._stop_worker()
+        super().reset()
+
+    def _check_params(self) -> None:
+        if not isinstance(self.indicator_interval, int) or self.indicator_interval < 1:
+            raise ValueError("The argument `indicator_interval` has to be a positive integer.")
+
+        if self.nb_samples is not None and (not isinstance(self.nb_samples, int) or self.nb_samples < 1):
+            raise ValueError("The argument `nb_samples` has to be `None` or a positive integer.")
+
+        if not isinstance(self.max_queue_size, int) or self.max_queue_size < 0:
+            raise ValueError("The argument `max_queue_size` has to be a non-negative integer.")
@@ -21,12 +21,14 @@ Module providing convenience functions.
 # pylint: disable=C0302
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import json
 import logging
 import math
 import os
 import shutil
 import sys
 import tarfile
+import tempfile
 import warnings
 import zipfile
 from functools import wraps
@@ -1174,15 +1176,17 @@ def non_maximum_suppression(
 # -------------------------------------------------------------------------------------------------- DATASET OPERATIONS
 
 
-def load_cifar10(
-    raw: bool = False,
-) -> DATASET_TYPE:
+def load_cifar10(raw: bool = False, cache: bool = False) -> DATASET_TYPE:
     """
     Loads CIFAR10 dataset from config.CIFAR10_PATH or downloads it if necessary.
 
     :param raw: `True` if no preprocessing should be applied to the data. Otherwise, data is normalized to 1.
+    :param cache: `True` to serve the dataset as read-only memory-mapped arrays from the dataset cache under
+                  `config.ART_DATA_PATH`, see :func:`load_cached_dataset`.
     :return: `(x_train, y_train), (x_test, y_test), min, max`
     """
+    if cache:
+        return load_cached_dataset(f"cifar10-{'raw' if raw else 'normalized'}", lambda: load_cifar10(raw=raw))
 
     def load_batch(fpath: str) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -1240,15 +1244,17 @@ def load_cifar10(
     return (x_train, y_train), (x_test, y_test), min_, max_
 
 
-def load_mnist(
-    raw: bool = False,
-) -> DATASET_TYPE:
+def load_mnist(raw: bool = False, cache: bool = False) -> DATASET_TYPE:
     """
     Loads MNIST dataset from `config.ART_DATA_PATH` or downloads it if necessary.
 
     :param raw: `True` if no preprocessing should be applied to the data. Otherwise, data is normalized to 1.
+    :param cache: `True` to serve the dataset as read-only memory-mapped arrays from the dataset cache under
+                  `config.ART_DATA_PATH`, see :func:`load_cached_dataset`.
     :return: `(x_train, y_train), (x_test, y_test), min, max`.
     """
+    if cache:
+        return load_cached_dataset(f"mnist-{'raw' if raw else 'normalized'}", lambda: load_mnist(raw=raw))
     path = get_file(
         "mnist.npz",
         path=config.ART_DATA_PATH,
@@ -1274,12 +1280,17 @@ def load_mnist(
     return (x_train, y_train), (x_test, y_test), min_, max_
 
 
-def load_stl() -> DATASET_TYPE:
+def load_stl(cache: bool = False) -> DATASET_TYPE:
     """
     Loads the STL-10 dataset from `config.ART_DATA_PATH` or downloads it if necessary.
 
+    :param cache: `True` to serve the dataset as read-only memory-mapped arrays from the dataset cache under
+                  `config.ART_DATA_PATH`, see :func:`load_cached_dataset`.
     :return: `(x_train, y_train), (x_test, y_test), min, max`.
     """
+    if cache:
+        return load_cached_dataset("stl10-normalized", load_stl)
+
     min_, max_ = 0.0, 1.0
 
     # Download and extract data if needed
@@ -1410,7 +1421,7 @@ def load_diabetes(raw: bool = False, test_set: float = 0.3) -> DATASET_TYPE:
 
 
 def load_nursery(
-    raw: bool = False, scaled: bool = True, test_set: float = 0.2, transform_social: bool = False
+    raw: bool = False, scaled: bool = True, test_set: float = 0.2, transform_social: bool = False, cache: bool = False
 ) -> DATASET_TYPE:
     """
     Loads the UCI Nursery dataset from `config.ART_DATA_PATH` or downloads it if necessary.
@@ -1422,8 +1433,18 @@ def load_nursery(
     :param transform_social: If `True`, transforms the social feature to be binary for the purpose of attribute
                              inference. This is done by assigning the original value 'problematic' the new value 1, and
                              the other original values are assigned the new value 0.
+    :param cache: `True` to serve the dataset as read-only memory-mapped arrays from the dataset cache under
+                  `config.ART_DATA_PATH`, see :func:`load_cached_dataset`. The raw dataset contains strings and is not
+                  cached.
     :return: Entire dataset and labels as numpy array.
     """
+    if cache:
+        variant = "raw" if raw else "scaled" if scaled else "normalized"
+        return load_cached_dataset(
+            f"nursery-{variant}-test_{test_set}-social_{int(transform_social)}",
+            lambda: load_nursery(raw=raw, scaled=scaled, test_set=test_set, transform_social=transform_social),
+        )
+
     import pandas as pd
     import sklearn.preprocessing
 
@@ -1521,33 +1542,89 @@ def load_nursery(
     return (x_train, y_train), (x_test, y_test), min_, max_
 
 
-def load_dataset(
-    name: str,
-) -> DATASET_TYPE:
+def load_dataset(name: str, cache: bool = False) -> DATASET_TYPE:
     """
     Loads or downloads the dataset corresponding to `name`. Options are: `mnist`, `cifar10`, `stl10`, `iris`, `nursery`
     and `diabetes`.
 
     :param name: Name of the dataset.
+    :param cache: `True` to serve the `mnist`, `cifar10`, `stl10` and `nursery` datasets as read-only memory-mapped
+                  arrays from the dataset cache under `config.ART_DATA_PATH`, see :func:`load_cached_dataset`.
     :return: The dataset separated in training and test sets as `(x_train, y_train), (x_test, y_test), min, max`.
     :raises NotImplementedError: If the dataset is unknown.
     """
     if "mnist" in name:
-        return load_mnist()
+        return load_mnist(cache=cache)
     if "cifar10" in name:
-        return load_cifar10()
+        return load_cifar10(cache=cache)
     if "stl10" in name:
-        return load_stl()
+        return load_stl(cache=cache)
     if "iris" in name:
         return load_iris()
     if "nursery" in name:
-        return load_nursery()
+        return load_nursery(cache=cache)
     if "diabetes" in name:
         return load_diabetes()
 
     raise NotImplementedError(f"There is no loader for dataset '{name}'.")
 
 
+DATASET_CACHE_VERSION = 1
+
+
+def load_cached_dataset(key: str, loader: Callable[[], DATASET_TYPE]) -> DATASET_TYPE:
+    """
+    Loads a dataset from the dataset cache under `config.ART_DATA_PATH/cache`, storing the output of `loader` in the
+    cache first if the dataset is not cached yet. The arrays are stored once as `.npy` files and served as read-only
+    memory-mapped arrays, so that the dataset is neither parsed nor preprocessed again and all processes loading it
+    share the same pages of memory. The entry of a dataset is named after `key` and `DATASET_CACHE_VERSION`, which is
+    incremented whenever the preprocessing of the loaders changes. Datasets with arrays of Python objects cannot be
+    memory-mapped and are returned by `loader` without being cached.
+
+    :param key: Name of the dataset in the cache, including its variant, e.g. `mnist-normalized`.
+    :param loader: Function loading the dataset if it is not cached yet.
+    :return: The dataset separated in training and test sets as `(x_train, y_train), (x_test, y_test), min, max`.
+    """
+    names = ["x_train", "y_train", "x_test", "y_test"]
+    cache_path = os.path.join(config.ART_DATA_PATH, "cache")
+    path = os.path.join(cache_path, f"{key}-v{DATASET_CACHE_VERSION}")
+
+    if not os.path.exists(os.path.join(path, "bounds.json")):
+        dataset = loader()
+        (x_train, y_train), (x_test, y_test), min_, max_ = dataset
+        arrays = [np.asarray(array) for array in [x_train, y_train, x_test, y_test]]
+        if any(array.dtype == object for array in arrays):
+            logger.info("The dataset %s contains Python objects and is not cached.", key)
+            return dataset
+
+        # Write the entry into a temporary directory renamed at the end, so that concurrent processes never read a
+        # partial entry
+        try:
+            os.makedirs(cache_path, exist_ok=True)
+            tmp_path = tempfile.mkdtemp(prefix=f".{key}-", dir=cache_path)
+        except OSError:  # pragma: no cover
+            logger.warning("Unable to write the dataset %s to the cache in %s.", key, cache_path, exc_info=True)
+            return dataset
+        try:
+            for name, array in zip(names, arrays):
+                np.save(os.path.join(tmp_path, f"{name}.npy"), array)
+            with open(os.path.join(tmp_path, "bounds.json"), "w", encoding="utf8") as file_:
+                json.dump({"min": float(min_), "max": float(max_)}, file_)
+            os.rename(tmp_path, path)
+        except OSError:
+            # Another process has cached the dataset in the meantime
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            if not os.path.exists(os.path.join(path, "bounds.json")):  # pragma: no cover
+                logger.warning("Unable to write the dataset %s to the cache in %s.", key, cache_path, exc_info=True)
+                return dataset
+
+    x_train, y_train, x_test, y_test = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in names]
+    with open(os.path.join(path, "bounds.json"), encoding="utf8") as file_:
+        bounds = json.load(file_)
+
+    return (x_train, y_train), (x_test, y_test), bounds["min"], bounds["max"]
+
+
 def _extract(full_path: str, path: str) -> bool:
     archive: Union[zipfile.ZipFile, tarfile.TarFile]
     if full_path.endswith("tar"):  # pragma: no cover
@@ -0,0 +1,3 @@
+"""
+Performance benchmarks of attacks, defences, metrics and estimators running on CPU with small synthetic models.
+"""
@@ -0,0 +1,435 @@
+"""
+Definitions of the benchmarks. Every benchmark creates its models and data in `setup` and runs the measured code path
+on `nb_samples` samples in `run`. The estimators listed in `estimators` are instrumented to count the queries and
+gradients of the measured code path.
+"""
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Type
+
+import numpy as np
+
+from benchmarks import models
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Benchmark:
+    """
+    Base class of the benchmarks.
+    """
+
+    name = ""
+    nb_samples = 1
+
+    def __init__(self) -> None:
+        self.estimators: List[Any] = []
+
+    def setup(self) -> None:
+        """
+        Create the models and data of the benchmark.
+        """
+        raise NotImplementedError
+
+    def run(self) -> None:
+        """
+        Run the measured code path of the benchmark.
+        """
+        raise NotImplementedError
+
+
+BENCHMARKS: Dict[str, Type[Benchmark]] = {}
+
+
+def register(cls: Type[Benchmark]) -> Type[Benchmark]:
+    """
+    Register a benchmark under its name.
+    """
+    BENCHMARKS[cls.name] = cls
+    return cls
+
+
+class _EvasionAttackBenchmark(Benchmark):
+    """
+    Benchmark of the `generate` method of an evasion attack on random images.
+    """
+
+    channels_first = True
+    labels = True
+
+    def create_estimator(self):
+        """
+        Create the estimator under attack.
+        """
+        return models.pytorch_classifier()
+
+    def create_attack(self, estimator):
+        """
+        Create the attack.
+        """
+        raise NotImplementedError
+
+    def setup(self) -> None:
+        estimator = self.create_estimator()
+        self.estimators = [estimator]
+        self.attack = self.create_attack(estimator)
+        self.x, self.y = self.create_data()
+
+    def create_data(self):
+        """
+        Create the inputs to attack.
+        """
+        return models.image_data(self.nb_samples, channels_first=self.channels_first)
+
+    def run(self) -> None:
+        self.attack.generate(self.x, y=self.y if self.labels else None)
+
+
+@register
+class FGSMPyTorch(_EvasionAttackBenchmark):
+    name = "attacks.fgsm.pytorch"
+    nb_samples = 256
+
+    def create_attack(self, estimator):
+        from art.attacks.evasion import FastGradientMethod
+
+        return FastGradientMethod(estimator, eps=0.1, batch_size=64)
+
+
+@register
+class FGSMTensorFlow(_EvasionAttackBenchmark):
+    name = "attacks.fgsm.tensorflow"
+    nb_samples = 256
+    channels_first = False
+
+    def create_estimator(self):
+        return models.tensorflow_classifier()
+
+    def create_attack(self, estimator):
+        from art.attacks.evasion import FastGradientMethod
+
+        return FastGradientMethod(estimator, eps=0.1, batch_size=64)
+
+
+@register
+class FGSMScikitlearn(_EvasionAttackBenchmark):
+    name = "attacks.fgsm.scikitlearn"
+    nb_samples = 1000
+
+    def create_estimator(self):
+        return models.sklearn_classifier()
+
+    def create_attack(self, estimator):
+        from art.attacks.evasion import FastGradientMethod
+
+        return FastGradientMethod(estimator, eps=0.1, batch_size=128)
+
+    def create_data(self):
+        x, y = models.tabular_data(self.nb_samples, seed=4321)
+        return x, np.eye(3)[y]
+
+
+@register
+class PGDPyTorch(_EvasionAttackBenchmark):
+    name = "attacks.pgd.pytorch"
+    nb_samples = 128
+
+    def create_attack(self, estimator):
+        from art.attacks.evasion import ProjectedGradientDescent
+
+        return ProjectedGradientDescent(estimator, eps=0.1, eps_step=0.02, max_iter=10, batch_size=64, verbose=False)
+
+
+@register
+class CarliniL2PyTorch(_EvasionAttackBenchmark):
+    name = "attacks.carlini_l2.pytorch"
+    nb_samples = 32
+
+    def create_attack(self, estimator):
+        from art.attacks.evasion import CarliniL2Method
+
+        return CarliniL2Method(estimator, max_iter=5, binary_search_steps=2, batch_size=16, verbose=False)
+
+
+@register
+class HopSkipJumpPyTorch(_EvasionAttackBenchmark):
+    name = "attacks.hop_skip_jump.pytorch"
+    nb_samples = 4
+    labels = False
+
+    def create_attack(self, estimator):
+        from art.attacks.evasion import HopSkipJump
+
+        return HopSkipJump(estimator, max_iter=2, max_eval=200, init_eval=20, init_size=20, verbose=False)
+
+
+@register
+class SquareAttackPyTorch(_EvasionAttackBenchmark):
+    name = "attacks.square_attack.pytorch"
+    nb_samples = 32
+
+    def create_attack(self, estimator):
+        from art.attacks.evasion import SquareAttack
+
+        return SquareAttack(estimator, eps=0.1, max_iter=50, nb_restarts=1, batch_size=32, verbose=False)
+
+
+@register
+class ZooScikitlearn(_EvasionAttackBenchmark):
+    name = "attacks.zoo.scikitlearn"
+    nb_samples = 10
+
+    def create_estimator(self):
+        return models.sklearn_classifier()
+
+    def create_attack(self, estimator):
+        from art.attacks.evasion import ZooAttack
+
+        return ZooAttack(
+            estimator,
+            max_iter=10,
+            binary_search_steps=2,
+            nb_parallel=5,
+            use_resize=False,
+            use_importance=False,
+            batch_size=1,
+            verbose=False,
+        )
+
+    def create_data(self):
+        x, y = models.tabular_data(self.nb_samples, seed=4321)
+        return x, np.eye(3)[y]
+
+
+class _WassersteinBenchmark(Benchmark):
+    """
+    Benchmark of the local transport or of a single projected Sinkhorn iteration of the Wasserstein attack, which
+    dominate the cost of every iteration of its optimizers, on random RGB images of size `size`. Only the internals of
+    the attack are measured, the linear model is not queried.
+    """
+
+    size = 32
+    kernel_size = 5
+
+    def setup(self) -> None:
+        import torch
+
+        from art.attacks.evasion import Wasserstein
+        from art.estimators.classification import PyTorchClassifier
+
+        torch.manual_seed(1234)
+        input_shape = (3, self.size, self.size)
+        classifier = PyTorchClassifier(
+            model=torch.nn.Sequential(
+                torch.nn.Flatten(), torch.nn.Linear(int(np.prod(input_shape)), models.NB_CLASSES)
+            ),
+            loss=torch.nn.CrossEntropyLoss(),
+            input_shape=input_shape,
+            nb_classes=models.NB_CLASSES,
+            clip_values=(0.0, 1.0),
+            device_type="cpu",
+        )
+        self.attack = Wasserstein(
+            classifier,
+            kernel_size=self.kernel_size,
+            projected_sinkhorn_max_iter=1,
+            batch_size=self.nb_samples,
+            verbose=False,
+        )
+
+        rng = np.random.default_rng(1234)
+        self.x = rng.random((self.nb_samples,) + input_shape)
+        self.x_init = rng.random((self.nb_samples,) + input_shape)
+        self.eps = np.full(self.nb_samples, 0.3)
+        self.cost_matrix = self.attack._compute_cost_matrix(self.attack.p, self.kernel_size)
+        self.var_k = np.exp(-self.cost_matrix - 1)[np.newaxis, np.newaxis]
+
+
+class _WassersteinLocalTransport(_WassersteinBenchmark):
+    def run(self) -> None:
+        self.attack._local_transport(self.var_k, self.x, self.kernel_size)
+
+
+class _WassersteinProjectedSinkhorn(_WassersteinBenchmark):
+    def run(self) -> None:
+        self.attack._projected_sinkhorn(self.x, self.x_init, self.cost_matrix, self.eps)
+
+
+@register
+class WassersteinLocalTransport32(_WassersteinLocalTransport):
+    name = "attacks.wasserstein.local_transport_32"
+    nb_samples = 32
+
+
+@register
+class WassersteinLocalTransport224(_WassersteinLocalTransport):
+    name = "attacks.wasserstein.local_transport_224"
+    nb_samples = 4
+    size = 224
+
+
+@register
+class WassersteinProjectedSinkhorn32(_WassersteinProjectedSinkhorn):
+    name = "attacks.wasserstein.projected_sinkhorn_32"
+    nb_samples = 32
+
+
+@register
+class WassersteinProjectedSinkhorn224(_WassersteinProjectedSinkhorn):
+    name = "attacks.wasserstein.projected_sinkhorn_224"
+    nb_samples = 4
+    size = 224
+
+
+@register
+class RandomizedSmoothingCertification(Benchmark):
+    name = "certification.randomized_smoothing.pytorch"
+    nb_samples = 8
+
+    def setup(self) -> None:
+        self.classifier = models.pytorch_classifier(randomized_smoothing=True, sample_size=32, scale=0.25)
+        self.estimators = [self.classifier]
+        self.x, _ = models.image_data(self.nb_samples)
+
+    def run(self) -> None:
+        self.classifier.certify(self.x, n=256, batch_size=128)
+
+
+@register
+class SubsetScanning(Benchmark):
+    name = "defences.subset_scanning.pytorch"
+    nb_samples = 100
+
+    def setup(self) -> None:
+        self.classifier = models.pytorch_classifier()
+        self.estimators = [self.classifier]
+        self.x_background, _ = models.image_data(200, seed=1)
+        self.x_clean, _ = models.image_data(self.nb_samples // 2, seed=2)
+        noise = np.sign(np.random.default_rng(3).normal(size=self.x_clean.shape)).astype(np.float32)
+        self.x_adv = np.clip(self.x_clean + 0.1 * noise, 0, 1)
+
+    def run(self) -> None:
+        from art.defences.detector.evasion import SubsetScanningDetector
+
+        # The detector scores the background data when created
+        detector = SubsetScanningDetector(self.classifier, bgd_data=self.x_background, layer=4, verbose=False)
+        detector.scan(self.x_clean, self.x_adv, run=5)
+
+
+@register
+class ActivationDefencePyTorch(Benchmark):
+    name = "defences.activation_defence.pytorch"
+    nb_samples = 500
+
+    def setup(self) -> None:
+        self.classifier = models.pytorch_classifier()
+        self.estimators = [self.classifier]
+        self.x, self.y = models.image_data(self.nb_samples)
+
+    def run(self) -> None:
+        from art.defences.detector.poison import ActivationDefence
+
+        # The defence caches the activations of the training data
+        defence = ActivationDefence(self.classifier, self.x, self.y)
+        defence.detect_poison(nb_clusters=2, nb_dims=10, reduce="PCA")
+
+
+@register
+class TreeVerification(Benchmark):
+    name = "metrics.tree_verification.scikitlearn"
+    nb_samples = 10
+
+    def setup(self) -> None:
+        from art.metrics import RobustnessVerificationTreeModelsCliqueMethod
+
+        classifier = models.tree_classifier()
+        self.estimators = [classifier]
+        self.x, y = models.tabular_data(self.nb_samples, seed=4321)
+        self.y = np.eye(3)[y]
+        self.verification = RobustnessVerificationTreeModelsCliqueMethod(classifier, verbose=False)
+
+    def run(self) -> None:
+        self.verification.verify(self.x, self.y, eps_init=0.3, nb_search_steps=5, max_clique=2, max_level=2)
+
+
+@register
+class JpegCompressionBenchmark(Benchmark):
+    name = "preprocessing.jpeg_compression"
+    nb_samples = 256
+
+    def setup(self) -> None:
+        from art.defences.preprocessor import JpegCompression
+
+        self.preprocessor = JpegCompression(clip_values=(0.0, 1.0), quality=50, channels_first=True)
+        self.x, _ = models.image_data(self.nb_samples)
+
+    def run(self) -> None:
+        self.preprocessor(self.x)
+
+
+@register
+class SpatialSmoothingBenchmark(Benchmark):
+    name = "preprocessing.spatial_smoothing"
+    nb_samples = 256
+
+    def setup(self) -> None:
+        from art.defences.preprocessor import SpatialSmoothing
+
+        self.preprocessor = SpatialSmoothing(window_size=3, channels_first=True, clip_values=(0.0, 1.0))
+        self.x, _ = models.image_data(self.nb_samples)
+
+    def run(self) -> None:
+        self.preprocessor(self.x)
+
+
+class _ImportBenchmark(Benchmark):
+    """
+    Benchmark of an import statement, executed in a fresh interpreter so that the measurement includes all the modules
+    loaded for the first time. The time includes the start-up of the interpreter, run `python -X importtime` to get the
+    cumulative time of every module of a statement.
+    """
+
+    statement = ""
+
+    def setup(self) -> None:
+        pass
+
+    def run(self) -> None:
+        subprocess.run([sys.executable, "-c", self.statement], check=True, cwd=ROOT)
+
+
+@register
+class ImportArt(_ImportBenchmark):
+    name = "imports.art"
+    statement = "import art"
+
+
+@register
+class ImportFastGradientMethod(_ImportBenchmark):
+    name = "imports.fast_gradient"
+    statement = "from art.attacks.evasion import FastGradientMethod"
+
+
+@register
+class ImportPyTorchClassifier(_ImportBenchmark):
+    name = "imports.pytorch_classifier"
+    statement = "from art.estimators.classification import PyTorchClassifier"
+
+
+@register
+class ImportJpegCompression(_ImportBenchmark):
+    name = "imports.jpeg_compression"
+    statement = "from art.defences.preprocessor import JpegCompression"
+
+
+@register
+class ImportEmpiricalRobustness(_ImportBenchmark):
+    name = "imports.empirical_robustness"
+    statement = "from art.metrics import empirical_robustness"
+
+
+@register
+class ImportEvasionAttacks(_ImportBenchmark):
+    name = "imports.evasion_attacks"
+    statement = "from art.attacks.evasion import *"
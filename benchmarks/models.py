@@ -0,0 +1,134 @@
+"""
+Small synthetic models and datasets of the benchmarks. The models are created with fixed seeds and random or briefly
+fitted weights, because only the runtime of the code paths of ART is of interest.
+"""
+import numpy as np
+
+NB_CLASSES = 10
+IMAGE_SHAPE = (1, 28, 28)
+NB_FEATURES = 20
+
+
+def image_data(nb_samples, channels_first=True, seed=1234):
+    """
+    Create random images in [0, 1] with one-hot labels.
+
+    :param nb_samples: Number of images.
+    :param channels_first: Whether to create images of shape NCHW or NHWC.
+    :param seed: Seed of the random generator.
+    :return: Tuple of images and one-hot labels.
+    """
+    rng = np.random.default_rng(seed)
+    x = rng.random((nb_samples,) + IMAGE_SHAPE, dtype=np.float32)
+    if not channels_first:
+        x = np.transpose(x, (0, 2, 3, 1))
+    y = np.eye(NB_CLASSES, dtype=np.float32)[rng.integers(0, NB_CLASSES, nb_samples)]
+    return x, y
+
+
+def tabular_data(nb_samples, seed=1234):
+    """
+    Create a random tabular classification dataset with features in [0, 1] and labels depending on the features.
+
+    :param nb_samples: Number of samples.
+    :param seed: Seed of the random generator.
+    :return: Tuple of features and label indices.
+    """
+    rng = np.random.default_rng(seed)
+    x = rng.random((nb_samples, NB_FEATURES)).astype(np.float32)
+    y = (x[:, :3].sum(axis=1) * 3 / 2).astype(int) % 3
+    return x, y
+
+
+def pytorch_classifier(randomized_smoothing=False, **kwargs):
+    """
+    Create a small convolutional PyTorch classifier for images of shape `IMAGE_SHAPE`.
+
+    :param randomized_smoothing: Whether to create a randomized smoothing classifier.
+    :param kwargs: Additional arguments of the classifier.
+    :return: PyTorch classifier.
+    """
+    import torch
+
+    from art.estimators.certification.randomized_smoothing import PyTorchRandomizedSmoothing
+    from art.estimators.classification import PyTorchClassifier
+
+    torch.manual_seed(1234)
+    model = torch.nn.Sequential(
+        torch.nn.Conv2d(1, 8, 5),
+        torch.nn.ReLU(),
+        torch.nn.MaxPool2d(4),
+        torch.nn.Flatten(),
+        torch.nn.Linear(8 * 6 * 6, 32),
+        torch.nn.ReLU(),
+        torch.nn.Linear(32, NB_CLASSES),
+    )
+    classifier_class = PyTorchRandomizedSmoothing if randomized_smoothing else PyTorchClassifier
+    return classifier_class(
+        model=model,
+        loss=torch.nn.CrossEntropyLoss(),
+        optimizer=torch.optim.Adam(model.parameters(), lr=0.01),
+        input_shape=IMAGE_SHAPE,
+        nb_classes=NB_CLASSES,
+        clip_values=(0.0, 1.0),
+        device_type="cpu",
+        **kwargs,
+    )
+
+
+def tensorflow_classifier():
+    """
+    Create a small convolutional TensorFlow v2 classifier for images of shape `IMAGE_SHAPE` in channels last format.
+
+    :return: TensorFlow v2 classifier.
+    """
+    import tensorflow as tf
+
+    from art.estimators.classification import TensorFlowV2Classifier
+
+    tf.random.set_seed(1234)
+    model = tf.keras.Sequential(
+        [
+            tf.keras.layers.Conv2D(8, 5, activation="relu", input_shape=IMAGE_SHAPE[1:] + IMAGE_SHAPE[:1]),
+            tf.keras.layers.MaxPool2D(4),
+            tf.keras.layers.Flatten(),
+            tf.keras.layers.Dense(32, activation="relu"),
+            tf.keras.layers.Dense(NB_CLASSES),
+        ]
+    )
+    return TensorFlowV2Classifier(
+        model=model,
+        loss_object=tf.keras.losses.CategoricalCrossentropy(from_logits=True),
+        nb_classes=NB_CLASSES,
+        input_shape=IMAGE_SHAPE[1:] + IMAGE_SHAPE[:1],
+        clip_values=(0.0, 1.0),
+    )
+
+
+def sklearn_classifier():
+    """
+    Create a scikit-learn logistic regression classifier fitted on the tabular dataset.
+
+    :return: Scikit-learn classifier.
+    """
+    from sklearn.linear_model import LogisticRegression
+
+    from art.estimators.classification import SklearnClassifier
+
+    x, y = tabular_data(500)
+    return SklearnClassifier(model=LogisticRegression(max_iter=200).fit(x, y), clip_values=(0.0, 1.0))
+
+
+def tree_classifier():
+    """
+    Create a scikit-learn gradient boosting classifier fitted on the tabular dataset.
+
+    :return: Scikit-learn tree ensemble classifier.
+    """
+    from sklearn.ensemble import GradientBoostingClassifier
+
+    from art.estimators.classification import SklearnClassifier
+
+    x, y = tabular_data(500)
+    model = GradientBoostingClassifier(n_estimators=4, max_depth=4, random_state=1234).fit(x, y)
+    return SklearnClassifier(model=model, clip_values=(0.0, 1.0))
@@ -0,0 +1,191 @@
+"""
+Run the benchmarks and store their results as JSON, so that they can be compared across commits. Every benchmark runs
+in a fresh process on CPU, which reports the median time of `--repeat` runs after a warm-up run, the throughput in
+samples, model queries and gradient computations per second, and the peak memory of a separate run.
+
+Usage::
+
+    python -m benchmarks.run                                  # run all benchmarks
+    python -m benchmarks.run -b attacks.pgd -b preprocessing  # run the benchmarks starting with the given names
+    python -m benchmarks.run --compare benchmarks/results/<commit>.json
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import re
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+RESULTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def run_benchmark(name: str, repeat: int) -> Dict[str, Any]:
+    """
+    Run a single benchmark in the current process.
+
+    :param name: Name of the benchmark.
+    :param repeat: Number of measured runs.
+    :return: Dictionary of the results.
+    """
+    os.environ["CUDA_VISIBLE_DEVICES"] = ""
+    import numpy as np
+
+    from art.estimators.instrumentation import EstimatorInstrumentation
+    from benchmarks.benchmarks import BENCHMARKS
+
+    np.random.seed(1234)
+    benchmark = BENCHMARKS[name]()
+    benchmark.setup()
+    benchmark.run()
+
+    times = []
+    with EstimatorInstrumentation(benchmark.estimators) as instrumentation:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            benchmark.run()
+            times.append(time.perf_counter() - start)
+
+    # Measure the memory in a separate run, tracing the allocations slows down the benchmarks
+    tracemalloc.start()
+    benchmark.run()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    nb_queries = 0
+    nb_gradients = 0
+    for methods in instrumentation.to_dict().get("total", {}).values():
+        for method in ["predict", "get_activations"]:
+            nb_queries += methods.get(method, {}).get("nb_samples", 0)
+        for method in ["loss_gradient", "class_gradient"]:
+            nb_gradients += methods.get(method, {}).get("nb_samples", 0)
+
+    median_time = statistics.median(times)
+    total_time = sum(times)
+    return {
+        "nb_samples": benchmark.nb_samples,
+        "repeat": repeat,
+        "times": times,
+        "median_time": median_time,
+        "samples_per_second": benchmark.nb_samples / median_time,
+        "queries_per_run": nb_queries / repeat,
+        "queries_per_second": nb_queries / total_time,
+        "gradients_per_run": nb_gradients / repeat,
+        "gradients_per_second": nb_gradients / total_time,
+        "peak_memory": peak_memory,
+        "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Describe the commit and the environment of the benchmark run.
+    """
+    import numpy as np
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, cwd=os.path.dirname(RESULTS_PATH)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+
+    return {
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "nb_cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def compare(results: Dict[str, Any], reference: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Print the ratio of the median times of two benchmark runs.
+
+    :param results: Results of the new run.
+    :param reference: Results of the reference run.
+    :param threshold: Ratio of the median times above which a benchmark is reported as regression.
+    :return: Names of the regressed benchmarks.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<48} {'reference':>10} {'current':>10} {'ratio':>7}")
+    for name, result in results["results"].items():
+        if "error" in result or "error" in reference["results"].get(name, {"error": True}):
+            continue
+        reference_time = reference["results"][name]["median_time"]
+        ratio = result["median_time"] / reference_time
+        flag = ""
+        if ratio > threshold:
+            regressions.append(name)
+            flag = "  slower"
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        print(f"{name:<48} {reference_time:10.4f} {result['median_time']:10.4f} {ratio:7.2f}{flag}")
+    return regressions
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Run the benchmarks from the command line.
+    """
+    from benchmarks.benchmarks import BENCHMARKS
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-b", "--bench", action="append", help="Run the benchmarks with names starting with BENCH.")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of measured runs per benchmark.")
+    parser.add_argument("-o", "--output", help="Path of the JSON results, default results/<commit>.json.")
+    parser.add_argument("--compare", help="Path of JSON results to compare with.")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Time ratio reported as regression.")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks.")
+    options = parser.parse_args(args)
+
+    names = [name for name in BENCHMARKS if not options.bench or any(name.startswith(b) for b in options.bench)]
+    if options.list:
+        print("\n".join(names))
+        return 0
+
+    results = environment()
+    results["results"] = {}
+    context = multiprocessing.get_context("spawn")
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            try:
+                result = executor.submit(run_benchmark, name, options.repeat).result()
+                print(
+                    f"{name:<48} {result['median_time']:8.4f} s {result['samples_per_second']:10.1f} samples/s "
+                    f"{result['queries_per_second']:12.1f} queries/s {result['peak_memory'] / 2 ** 20:8.1f} MiB"
+                )
+            except Exception as exception:  # pylint: disable=W0703
+                result = {"error": repr(exception)}
+                print(f"{name:<48} failed: {exception!r}")
+        results["results"][name] = result
+
+    output = options.output
+    if output is None:
+        output = os.path.join(RESULTS_PATH, re.sub(r"\W", "", results["commit"])[:12] + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf8") as file_:
+        json.dump(results, file_, indent=2)
+    print(f"Results written to {output}")
+
+    if options.compare:
+        with open(options.compare, encoding="utf8") as file_:
+            reference = json.load(file_)
+        if compare(results, reference, options.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
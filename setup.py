@@ -110,7 +110,6 @@ setup(
             "pytest-mock",
             "pytest-cov",
             "requests",
-            "sortedcontainers",
             "numba",
             "timm",
             "multiprocess",
@@ -15,8 +15,14 @@
 # AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
 # TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
+import json
+import os
+
+import numpy as np
 import pytest
 
+from tests.utils import ARTTestException
+
 
 @pytest.mark.skip_framework("tensorflow1", "tensorflow2v1", "keras", "non_dl_frameworks", "mxnet", "kerastf")
 def test_attack_repr(image_dl_estimator):
@@ -36,3 +42,59 @@ def test_attack_repr(image_dl_estimator):
         + "num_random_init=0, batch_size=32, minimal=False, summary_writer=None, decay=0.5, "
         + "max_iter=100, random_eps=False, verbose=True, )"
     )
+
+
+@pytest.mark.skip_framework("tensorflow1", "tensorflow2v1", "keras", "non_dl_frameworks", "mxnet", "kerastf")
+def test_generate_out_of_core(art_warning, get_mnist_dataset, image_dl_estimator, tmp_path):
+    try:
+        from art.attacks.evasion import FastGradientMethod
+
+        classifier, _ = image_dl_estimator(from_logits=True)
+        attack = FastGradientMethod(classifier, eps=0.3, batch_size=4)
+
+        (_, _), (x_test, y_test) = get_mnist_dataset
+        x_test, y_test = x_test[:10], y_test[:10]
+        np.save(os.path.join(tmp_path, "x.npy"), x_test)
+        x_mmap = np.load(os.path.join(tmp_path, "x.npy"), mmap_mode="r")
+        x_adv_expected = attack.generate(x_test, y=y_test)
+
+        output_path = os.path.join(tmp_path, "x_adv.npy")
+        x_adv = attack.generate_out_of_core(x_mmap, output_path, y=y_test, chunk_size=3)
+        assert isinstance(x_adv, np.memmap)
+        np.testing.assert_array_almost_equal(x_adv, x_adv_expected, decimal=5)
+        with open(output_path + ".progress.json", encoding="utf8") as file_:
+            assert json.load(file_) == {"nb_samples": 10, "nb_completed": 10}
+
+        # Interrupt an attack over an iterable of batches after two batches and resume it
+        def batches(nb_batches):
+            for i in range(nb_batches):
+                yield x_test[4 * i : 4 * (i + 1)], y_test[4 * i : 4 * (i + 1)]
+            if nb_batches < 3:
+                raise KeyboardInterrupt
+
+        output_path = os.path.join(tmp_path, "x_adv_batches.npy")
+        with pytest.raises(KeyboardInterrupt):
+            attack.generate_out_of_core(batches(2), output_path, nb_samples=10)
+        with open(output_path + ".progress.json", encoding="utf8") as file_:
+            assert json.load(file_)["nb_completed"] == 8
+
+        nb_generated = []
+        generate = attack.generate
+
+        def generate_counted(x, y=None, **kwargs):
+            nb_generated.append(len(x))
+            return generate(x, y=y, **kwargs)
+
+        attack.generate = generate_counted
+        x_adv = attack.generate_out_of_core(batches(3), output_path, nb_samples=10)
+        assert nb_generated == [2]
+        np.testing.assert_array_almost_equal(x_adv, x_adv_expected, decimal=5)
+
+        with pytest.raises(ValueError):
+            attack.generate_out_of_core(batches(3), output_path, nb_samples=12)
+        with pytest.raises(ValueError):
+            attack.generate_out_of_core(batches(3), output_path)
+        with pytest.raises(ValueError):
+            attack.generate_out_of_core(x_mmap, output_path, chunk_size=0)
+    except ARTTestException as e:
+        art_warning(e)
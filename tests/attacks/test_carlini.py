@@ -512,6 +512,34 @@ class TestCarlini(TestBase):
     #     y_pred_adv = np.argmax(ptc.predict(x_test_adv), axis=1)
     #     self.assertTrue((target != y_pred_adv).any())
 
+    def test_pytorch_mnist_LInf_batched(self):
+        """
+        Test that the batched L_inf attack optimizes each sample independently of the batch size.
+        :return:
+        """
+        x_test = np.swapaxes(self.x_test_mnist, 1, 3).astype(np.float32)
+        ptc = get_image_classifier_pt(from_logits=True)
+
+        clinfm = CarliniLInfMethod(
+            classifier=ptc, targeted=False, max_iter=10, initial_const=1, largest_const=1.1, batch_size=1, verbose=False
+        )
+        x_test_adv_single = clinfm.generate(x_test)
+
+        clinfm = CarliniLInfMethod(
+            classifier=ptc,
+            targeted=False,
+            max_iter=10,
+            initial_const=1,
+            largest_const=1.1,
+            batch_size=10,
+            verbose=False,
+        )
+        x_test_adv_batch = clinfm.generate(x_test)
+
+        self.assertLessEqual(np.amax(x_test_adv_batch), 1.0)
+        self.assertGreaterEqual(np.amin(x_test_adv_batch), 0.0)
+        np.testing.assert_array_almost_equal(x_test_adv_single, x_test_adv_batch, decimal=4)
+
     def test_classifier_type_check_fail_LInf(self):
         backend_test_classifier_type_check_fail(CarliniLInfMethod, [BaseEstimator, ClassGradientsMixin])
 
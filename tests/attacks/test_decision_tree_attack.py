@@ -20,6 +20,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import logging
 import unittest
 
+from sklearn.ensemble import ExtraTreesClassifier
 from sklearn.tree import DecisionTreeClassifier
 from sklearn.datasets import load_digits
 import numpy as np
@@ -27,6 +28,8 @@ import numpy as np
 from art.attacks.evasion.decision_tree_attack import DecisionTreeAttack
 from art.estimators.classification.scikitlearn import SklearnClassifier
 from art.estimators.classification.scikitlearn import ScikitlearnDecisionTreeClassifier
+from art.estimators.classification.scikitlearn import ScikitlearnExtraTreesClassifier
+from art.estimators.classification.scikitlearn import ScikitlearnRandomForestClassifier
 
 from tests.utils import TestBase, master_seed
 from tests.attacks.utils import backend_test_classifier_type_check_fail
@@ -65,6 +68,18 @@ class TestDecisionTreeAttack(TestBase):
         # Check that X has not been modified by attack and classifier
         self.assertAlmostEqual(float(np.max(np.abs(x_original - self.X))), 0.0, delta=0.00001)
 
+    def test_scikitlearn_ensemble(self):
+        clf = ExtraTreesClassifier(n_estimators=10, random_state=0)
+        clf.fit(self.X, self.y)
+        clf_art = SklearnClassifier(clf)
+        attack = DecisionTreeAttack(clf_art, verbose=False)
+        y_pred = clf.predict(self.X[:25])
+        adv = attack.generate(self.X[:25])
+        self.assertGreaterEqual(np.mean(clf.predict(adv) != y_pred), 0.9)
+        targets = (y_pred + 1) % 10
+        adv = attack.generate(self.X[:25], targets)
+        self.assertGreaterEqual(np.mean(clf.predict(adv) == targets), 0.9)
+
     def test_check_params(self):
         clf = DecisionTreeClassifier()
         clf.fit(self.X, self.y)
@@ -77,7 +92,16 @@ class TestDecisionTreeAttack(TestBase):
             _ = DecisionTreeAttack(clf_art, verbose="False")
 
     def test_classifier_type_check_fail(self):
-        backend_test_classifier_type_check_fail(DecisionTreeAttack, [ScikitlearnDecisionTreeClassifier])
+        backend_test_classifier_type_check_fail(
+            DecisionTreeAttack,
+            [
+                (
+                    ScikitlearnDecisionTreeClassifier,
+                    ScikitlearnExtraTreesClassifier,
+                    ScikitlearnRandomForestClassifier,
+                )
+            ],
+        )
 
 
 if __name__ == "__main__":
@@ -191,6 +191,22 @@ class TestDeepFool(TestBase):
         accuracy = sum10 / self.y_test_mnist.shape[0]
         logger.info("Accuracy on adversarial test examples: %.2f%%", (accuracy * 100))
 
+    def test_9_class_gradient_top_k(self):
+        x_test_pt = np.reshape(self.x_test_mnist, (self.x_test_mnist.shape[0], 1, 28, 28)).astype(np.float32)
+        for classifier, x_test in [
+            (get_image_classifier_kr(from_logits=True), self.x_test_mnist),
+            (get_image_classifier_pt(from_logits=True), x_test_pt),
+        ]:
+            preds = classifier.predict(x_test)
+            class_gradients = classifier.class_gradient(x_test)
+
+            for nb_grads in [3, classifier.nb_classes]:
+                attack = DeepFool(classifier, nb_grads=nb_grads, verbose=False)
+                labels = np.argsort(-preds, axis=1, kind="stable")[:, :nb_grads]
+                grads = attack._class_gradient_top_k(x_test, labels)
+                expected = class_gradients[np.arange(len(x_test))[:, np.newaxis], labels]
+                np.testing.assert_array_almost_equal(grads, expected, decimal=4)
+
     def test_1_classifier_type_check_fail(self):
         backend_test_classifier_type_check_fail(DeepFool, [BaseEstimator, ClassGradientsMixin])
 
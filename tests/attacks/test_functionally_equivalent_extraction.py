@@ -930,6 +930,19 @@ class TestFunctionallyEquivalentExtraction(TestBase):
     #     )
     #     np.testing.assert_array_almost_equal(self.fee.b_1, layer_1_biases_expected, decimal=2)
 
+    def test_nb_queries(self):
+        # Weight recovery probes every pair of neuron and feature at least twice for value and twice for sign
+        self.assertGreater(self.fee.nb_queries, 4 * 16 * 784)
+        self.assertEqual(self.fee.w_0.shape, (784, 16))
+        self.assertEqual(self.fee.b_0.shape, (16, 1))
+
+    def test_check_params(self):
+        with self.assertRaises(ValueError):
+            _ = FunctionallyEquivalentExtraction(classifier=self.fee.estimator, num_neurons=16, batch_size=0)
+
+        with self.assertRaises(ValueError):
+            _ = FunctionallyEquivalentExtraction(classifier=self.fee.estimator, num_neurons=-1)
+
     def test_classifier_type_check_fail(self):
         backend_test_classifier_type_check_fail(
             FunctionallyEquivalentExtraction, [BaseEstimator, NeuralNetworkMixin, ClassifierMixin]
@@ -198,6 +198,19 @@ class TestKnockoffNets(TestBase):
                 use_probability="True",
             )
 
+        with self.assertRaises(ValueError):
+            _ = KnockoffNets(
+                classifier=victim_tfc,
+                batch_size_fit=BATCH_SIZE,
+                batch_size_query=BATCH_SIZE,
+                nb_epochs=NB_EPOCHS,
+                nb_stolen=NB_STOLEN,
+                sampling_strategy="adaptive",
+                reward="all",
+                verbose=False,
+                batch_size_adaptive=0,
+            )
+
         # Clean-up session
         if sess is not None:
             sess.close()
@@ -460,6 +473,28 @@ class TestKnockoffNets(TestBase):
 
         self.assertGreater(acc, 0.4)
 
+        # Create adaptive attack drawing batches of actions
+        for reward in ["cert", "div", "loss", "all"]:
+            thieved_ptc = get_tabular_classifier_pt(load_init=False)
+            attack = KnockoffNets(
+                classifier=victim_ptc,
+                batch_size_fit=BATCH_SIZE,
+                batch_size_query=BATCH_SIZE,
+                nb_epochs=NB_EPOCHS,
+                nb_stolen=NB_STOLEN,
+                sampling_strategy="adaptive",
+                reward=reward,
+                verbose=False,
+                batch_size_adaptive=16,
+            )
+            thieved_ptc = attack.extract(x=self.x_train_iris, y=self.y_train_iris, thieved_classifier=thieved_ptc)
+
+            victim_preds = np.argmax(victim_ptc.predict(x=self.x_train_iris), axis=1)
+            thieved_preds = np.argmax(thieved_ptc.predict(x=self.x_train_iris), axis=1)
+            acc = np.sum(victim_preds == thieved_preds) / len(victim_preds)
+
+            self.assertGreater(acc, 0.4)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -147,6 +147,23 @@ class TestSpatialTransformation(TestBase):
         # Check that x_test has not been modified by attack and classifier
         self.assertAlmostEqual(float(np.max(np.abs(x_test_original - x_test_mnist))), 0.0, delta=0.00001)
 
+    def test_6_pytorch_classifier_parallel(self):
+        x_train_mnist = np.reshape(self.x_train_mnist, (self.x_train_mnist.shape[0], 1, 28, 28)).astype(np.float32)
+        ptc = get_image_classifier_pt(from_logits=True)
+        attack_params = {"max_translation": 10.0, "num_translations": 3, "max_rotation": 30.0, "num_rotations": 3}
+
+        attack_st = SpatialTransformation(ptc, batch_size=1, nb_workers=1, verbose=False, **attack_params)
+        x_train_adv = attack_st.generate(x_train_mnist)
+
+        attack_st_parallel = SpatialTransformation(ptc, batch_size=512, nb_workers=4, verbose=False, **attack_params)
+        x_train_adv_parallel = attack_st_parallel.generate(x_train_mnist)
+
+        self.assertEqual(attack_st.fooling_rate, attack_st_parallel.fooling_rate)
+        self.assertEqual(attack_st.attack_trans_x, attack_st_parallel.attack_trans_x)
+        self.assertEqual(attack_st.attack_trans_y, attack_st_parallel.attack_trans_y)
+        self.assertEqual(attack_st.attack_rot, attack_st_parallel.attack_rot)
+        np.testing.assert_array_almost_equal(x_train_adv, x_train_adv_parallel)
+
     def test_5_failure_feature_vectors(self):
         attack_params = {"max_translation": 10.0, "num_translations": 3, "max_rotation": 30.0, "num_rotations": 3}
         classifier = get_tabular_classifier_kr()
@@ -173,6 +190,12 @@ class TestSpatialTransformation(TestBase):
         with self.assertRaises(ValueError):
             _ = SpatialTransformation(ptc, max_rotation=-1)
 
+        with self.assertRaises(ValueError):
+            _ = SpatialTransformation(ptc, batch_size=0)
+
+        with self.assertRaises(ValueError):
+            _ = SpatialTransformation(ptc, nb_workers=0)
+
         with self.assertRaises(ValueError):
             _ = SpatialTransformation(ptc, verbose="False")
 
@@ -0,0 +1,181 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2023
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pytest
+
+from art.estimators.classification import BlackBoxClassifier, BlackBoxClassifierNeuralNetwork
+
+from tests.utils import ARTTestException
+
+logger = logging.getLogger(__name__)
+
+WEIGHTS = np.random.RandomState(seed=1234).normal(size=(5, 4))
+
+
+def _model(x):
+    return np.eye(4)[np.argmax(np.asarray(x).reshape(len(x), -1) @ WEIGHTS, axis=1)]
+
+
+class _ModelServer:
+    """
+    Local stand-in for a remote model, answering JSON requests after a delay and failing the first requests.
+    """
+
+    def __init__(self, delay=0.05, nb_failures=0):
+        self.delay = delay
+        self.nb_failures = nb_failures
+        self.nb_active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # pylint: disable=C0103
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server.lock:
+                    server.nb_active += 1
+                    server.max_active = max(server.max_active, server.nb_active)
+                    fail = server.nb_failures > 0
+                    server.nb_failures -= int(fail)
+                time.sleep(server.delay)
+                with server.lock:
+                    server.nb_active -= 1
+
+                if fail:
+                    self.send_response(503)
+                    self.end_headers()
+                    return
+                response = json.dumps(_model(body["x"]).tolist()).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = "http://127.0.0.1:{}/predict".format(self.httpd.server_address[1])
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    def predict_fn(self, x):
+        request = urllib.request.Request(self.url, data=json.dumps({"x": x.tolist()}).encode(), method="POST")
+        with urllib.request.urlopen(request) as response:
+            return np.array(json.loads(response.read()))
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture()
+def model_server():
+    servers = []
+
+    def _create(**kwargs):
+        servers.append(_ModelServer(**kwargs))
+        return servers[-1]
+
+    yield _create
+    for server in servers:
+        server.close()
+
+
+def test_concurrent_batches(art_warning, model_server):
+    try:
+        server = model_server()
+        x = np.random.RandomState(seed=0).rand(50, 5)
+
+        classifier = BlackBoxClassifier(server.predict_fn, (5,), 4, nb_workers=4)
+        np.testing.assert_array_equal(classifier.predict(x, batch_size=6), _model(x))
+        assert server.max_active > 1
+
+        classifier = BlackBoxClassifierNeuralNetwork(server.predict_fn, (5,), 4, nb_workers=4)
+        np.testing.assert_array_equal(classifier.predict(x, batch_size=6), _model(x))
+    except ARTTestException as e:
+        art_warning(e)
+
+
+def test_retries(art_warning, model_server):
+    try:
+        x = np.random.RandomState(seed=0).rand(20, 5)
+
+        server = model_server(delay=0.0, nb_failures=2)
+        attempts = []
+        classifier = BlackBoxClassifier(
+            server.predict_fn,
+            (5,),
+            4,
+            nb_workers=2,
+            max_retries=2,
+            retry_delay=0.01,
+            retry_hook=lambda attempt, exception: attempts.append(attempt),
+        )
+        np.testing.assert_array_equal(classifier.predict(x, batch_size=10), _model(x))
+        assert len(attempts) == 2
+
+        server = model_server(delay=0.0, nb_failures=1)
+        classifier = BlackBoxClassifier(server.predict_fn, (5,), 4)
+        with pytest.raises(urllib.error.HTTPError):
+            classifier.predict(x)
+    except ARTTestException as e:
+        art_warning(e)
+
+
+def test_async_predict_fn(art_warning):
+    try:
+        rng = np.random.RandomState(seed=0)
+        x = rng.rand(50, 5)
+        active = {"current": 0, "max": 0}
+
+        async def predict_fn(batch):
+            active["current"] += 1
+            active["max"] = max(active["max"], active["current"])
+            await asyncio.sleep(0.01 * rng.rand())
+            active["current"] -= 1
+            return _model(batch)
+
+        classifier = BlackBoxClassifier(predict_fn, (5,), 4, nb_workers=3)
+        np.testing.assert_array_equal(classifier.predict(x, batch_size=4), _model(x))
+        assert active["max"] == 3
+    except ARTTestException as e:
+        art_warning(e)
+
+
+def test_check_params(art_warning):
+    try:
+        with pytest.raises(ValueError):
+            _ = BlackBoxClassifier(_model, (5,), 4, nb_workers=0)
+
+        with pytest.raises(ValueError):
+            _ = BlackBoxClassifier(_model, (5,), 4, max_retries=-1)
+
+        with pytest.raises(ValueError):
+            _ = BlackBoxClassifierNeuralNetwork(_model, (5,), 4, retry_delay=-1.0)
+    except ARTTestException as e:
+        art_warning(e)
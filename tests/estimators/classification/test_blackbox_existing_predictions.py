@@ -77,3 +77,26 @@ def test_blackbox_nn_existing_predictions_fuzzy(art_warning):
         assert np.array_equal(bb.predict(fuzzy_x), y)
     except ARTTestException as e:
         art_warning(e)
+
+
+def test_blackbox_existing_predictions_memmap(art_warning, tmp_path):
+    try:
+        rng = np.random.RandomState(seed=1234)
+        x = np.lib.format.open_memmap(str(tmp_path / "x.npy"), mode="w+", dtype=np.float32, shape=(1000, 4, 4))
+        x[:] = rng.rand(1000, 4, 4)
+        x.flush()
+        x = np.load(str(tmp_path / "x.npy"), mmap_mode="r")
+        y = np.eye(10)[rng.randint(0, 10, size=1000)]
+        queries = rng.permutation(1000)[:300]
+
+        bb = BlackBoxClassifier((x, y), (4, 4), 10)
+        assert isinstance(bb.predict_fn.sorted_hashes, np.memmap)
+        assert np.array_equal(bb.predict(x[queries]), y[queries])
+
+        bb = BlackBoxClassifier((x, y), (4, 4), 10, fuzzy_float_compare=True)
+        assert np.array_equal(bb.predict(x[queries] * (1 + 1e-7)), y[queries])
+
+        with pytest.raises(ValueError):
+            bb.predict(x[queries] + 0.1)
+    except ARTTestException as e:
+        art_warning(e)
@@ -24,7 +24,7 @@ import keras.backend as k
 import numpy as np
 
 from art.estimators.classification.ensemble import EnsembleClassifier
-from tests.utils import TestBase, get_image_classifier_kr
+from tests.utils import TestBase, get_image_classifier_kr, get_image_classifier_pt
 
 logger = logging.getLogger(__name__)
 
@@ -248,6 +248,38 @@ class TestEnsembleClassifier(TestBase):
         )
         np.testing.assert_array_almost_equal(gradients_2[0, 0, 5, 14, :, 0], expected_predictions_2, decimal=4)
 
+    def test_parallel_members(self):
+        # Keras classifiers in graph mode are bound to the graph of their thread, use PyTorch members instead
+        classifiers = [get_image_classifier_pt(), get_image_classifier_pt(load_init=False)]
+        x_test = np.transpose(self.x_test_mnist, (0, 3, 1, 2)).astype(np.float32)
+        params = dict(classifiers=classifiers, classifier_weights=[0.3, 0.7], channels_first=True, clip_values=(0, 1))
+        ensemble = EnsembleClassifier(nb_workers=2, **params)
+        serial = EnsembleClassifier(**params)
+
+        np.testing.assert_array_equal(ensemble.predict(x_test), serial.predict(x_test))
+        np.testing.assert_array_equal(ensemble.predict(x_test, raw=True), serial.predict(x_test, raw=True))
+        np.testing.assert_array_equal(
+            ensemble.loss_gradient(x_test, self.y_test_mnist), serial.loss_gradient(x_test, self.y_test_mnist)
+        )
+        np.testing.assert_array_equal(ensemble.class_gradient(x_test, label=3), serial.class_gradient(x_test, label=3))
+
+        predictions = serial.predict(x_test)
+        predictions_early_exit = ensemble.predict(x_test, early_exit=True)
+        np.testing.assert_array_equal(np.argmax(predictions_early_exit, axis=1), np.argmax(predictions, axis=1))
+
+        # Changing the parameters recreates the pool
+        ensemble.set_params(nb_workers=3)
+        self.assertIsNone(ensemble._executor)
+        np.testing.assert_array_equal(ensemble.predict(x_test), predictions)
+        self.assertEqual(ensemble._executor._max_workers, 3)
+
+    def test_check_params(self):
+        classifiers = [get_image_classifier_kr()]
+        with self.assertRaises(ValueError):
+            _ = EnsembleClassifier(classifiers=classifiers, nb_workers=0)
+        with self.assertRaises(ValueError):
+            _ = EnsembleClassifier(classifiers=classifiers, parallel_backend="gpu")
+
     def test_repr(self):
         repr_ = repr(self.ensemble)
         self.assertIn("art.estimators.classification.ensemble.EnsembleClassifier", repr_)
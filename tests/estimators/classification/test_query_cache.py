@@ -0,0 +1,131 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2023
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import logging
+
+import numpy as np
+import pytest
+
+from art.attacks.evasion import HopSkipJump
+from art.estimators.classification import BlackBoxClassifier, QueryCacheClassifier
+
+from tests.utils import ARTTestException
+
+logger = logging.getLogger(__name__)
+
+
+class CountingPredictFn:
+    def __init__(self):
+        self.weights = np.random.RandomState(seed=1234).normal(size=(4, 3))
+        self.nb_rows = 0
+
+    def __call__(self, x):
+        self.nb_rows += x.shape[0]
+        return np.eye(3)[np.argmax(x.reshape(x.shape[0], -1) @ self.weights, axis=1)]
+
+
+@pytest.fixture()
+def blackbox():
+    predict_fn = CountingPredictFn()
+    return BlackBoxClassifier(predict_fn, (4,), 3, clip_values=(0, 1)), predict_fn
+
+
+def test_cache(art_warning, blackbox):
+    try:
+        classifier, predict_fn = blackbox
+        cached = QueryCacheClassifier(classifier)
+        x = np.random.RandomState(seed=0).rand(10, 4).astype(np.float32)
+
+        predictions = cached.predict(np.concatenate([x, x[:3]]))
+        np.testing.assert_array_equal(predictions, np.concatenate([classifier.predict(x), classifier.predict(x[:3])]))
+        assert predict_fn.nb_rows == 10 + 13
+        assert (cached.nb_queries, cached.nb_cache_hits, cached.cache_size) == (10, 0, 10)
+
+        predictions[:] = -1
+        np.testing.assert_array_equal(cached.predict(x[::-1]), classifier.predict(x[::-1]))
+        assert (cached.nb_queries, cached.nb_batches, cached.nb_cache_hits) == (10, 1, 10)
+        assert predict_fn.nb_rows == 10 + 13 + 10
+
+        # a different data type is a different input
+        cached.predict(x[:2].astype(np.float64))
+        assert cached.nb_queries == 12
+
+        cached.reset_counters()
+        cached.clear_cache()
+        cached.predict(x)
+        assert (cached.nb_queries, cached.nb_cache_hits) == (10, 0)
+    except ARTTestException as e:
+        art_warning(e)
+
+
+def test_eviction_and_budget(art_warning, blackbox):
+    try:
+        classifier, _ = blackbox
+        cached = QueryCacheClassifier(classifier, max_cache_size=5, query_budget=12)
+        x = np.random.RandomState(seed=0).rand(10, 4)
+
+        cached.predict(x)
+        assert cached.cache_size == 5
+        cached.predict(x[5:])
+        assert (cached.nb_queries, cached.nb_cache_hits) == (10, 5)
+
+        with pytest.raises(ValueError):
+            cached.predict(x[:3])
+        assert cached.nb_queries == 10
+        cached.predict(x[:2])
+        assert cached.nb_queries == 12
+
+        with pytest.raises(ValueError):
+            _ = QueryCacheClassifier(classifier, query_budget=-1)
+    except ARTTestException as e:
+        art_warning(e)
+
+
+def test_persistence(art_warning, blackbox, tmp_path):
+    try:
+        classifier, predict_fn = blackbox
+        x = np.random.RandomState(seed=0).rand(20, 4)
+        cache_path = str(tmp_path / "predictions.db")
+
+        cached = QueryCacheClassifier(classifier, cache_path=cache_path)
+        expected = cached.predict(x[:10])
+        cached.close()
+
+        cached = QueryCacheClassifier(classifier, cache_path=cache_path)
+        nb_rows = predict_fn.nb_rows
+        predictions = cached.predict(x)
+        np.testing.assert_array_equal(predictions[:10], expected)
+        assert cached.nb_queries == 10
+        assert predict_fn.nb_rows == nb_rows + 10
+        cached.close()
+    except ARTTestException as e:
+        art_warning(e)
+
+
+def test_attack(art_warning, blackbox):
+    try:
+        classifier, _ = blackbox
+        cached = QueryCacheClassifier(classifier)
+        x = np.random.RandomState(seed=0).rand(2, 4).astype(np.float32)
+
+        attack = HopSkipJump(cached, max_iter=2, max_eval=20, init_eval=5, verbose=False)
+        x_adv = attack.generate(x)
+        assert x_adv.shape == x.shape
+        assert cached.nb_cache_hits > 0
+        assert cached.nb_queries == cached.cache_size
+    except ARTTestException as e:
+        art_warning(e)
@@ -141,6 +141,23 @@ class TestQueryEfficientVectors(unittest.TestCase):
         preds_adv = np.argmax(classifier.predict(x_test_adv), axis=1)
         self.assertFalse((np.argmax(y_test, axis=1) == preds_adv).all())
 
+    def test_iris_batched_loss_gradient(self):
+        (_, _), (x_test, y_test) = self.iris
+        classifier = get_tabular_classifier_kr()
+
+        gradients = []
+        for max_batch_memory in [1, 2 ** 12, 2 ** 28]:
+            master_seed(seed=1234)
+            estimator = QueryEfficientGradientEstimationClassifier(
+                classifier, 20, 1 / 64.0, round_samples=1 / 255.0, max_batch_memory=max_batch_memory
+            )
+            gradients.append(estimator.loss_gradient(x_test, y_test))
+
+        self.assertEqual(gradients[0].shape, x_test.shape)
+        self.assertTrue(np.any(gradients[0] != 0))
+        np.testing.assert_allclose(gradients[0], gradients[1])
+        np.testing.assert_allclose(gradients[0], gradients[2])
+
 
 if __name__ == "__main__":
     unittest.main()
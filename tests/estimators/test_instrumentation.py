@@ -0,0 +1,103 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2020
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from art.attacks.evasion import FastGradientMethod
+from art.estimators.instrumentation import EstimatorInstrumentation
+from tests.utils import TestBase, get_image_classifier_pt
+
+logger = logging.getLogger(__name__)
+
+
+class TestEstimatorInstrumentation(TestBase):
+    """
+    This class tests the instrumentation of estimators.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.x_test = np.transpose(cls.x_test_mnist, (0, 3, 1, 2)).astype(np.float32)
+
+    def test_statistics(self):
+        classifier = get_image_classifier_pt()
+        attack = FastGradientMethod(classifier, eps=0.3, batch_size=4)
+
+        with EstimatorInstrumentation(classifier) as instrumentation:
+            self.assertIn("predict", vars(classifier))
+            with instrumentation.scope("fgsm"):
+                attack.generate(self.x_test[:10])
+            classifier.predict(self.x_test[:5])
+            classifier.class_gradient(self.x_test[:2], label=3)
+        self.assertNotIn("predict", vars(classifier))
+
+        statistics = instrumentation.to_dict()
+        self.assertEqual(set(statistics), {"total", "fgsm"})
+
+        total = statistics["total"]["PyTorchClassifier"]
+        fgsm = statistics["fgsm"]["PyTorchClassifier"]
+        self.assertEqual(fgsm["loss_gradient"]["nb_calls"], 3)
+        self.assertEqual(fgsm["loss_gradient"]["nb_samples"], 10)
+        self.assertEqual(total["predict"]["nb_calls"], fgsm["predict"]["nb_calls"] + 1)
+        self.assertEqual(total["predict"]["nb_samples"], fgsm["predict"]["nb_samples"] + 5)
+        self.assertEqual(total["class_gradient"]["nb_samples"], 2)
+        self.assertNotIn("class_gradient", fgsm)
+
+        gradients = fgsm["loss_gradient"]
+        self.assertEqual(sum(gradients["histogram"]["counts"]), 3)
+        self.assertGreater(gradients["phase_times"]["forward"], 0.0)
+        self.assertGreater(gradients["phase_times"]["backward"], 0.0)
+        self.assertAlmostEqual(sum(gradients["phase_times"].values()), gradients["total_time"], places=6)
+        self.assertEqual(total["predict"]["phase_times"]["backward"], 0.0)
+
+        # Statistics are not recorded while detached
+        classifier.predict(self.x_test[:5])
+        self.assertEqual(instrumentation.to_dict(), statistics)
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            path = os.path.join(tmp_path, "statistics.json")
+            instrumentation.to_json(path)
+            with open(path, encoding="utf8") as file_:
+                self.assertEqual(json.load(file_), statistics)
+
+        instrumentation.reset()
+        self.assertEqual(instrumentation.to_dict(), {})
+
+    def test_names(self):
+        classifiers = [get_image_classifier_pt(), get_image_classifier_pt()]
+        with EstimatorInstrumentation(classifiers) as instrumentation:
+            for classifier in classifiers:
+                classifier.predict(self.x_test[:3])
+        self.assertEqual(set(instrumentation.to_dict()["total"]), {"PyTorchClassifier_0", "PyTorchClassifier_1"})
+
+        with self.assertRaises(ValueError):
+            _ = EstimatorInstrumentation(classifiers, names=["a"])
+        with self.assertRaises(ValueError):
+            _ = EstimatorInstrumentation(classifiers, names=["a", "a"])
+        with self.assertRaises(ValueError):
+            _ = EstimatorInstrumentation(classifiers, bin_edges=[1.0, 0.1])
+
+
+if __name__ == "__main__":
+    unittest.main()
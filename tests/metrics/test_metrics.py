@@ -36,9 +36,11 @@ from art.metrics.metrics import (
     clever_t,
     clever_u,
     clever,
+    clever_scores,
     loss_sensitivity,
     wasserstein_distance,
 )
+from art.metrics.robustness_report import RobustnessReport
 from art.utils import load_mnist
 
 from tests.utils import master_seed
@@ -108,6 +110,49 @@ class TestMetrics(unittest.TestCase):
         sensitivity = loss_sensitivity(classifier, x_train, y_train)
         self.assertGreaterEqual(sensitivity, 0)
 
+    def test_robustness_report(self):
+        (x_train, y_train), (_, _), _, _ = load_mnist()
+        x_train, y_train = x_train[:NB_TRAIN], y_train[:NB_TRAIN]
+
+        # Get classifier
+        classifier = self._cnn_mnist_k([28, 28, 1])
+        classifier.fit(x_train, y_train, batch_size=BATCH_SIZE, nb_epochs=2, verbose=0)
+
+        # The metrics derived from the shared adversarial examples match the individual metrics
+        params = {"eps_step": 0.1, "eps": 0.2}
+        report = RobustnessReport(classifier, ["fgsm"], attack_params={"fgsm": params}, batch_size=32, verbose=False)
+        results = report.evaluate(x_train, y_train)
+
+        self.assertAlmostEqual(
+            results["attacks"]["fgsm"]["empirical_robustness"],
+            empirical_robustness(classifier, x_train, "fgsm", params),
+            places=5,
+        )
+        self.assertAlmostEqual(
+            results["attacks"]["fgsm"]["adversarial_accuracy"],
+            adversarial_accuracy(classifier, x_train, y_train, attack_name="fgsm", attack_params=params),
+        )
+        self.assertAlmostEqual(results["loss_sensitivity"], loss_sensitivity(classifier, x_train, y_train), places=5)
+        self.assertAlmostEqual(
+            results["clean_accuracy"],
+            np.mean(np.argmax(classifier.predict(x_train), axis=1) == np.argmax(y_train, axis=1)),
+        )
+        self.assertEqual(report.perturbation_norms["fgsm"].shape, (NB_TRAIN,))
+
+        results = report.evaluate(x_train)
+        self.assertNotIn("clean_accuracy", results)
+        self.assertNotIn("loss_sensitivity", results)
+        self.assertAlmostEqual(
+            report.adversarial_accuracy("fgsm"),
+            adversarial_accuracy(classifier, x_train, attack_name="fgsm", attack_params=params),
+        )
+
+        with self.assertRaises(ValueError):
+            report.empirical_robustness("hsj")
+
+        with self.assertRaises(ValueError):
+            _ = RobustnessReport(classifier, [])
+
     # def testNearestNeighborDist(self):
     #     # Get MNIST
     #     (x_train, y_train), (_, _), _, _ = load_mnist()
@@ -418,6 +463,45 @@ class TestMetrics(unittest.TestCase):
         )
         self.assertIsNone(scores[0], msg="Clever scores for the predicted class should be `None`.")
 
+    def test_clever_scores(self):
+        batch_size, nb_train, nb_test = 100, 1000, 4
+        (x_train, y_train), (x_test, _), _, _ = load_mnist()
+        x_train = np.swapaxes(x_train[:nb_train], 1, 3).astype(np.float32)
+        x_test = np.swapaxes(x_test[:nb_test], 1, 3).astype(np.float32)
+
+        ptc = self._create_ptclassifier()
+        ptc.fit(x_train, y_train[:nb_train], batch_size=batch_size, nb_epochs=1)
+        pred_classes = np.argmax(ptc.predict(x_test), axis=1)
+
+        # The gradients of the pools of all samples and classes are computed in a single call
+        class_gradient = ptc.class_gradient
+        nb_calls = []
+
+        def class_gradient_counted(*args, **kwargs):
+            nb_calls.append(1)
+            return class_gradient(*args, **kwargs)
+
+        ptc.class_gradient = class_gradient_counted
+
+        scores = clever_scores(ptc, x_test, 10, 5, R_L2, norm=2, pool_factor=3, verbose=False)
+        self.assertEqual(len(nb_calls), 1)
+        self.assertEqual(scores.shape, (nb_test, 10))
+        self.assertTrue(np.isnan(scores[np.arange(nb_test), pred_classes]).all())
+        self.assertEqual(np.sum(np.isnan(scores)), nb_test)
+        self.assertTrue(((scores[~np.isnan(scores)] > 0) & (scores[~np.isnan(scores)] <= R_L2)).all())
+
+        scores = clever_scores(ptc, x_test, 10, 5, R_L2, norm=2, target=[3, 5], pool_factor=3, verbose=False)
+        self.assertEqual(len(nb_calls), 2)
+        self.assertEqual(np.sum(~np.isnan(scores)), 2 * nb_test - np.sum(np.isin(pred_classes, [3, 5])))
+        self.assertTrue(np.isnan(np.delete(scores, [3, 5], axis=1)).all())
+
+        # Untargeted scores of single samples are the minimum over the target classes
+        score_u = clever_u(ptc, x_test[0], 10, 5, R_L2, norm=2, pool_factor=3, verbose=False)
+        scores_t = clever(ptc, x_test[0], 10, 5, R_L2, norm=2, pool_factor=3, verbose=False)
+        self.assertEqual(len(nb_calls), 4)
+        self.assertEqual(scores_t.shape, (9,))
+        self.assertAlmostEqual(score_u, np.min(scores_t.astype(float)), delta=0.5 * score_u)
+
     def test_1_wasserstein_distance(self):
         nb_train = 1000
         nb_test = 100
@@ -442,6 +526,30 @@ class TestMetrics(unittest.TestCase):
 
         np.testing.assert_array_equal(wd_2, np.asarray([0.0, 0.0, 0.0]))
 
+    def test_wasserstein_distance_scipy(self):
+        from scipy.stats import wasserstein_distance as wasserstein_distance_scipy
+
+        # Continuous values and discrete values with ties, processed in several batches
+        u_values = [np.random.rand(10, 4, 5), np.random.randint(0, 4, size=(10, 20)).astype(np.float32)]
+        v_values = [np.random.rand(10, 4, 5), np.random.randint(0, 4, size=(10, 20)).astype(np.float32)]
+
+        for u, v in zip(u_values, v_values):
+            u_weights = np.random.rand(*u.shape)
+            v_weights = np.random.rand(*v.shape)
+
+            w_d = wasserstein_distance(u, v, batch_size=3)
+            w_d_weights = wasserstein_distance(u, v, u_weights, v_weights, batch_size=3)
+
+            for i in range(u.shape[0]):
+                self.assertAlmostEqual(w_d[i], wasserstein_distance_scipy(u[i].flatten(), v[i].flatten()), places=10)
+                self.assertAlmostEqual(
+                    w_d_weights[i],
+                    wasserstein_distance_scipy(
+                        u[i].flatten(), v[i].flatten(), u_weights[i].flatten(), v_weights[i].flatten()
+                    ),
+                    places=10,
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
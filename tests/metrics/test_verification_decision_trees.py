@@ -29,7 +29,7 @@ from art.estimators.classification.xgboost import XGBoostClassifier
 from art.estimators.classification.lightgbm import LightGBMClassifier
 from art.estimators.classification.scikitlearn import SklearnClassifier
 from art.utils import load_dataset
-from art.metrics.verification_decisions_trees import RobustnessVerificationTreeModelsCliqueMethod
+from art.metrics.verification_decisions_trees import RobustnessVerificationTreeModelsCliqueMethod, TreeEnsemble
 
 from tests.utils import master_seed
 
@@ -146,6 +146,49 @@ class TestMetricsTrees(unittest.TestCase):
         self.assertEqual(average_bound, 0.05406445312499999)
         self.assertEqual(verified_error, 0.96)
 
+    def test_tree_ensemble(self):
+        model = RandomForestClassifier(n_estimators=4, max_depth=6)
+        model.fit(self.x_train, np.argmax(self.y_train, axis=1))
+        classifier_rf = SklearnClassifier(model=model)
+
+        model = XGBClassifier(n_estimators=4, max_depth=6, objective="multi:softprob", eval_metric="merror")
+        model.fit(self.x_train, np.argmax(self.y_train, axis=1))
+        classifier_xgb = XGBoostClassifier(model=model, nb_features=self.n_features, nb_classes=self.n_classes)
+
+        for classifier in [classifier_rf, classifier_xgb]:
+            tree_ensemble = classifier.get_tree_ensemble()
+            self.assertIs(classifier.get_tree_ensemble(), tree_ensemble)
+
+            expected = TreeEnsemble.from_trees(classifier.get_trees(), nb_features=self.n_features)
+            np.testing.assert_allclose(tree_ensemble.bounds, expected.bounds, rtol=1e-6)
+            np.testing.assert_allclose(tree_ensemble.values, expected.values, rtol=1e-6)
+            np.testing.assert_array_equal(tree_ensemble.class_labels, expected.class_labels)
+            np.testing.assert_array_equal(tree_ensemble.tree_ids, expected.tree_ids)
+            np.testing.assert_array_equal(tree_ensemble.node_ids, expected.node_ids)
+            np.testing.assert_array_equal(tree_ensemble.tree_class_ids, expected.tree_class_ids)
+            np.testing.assert_array_equal(tree_ensemble.tree_offsets, expected.tree_offsets)
+
+            # Fitting the model discards the cached tree ensemble
+            classifier.fit(
+                self.x_train, np.argmax(self.y_train, axis=1) if classifier is classifier_xgb else self.y_train
+            )
+            self.assertIsNot(classifier.get_tree_ensemble(), tree_ensemble)
+
+    def test_parallel(self):
+        model = RandomForestClassifier(n_estimators=4, max_depth=6)
+        model.fit(self.x_train, np.argmax(self.y_train, axis=1))
+
+        classifier = SklearnClassifier(model=model)
+
+        rt = RobustnessVerificationTreeModelsCliqueMethod(classifier=classifier, verbose=False)
+        expected = rt.verify(x=self.x_test[:20], y=self.y_test[:20], eps_init=0.3, nb_search_steps=5)
+        result = rt.verify(x=self.x_test[:20], y=self.y_test[:20], eps_init=0.3, nb_search_steps=5, nb_workers=2)
+
+        self.assertEqual(result, expected)
+
+        with self.assertRaises(ValueError):
+            rt.verify(x=self.x_test, y=self.y_test, eps_init=0.3, nb_workers=0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -25,7 +25,7 @@ import numpy as np
 from keras.preprocessing.image import ImageDataGenerator
 
 from art.data_generators import KerasDataGenerator, PyTorchDataGenerator, MXDataGenerator, TensorFlowDataGenerator
-from art.data_generators import TensorFlowV2DataGenerator, NumpyDataGenerator
+from art.data_generators import TensorFlowV2DataGenerator, NumpyDataGenerator, PrefetchingDataGenerator
 
 from tests.utils import master_seed
 
@@ -150,6 +150,64 @@ class TestNumpyDataGenerator(unittest.TestCase):
         self.assertTrue((y_batch == self.y[: self.batch_size]).all())
 
 
+class TestPrefetchingDataGenerator(unittest.TestCase):
+    def setUp(self):
+        self.x = np.random.random((100, 28, 28, 1)).astype(np.float32)
+        self.y = np.arange(100)
+        self.batch_size = 30
+
+    def test_threads(self):
+        data_generator = NumpyDataGenerator(self.x, self.y, batch_size=self.batch_size, drop_remainder=False)
+        reference = NumpyDataGenerator(self.x, self.y, batch_size=self.batch_size, drop_remainder=False)
+
+        with PrefetchingDataGenerator(data_generator, prefetch=3) as prefetching_generator:
+            self.assertEqual(prefetching_generator.size, 100)
+            self.assertEqual(prefetching_generator.batch_size, self.batch_size)
+            for _ in range(10):
+                x_batch, y_batch = prefetching_generator.get_batch()
+                x_reference, y_reference = reference.get_batch()
+                np.testing.assert_array_equal(x_batch, x_reference)
+                np.testing.assert_array_equal(y_batch, y_reference)
+
+            self.assertEqual(prefetching_generator.metrics["nb_batches"], 10)
+            self.assertLessEqual(prefetching_generator.metrics["queue_depth"], 3)
+            self.assertGreaterEqual(prefetching_generator.metrics["stall_time"], 0.0)
+
+        with self.assertRaises(ValueError):
+            prefetching_generator.get_batch()
+
+    def test_processes(self):
+        data_generator = NumpyDataGenerator(self.x, self.y, batch_size=self.batch_size, drop_remainder=False)
+        reference = NumpyDataGenerator(self.x, self.y, batch_size=self.batch_size, drop_remainder=False)
+
+        with PrefetchingDataGenerator(
+            data_generator, prefetch=2, parallel_backend="processes"
+        ) as prefetching_generator:
+            for _ in range(10):
+                x_batch, y_batch = prefetching_generator.get_batch()
+                x_reference, y_reference = reference.get_batch()
+                np.testing.assert_array_equal(x_batch, x_reference)
+                np.testing.assert_array_equal(y_batch, y_reference)
+
+    def test_worker_error(self):
+        data_generator = NumpyDataGenerator(self.x, self.y, batch_size=self.batch_size)
+        data_generator.generator = None
+
+        with self.assertRaises(TypeError):
+            PrefetchingDataGenerator(data_generator).get_batch()
+
+    def test_errors(self):
+        data_generator = NumpyDataGenerator(self.x, self.y, batch_size=self.batch_size)
+        with self.assertRaises(TypeError):
+            PrefetchingDataGenerator(self.x)
+        with self.assertRaises(ValueError):
+            PrefetchingDataGenerator(data_generator, prefetch=0)
+        with self.assertRaises(ValueError):
+            PrefetchingDataGenerator(data_generator, nb_workers=0)
+        with self.assertRaises(ValueError):
+            PrefetchingDataGenerator(data_generator, parallel_backend="gpu")
+
+
 class TestKerasDataGenerator(unittest.TestCase):
     def setUp(self):
         from tensorflow import keras
@@ -0,0 +1,184 @@
+# MIT License
+#
+# Copyright (C) The Adversarial Robustness Toolbox (ART) Authors 2021
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the "Software"), to deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software, and to permit
+# persons to whom the Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of the
+# Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE
+# WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT,
+# TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import ast
+import glob
+import json
+import logging
+import os
+import subprocess
+import sys
+
+import pytest
+
+from tests.utils import ARTTestException
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["torch", "tensorflow", "keras", "sklearn", "numba", "scipy.optimize", "jax", "mxnet", "lightgbm"]
+
+
+def _run(statement):
+    """
+    Execute an import statement in a fresh interpreter and return its duration and the modules it loaded.
+    """
+    code = (
+        "import json, sys, time\n"
+        "modules = set(sys.modules)\n"
+        "start = time.perf_counter()\n"
+        "{}\n"
+        "duration = time.perf_counter() - start\n"
+        "print(json.dumps({{'duration': duration, 'modules': sorted(set(sys.modules) - modules)}}))\n"
+    ).format(statement)
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def _declared_names(path):
+    """
+    Parse the `__init__` of a lazily loaded package and return the pairs of module and name imported for type checkers
+    and the pairs of module and name declared to `attach`.
+    """
+    package = os.path.relpath(os.path.dirname(path), ROOT).replace(os.sep, ".")
+    with open(path, encoding="utf8") as file_:
+        tree = ast.parse(file_.read())
+
+    type_checking = set()
+    for node in tree.body:
+        if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING":
+            for statement in node.body:
+                if isinstance(statement, ast.ImportFrom):
+                    type_checking.update((statement.module, alias.asname or alias.name) for alias in statement.names)
+
+    # The submodule attributes are given as a dictionary literal or as a dictionary variable extended conditionally
+    dicts = {}
+    attached = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    dicts[target.id] = list(zip(node.value.keys, node.value.values))
+        elif isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Subscript):
+            target = node.targets[0]
+            dicts.setdefault(target.value.id, []).append((target.slice, node.value))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "attach":
+            for keyword in node.keywords:
+                if keyword.arg == "submodules":
+                    attached.update((package, name) for name in ast.literal_eval(keyword.value))
+                elif keyword.arg == "submod_attrs":
+                    items = (
+                        dicts[keyword.value.id]
+                        if isinstance(keyword.value, ast.Name)
+                        else zip(keyword.value.keys, keyword.value.values)
+                    )
+                    for key, value in items:
+                        module = f"{package}.{ast.literal_eval(key)}"
+                        attached.update((module, name) for name in ast.literal_eval(value))
+
+    return type_checking, attached
+
+
+@pytest.mark.framework_agnostic
+def test_import_art(art_warning):
+    try:
+        result = _run("import art")
+
+        assert result["duration"] < 1.0
+        assert len(result["modules"]) < 300
+        for module in HEAVY_MODULES:
+            assert module not in result["modules"]
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_import_attack(art_warning):
+    try:
+        result = _run("from art.attacks.evasion import FastGradientMethod")
+
+        assert result["duration"] < 2.0
+        assert "art.attacks.evasion.fast_gradient" in result["modules"]
+        assert "art.attacks.evasion.carlini" not in result["modules"]
+        assert "art.estimators.classification.pytorch" not in result["modules"]
+        for module in HEAVY_MODULES:
+            assert module not in result["modules"]
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_public_names(art_warning):
+    try:
+        import art
+        import art.attacks.evasion
+        import art.estimators.classification
+        from art.attacks.evasion import FastGradientMethod
+        from art.attacks.evasion.fast_gradient import FastGradientMethod as FastGradientMethodModule
+
+        assert FastGradientMethod is FastGradientMethodModule
+        assert art.attacks.evasion.FastGradientMethod is FastGradientMethod
+        assert "FastGradientMethod" in art.attacks.evasion.__all__
+        assert "FastGradientMethod" in dir(art.attacks.evasion)
+        assert "PyTorchClassifier" in art.estimators.classification.__all__
+        assert "evasion" in dir(art.attacks)
+        assert art.estimators.classification.pytorch.PyTorchClassifier is not None
+
+        for name in art.attacks.evasion.__all__:
+            assert getattr(art.attacks.evasion, name) is not None
+
+        with pytest.raises(AttributeError):
+            _ = art.attacks.evasion.NotAnAttack
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_static_types(art_warning):
+    try:
+        mypy_api = pytest.importorskip("mypy.api")
+
+        code = (
+            "import art.estimators.classification\n"
+            "from art.attacks.evasion import FastGradientMethod\n"
+            "reveal_type(FastGradientMethod)\n"
+            "reveal_type(art.estimators.classification.PyTorchClassifier)\n"
+        )
+        stdout, _, _ = mypy_api.run(["--follow-imports=silent", "--ignore-missing-imports", "-c", code])
+
+        assert "-> art.attacks.evasion.fast_gradient.FastGradientMethod" in stdout
+        assert "-> art.estimators.classification.pytorch.PyTorchClassifier" in stdout
+        assert 'Revealed type is "Any"' not in stdout
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_type_checking_names(art_warning):
+    try:
+        nb_packages = 0
+        for path in glob.glob(os.path.join(ROOT, "art", "**", "__init__.py"), recursive=True):
+            type_checking, attached = _declared_names(path)
+            if attached:
+                nb_packages += 1
+                assert type_checking == attached, (path, type_checking ^ attached)
+
+        assert nb_packages > 40
+    except ARTTestException as e:
+        art_warning(e)
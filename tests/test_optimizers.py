@@ -16,6 +16,8 @@
 # TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 import logging
+
+import numpy as np
 import pytest
 
 from art.optimizers import Adam
@@ -47,3 +49,31 @@ def test_adam_optimize(art_warning):
 
     except ARTTestException as e:
         art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_adam_optimize_batch(art_warning):
+    try:
+        target = np.array([2.0, -3.0, 10.0])
+
+        def func(x, index):
+            return (x - target[index]) ** 2
+
+        def jacobian(x, index):
+            return 2 * (x - target[index])
+
+        optimizer = Adam(alpha=0.5)
+
+        x_0 = np.array([10.0, 10.0, 10.0])
+        max_iter = 1000
+        loss_converged = 0.01
+
+        x_opt = optimizer.optimize_batch(func, jacobian, x_0, max_iter, loss_converged)
+
+        assert pytest.approx(1.94, abs=0.02) == x_opt[0]
+        assert np.all(func(x_opt, np.arange(3)) < loss_converged)
+        assert x_opt[2] == 10.0
+        assert (x_0 == 10.0).all()
+
+    except ARTTestException as e:
+        art_warning(e)
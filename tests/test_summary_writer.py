@@ -115,3 +115,80 @@ def test_update_image_object_detection_sw(art_warning, fix_get_mnist_subset, fix
 
     except ARTTestException as e:
         art_warning(e)
+
+
+@pytest.mark.skip_framework("scikitlearn", "mxnet")
+def test_update_asynchronous(art_warning, fix_get_mnist_subset, image_dl_estimator):
+    try:
+
+        from art.attacks.evasion import ProjectedGradientDescent
+
+        classifier, _ = image_dl_estimator(from_logits=False)
+
+        (x_train_mnist, y_train_mnist, x_test_mnist, y_test_mnist) = fix_get_mnist_subset
+
+        summary_writers = []
+        for asynchronous in [False, True]:
+            swd = SummaryWriterDefault(
+                summary_writer=True, ind_1=True, ind_2=True, ind_3=True, ind_4=True, asynchronous=asynchronous
+            )
+            attack = ProjectedGradientDescent(
+                estimator=classifier,
+                max_iter=10,
+                eps=0.3,
+                eps_step=0.03,
+                batch_size=5,
+                verbose=False,
+                summary_writer=swd,
+            )
+            attack.generate(x=x_train_mnist, y=y_train_mnist)
+            summary_writers.append(swd)
+
+        swd_sync, swd_async = summary_writers
+        np.testing.assert_array_equal(swd_async.i_1, swd_sync.i_1)
+        np.testing.assert_array_almost_equal(swd_async.i_2, swd_sync.i_2)
+        for batch_id in ["0", "1"]:
+            np.testing.assert_array_almost_equal(swd_async.i_3[batch_id], swd_sync.i_3[batch_id])
+            np.testing.assert_array_almost_equal(swd_async.i_4[batch_id], swd_sync.i_4[batch_id])
+
+        swd = SummaryWriterDefault(
+            summary_writer=True,
+            ind_1=True,
+            ind_2=True,
+            ind_3=True,
+            ind_4=True,
+            asynchronous=True,
+            indicator_interval=2,
+            nb_samples=3,
+            histogram=True,
+        )
+        attack = ProjectedGradientDescent(
+            estimator=classifier, max_iter=10, eps=0.3, eps_step=0.03, batch_size=5, verbose=False, summary_writer=swd
+        )
+        attack.generate(x=x_train_mnist, y=y_train_mnist)
+
+        assert swd.i_1.shape == (3,)
+        assert swd.i_3["0"].shape == (3,)
+        assert swd.i_4["0"].shape == (5,)
+        assert len(swd.losses["0"]) == 5
+
+        swd.close()
+
+    except ARTTestException as e:
+        art_warning(e)
+
+
+@pytest.mark.framework_agnostic
+def test_check_params(art_warning):
+    try:
+        with pytest.raises(ValueError):
+            _ = SummaryWriterDefault(summary_writer=True, indicator_interval=0)
+
+        with pytest.raises(ValueError):
+            _ = SummaryWriterDefault(summary_writer=True, nb_samples=0)
+
+        with pytest.raises(ValueError):
+            _ = SummaryWriterDefault(summary_writer=True, max_queue_size=-1)
+
+    except ARTTestException as e:
+        art_warning(e)
@@ -18,13 +18,16 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import logging
+import os
+import tempfile
 import unittest
 
 import numpy as np
 import tensorflow as tf
 
 from art.utils import projection, random_sphere, uniform_sample_from_sphere_or_ball, to_categorical, least_likely_class
-from art.utils import load_dataset, load_iris, load_mnist, load_nursery, load_cifar10
+from art import config
+from art.utils import load_dataset, load_iris, load_mnist, load_nursery, load_cifar10, load_cached_dataset
 from art.utils import second_most_likely_class, random_targets, get_label_conf, get_labels_np_array, preprocess
 from art.utils import compute_success_array, compute_success, check_and_transform_label_format
 from art.utils import segment_by_class, performance_diff
@@ -473,6 +476,44 @@ class TestUtils(unittest.TestCase):
     #     self.assertEqual(x_train.shape[0], y_train.shape[0])
     #     self.assertEqual(x_test.shape[0], y_test.shape[0])
 
+    def test_load_cached_dataset(self):
+        data_path = config.ART_DATA_PATH
+        nb_calls = []
+
+        def loader():
+            nb_calls.append(1)
+            x = np.random.rand(20, 4).astype(np.float32)
+            y = to_categorical(np.arange(20) % 3, 3)
+            return (x[:15], y[:15]), (x[15:], y[15:]), 0.0, 1.0
+
+        def loader_object():
+            nb_calls.append(1)
+            x = np.array([["a", 1], ["b", 2]], dtype=object)
+            return (x, np.arange(2)), (x, np.arange(2)), 1, 2
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            try:
+                config.set_data_path(tmp_path)
+                dataset = load_cached_dataset("test-normalized", loader)
+                (x_train, y_train), (x_test, y_test), min_, max_ = load_cached_dataset("test-normalized", loader)
+
+                self.assertEqual(len(nb_calls), 1)
+                self.assertTrue(os.path.isdir(os.path.join(tmp_path, "cache", "test-normalized-v1")))
+                for cached, expected in zip([x_train, y_train, x_test, y_test], [*dataset[0], *dataset[1]]):
+                    self.assertIsInstance(cached, np.memmap)
+                    self.assertFalse(cached.flags.writeable)
+                    self.assertEqual(cached.dtype, expected.dtype)
+                    np.testing.assert_array_equal(cached, expected)
+                self.assertEqual((min_, max_), (0.0, 1.0))
+
+                load_cached_dataset("test-object", loader_object)
+                (x_train, _), (_, _), _, _ = load_cached_dataset("test-object", loader_object)
+                self.assertEqual(len(nb_calls), 3)
+                self.assertEqual(x_train.dtype, object)
+                self.assertEqual(os.listdir(os.path.join(tmp_path, "cache")), ["test-normalized-v1"])
+            finally:
+                config.set_data_path(data_path)
+
     def test_nursery(self):
         (x_train, y_train), (x_test, y_test), min_, max_ = load_nursery(raw=True)
         self.assertEqual(x_train.shape[0], y_train.shape[0])